@@ -0,0 +1,389 @@
+package webassembler
+
+import (
+	"crypto/sha256"
+	"fmt"
+	"io"
+	"math/rand"
+	"runtime"
+	"testing"
+
+	"github.com/tetratelabs/wazero"
+)
+
+// To compare against the checked-in baseline:
+//
+//	go test -run '^$' -bench . -count 10 >new.txt
+//	benchstat testdata/bench/baseline.txt new.txt
+
+var benchSink []byte
+
+func BenchmarkLEB128(b *testing.B) {
+	unsignedCases := []U32{0x7f, 0x3fff, 0x1fffff, 0xffffffff}
+	for _, v := range unsignedCases {
+		b.Run(fmt.Sprintf("U32/%dB", unsignedLEB128Size(v)), func(b *testing.B) {
+			b.ReportAllocs()
+			buf := make([]byte, 0, 16)
+			for i := 0; i < b.N; i++ {
+				buf = appendUnsignedLEB128(buf[:0], v)
+			}
+			benchSink = buf
+		})
+	}
+	signedCases := []I64{-1, 0x1fff, -0xfffff, 0x7ffffffff, -0x7fffffffffffffff}
+	for _, v := range signedCases {
+		b.Run(fmt.Sprintf("I64/%dB", len(appendSignedLEB128(nil, v))), func(b *testing.B) {
+			b.ReportAllocs()
+			buf := make([]byte, 0, 16)
+			for i := 0; i < b.N; i++ {
+				buf = appendSignedLEB128(buf[:0], v)
+			}
+			benchSink = buf
+		})
+	}
+}
+
+// emitMix appends n instructions, in multiples of 8, drawn from a mix that
+// is typical of compiler output: locals, small constants, arithmetic and
+// memory access. Each group of 8 leaves the operand stack unchanged.
+func emitMix(code *Code, n int) {
+	for i := 0; i < n; i += 8 {
+		code.Localget(LocalIdx(i & 3))
+		code.Localget(1)
+		code.I32_Load(MemArg{2, U32(i & 0xff)})
+		code.I32_Const(I32(i & 0xfff))
+		code.I32_Add()
+		code.I32_Store(MemArg{2, U32(i & 0xff)})
+		code.I32_Const(I32(i))
+		code.Localset(2)
+	}
+}
+
+func BenchmarkInstructions(b *testing.B) {
+	const n = 1 << 10
+	b.ReportAllocs()
+	code := NewCode()
+	for i := 0; i < b.N; i++ {
+		code.buf.buf = code.buf.buf[:0]
+		emitMix(code, n)
+	}
+	b.ReportMetric(float64(b.Elapsed().Nanoseconds())/float64(b.N*n), "ns/instr")
+}
+
+// benchCode returns n small, valid function bodies of type [] -> [].
+func benchCode(n int) []*Code {
+	codes := make([]*Code, n)
+	for i := range codes {
+		code := NewCode(LocalType{4, TypeIdx(TypeI32)})
+		emitMix(code, 32)
+		code.End()
+		codes[i] = code
+	}
+	return codes
+}
+
+func BenchmarkCodeSectionAdd(b *testing.B) {
+	codes := benchCode(10_000)
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		var sec CodeSection
+		for _, code := range codes {
+			sec.Add(code)
+		}
+	}
+}
+
+func benchModule(numFuncs int) *Module {
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, nil)
+	mod.AddMemory(MemType{MakeUnlimited(1)})
+	for _, code := range benchCode(numFuncs) {
+		mod.AddFunc(typeIdx, code)
+	}
+	return mod
+}
+
+func BenchmarkModule(b *testing.B) {
+	for _, numFuncs := range []int{1_000, 10_000, 100_000} {
+		mod := benchModule(numFuncs)
+		size := int64(mod.Size())
+		b.Run(fmt.Sprintf("Bytes/%d", numFuncs), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(size)
+			for i := 0; i < b.N; i++ {
+				benchSink = mod.Bytes()
+			}
+		})
+		b.Run(fmt.Sprintf("AppendTo/%d", numFuncs), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(size)
+			buf := make([]byte, 0, size)
+			for i := 0; i < b.N; i++ {
+				buf = mod.AppendTo(buf[:0])
+			}
+			benchSink = buf
+		})
+		b.Run(fmt.Sprintf("WriteTo/%d", numFuncs), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(size)
+			for i := 0; i < b.N; i++ {
+				if _, err := mod.WriteTo(io.Discard); err != nil {
+					b.Fatal(err)
+				}
+			}
+		})
+	}
+}
+
+// BenchmarkCompactData instantiates a module whose memory image is mostly
+// zeros, before and after compaction.
+func BenchmarkCompactData(b *testing.B) {
+	image := make([]byte, 4<<20)
+	rng := rand.New(rand.NewSource(1))
+	for i := 0; i < 256; i++ {
+		rng.Read(image[rng.Intn(len(image)-64):][:64])
+	}
+
+	for _, compact := range []bool{false, true} {
+		mod := NewModule()
+		mem := mod.AddMemory(MemType{MakeUnlimited(U32(len(image) >> 16))})
+		mod.Data.AddActive(mem, 0, image)
+		name := "Raw"
+		if compact {
+			mod.CompactData(16)
+			name = "Compacted"
+		}
+		bin := mod.Bytes()
+
+		b.Run(name, func(b *testing.B) {
+			ctx := b.Context()
+			b.ReportAllocs()
+			b.ReportMetric(float64(len(bin)), "module-bytes")
+			for i := 0; i < b.N; i++ {
+				rt := wazero.NewRuntime(ctx)
+				compiled, err := rt.CompileModule(ctx, bin)
+				if err != nil {
+					b.Fatal(err)
+				}
+				inst, err := rt.InstantiateModule(ctx, compiled, wazero.NewModuleConfig())
+				if err != nil {
+					b.Fatal(err)
+				}
+				inst.Close(ctx)
+				rt.Close(ctx)
+			}
+		})
+	}
+}
+
+func BenchmarkInstrIter(b *testing.B) {
+	const n = 1 << 10
+	code := NewCode()
+	emitMix(code, n)
+	b.ReportAllocs()
+	b.SetBytes(int64(code.buf.Len()))
+	for i := 0; i < b.N; i++ {
+		it := code.Instrs()
+		for it.Next() {
+		}
+	}
+	b.ReportMetric(float64(b.Elapsed().Nanoseconds())/float64(b.N*n), "ns/instr")
+}
+
+func BenchmarkPeephole(b *testing.B) {
+	const n = 1 << 10
+	code := NewCode()
+	emitMix(code, n)
+	code.End()
+	b.ReportAllocs()
+	b.SetBytes(int64(code.buf.Len()))
+	for i := 0; i < b.N; i++ {
+		code.Peephole()
+	}
+	b.ReportMetric(float64(b.Elapsed().Nanoseconds())/float64(b.N*n), "ns/instr")
+}
+
+// BenchmarkRecording compares the memory held per instruction by encoded
+// and recorded bodies, and the cost of recording then encoding them.
+func BenchmarkRecording(b *testing.B) {
+	const n = 1 << 10
+	for _, record := range []bool{false, true} {
+		name := "Encoded"
+		if record {
+			name = "Recorded"
+		}
+		b.Run(name, func(b *testing.B) {
+			b.ReportAllocs()
+			var size int
+			for i := 0; i < b.N; i++ {
+				code := NewCode()
+				if record {
+					code.EnableRecording()
+				}
+				emitMix(code, n)
+				size = code.buf.Len()
+				if record {
+					size = 2*len(code.ir.ops) + 8*len(code.ir.imms)
+					code.flush()
+				}
+			}
+			b.ReportMetric(float64(size)/n, "B/instr")
+			b.ReportMetric(float64(b.Elapsed().Nanoseconds())/float64(b.N*n), "ns/instr")
+		})
+	}
+}
+
+// BenchmarkTemplate compares building a module with a prefix of 1,000
+// functions from scratch, and from a template of the prefix, before adding
+// one more.
+func BenchmarkTemplate(b *testing.B) {
+	const n = 1_000
+	codes := benchCode(n + 1)
+	build := func() *Module {
+		mod := NewModule()
+		typeIdx := mod.Types.AddFunc(nil, nil)
+		mod.AddMemory(MemType{MakeUnlimited(1)})
+		for _, code := range codes[:n] {
+			mod.AddFunc(typeIdx, code)
+		}
+		return mod
+	}
+	b.Run("Rebuild", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			mod := build()
+			mod.AddFunc(0, codes[n])
+			benchSink = mod.Funcs.buf.Bytes()
+		}
+	})
+	b.Run("Template", func(b *testing.B) {
+		tmpl := build().Freeze()
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			mod := tmpl.NewModule()
+			mod.AddFunc(0, codes[n])
+			benchSink = mod.Funcs.buf.Bytes()
+		}
+	})
+}
+
+// BenchmarkCodePool compares building and encoding modules with a fresh
+// body per function, and with bodies from AcquireCode that are released
+// once the module is encoded.
+func BenchmarkCodePool(b *testing.B) {
+	const n = 10_000
+	for _, pooled := range []bool{false, true} {
+		name := "NewCode"
+		if pooled {
+			name = "AcquireCode"
+		}
+		b.Run(name, func(b *testing.B) {
+			var buf []byte
+			var before, after runtime.MemStats
+			runtime.GC()
+			runtime.ReadMemStats(&before)
+			b.ReportAllocs()
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				mod := NewModule()
+				typeIdx := mod.Types.AddFunc(nil, nil)
+				for j := 0; j < n; j++ {
+					var code *Code
+					if pooled {
+						code = AcquireCode(LocalType{4, TypeIdx(TypeI32)})
+					} else {
+						code = NewCode(LocalType{4, TypeIdx(TypeI32)})
+					}
+					emitMix(code, 32)
+					code.End()
+					mod.AddFunc(typeIdx, code)
+				}
+				buf = mod.AppendTo(buf[:0])
+				if pooled {
+					for _, code := range mod.Code.funcs {
+						code.Release()
+					}
+				}
+			}
+			b.StopTimer()
+			runtime.ReadMemStats(&after)
+			benchSink = buf
+			b.ReportMetric(float64(after.NumGC-before.NumGC)/float64(b.N), "gcs/op")
+			b.ReportMetric(float64(after.PauseTotalNs-before.PauseTotalNs)/float64(b.N), "gc-pause-ns/op")
+		})
+	}
+}
+
+// BenchmarkDigest compares hashing a module's encoding with SHA-256, its
+// digest computed from scratch, and its digest kept up to date as a
+// function is added.
+func BenchmarkDigest(b *testing.B) {
+	const numFuncs = 10_000
+	mod := benchModule(numFuncs)
+	size := int64(mod.Size())
+	b.Run("BytesSHA256", func(b *testing.B) {
+		b.ReportAllocs()
+		b.SetBytes(size)
+		for i := 0; i < b.N; i++ {
+			sum := sha256.Sum256(mod.Bytes())
+			benchSink = sum[:]
+		}
+	})
+	b.Run("Digest", func(b *testing.B) {
+		b.ReportAllocs()
+		b.SetBytes(size)
+		for i := 0; i < b.N; i++ {
+			mod.Code.hashed, mod.Code.hashedFuncs = digest{}, 0
+			mod.Types.hashed, mod.Funcs.hashed = digest{}, digest{}
+			benchDigest = mod.Digest()
+		}
+	})
+	b.Run("Incremental", func(b *testing.B) {
+		mod := benchModule(numFuncs)
+		code := benchCode(1)[0]
+		mod.Digest()
+		b.ReportAllocs()
+		b.ResetTimer()
+		for i := 0; i < b.N; i++ {
+			mod.AddFunc(0, code)
+			benchDigest = mod.Digest()
+		}
+	})
+}
+
+var benchDigest uint64
+
+// BenchmarkNameSection measures naming 100,000 functions, each with two
+// locals, and encoding the names.
+func BenchmarkNameSection(b *testing.B) {
+	const n = 100_000
+	fnNames := make([]string, n)
+	for i := range fnNames {
+		fnNames[i] = fmt.Sprintf("pkg.func%d", i)
+	}
+	b.Run("Add", func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			var names NameSection
+			for j, name := range fnNames {
+				names.AddFunc(FuncIdx(j), name)
+				names.AddLocal(FuncIdx(j), 0, "x")
+				names.AddLocal(FuncIdx(j), 1, "y")
+			}
+		}
+	})
+	b.Run("Encode", func(b *testing.B) {
+		var names NameSection
+		for j, name := range fnNames {
+			names.AddFunc(FuncIdx(j), name)
+			names.AddLocal(FuncIdx(j), 0, "x")
+			names.AddLocal(FuncIdx(j), 1, "y")
+		}
+		b.ReportAllocs()
+		b.SetBytes(int64(names.Len()))
+		for i := 0; i < b.N; i++ {
+			names.WriteTo(io.Discard)
+		}
+	})
+}
@@ -1,59 +1,126 @@
 package webassembler
 
-import "bytes"
+import (
+	"encoding/binary"
+	"fmt"
+	"io"
+	"math"
+	"slices"
+)
 
 // A byte buffer extended with methods for writing WASM encodings.
+//
+// Writes append directly to a plain byte slice, so that the small methods
+// used by the generated instruction encoders can be inlined.
 type Buffer struct {
-	buf bytes.Buffer
+	buf []byte
+}
+
+// bufferFrom returns a Buffer that appends to bs.
+func bufferFrom(bs []byte) Buffer {
+	return Buffer{buf: bs}
+}
+
+// share returns a Buffer with the same contents as b. Its capacity is
+// capped, so that its first write copies the contents rather than
+// overwriting bytes beyond them that b may go on to write.
+func (b *Buffer) share() Buffer {
+	return Buffer{buf: slices.Clip(b.buf)}
+}
+
+// reserve ensures capacity for n more bytes, so that appending up to n bytes
+// does not reallocate.
+func (b *Buffer) reserve(n int) {
+	b.buf = slices.Grow(b.buf, n)
 }
 
 func (b *Buffer) Len() int {
-	return b.buf.Len()
+	return len(b.buf)
 }
 
 func (b *Buffer) Bytes() []byte {
-	return b.buf.Bytes()
+	return b.buf
 }
 
 func (b *Buffer) WriteName(s string) {
 	b.WriteU32(U32(len(s)))
-	b.buf.WriteString(s)
+	b.buf = append(b.buf, s...)
 }
 
 func (b *Buffer) WriteRaw(bs []byte) {
-	b.buf.Write(bs)
+	b.buf = append(b.buf, bs...)
 }
 
 func (b *Buffer) WriteRawByte(c byte) {
-	b.buf.WriteByte(c)
+	b.buf = append(b.buf, c)
+}
+
+// writeReaderAt copies n bytes from r into the buffer. Buffer writes cannot
+// fail, so a read error panics; use Module.WriteTo to have it returned.
+func (b *Buffer) writeReaderAt(r io.ReaderAt, n int64) {
+	start := len(b.buf)
+	b.reserve(int(n))
+	b.buf = b.buf[:start+int(n)]
+	if m, err := r.ReadAt(b.buf[start:], 0); m < int(n) {
+		panic(fmt.Errorf("reading data segment: %w", err))
+	}
+}
+
+// writeWriterTo copies the n bytes that wt writes into the buffer. As with
+// writeReaderAt, an error panics.
+func (b *Buffer) writeWriterTo(wt io.WriterTo, n int) {
+	start := len(b.buf)
+	b.reserve(n)
+	_, err := wt.WriteTo((*bufferWriter)(b))
+	if m := len(b.buf) - start; err == nil && m != n {
+		err = fmt.Errorf("wrote %d bytes rather than %d", m, n)
+	}
+	if err != nil {
+		panic(fmt.Errorf("writing custom section: %w", err))
+	}
+}
+
+// A bufferWriter is a Buffer as an io.Writer, which Buffer itself is not, so
+// that its methods are all WASM encodings.
+type bufferWriter Buffer
+
+func (w *bufferWriter) Write(p []byte) (int, error) {
+	w.buf = append(w.buf, p...)
+	return len(p), nil
 }
 
 func (b *Buffer) WriteU32(i U32) {
-	writeUnsignedLEB128(&b.buf, i)
+	b.buf = appendUnsignedLEB128(b.buf, i)
 }
 
 func (b *Buffer) WriteI32(i I32) {
-	writeSignedLEB128(&b.buf, i)
+	b.buf = appendSignedLEB128(b.buf, i)
 }
 
 func (b *Buffer) WriteI64(i I64) {
-	writeSignedLEB128(&b.buf, i)
+	b.buf = appendSignedLEB128(b.buf, i)
 }
 
 func (b *Buffer) WriteF32(f F32) {
-	panic("todo: WriteF32")
+	b.buf = binary.LittleEndian.AppendUint32(b.buf, math.Float32bits(f))
 }
 
 func (b *Buffer) WriteF64(f F64) {
-	panic("todo: WriteF64")
+	b.buf = binary.LittleEndian.AppendUint64(b.buf, math.Float64bits(f))
 }
 
+// WriteI128 writes a v128 immediate. i holds its bytes in little-endian
+// order, as they are laid out in memory.
 func (b *Buffer) WriteI128(i I128) {
-	panic("todo: WriteI128")
+	b.buf = append(b.buf, i[:]...)
 }
 
 func (b *Buffer) WriteLaneShuffle(lanes LaneShuffle) {
-	panic("todo: WriteLaneShuffle")
+	var bs [len(lanes)]byte
+	for i, lane := range lanes {
+		bs[i] = byte(lane)
+	}
+	b.buf = append(b.buf, bs[:]...)
 }
 
 func (b *Buffer) WriteMemArg(mem MemArg) {
@@ -65,14 +132,20 @@ func (b *Buffer) WriteTypeIdx(i TypeIdx) {
 	b.WriteU32(U32(i))
 }
 
+// WriteLaneIdx writes a lane index, which unlike other indices is a single
+// byte.
 func (b *Buffer) WriteLaneIdx(i LaneIdx) {
-	b.WriteU32(U32(i))
+	b.WriteRawByte(byte(i))
 }
 
 func (b *Buffer) WriteLabelIdx(i LabelIdx) {
 	b.WriteU32(U32(i))
 }
 
+func (b *Buffer) WriteLabelVec(labels LabelVec) {
+	writeVec(b, labels)
+}
+
 func (b *Buffer) WriteLocalIdx(i LocalIdx) {
 	b.WriteU32(U32(i))
 }
@@ -125,6 +198,10 @@ func (b *Buffer) WriteValType(typ ValType) {
 	b.WriteRawByte(byte(typ))
 }
 
+func (b *Buffer) WriteResultType(rt ResultType) {
+	writeVec(b, rt)
+}
+
 func (b *Buffer) WriteBool(value bool) {
 	if value {
 		b.WriteRawByte(1)
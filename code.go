@@ -1,8 +1,17 @@
 package webassembler
 
+import (
+	"slices"
+	"sync"
+)
+
 // Code provides an instruction encoder encapsulating local variables with an expression.
 type Code struct {
 	Expr
+
+	// Whether the body's array is shared with a CodeCache or a Template,
+	// so must not be written into by Reset or reused by the pool.
+	shared bool
 }
 
 func NewCode(locals ...LocalType) *Code {
@@ -12,6 +21,50 @@ func NewCode(locals ...LocalType) *Code {
 	return c
 }
 
+// Reset empties the body, keeping the capacity it has grown to, and begins it
+// with locals as NewCode does. Stats and recording mode are kept. A body
+// returned by CodeCache.Get, or added to a module since frozen, shares its
+// bytes with the cache or template, so it is given a new buffer instead.
+func (c *Code) Reset(locals ...LocalType) {
+	if c.shared {
+		c.buf.buf, c.shared = nil, false
+	}
+	c.buf.buf = c.buf.buf[:0]
+	if c.ir != nil {
+		*c.ir = exprIR{ops: c.ir.ops[:0], imms: c.ir.imms[:0]}
+	}
+	writeVec(&c.buf, locals)
+}
+
+// AcquireCode is like NewCode, but reuses a body returned by Release when
+// one is available, so that building many functions needn't allocate and
+// grow a buffer for each.
+func AcquireCode(locals ...LocalType) *Code {
+	c := codePool.Get().(*Code)
+	c.Reset(locals...)
+	return c
+}
+
+// Release returns the body to the pool used by AcquireCode. Sections retain
+// bodies by reference, so a body may only be released once it is no longer
+// needed by any module or cache it was added to: after the last time they
+// are encoded. The body must not be used afterwards.
+func (c *Code) Release() {
+	if c.shared || cap(c.buf.buf) > maxPooledCode {
+		return
+	}
+	*c = Code{Expr: Expr{buf: c.buf}}
+	codePool.Put(c)
+}
+
+// Bodies that grew larger than this are left to the garbage collector
+// rather than pinned in the pool.
+const maxPooledCode = 1 << 16
+
+var codePool = sync.Pool{
+	New: func() any { return &Code{} },
+}
+
 type LocalType struct {
 	N    U32
 	Type TypeIdx
@@ -23,28 +76,225 @@ func (lt LocalType) emit(buf *Buffer) {
 }
 
 type CodeSection struct {
-	n     U32
-	buf   Buffer
 	funcs []*Code
+	// Encoded size of all function bodies, including their length prefixes,
+	// except for those still pending.
+	size int
+	// Reserved slots whose bodies are not yet accounted for in size.
+	pending []CodeIdx
+
+	// In incremental mode, layout holds the offset of each body within the
+	// section contents as last emitted, and edits maps each body replaced
+	// since then to the encoded size of the body it replaced.
+	incremental bool
+	layout      []int
+	edits       map[CodeIdx]int
+
+	// Whether bodies are rewritten with Code.Peephole as they are supplied.
+	peephole bool
+
+	// Whether funcs is shared with modules cloned from a Template, so must
+	// be copied before bodies are replaced in place.
+	sharedFuncs bool
+
+	// Digest of the leading hashedFuncs bodies, with their length prefixes,
+	// extended by Module.Digest.
+	hashed      digest
+	hashedFuncs int
+
+	// Receives counts of added bodies when non-nil.
+	stats *Stats
 }
 
 func (sec *CodeSection) SectionID() SectionID {
 	return CodeSectionID
 }
 
+// Size settles the section, so panics if a reserved slot is undefined.
 func (sec *CodeSection) Size() int {
-	return unsignedLEB128Size(sec.n) + sec.buf.Len()
+	sec.settle()
+	return unsignedLEB128Size(U32(len(sec.funcs))) + sec.size
 }
 
-func (sec *CodeSection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *CodeSection) emitContents(w sectionWriter) {
+	n := U32(len(sec.funcs))
+	w.WriteU32(n)
+	// While replacements are pending, the layout is kept as the encoding
+	// they will be spliced into, unless there is none to keep, in which
+	// case this encoding includes them and becomes the one to splice into.
+	record := sec.incremental && (len(sec.edits) == 0 || !sec.laidOut())
+	if record {
+		sec.layout = sec.layout[:0]
+		clear(sec.edits)
+	}
+	offset := unsignedLEB128Size(n)
+	for _, code := range sec.funcs {
+		body := code.buf.Bytes()
+		w.WriteU32(U32(len(body)))
+		w.WriteRaw(body)
+		if record {
+			sec.layout = append(sec.layout, offset)
+			offset += encodedBodySize(code)
+		}
+	}
 }
 
+// encodedBodySize returns the size of code in the section, including its
+// length prefix.
+func encodedBodySize(code *Code) int {
+	n := code.buf.Len()
+	return unsignedLEB128Size(U32(n)) + n
+}
+
+// Add appends a function body to the section. The body is retained by
+// reference, not copied, so code must not be modified after it is added.
 func (sec *CodeSection) Add(code *Code) CodeIdx {
-	i := sec.n
-	sec.n++
-	sec.buf.WriteU32(U32(code.buf.Len()))
-	sec.buf.WriteRaw(code.buf.Bytes())
+	code = sec.optimize(code)
+	i := len(sec.funcs)
+	sec.funcs = append(sec.funcs, code)
+	if code.ir != nil {
+		// Recorded bodies are encoded when the section is next sized.
+		sec.pending = append(sec.pending, CodeIdx(i))
+		return CodeIdx(i)
+	}
+	sec.size += encodedBodySize(code)
+	if sec.stats != nil {
+		sec.stats.recordBody(code)
+	}
 	return CodeIdx(i)
 }
+
+// Reserve appends an empty slot for a function body to be supplied later
+// with Define.
+func (sec *CodeSection) Reserve() CodeIdx {
+	i := len(sec.funcs)
+	sec.funcs = append(sec.funcs, nil)
+	sec.pending = append(sec.pending, CodeIdx(i))
+	return CodeIdx(i)
+}
+
+// Define supplies the body for a slot returned by Reserve. It is safe to
+// call concurrently for distinct slots, but not concurrently with any other
+// method of the section. As with Add, code is retained by reference.
+func (sec *CodeSection) Define(idx CodeIdx, code *Code) {
+	if sec.funcs[idx] != nil {
+		panic("code already defined")
+	}
+	sec.funcs[idx] = sec.optimize(code)
+}
+
+// settle accounts for the bodies of reserved slots, all of which must have
+// been defined by now.
+func (sec *CodeSection) settle() {
+	for _, idx := range sec.pending {
+		code := sec.funcs[idx]
+		if code == nil {
+			panic("reserved code was never defined")
+		}
+		code.flush()
+		sec.size += encodedBodySize(code)
+		if sec.stats != nil {
+			sec.stats.recordBody(code)
+		}
+	}
+	sec.pending = sec.pending[:0]
+}
+
+// EnableIncremental makes the section record where each body is placed
+// when the module is encoded, so that Module.Splice can later patch that
+// encoding with bodies replaced by ReplaceBody.
+func (sec *CodeSection) EnableIncremental() {
+	sec.incremental = true
+	if sec.edits == nil {
+		sec.edits = make(map[CodeIdx]int)
+	}
+}
+
+// EnablePeephole makes the section simplify bodies with Code.Peephole as
+// they are added, defined or replaced.
+func (sec *CodeSection) EnablePeephole() {
+	sec.peephole = true
+}
+
+func (sec *CodeSection) optimize(code *Code) *Code {
+	if sec.peephole {
+		return code.Peephole()
+	}
+	return code
+}
+
+// ReplaceBody replaces a previously added function body. As with Add, code
+// is retained by reference.
+func (sec *CodeSection) ReplaceBody(idx CodeIdx, code *Code) {
+	code = sec.optimize(code)
+	code.flush()
+	sec.settle()
+	old := encodedBodySize(sec.funcs[idx])
+	if _, ok := sec.edits[idx]; !ok && sec.incremental {
+		sec.edits[idx] = old
+	}
+	if int(idx) < sec.hashedFuncs {
+		sec.hashed, sec.hashedFuncs = digest{}, 0
+	}
+	if sec.sharedFuncs {
+		sec.funcs = slices.Clone(sec.funcs)
+		sec.sharedFuncs = false
+	}
+	sec.funcs[idx] = code
+	sec.size += encodedBodySize(code) - old
+}
+
+// laidOut reports whether the layout covers every body in the section.
+func (sec *CodeSection) laidOut() bool {
+	return len(sec.layout) == len(sec.funcs)
+}
+
+// splice patches prev, in which this section's header begins at start, with
+// the bodies replaced since it was emitted.
+func (sec *CodeSection) splice(prev []byte, start int) []byte {
+	idxs := make([]CodeIdx, 0, len(sec.edits))
+	inPlace := true
+	for idx, old := range sec.edits {
+		idxs = append(idxs, idx)
+		inPlace = inPlace && old == encodedBodySize(sec.funcs[idx])
+	}
+	slices.Sort(idxs)
+
+	oldSize, n := readUnsignedLEB128(prev[start+1:])
+	contents := start + 1 + n
+	out := prev
+	if !inPlace {
+		// Copy the runs between replaced bodies into a new encoding.
+		out = make([]byte, 0, len(prev)+sec.Size()-int(oldSize)+unsignedLEB128Size(U32(sec.Size()))-n)
+		out = append(out, prev[:start+1]...)
+		out = appendUnsignedLEB128(out, U32(sec.Size()))
+	}
+	pos := contents
+	for _, idx := range idxs {
+		offset := contents + sec.layout[idx]
+		body := sec.funcs[idx].buf.Bytes()
+		if inPlace {
+			prefix := appendUnsignedLEB128(prev[offset:offset], U32(len(body)))
+			copy(prev[offset+len(prefix):], body)
+			continue
+		}
+		out = append(out, prev[pos:offset]...)
+		out = appendUnsignedLEB128(out, U32(len(body)))
+		out = append(out, body...)
+		pos = offset + sec.edits[idx]
+	}
+	if !inPlace {
+		out = append(out, prev[pos:]...)
+	}
+
+	// Shift the layout of bodies after the first replacement.
+	if len(idxs) > 0 && !inPlace {
+		offset := sec.layout[idxs[0]]
+		for i := int(idxs[0]); i < len(sec.funcs); i++ {
+			sec.layout[i] = offset
+			offset += encodedBodySize(sec.funcs[i])
+		}
+	}
+	clear(sec.edits)
+	return out
+}
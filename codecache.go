@@ -0,0 +1,181 @@
+package webassembler
+
+import (
+	"container/list"
+	"crypto/sha256"
+	"encoding/hex"
+	"errors"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"sync"
+)
+
+// A CodeKey identifies a function body in a CodeCache. Keys may be derived
+// from a function's source-level identity, or from its encoding with
+// KeyOfCode.
+type CodeKey [sha256.Size]byte
+
+func KeyOfCode(code *Code) CodeKey {
+	code.flush()
+	return sha256.Sum256(code.buf.Bytes())
+}
+
+// CodeCache is a content-addressed cache of encoded function bodies, so
+// that unchanged functions needn't be re-encoded across module builds.
+// Memory use is bounded, with least recently used bodies evicted first.
+// A cache opened on a directory also persists bodies there.
+//
+// A CodeCache is safe for concurrent use.
+type CodeCache struct {
+	mu       sync.Mutex
+	maxBytes int
+	dir      string
+	entries  map[CodeKey]*list.Element
+	lru      list.List // Most recently used first.
+	stats    CodeCacheStats
+}
+
+type codeCacheEntry struct {
+	key  CodeKey
+	body []byte
+}
+
+type CodeCacheStats struct {
+	Hits      uint64
+	Misses    uint64
+	Evictions uint64
+	// Bodies and bytes currently held in memory.
+	Entries int
+	Bytes   int
+}
+
+// NewCodeCache returns an in-memory cache holding up to maxBytes of
+// encoded bodies.
+func NewCodeCache(maxBytes int) *CodeCache {
+	return &CodeCache{
+		maxBytes: maxBytes,
+		entries:  make(map[CodeKey]*list.Element),
+	}
+}
+
+// OpenCodeCache returns a cache that additionally persists bodies as files
+// in dir, creating it if needed. Bodies evicted from memory are reloaded
+// from dir on demand. The directory itself is not bounded.
+func OpenCodeCache(dir string, maxBytes int) (*CodeCache, error) {
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		return nil, err
+	}
+	cc := NewCodeCache(maxBytes)
+	cc.dir = dir
+	return cc, nil
+}
+
+// Get returns the cached body for key. The returned Code shares the cached
+// bytes and may be passed directly to Module.AddFunc or CodeSection.Add,
+// but must not be modified.
+func (cc *CodeCache) Get(key CodeKey) (*Code, bool) {
+	cc.mu.Lock()
+	defer cc.mu.Unlock()
+	if elem, ok := cc.entries[key]; ok {
+		cc.lru.MoveToFront(elem)
+		cc.stats.Hits++
+		return cachedCode(elem.Value.(*codeCacheEntry).body), true
+	}
+	if cc.dir != "" {
+		body, err := os.ReadFile(cc.path(key))
+		if err == nil {
+			cc.insert(key, body)
+			cc.stats.Hits++
+			return cachedCode(body), true
+		}
+	}
+	cc.stats.Misses++
+	return nil, false
+}
+
+// Put caches the encoded body of code under key. The error, if any, is
+// from persisting the body; it is cached in memory regardless.
+func (cc *CodeCache) Put(key CodeKey, code *Code) error {
+	code.flush()
+	body := append([]byte(nil), code.buf.Bytes()...)
+	cc.mu.Lock()
+	if elem, ok := cc.entries[key]; ok {
+		cc.remove(elem)
+	}
+	cc.insert(key, body)
+	cc.mu.Unlock()
+
+	if cc.dir == "" {
+		return nil
+	}
+	// Write then rename, so that concurrent readers never see a partial
+	// file.
+	tmp, err := os.CreateTemp(cc.dir, "tmp-*")
+	if err != nil {
+		return err
+	}
+	_, err = tmp.Write(body)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), cc.path(key))
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+	}
+	return err
+}
+
+// Remove drops key from the cache, including its persisted copy.
+func (cc *CodeCache) Remove(key CodeKey) error {
+	cc.mu.Lock()
+	if elem, ok := cc.entries[key]; ok {
+		cc.remove(elem)
+	}
+	cc.mu.Unlock()
+	if cc.dir == "" {
+		return nil
+	}
+	if err := os.Remove(cc.path(key)); err != nil && !errors.Is(err, fs.ErrNotExist) {
+		return err
+	}
+	return nil
+}
+
+func (cc *CodeCache) Stats() CodeCacheStats {
+	cc.mu.Lock()
+	defer cc.mu.Unlock()
+	return cc.stats
+}
+
+func (cc *CodeCache) insert(key CodeKey, body []byte) {
+	if len(body) > cc.maxBytes {
+		return
+	}
+	for cc.stats.Bytes+len(body) > cc.maxBytes {
+		cc.remove(cc.lru.Back())
+		cc.stats.Evictions++
+	}
+	cc.entries[key] = cc.lru.PushFront(&codeCacheEntry{key, body})
+	cc.stats.Entries++
+	cc.stats.Bytes += len(body)
+}
+
+func (cc *CodeCache) remove(elem *list.Element) {
+	entry := cc.lru.Remove(elem).(*codeCacheEntry)
+	delete(cc.entries, entry.key)
+	cc.stats.Entries--
+	cc.stats.Bytes -= len(entry.body)
+}
+
+func (cc *CodeCache) path(key CodeKey) string {
+	return filepath.Join(cc.dir, hex.EncodeToString(key[:]))
+}
+
+// cachedCode wraps a shared body. Capping its capacity makes any append
+// reallocate rather than write into the cache.
+func cachedCode(body []byte) *Code {
+	return &Code{Expr: Expr{buf: Buffer{buf: body[:len(body):len(body)]}}, shared: true}
+}
@@ -0,0 +1,68 @@
+package webassembler
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func constCode(i I32) *Code {
+	code := NewCode()
+	code.I32_Const(i)
+	code.End()
+	return code
+}
+
+func TestCodeCache(t *testing.T) {
+	a, b, c := constCode(1), constCode(2), constCode(3)
+	size := a.buf.Len()
+
+	cc := NewCodeCache(2 * size)
+	assert.NoError(t, cc.Put(KeyOfCode(a), a))
+	assert.NoError(t, cc.Put(KeyOfCode(b), b))
+
+	// Touch a, so that b is evicted by c.
+	got, ok := cc.Get(KeyOfCode(a))
+	assert.True(t, ok)
+	assert.Equal(t, a.buf.Bytes(), got.buf.Bytes())
+	assert.NoError(t, cc.Put(KeyOfCode(c), c))
+	_, ok = cc.Get(KeyOfCode(b))
+	assert.False(t, ok)
+
+	assert.Equal(t, CodeCacheStats{
+		Hits:      1,
+		Misses:    1,
+		Evictions: 1,
+		Entries:   2,
+		Bytes:     2 * size,
+	}, cc.Stats())
+
+	// Cached bodies can be added directly.
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	got, _ = cc.Get(KeyOfCode(c))
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, got))
+	assert.Equal(t, 3, runInt(t, mod))
+}
+
+func TestCodeCachePersistence(t *testing.T) {
+	dir := t.TempDir()
+	a := constCode(1)
+	key := KeyOfCode(a)
+
+	cc, err := OpenCodeCache(dir, 1<<20)
+	assert.NoError(t, err)
+	assert.NoError(t, cc.Put(key, a))
+
+	cc, err = OpenCodeCache(dir, 1<<20)
+	assert.NoError(t, err)
+	got, ok := cc.Get(key)
+	assert.True(t, ok)
+	assert.Equal(t, a.buf.Bytes(), got.buf.Bytes())
+
+	assert.NoError(t, cc.Remove(key))
+	cc, err = OpenCodeCache(dir, 1<<20)
+	assert.NoError(t, err)
+	_, ok = cc.Get(key)
+	assert.False(t, ok)
+}
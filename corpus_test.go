@@ -0,0 +1,323 @@
+package webassembler
+
+import (
+	"fmt"
+	"math"
+	"math/rand"
+	"slices"
+	"strings"
+	"testing"
+
+	"github.com/tetratelabs/wazero"
+)
+
+// A corpusShape configures the modules made by genModule.
+type corpusShape struct {
+	Name string
+	// Number of functions, and of instructions in each body.
+	Funcs, BodySize int
+	// Relative frequencies of instructions, keyed by their name up to the
+	// first dot, as in index.csv: "i32", "f64x2", "localget", "call" and so
+	// on. Unlisted instructions are never chosen, and a nil Mix chooses
+	// among all instructions equally.
+	Mix map[string]int
+	// Bytes of data in an active segment.
+	DataSize int
+}
+
+var corpusShapes = []corpusShape{
+	{Name: "Scalar", Funcs: 1000, BodySize: 64, Mix: map[string]int{
+		"i32": 8, "i64": 4, "f32": 1, "f64": 2, "localget": 4, "localset": 2, "localtee": 1, "call": 1, "select": 1,
+	}},
+	{Name: "Uniform", Funcs: 200, BodySize: 256, DataSize: 64 << 10},
+	{Name: "Large", Funcs: 20, BodySize: 20_000, Mix: map[string]int{
+		"i32": 4, "i64": 2, "v128": 1, "i8x16": 1, "i32x4": 1, "f64x2": 1, "localget": 2, "localset": 1,
+	}},
+}
+
+// corpusLocals are the locals declared by generated bodies, one of each
+// type in index order.
+var corpusLocals = [...]ValType{TypeI32, TypeI64, TypeF32, TypeF64, TypeV128}
+
+// genModule returns a valid module of the given shape, made
+// deterministically from seed. Instructions are chosen by their stack
+// effects in the decoder tables: operands are pushed as constants unless
+// the stack already holds them, and excess results are dropped. Every
+// function has type [] -> [], and any may be called.
+func genModule(seed int64, shape corpusShape) *Module {
+	rng := rand.New(rand.NewSource(seed))
+	var ops []opcode
+	var weights []int
+	total := 0
+	for op := opcode(1); op < numOpcodes; op++ {
+		name := opcodeNames[op]
+		weight := 1
+		if shape.Mix != nil {
+			weight = shape.Mix[strings.SplitN(name, ".", 2)[0]]
+		}
+		if weight > 0 && corpusOp(op) {
+			ops = append(ops, op)
+			weights = append(weights, weight)
+			total += weight
+		}
+	}
+
+	mod := NewModule()
+	pages := U32(shape.DataSize>>16) + 1
+	mod.AddMemory(MemType{MakeLimits(pages, pages+1)})
+	if shape.DataSize > 0 {
+		data := make([]byte, shape.DataSize)
+		rng.Read(data)
+		mod.Data.AddActive(0, 0, data)
+	}
+	typeIdx := mod.Types.AddFunc(nil, nil)
+	locals := make([]LocalType, len(corpusLocals))
+	for i, typ := range corpusLocals {
+		locals[i] = LocalType{1, TypeIdx(typ)}
+	}
+	for f := 0; f < shape.Funcs; f++ {
+		g := corpusGen{rng: rng, numFuncs: shape.Funcs, code: NewCode(locals...)}
+		g.code.EnableRecording()
+		for len(g.code.ir.ops) < shape.BodySize {
+			i, w := 0, rng.Intn(total)
+			for w >= weights[i] {
+				w -= weights[i]
+				i++
+			}
+			g.emit(ops[i])
+		}
+		for range g.stack {
+			g.code.Drop()
+		}
+		g.code.End()
+		mod.AddFunc(typeIdx, g.code)
+	}
+	mod.ExportFunc("_start", 0)
+	return mod
+}
+
+// corpusOp reports whether genModule can generate op: it is not a block
+// delimiter, has a fixed stack effect over numeric and vector types, and
+// has immediates that need no other definitions than a memory and locals.
+// Calls are the exception, as every function has the same type.
+func corpusOp(op opcode) bool {
+	info := &opcodeInfos[op]
+	switch {
+	case op == opCall:
+		return true
+	case op == opElse, op == opEnd, op == opDrop, op == opRefisnull, info.polymorphic:
+		return false
+	}
+	for _, kind := range info.imm {
+		switch kind {
+		case immNone, immMemArg, immI32, immI64, immF32, immF64, immV128, immLane, immShuffle, immLocal, immZero:
+		default:
+			return false
+		}
+	}
+	for _, types := range [][]ValType{info.in, info.out} {
+		for _, typ := range types {
+			if typ == TypeFuncRef || typ == TypeExternRef {
+				return false
+			}
+		}
+	}
+	return true
+}
+
+// A corpusGen generates one body, tracking the types on its stack.
+type corpusGen struct {
+	rng      *rand.Rand
+	numFuncs int
+	code     *Code
+	stack    []ValType
+}
+
+func (g *corpusGen) emit(op opcode) {
+	info := &opcodeInfos[op]
+	typ := g.anyType(info.in)
+	in, out := bindAny(info.in, typ), bindAny(info.out, typ)
+	if !g.onStack(in) {
+		for _, typ := range in {
+			g.push(typ)
+		}
+	}
+	g.instr(op, typ)
+	g.stack = append(g.stack[:len(g.stack)-len(in)], out...)
+	if len(g.stack) > 8 {
+		for len(g.stack) > 4 {
+			g.code.Drop()
+			g.stack = g.stack[:len(g.stack)-1]
+		}
+	}
+}
+
+// anyType returns the type to stand for typeAny in an instruction with
+// operands in: that of the operand the stack holds in the first such
+// position, or else a random type.
+func (g *corpusGen) anyType(in []ValType) ValType {
+	if p := slices.Index(in, typeAny); p >= 0 {
+		if i := len(g.stack) - len(in) + p; i >= 0 {
+			return g.stack[i]
+		}
+	}
+	return corpusLocals[g.rng.Intn(len(corpusLocals))]
+}
+
+func bindAny(types []ValType, typ ValType) []ValType {
+	if !slices.Contains(types, typeAny) {
+		return types
+	}
+	bound := slices.Clone(types)
+	for i := range bound {
+		if bound[i] == typeAny {
+			bound[i] = typ
+		}
+	}
+	return bound
+}
+
+func (g *corpusGen) onStack(in []ValType) bool {
+	if len(in) > len(g.stack) {
+		return false
+	}
+	for i, typ := range in {
+		if g.stack[len(g.stack)-len(in)+i] != typ {
+			return false
+		}
+	}
+	return true
+}
+
+func (g *corpusGen) push(typ ValType) {
+	switch typ {
+	case TypeI32:
+		g.instr(opI32_Const, typ)
+	case TypeI64:
+		g.instr(opI64_Const, typ)
+	case TypeF32:
+		g.instr(opF32_Const, typ)
+	case TypeF64:
+		g.instr(opF64_Const, typ)
+	case TypeV128:
+		g.instr(opV128_Vconst, typ)
+	}
+	g.stack = append(g.stack, typ)
+}
+
+// instr records op with random immediates. Local indices are those of
+// the local of type typ.
+func (g *corpusGen) instr(op opcode, typ ValType) {
+	ir := g.code.ir
+	ir.ops = append(ir.ops, op)
+	for _, kind := range opcodeInfos[op].imm {
+		switch kind {
+		case immMemArg:
+			ir.WriteMemArg(MemArg{Offset: U32(g.rng.Intn(256))})
+		case immI32:
+			ir.WriteI32(I32(g.rng.Uint32()))
+		case immI64:
+			ir.WriteI64(I64(g.rng.Uint64()))
+		case immF32:
+			ir.WriteF32(F32(g.rng.NormFloat64()))
+		case immF64:
+			ir.WriteF64(F64(math.Float64frombits(g.rng.Uint64())))
+		case immV128:
+			var v I128
+			g.rng.Read(v[:])
+			ir.WriteI128(v)
+		case immLane:
+			ir.WriteLaneIdx(LaneIdx(g.rng.Intn(int(maxLane(opcodeNames[op])) + 1)))
+		case immShuffle:
+			var lanes LaneShuffle
+			for i := range lanes {
+				lanes[i] = LaneIdx(g.rng.Intn(32))
+			}
+			ir.WriteLaneShuffle(lanes)
+		case immLocal:
+			for i, local := range corpusLocals {
+				if local == typ {
+					ir.WriteLocalIdx(LocalIdx(i))
+				}
+			}
+		case immFunc:
+			ir.WriteFuncIdx(FuncIdx(g.rng.Intn(g.numFuncs)))
+		}
+	}
+}
+
+// TestCorpus checks that generated modules of every shape are valid, and
+// that generation is deterministic.
+func TestCorpus(t *testing.T) {
+	ctx := t.Context()
+	rt := wazero.NewRuntime(ctx)
+	defer rt.Close(ctx)
+	for _, shape := range corpusShapes {
+		shape.Funcs = min(shape.Funcs, 10)
+		bin := genModule(1, shape).Bytes()
+		if _, err := rt.CompileModule(ctx, bin); err != nil {
+			t.Fatalf("%s: %v", shape.Name, err)
+		}
+		if string(bin) != string(genModule(1, shape).Bytes()) {
+			t.Errorf("%s: generation is not deterministic", shape.Name)
+		}
+	}
+}
+
+// BenchmarkPipeline measures each stage of the path from a finished module
+// to a running instance, over the corpus shapes: encoding it with Bytes,
+// then compiling and instantiating the encoding with wazero. Throughput is
+// reported in modules and encoded MB per second.
+func BenchmarkPipeline(b *testing.B) {
+	for _, shape := range corpusShapes {
+		mod := genModule(1, shape)
+		bin := mod.Bytes()
+		report := func(b *testing.B) {
+			b.ReportMetric(float64(b.N)/b.Elapsed().Seconds(), "modules/s")
+		}
+		b.Run(fmt.Sprintf("Assemble/%s", shape.Name), func(b *testing.B) {
+			b.ReportAllocs()
+			b.SetBytes(int64(len(bin)))
+			for i := 0; i < b.N; i++ {
+				benchSink = mod.Bytes()
+			}
+			report(b)
+		})
+		b.Run(fmt.Sprintf("Compile/%s", shape.Name), func(b *testing.B) {
+			ctx := b.Context()
+			rt := wazero.NewRuntime(ctx)
+			defer rt.Close(ctx)
+			b.ReportAllocs()
+			b.SetBytes(int64(len(bin)))
+			for i := 0; i < b.N; i++ {
+				compiled, err := rt.CompileModule(ctx, bin)
+				if err != nil {
+					b.Fatal(err)
+				}
+				compiled.Close(ctx)
+			}
+			report(b)
+		})
+		b.Run(fmt.Sprintf("Instantiate/%s", shape.Name), func(b *testing.B) {
+			ctx := b.Context()
+			rt := wazero.NewRuntime(ctx)
+			defer rt.Close(ctx)
+			compiled, err := rt.CompileModule(ctx, bin)
+			if err != nil {
+				b.Fatal(err)
+			}
+			defer compiled.Close(ctx)
+			b.ReportAllocs()
+			b.SetBytes(int64(len(bin)))
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				inst, err := rt.InstantiateModule(ctx, compiled, wazero.NewModuleConfig().WithName(""))
+				if err != nil {
+					b.Fatal(err)
+				}
+				inst.Close(ctx)
+			}
+			report(b)
+		})
+	}
+}
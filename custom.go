@@ -0,0 +1,43 @@
+package webassembler
+
+import "io"
+
+// CustomContents supplies the contents of a custom section when the module
+// is encoded, rather than when the section is added. Len must be cheap, as
+// it is called whenever the module is sized, and WriteTo must write exactly
+// Len bytes.
+type CustomContents interface {
+	io.WriterTo
+	Len() int
+}
+
+// A CustomSection is a named section of arbitrary contents, which the
+// runtime ignores, such as debugging information.
+type CustomSection struct {
+	// Encoded name, with its length prefix.
+	name     []byte
+	contents CustomContents
+}
+
+// AddCustom appends a custom section to the module, after those already
+// in it. The contents are not read until the module is encoded.
+func (mod *Module) AddCustom(name string, contents CustomContents) *CustomSection {
+	var buf Buffer
+	buf.WriteName(name)
+	sec := &CustomSection{name: buf.Bytes(), contents: contents}
+	mod.Sections = append(mod.Sections, sec)
+	return sec
+}
+
+func (sec *CustomSection) SectionID() SectionID {
+	return CustomSectionID
+}
+
+func (sec *CustomSection) Size() int {
+	return len(sec.name) + sec.contents.Len()
+}
+
+func (sec *CustomSection) emitContents(w sectionWriter) {
+	w.WriteRaw(sec.name)
+	w.writeWriterTo(sec.contents, sec.contents.Len())
+}
@@ -0,0 +1,159 @@
+package webassembler
+
+import "io"
+
+// DataSection holds data segments by reference. Segment contents are either
+// caller-owned slices, which may be memory-mapped files, or io.ReaderAt
+// sources, which are only read while the module is emitted. Either way,
+// contents are not buffered by the section, and Module.WriteTo streams them
+// to its destination without copying them into memory first.
+type DataSection struct {
+	segments []dataSegment
+	// Encoded size of all segments.
+	size int
+
+	// Digest of the leading hashedSegs segments, all slice-backed, extended
+	// by Module.Digest.
+	hashed     digest
+	hashedSegs int
+}
+
+type dataSegment struct {
+	// Encoded mode, memory index, offset expression and content length.
+	header []byte
+	// Contents, from exactly one of data or r.
+	data []byte
+	r    io.ReaderAt
+	n    int64
+
+	// Placement of active segments.
+	active bool
+	mem    MemIdx
+	offset U32
+}
+
+func (sec *DataSection) SectionID() SectionID {
+	return DataSectionID
+}
+
+func (sec *DataSection) Size() int {
+	if len(sec.segments) == 0 {
+		return 0
+	}
+	return unsignedLEB128Size(U32(len(sec.segments))) + sec.size
+}
+
+func (sec *DataSection) emitContents(w sectionWriter) {
+	w.WriteU32(U32(len(sec.segments)))
+	for _, seg := range sec.segments {
+		w.WriteRaw(seg.header)
+		if seg.r != nil {
+			w.writeReaderAt(seg.r, seg.n)
+		} else {
+			w.WriteRaw(seg.data)
+		}
+	}
+}
+
+// AddActive adds a segment that is copied into memory at offset when the
+// module is instantiated. data is retained by reference and must not be
+// modified until the module has been emitted.
+func (sec *DataSection) AddActive(mem MemIdx, offset U32, data []byte) DataIdx {
+	return sec.add(newActiveSegment(mem, offset, data, nil, int64(len(data))))
+}
+
+// AddActiveReader is like AddActive, but the n bytes of contents are read
+// from r when the module is emitted.
+func (sec *DataSection) AddActiveReader(mem MemIdx, offset U32, r io.ReaderAt, n int64) DataIdx {
+	return sec.add(newActiveSegment(mem, offset, nil, r, n))
+}
+
+// AddPassive adds a segment for use with memory.init. As with AddActive,
+// data is retained by reference.
+func (sec *DataSection) AddPassive(data []byte) DataIdx {
+	return sec.add(newPassiveSegment(data, nil, int64(len(data))))
+}
+
+// AddPassiveReader is like AddPassive, but the n bytes of contents are read
+// from r when the module is emitted.
+func (sec *DataSection) AddPassiveReader(r io.ReaderAt, n int64) DataIdx {
+	return sec.add(newPassiveSegment(nil, r, n))
+}
+
+func (sec *DataSection) add(seg dataSegment) DataIdx {
+	idx := len(sec.segments)
+	sec.segments = append(sec.segments, seg)
+	sec.size += seg.size()
+	return DataIdx(idx)
+}
+
+func newActiveSegment(mem MemIdx, offset U32, data []byte, r io.ReaderAt, n int64) dataSegment {
+	return dataSegment{
+		header: activeSegmentHeader(mem, offset, int(n)),
+		data:   data,
+		r:      r,
+		n:      n,
+		active: true,
+		mem:    mem,
+		offset: offset,
+	}
+}
+
+func newPassiveSegment(data []byte, r io.ReaderAt, n int64) dataSegment {
+	return dataSegment{
+		header: passiveSegmentHeader(int(n)),
+		data:   data,
+		r:      r,
+		n:      n,
+	}
+}
+
+func (seg *dataSegment) size() int {
+	return len(seg.header) + int(seg.n)
+}
+
+func activeSegmentHeader(mem MemIdx, offset U32, n int) []byte {
+	var buf Buffer
+	if mem == 0 {
+		buf.WriteRawByte(0x00)
+	} else {
+		buf.WriteRawByte(0x02)
+		buf.WriteU32(U32(mem))
+	}
+	var offsetExpr Expr
+	offsetExpr.I32_Const(I32(offset))
+	offsetExpr.End()
+	buf.WriteRaw(offsetExpr.buf.Bytes())
+	buf.WriteU32(U32(n))
+	return buf.Bytes()
+}
+
+func passiveSegmentHeader(n int) []byte {
+	var buf Buffer
+	buf.WriteRawByte(0x01)
+	buf.WriteU32(U32(n))
+	return buf.Bytes()
+}
+
+// DataCountSection declares the number of data segments, which validation
+// requires before code that refers to segments. NewModule links it to the
+// module's data section, so it is emitted automatically whenever there are
+// segments.
+type DataCountSection struct {
+	data *DataSection
+}
+
+func (sec *DataCountSection) SectionID() SectionID {
+	return DataCountSectionID
+}
+
+func (sec *DataCountSection) Size() int {
+	if sec.data == nil || len(sec.data.segments) == 0 {
+		return 0
+	}
+	return unsignedLEB128Size(U32(len(sec.data.segments)))
+}
+
+func (sec *DataCountSection) emitContents(w sectionWriter) {
+	w.WriteU32(U32(len(sec.data.segments)))
+}
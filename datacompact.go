@@ -0,0 +1,170 @@
+package webassembler
+
+import (
+	"bytes"
+	"cmp"
+	"encoding/binary"
+	"slices"
+)
+
+// compact rewrites the section's active segments as described by
+// Module.CompactData. Memories with indices below numImportedMems are
+// imported, so may not start zeroed.
+func (sec *DataSection) compact(numImportedMems U32, minZeroRun int) {
+	// Segments up to the last passive one keep their indices.
+	first := 0
+	for i, seg := range sec.segments {
+		if !seg.active {
+			first = i + 1
+		}
+	}
+	overlapping := overlappingMems(sec.segments)
+
+	segs := slices.Clone(sec.segments[:first])
+	var last *compactSegment
+	for _, seg := range sec.segments[first:] {
+		if !seg.active || seg.r != nil || U32(seg.mem) < numImportedMems || overlapping[seg.mem] {
+			if last != nil {
+				segs = append(segs, last.segment())
+				last = nil
+			}
+			segs = append(segs, seg)
+			continue
+		}
+		for _, span := range splitZeroRuns(seg.data, seg.mem, seg.offset, minZeroRun) {
+			offset := seg.offset + U32(span[0])
+			data := seg.data[span[0]:span[1]]
+			if last != nil && last.mergeable(seg.mem, offset, len(data)) {
+				last.merge(offset, data)
+				continue
+			}
+			if last != nil {
+				segs = append(segs, last.segment())
+			}
+			last = &compactSegment{mem: seg.mem, offset: offset, data: data}
+		}
+	}
+	if last != nil {
+		segs = append(segs, last.segment())
+	}
+
+	sec.segments = segs
+	sec.hashed, sec.hashedSegs = digest{}, 0
+	sec.size = 0
+	for i := range segs {
+		sec.size += segs[i].size()
+	}
+}
+
+// A compactSegment is an active segment under construction.
+type compactSegment struct {
+	mem    MemIdx
+	offset U32
+	data   []byte
+	// Whether data was allocated by compaction, rather than being a slice of
+	// a caller's segment.
+	owned bool
+}
+
+func (cs *compactSegment) end() U32 {
+	return cs.offset + U32(len(cs.data))
+}
+
+// mergeable reports whether a segment of n bytes at offset should be merged
+// into cs, because the zeros between them cost less than its header.
+func (cs *compactSegment) mergeable(mem MemIdx, offset U32, n int) bool {
+	return mem == cs.mem && offset >= cs.end() &&
+		int(offset-cs.end()) <= activeSegmentHeaderSize(mem, offset, n)
+}
+
+func (cs *compactSegment) merge(offset U32, data []byte) {
+	if !cs.owned {
+		cs.data = slices.Clone(cs.data)
+		cs.owned = true
+	}
+	cs.data = append(cs.data, make([]byte, offset-cs.end())...)
+	cs.data = append(cs.data, data...)
+}
+
+func (cs *compactSegment) segment() dataSegment {
+	return newActiveSegment(cs.mem, cs.offset, cs.data, nil, int64(len(cs.data)))
+}
+
+func activeSegmentHeaderSize(mem MemIdx, offset U32, n int) int {
+	var tmp [5]byte
+	size := 1 // Mode.
+	if mem != 0 {
+		size += unsignedLEB128Size(U32(mem))
+	}
+	size += 2 // i32.const and end.
+	size += len(appendSignedLEB128(tmp[:0], I32(offset)))
+	return size + unsignedLEB128Size(U32(n))
+}
+
+// splitZeroRuns returns the [start, end) spans of data that remain after
+// trimming leading and trailing zeros and cutting out interior runs of at
+// least minZeroRun zeros that are longer than the header of the segment
+// that would follow them.
+func splitZeroRuns(data []byte, mem MemIdx, offset U32, minZeroRun int) [][2]int {
+	var spans [][2]int
+	start := zeroRunEnd(data, 0)
+	i := start
+	for i < len(data) {
+		z := bytes.IndexByte(data[i:], 0)
+		if z < 0 {
+			break
+		}
+		zeros := i + z
+		i = zeroRunEnd(data, zeros)
+		if i == len(data) {
+			// Trailing zeros.
+			spans = append(spans, [2]int{start, zeros})
+			return spans
+		}
+		run := i - zeros
+		if run >= minZeroRun && run > activeSegmentHeaderSize(mem, offset+U32(i), len(data)-i) {
+			spans = append(spans, [2]int{start, zeros})
+			start = i
+		}
+	}
+	if start < len(data) {
+		spans = append(spans, [2]int{start, len(data)})
+	}
+	return spans
+}
+
+// zeroRunEnd returns the index of the first nonzero byte of data at or
+// after i, or len(data) if there is none.
+func zeroRunEnd(data []byte, i int) int {
+	for i+8 <= len(data) && binary.LittleEndian.Uint64(data[i:]) == 0 {
+		i += 8
+	}
+	for i < len(data) && data[i] == 0 {
+		i++
+	}
+	return i
+}
+
+// overlappingMems returns the memories that have overlapping active
+// segments. Since later segments overwrite earlier ones, zeros in those
+// memories are significant.
+func overlappingMems(segs []dataSegment) map[MemIdx]bool {
+	byMem := make(map[MemIdx][][2]int64)
+	for _, seg := range segs {
+		if seg.active {
+			byMem[seg.mem] = append(byMem[seg.mem], [2]int64{int64(seg.offset), int64(seg.offset) + seg.n})
+		}
+	}
+	overlapping := make(map[MemIdx]bool)
+	for mem, spans := range byMem {
+		slices.SortFunc(spans, func(a, b [2]int64) int {
+			return cmp.Compare(a[0], b[0])
+		})
+		for i := 1; i < len(spans); i++ {
+			if spans[i][0] < spans[i-1][1] {
+				overlapping[mem] = true
+			}
+		}
+	}
+	return overlapping
+}
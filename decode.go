@@ -0,0 +1,249 @@
+package webassembler
+
+import "fmt"
+
+// The decoder tables in instructions.go describe each instruction's
+// immediates and operands.
+type opcodeInfo struct {
+	imm [maxImmediates]immKind
+	// Operand types, with typeAny for operands whose type matches another
+	// operand's.
+	in, out []ValType
+	// Whether there are further operands, depending on the immediates or the
+	// enclosing blocks.
+	polymorphic bool
+}
+
+const maxImmediates = 2
+
+const typeAny ValType = 0
+
+// An immKind is the binary layout of an immediate.
+type immKind uint8
+
+const (
+	immNone      immKind = iota
+	immMemArg            // Alignment and offset.
+	immI32               // Signed LEB128.
+	immI64               // Signed LEB128.
+	immF32               // 4 bytes.
+	immF64               // 8 bytes.
+	immV128              // 16 bytes.
+	immLane              // 1 byte.
+	immShuffle           // 16 lane bytes.
+	immLabel             // Unsigned LEB128, like all indices.
+	immLabels            // Vector of labels.
+	immBlockType         // Value type byte, or signed LEB128 type index.
+	immIndex             // Type, table, element or data index.
+	immType              // Type index or reference type.
+	immTypes             // Vector of value type bytes.
+	immLocal
+	immGlobal
+	immFunc
+	immZero // Reserved zero byte.
+)
+
+// An InstrIter walks the instructions of an encoded expression. It only
+// decodes opcodes, skipping over immediates, and does not allocate:
+//
+//	it := code.Instrs()
+//	for it.Next() {
+//		fmt.Println(it.Name())
+//	}
+//	if err := it.Err(); err != nil {
+//		...
+//	}
+type InstrIter struct {
+	bs []byte
+	// Offsets of the current instruction, its immediates, and the next
+	// instruction.
+	start, imm, end int
+	op              opcode
+	err             error
+}
+
+// NewInstrIter returns an iterator over the instructions encoded in bs.
+func NewInstrIter(bs []byte) InstrIter {
+	return InstrIter{bs: bs}
+}
+
+// Instrs returns an iterator over the instructions written so far.
+func (c *Expr) Instrs() InstrIter {
+	c.flush()
+	return NewInstrIter(c.buf.Bytes())
+}
+
+// Instrs returns an iterator over the instructions of the body, after its
+// local declarations.
+func (c *Code) Instrs() InstrIter {
+	c.flush()
+	bs := c.buf.Bytes()
+	n, i := decodeU32(bs, 0)
+	for ; n > 0 && i >= 0; n-- {
+		i = skipLEB128(bs, i)
+		if i >= 0 {
+			i = skipLEB128(bs, i)
+		}
+	}
+	if i < 0 {
+		return InstrIter{err: fmt.Errorf("truncated local declarations")}
+	}
+	it := NewInstrIter(bs)
+	it.end = i
+	return it
+}
+
+// Next advances to the next instruction, returning false at the end of the
+// expression or on a decoding error.
+func (it *InstrIter) Next() bool {
+	it.start = it.end
+	it.op = opInvalid
+	if it.err != nil || it.start >= len(it.bs) {
+		return false
+	}
+	op, i := decodeOpcode(it.bs, it.start)
+	if op == opInvalid {
+		it.err = fmt.Errorf("unknown opcode %#x at offset %d", it.bs[it.start], it.start)
+		return false
+	}
+	it.imm = i
+	for _, kind := range opcodeInfos[op].imm {
+		if kind == immNone {
+			break
+		}
+		if i = skipImmediate(it.bs, i, kind); i < 0 {
+			it.err = fmt.Errorf("truncated %s at offset %d", opcodeNames[op], it.start)
+			return false
+		}
+	}
+	it.op, it.end = op, i
+	return true
+}
+
+// Err returns the decoding error that ended iteration, if any.
+func (it *InstrIter) Err() error {
+	return it.err
+}
+
+// Name returns the name of the current instruction, as listed in
+// index.csv.
+func (it *InstrIter) Name() string {
+	return opcodeNames[it.op]
+}
+
+// Offset returns the position of the current instruction in the
+// expression.
+func (it *InstrIter) Offset() int {
+	return it.start
+}
+
+// Bytes returns the encoding of the current instruction. It aliases the
+// expression.
+func (it *InstrIter) Bytes() []byte {
+	return it.bs[it.start:it.end]
+}
+
+// Opcode returns the encoded opcode of the current instruction, including
+// any prefix byte.
+func (it *InstrIter) Opcode() []byte {
+	return it.bs[it.start:it.imm]
+}
+
+// Immediates returns the encoded immediates of the current instruction.
+func (it *InstrIter) Immediates() []byte {
+	return it.bs[it.imm:it.end]
+}
+
+// StackEffect returns the operand types that the current instruction pops
+// and pushes. A zero ValType stands for the type of another operand, as in
+// select. ok is false when the instruction takes further operands, which
+// depend on its immediates or enclosing blocks, as for calls and branches.
+// The returned slices are shared and must not be modified.
+func (it *InstrIter) StackEffect() (in, out []ValType, ok bool) {
+	info := &opcodeInfos[it.op]
+	return info.in, info.out, !info.polymorphic
+}
+
+// decodeOpcode returns the ID of the opcode at bs[i], and the offset of its
+// immediates. The ID is opInvalid for unassigned opcodes.
+func decodeOpcode(bs []byte, i int) (opcode, int) {
+	b := bs[i]
+	i++
+	if b != 0xFC && b != 0xFD {
+		return opcodesByByte[b], i
+	}
+	sub, i := decodeU32(bs, i)
+	switch {
+	case i < 0:
+		return opInvalid, i
+	case b == 0xFC && int(sub) < len(opcodesFC):
+		return opcodesFC[sub], i
+	case b == 0xFD && int(sub) < len(opcodesFD):
+		return opcodesFD[sub], i
+	}
+	return opInvalid, i
+}
+
+// skipImmediate returns the offset following an immediate at bs[i], or -1
+// if it is truncated.
+func skipImmediate(bs []byte, i int, kind immKind) int {
+	switch kind {
+	case immMemArg:
+		if i = skipLEB128(bs, i); i < 0 {
+			return i
+		}
+		return skipLEB128(bs, i)
+	case immF32:
+		i += 4
+	case immF64:
+		i += 8
+	case immV128, immShuffle:
+		i += 16
+	case immLane, immZero:
+		i++
+	case immLabels:
+		var n U32
+		for n, i = decodeU32(bs, i); n > 0 && i >= 0; n-- {
+			i = skipLEB128(bs, i)
+		}
+		return i
+	case immTypes:
+		var n U32
+		if n, i = decodeU32(bs, i); i < 0 {
+			return i
+		}
+		i += int(n)
+	default:
+		return skipLEB128(bs, i)
+	}
+	if i > len(bs) {
+		return -1
+	}
+	return i
+}
+
+// skipLEB128 returns the offset following a LEB128 value at bs[i], or -1 if
+// it is truncated.
+func skipLEB128(bs []byte, i int) int {
+	for ; i < len(bs); i++ {
+		if bs[i] < 0x80 {
+			return i + 1
+		}
+	}
+	return -1
+}
+
+// decodeU32 is like readUnsignedLEB128, but reads from bs[i], returning the
+// offset following the value, or -1 if it is truncated or too long.
+func decodeU32(bs []byte, i int) (U32, int) {
+	var v U32
+	for n := 0; n < 5 && i < len(bs); n++ {
+		b := bs[i]
+		i++
+		v |= U32(b&0x7f) << (7 * n)
+		if b < 0x80 {
+			return v, i
+		}
+	}
+	return 0, -1
+}
@@ -0,0 +1,91 @@
+package webassembler
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// branchCode returns a body of type [] -> [i32] that branches with br_table
+// to code that reads the memory size, so returns 21 with one page.
+func branchCode() *Code {
+	code := NewCode(LocalType{2, TypeIdx(TypeI64)})
+	code.Block(0x40)
+	code.Block(0x40)
+	code.I32_Const(1)
+	code.Brtable(LabelVec{0, 1}, 0)
+	code.End()
+	code.I32_Const(10)
+	code.Return()
+	code.End()
+	code.Memorysize()
+	code.I32_Const(20)
+	code.I32_Add()
+	code.End()
+	return code
+}
+
+func TestBranchTable(t *testing.T) {
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mod.AddMemory(MemType{MakeUnlimited(1)})
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, branchCode()))
+	assert.Equal(t, 21, runInt(t, mod))
+}
+
+func TestInstrIter(t *testing.T) {
+	code := branchCode()
+	code.I64_Const(-1 << 40)
+	code.I32_Load(MemArg{2, 1 << 20})
+	code.Memorycopy()
+	code.Memoryinit(3)
+	code.I8x16_ExtractlaneS(15)
+	code.SelectTyped(ResultType{TypeI32})
+
+	var names []string
+	var body []byte
+	it := code.Instrs()
+	for it.Next() {
+		assert.Equal(t, 3+len(body), it.Offset())
+		names = append(names, it.Name())
+		body = append(body, it.Bytes()...)
+		assert.Equal(t, it.Bytes(), append(append([]byte(nil), it.Opcode()...), it.Immediates()...))
+	}
+	assert.NoError(t, it.Err())
+	assert.Equal(t, []string{
+		"block", "block", "i32.const", "brtable", "end", "i32.const",
+		"return", "end", "memorysize", "i32.const", "i32.add", "end",
+		"i64.const", "i32.load", "memorycopy", "memoryinit",
+		"i8x16.extractlane_s", "select_typed",
+	}, names)
+	// The locals vector is skipped.
+	assert.Equal(t, code.buf.Bytes()[3:], body)
+
+	// Stack effects.
+	it = NewInstrIter([]byte{0x6A, 0x1B, 0x0C, 0x00})
+	it.Next()
+	in, out, ok := it.StackEffect()
+	assert.Equal(t, []ValType{TypeI32, TypeI32}, in)
+	assert.Equal(t, []ValType{TypeI32}, out)
+	assert.True(t, ok)
+	it.Next()
+	in, out, ok = it.StackEffect()
+	assert.Equal(t, []ValType{typeAny, typeAny, TypeI32}, in)
+	assert.Equal(t, []ValType{typeAny}, out)
+	assert.True(t, ok)
+	it.Next()
+	_, _, ok = it.StackEffect()
+	assert.False(t, ok)
+
+	// Errors.
+	it = NewInstrIter([]byte{0x01, 0x06})
+	assert.True(t, it.Next())
+	assert.False(t, it.Next())
+	assert.Error(t, it.Err())
+	it = NewInstrIter([]byte{0x41, 0x80})
+	assert.False(t, it.Next())
+	assert.Error(t, it.Err())
+	it = NewInstrIter([]byte{0xFD, 0x80})
+	assert.False(t, it.Next())
+	assert.Error(t, it.Err())
+}
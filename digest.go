@@ -0,0 +1,212 @@
+package webassembler
+
+import (
+	"fmt"
+	"io"
+	"math/bits"
+)
+
+// Digest returns a 61-bit hash of the module's encoding, equal to
+// DigestBytes(mod.Bytes()), without encoding the module. Each section
+// keeps the digest of its contents as far as it was last computed, and
+// extends it over what has been appended since, so after a module changes
+// only its new contents are hashed again. Data segments read from an
+// io.ReaderAt are read each time, and read errors panic, as with Bytes.
+// As with Size, every function declared with ReserveFunc must have been
+// defined.
+//
+// The digest suits cache keys and change detection. It is a polynomial
+// hash, so unlike a cryptographic hash, collisions can be constructed
+// deliberately.
+func (mod *Module) Digest() uint64 {
+	d := digest{}.update(moduleHeader)
+	for _, s := range mod.sections() {
+		size := s.Size()
+		if size == 0 {
+			continue
+		}
+		var header [6]byte
+		d = d.update(appendUnsignedLEB128(append(header[:0], byte(s.SectionID())), U32(size)))
+		d = d.concat(contentsDigest(s))
+	}
+	return d.h
+}
+
+// DigestBytes returns the digest of an encoded module, as computed by
+// Module.Digest.
+func DigestBytes(bs []byte) uint64 {
+	return digest{}.update(bs).h
+}
+
+// A digest is the polynomial hash, modulo the Mersenne prime 2^61-1, of a
+// string of n bytes s, with each byte offset by one so that leading zeros
+// count:
+//
+//	h = (s[0]+1)*B^(n-1) + (s[1]+1)*B^(n-2) + ... + (s[n-1]+1)
+//
+// The digest of a concatenation follows from the digests of its parts, so
+// sections can be hashed separately, and incrementally.
+type digest struct {
+	h uint64
+	n int
+}
+
+const (
+	digestPrime = 1<<61 - 1
+	digestBase  = 0x1d9f_27c3_a4e6_5b01 % digestPrime
+)
+
+func (d digest) update(bs []byte) digest {
+	h, n := d.h, d.n+len(bs)
+	// Hash 8 bytes at a time, as h*B^8 plus a sum of terms looked up in
+	// digestTable, which needs only one multiplication.
+	for ; len(bs) >= 8; bs = bs[8:] {
+		t := &digestTable
+		lo := t[7][bs[0]] + t[6][bs[1]] + t[5][bs[2]] + t[4][bs[3]]
+		hi := t[3][bs[4]] + t[2][bs[5]] + t[1][bs[6]] + t[0][bs[7]]
+		h = reduceMod(mulMod(h, digestBase8) + reduceMod(lo) + reduceMod(hi))
+	}
+	for _, b := range bs {
+		h = reduceMod(mulMod(h, digestBase) + uint64(b) + 1)
+	}
+	return digest{h, n}
+}
+
+// digestTable[j][b] is (b+1)*B^j modulo digestPrime.
+var digestTable = func() (t [8][256]uint64) {
+	for j := range t {
+		pow := powMod(digestBase, j)
+		for b := range t[j] {
+			t[j][b] = mulMod(uint64(b+1), pow)
+		}
+	}
+	return t
+}()
+
+var digestBase8 = powMod(digestBase, 8)
+
+// concat returns the digest of the strings of d followed by e.
+func (d digest) concat(e digest) digest {
+	return digest{reduceMod(mulMod(d.h, powMod(digestBase, e.n)) + e.h), d.n + e.n}
+}
+
+// mulMod returns a*b modulo digestPrime, for a and b less than it.
+func mulMod(a, b uint64) uint64 {
+	hi, lo := bits.Mul64(a, b)
+	h := (hi<<3 | lo>>61) + lo&digestPrime
+	if h >= digestPrime {
+		h -= digestPrime
+	}
+	return h
+}
+
+// reduceMod returns x modulo digestPrime.
+func reduceMod(x uint64) uint64 {
+	x = x&digestPrime + x>>61
+	if x >= digestPrime {
+		x -= digestPrime
+	}
+	return x
+}
+
+func powMod(b uint64, n int) uint64 {
+	r := uint64(1)
+	for ; n > 0; n >>= 1 {
+		if n&1 != 0 {
+			r = mulMod(r, b)
+		}
+		b = mulMod(b, b)
+	}
+	return r
+}
+
+// contentsDigest returns the digest of the contents of s. Sections other
+// than the module's own are encoded to be hashed.
+func contentsDigest(s Section) digest {
+	switch sec := s.(type) {
+	case *TypeSection:
+		return vecDigest(sec.n, &sec.buf, &sec.hashed)
+	case *ImportSection:
+		return vecDigest(sec.n, &sec.buf, &sec.hashed)
+	case *FuncSection:
+		return vecDigest(sec.n, &sec.buf, &sec.hashed)
+	case *MemorySection:
+		return vecDigest(sec.n, &sec.buf, &sec.hashed)
+	case *GlobalSection:
+		return vecDigest(sec.n, &sec.buf, &sec.hashed)
+	case *ExportSection:
+		return vecDigest(sec.n, &sec.buf, &sec.hashed)
+	case *CodeSection:
+		return sec.digest()
+	case *DataSection:
+		return sec.digest()
+	}
+	var buf Buffer
+	s.emitContents(&buf)
+	return digest{}.update(buf.Bytes())
+}
+
+// vecDigest returns the digest of a section made up of a count of entries
+// and their encoding in buf, extending hashed, the digest of a prefix of
+// buf, to all of it.
+func vecDigest(n U32, buf *Buffer, hashed *digest) digest {
+	bs := buf.Bytes()
+	if hashed.n > len(bs) {
+		*hashed = digest{}
+	}
+	*hashed = hashed.update(bs[hashed.n:])
+	var count [5]byte
+	return digest{}.update(appendUnsignedLEB128(count[:0], n)).concat(*hashed)
+}
+
+// digest returns the digest of the section's contents, hashing only the
+// bodies added since it was last computed, unless a body it covered has
+// been replaced.
+func (sec *CodeSection) digest() digest {
+	sec.settle()
+	var prefix [5]byte
+	for _, code := range sec.funcs[sec.hashedFuncs:] {
+		body := code.buf.Bytes()
+		sec.hashed = sec.hashed.update(appendUnsignedLEB128(prefix[:0], U32(len(body)))).update(body)
+	}
+	sec.hashedFuncs = len(sec.funcs)
+	return digest{}.update(appendUnsignedLEB128(prefix[:0], U32(len(sec.funcs)))).concat(sec.hashed)
+}
+
+// digest returns the digest of the section's contents, hashing only the
+// slice-backed segments added since it was last computed, and reading
+// every reader-backed segment.
+func (sec *DataSection) digest() digest {
+	if sec.hashedSegs > len(sec.segments) {
+		sec.hashed, sec.hashedSegs = digest{}, 0
+	}
+	for _, seg := range sec.segments[sec.hashedSegs:] {
+		if seg.r != nil {
+			break
+		}
+		sec.hashed = sec.hashed.update(seg.header).update(seg.data)
+		sec.hashedSegs++
+	}
+	d := sec.hashed
+	for _, seg := range sec.segments[sec.hashedSegs:] {
+		d = d.update(seg.header)
+		if seg.r == nil {
+			d = d.update(seg.data)
+			continue
+		}
+		var chunk [32 << 10]byte
+		for off := int64(0); off < seg.n; {
+			m, err := seg.r.ReadAt(chunk[:min(int64(len(chunk)), seg.n-off)], off)
+			if m == 0 {
+				if err == nil || err == io.EOF {
+					err = io.ErrUnexpectedEOF
+				}
+				panic(fmt.Errorf("reading data segment: %w", err))
+			}
+			d = d.update(chunk[:m])
+			off += int64(m)
+		}
+	}
+	var count [5]byte
+	return digest{}.update(appendUnsignedLEB128(count[:0], U32(len(sec.segments)))).concat(d)
+}
@@ -0,0 +1,69 @@
+package webassembler
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestDigest(t *testing.T) {
+	build := func() *Module {
+		mod := NewModule()
+		log := mod.ImportFunc("env", "log", mod.Types.AddFunc(ResultType{TypeI32}, nil))
+		mem := mod.AddMemory(MemType{MakeUnlimited(1)})
+		init := &Expr{}
+		init.I32_Const(3)
+		init.End()
+		mod.AddGlobal(GlobalType{Value: TypeI32}, init)
+		typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+		for i := 0; i < 100; i++ {
+			code := constCode(I32(i))
+			if i%10 == 0 {
+				code = NewCode()
+				code.I32_Const(I32(i))
+				code.Call(log)
+				code.I32_Const(0)
+				code.End()
+			}
+			mod.ExportFunc(strings.Repeat("f", i), mod.AddFunc(typeIdx, code))
+		}
+		mod.Data.AddActive(mem, 0, make([]byte, 100))
+		mod.Data.AddActiveReader(mem, 200, strings.NewReader(strings.Repeat("\x02", 1000)), 1000)
+		mod.Data.AddPassive([]byte("passive"))
+		return mod
+	}
+	mod := build()
+	want := DigestBytes(mod.Bytes())
+	assert.Equal(t, want, mod.Digest())
+	assert.Equal(t, want, build().Digest())
+
+	// Digests are extended or recomputed as the module changes.
+	mod.AddFunc(1, constCode(100))
+	assert.NotEqual(t, want, mod.Digest())
+	assert.Equal(t, DigestBytes(mod.Bytes()), mod.Digest())
+	mod.Code.ReplaceBody(3, constCode(-3))
+	assert.Equal(t, DigestBytes(mod.Bytes()), mod.Digest())
+	mod.CompactData(8)
+	assert.Equal(t, DigestBytes(mod.Bytes()), mod.Digest())
+	mod.EnableTreeShaking()
+	assert.Equal(t, DigestBytes(mod.Bytes()), mod.Digest())
+
+	// Shaking renumbers the type of an import already hashed.
+	mod = NewModule()
+	mod.Types.AddFunc(nil, ResultType{TypeI64})
+	log := mod.ImportFunc("env", "log", mod.Types.AddFunc(ResultType{TypeI32}, nil))
+	code := NewCode()
+	code.I32_Const(1)
+	code.Call(log)
+	code.End()
+	mod.ExportFunc("f", mod.AddFunc(mod.Types.AddFunc(nil, nil), code))
+	assert.Equal(t, DigestBytes(mod.Bytes()), mod.Digest())
+	mod.EnableTreeShaking()
+	assert.Equal(t, DigestBytes(mod.Bytes()), mod.Digest())
+
+	clone := build().Freeze().NewModule()
+	assert.Equal(t, want, clone.Digest())
+	clone.Types.AddFunc(nil, nil)
+	assert.Equal(t, DigestBytes(clone.Bytes()), clone.Digest())
+}
@@ -3,6 +3,9 @@ package webassembler
 type ExportSection struct {
 	n   U32
 	buf Buffer
+
+	// Digest of a prefix of buf, extended by Module.Digest.
+	hashed digest
 }
 
 func (sec *ExportSection) SectionID() SectionID {
@@ -13,9 +16,9 @@ func (sec *ExportSection) Size() int {
 	return unsignedLEB128Size(sec.n) + sec.buf.Len()
 }
 
-func (sec *ExportSection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *ExportSection) emitContents(w sectionWriter) {
+	w.WriteU32(sec.n)
+	w.WriteRaw(sec.buf.Bytes())
 }
 
 func (sec *ExportSection) add(name string, kind byte, idx U32) ExportIdx {
@@ -3,7 +3,29 @@ package webassembler
 // Code provides an instruction encoder for an expression.
 type Expr struct {
 	buf Buffer
+
+	// Receives instruction counts when non-nil.
+	stats *Stats
+
+	// Holds instructions in recording mode; nil otherwise.
+	ir *exprIR
 }
 
 // The public interface of Expr is made up of generated instruction methods.
 //go:generate sh -c "go run internal/cmd/codegen/main.go <internal/instructions/index.csv >instructions.go"
+
+// An opcode identifies an instruction by its position in index.csv. Unlike
+// binary opcodes, these are dense, so they can index tables directly.
+type opcode uint16
+
+// SetStats directs counts of emitted instructions to s. A nil s, the
+// default, disables counting.
+func (c *Expr) SetStats(s *Stats) {
+	c.stats = s
+}
+
+func (c *Expr) count(op opcode) {
+	if c.stats != nil {
+		c.stats.opcodes[op]++
+	}
+}
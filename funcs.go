@@ -3,6 +3,9 @@ package webassembler
 type FuncSection struct {
 	n   U32
 	buf Buffer
+
+	// Digest of a prefix of buf, extended by Module.Digest.
+	hashed digest
 }
 
 func (sec *FuncSection) SectionID() SectionID {
@@ -13,9 +16,9 @@ func (sec *FuncSection) Size() int {
 	return unsignedLEB128Size(sec.n) + sec.buf.Len()
 }
 
-func (sec *FuncSection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *FuncSection) emitContents(w sectionWriter) {
+	w.WriteU32(sec.n)
+	w.WriteRaw(sec.buf.Bytes())
 }
 
 func (sec *FuncSection) Add(typ TypeIdx, numFuncImports U32) FuncIdx {
@@ -8,6 +8,9 @@ type GlobalType struct {
 type GlobalSection struct {
 	n   U32
 	buf Buffer
+
+	// Digest of a prefix of buf, extended by Module.Digest.
+	hashed digest
 }
 
 func (sec *GlobalSection) SectionID() SectionID {
@@ -18,15 +21,16 @@ func (sec *GlobalSection) Size() int {
 	return unsignedLEB128Size(sec.n) + sec.buf.Len()
 }
 
-func (sec *GlobalSection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *GlobalSection) emitContents(w sectionWriter) {
+	w.WriteU32(sec.n)
+	w.WriteRaw(sec.buf.Bytes())
 }
 
 func (sec *GlobalSection) Add(typ GlobalType, numGlobalImports U32, x *Expr) GlobalIdx {
 	i := sec.n
 	sec.n++
 	sec.buf.WriteGlobalType(typ)
+	x.flush()
 	sec.buf.WriteRaw(x.buf.Bytes())
 	return GlobalIdx(numGlobalImports + i)
 }
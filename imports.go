@@ -14,6 +14,9 @@ type ImportSection struct {
 	// sections to be added only after their respective imports have
 	// finished shifted the corresponding index space.
 	frozen bool
+
+	// Digest of a prefix of buf, extended by Module.Digest.
+	hashed digest
 }
 
 func (sec *ImportSection) SectionID() SectionID {
@@ -24,9 +27,9 @@ func (sec *ImportSection) Size() int {
 	return unsignedLEB128Size(sec.n) + sec.buf.Len()
 }
 
-func (sec *ImportSection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *ImportSection) emitContents(w sectionWriter) {
+	w.WriteU32(sec.n)
+	w.WriteRaw(sec.buf.Bytes())
 }
 
 func (sec *ImportSection) Freeze() {
@@ -2,2654 +2,6843 @@
 
 package webassembler
 
+// Opcode IDs, numbered in index.csv order.
+// Zero marks unassigned entries in the decoder tables.
+const (
+	opInvalid opcode = iota
+	opUnreachable
+	opNop
+	opBlock
+	opLoop
+	opIf
+	opElse
+	opEnd
+	opBr
+	opBrif
+	opBrtable
+	opReturn
+	opCall
+	opCallindirect
+	opDrop
+	opSelect
+	opSelectTyped
+	opLocalget
+	opLocalset
+	opLocaltee
+	opGlobalget
+	opGlobalset
+	opTableget
+	opTableset
+	opI32_Load
+	opI64_Load
+	opF32_Load
+	opF64_Load
+	opI32_Load8S
+	opI32_Load8U
+	opI32_Load16S
+	opI32_Load16U
+	opI64_Load8S
+	opI64_Load8U
+	opI64_Load16S
+	opI64_Load16U
+	opI64_Load32S
+	opI64_Load32U
+	opI32_Store
+	opI64_Store
+	opF32_Store
+	opF64_Store
+	opI32_Store8
+	opI32_Store16
+	opI64_Store8
+	opI64_Store16
+	opI64_Store32
+	opMemorysize
+	opMemorygrow
+	opI32_Const
+	opI64_Const
+	opF32_Const
+	opF64_Const
+	opI32_Eqz
+	opI32_Eq
+	opI32_Ne
+	opI32_LtS
+	opI32_LtU
+	opI32_GtS
+	opI32_GtU
+	opI32_LeS
+	opI32_LeU
+	opI32_GeS
+	opI32_GeU
+	opI64_Eqz
+	opI64_Eq
+	opI64_Ne
+	opI64_LtS
+	opI64_LtU
+	opI64_GtS
+	opI64_GtU
+	opI64_LeS
+	opI64_LeU
+	opI64_GeS
+	opI64_GeU
+	opF32_Eq
+	opF32_Ne
+	opF32_Lt
+	opF32_Gt
+	opF32_Le
+	opF32_Ge
+	opF64_Eq
+	opF64_Ne
+	opF64_Lt
+	opF64_Gt
+	opF64_Le
+	opF64_Ge
+	opI32_Clz
+	opI32_Ctz
+	opI32_Popcnt
+	opI32_Add
+	opI32_Sub
+	opI32_Mul
+	opI32_DivS
+	opI32_DivU
+	opI32_RemS
+	opI32_RemU
+	opI32_And
+	opI32_Or
+	opI32_Xor
+	opI32_Shl
+	opI32_ShrS
+	opI32_ShrU
+	opI32_Rotl
+	opI32_Rotr
+	opI64_Clz
+	opI64_Ctz
+	opI64_Popcnt
+	opI64_Add
+	opI64_Sub
+	opI64_Mul
+	opI64_DivS
+	opI64_DivU
+	opI64_RemS
+	opI64_RemU
+	opI64_And
+	opI64_Or
+	opI64_Xor
+	opI64_Shl
+	opI64_ShrS
+	opI64_ShrU
+	opI64_Rotl
+	opI64_Rotr
+	opF32_Abs
+	opF32_Neg
+	opF32_Ceil
+	opF32_Floor
+	opF32_Trunc
+	opF32_Nearest
+	opF32_Sqrt
+	opF32_Add
+	opF32_Sub
+	opF32_Mul
+	opF32_Div
+	opF32_Fmin
+	opF32_Fmax
+	opF32_Copysign
+	opF64_Abs
+	opF64_Neg
+	opF64_Ceil
+	opF64_Floor
+	opF64_Trunc
+	opF64_Nearest
+	opF64_Sqrt
+	opF64_Add
+	opF64_Sub
+	opF64_Mul
+	opF64_Div
+	opF64_Fmin
+	opF64_Fmax
+	opF64_Copysign
+	opI32_WrapI64
+	opI32_TruncF32S
+	opI32_TruncF32U
+	opI32_TruncF64S
+	opI32_TruncF64U
+	opI64_ExtendI32S
+	opI64_ExtendI32U
+	opI64_TruncF32S
+	opI64_TruncF32U
+	opI64_TruncF64S
+	opI64_TruncF64U
+	opF32_ConvertI32S
+	opF32_ConvertI32U
+	opF32_ConvertI64S
+	opF32_ConvertI64U
+	opF32_DemoteF64
+	opF64_ConvertI32S
+	opF64_ConvertI32U
+	opF64_ConvertI64S
+	opF64_ConvertI64U
+	opF64_PromoteF32
+	opI32_ReinterpretF32
+	opI64_ReinterpretF64
+	opF32_ReinterpretI32
+	opF64_ReinterpretI64
+	opI32_Extend8S
+	opI32_Extend16S
+	opI64_Extend8S
+	opI64_Extend16S
+	opI64_Extend32S
+	opRefnull
+	opRefisnull
+	opReffunc
+	opI32_TruncSatF32S
+	opI32_TruncSatF32U
+	opI32_TruncSatF64S
+	opI32_TruncSatF64U
+	opI64_TruncSatF32S
+	opI64_TruncSatF32U
+	opI64_TruncSatF64S
+	opI64_TruncSatF64U
+	opMemoryinit
+	opDatadrop
+	opMemorycopy
+	opMemoryfill
+	opTableinit
+	opElemdrop
+	opTablecopy
+	opTablegrow
+	opTablesize
+	opTablefill
+	opV128_Load
+	opV128_Load8x8S
+	opV128_Load8x8U
+	opV128_Load16x4S
+	opV128_Load16x4U
+	opV128_Load32x2S
+	opV128_Load32x2U
+	opV128_Load8Splat
+	opV128_Load16Splat
+	opV128_Load32Splat
+	opV128_Load64Splat
+	opV128_Store
+	opV128_Vconst
+	opI8x16_Shuffle
+	opI8x16_Swizzle
+	opI8x16_Splat
+	opI16x8_Splat
+	opI32x4_Splat
+	opI64x2_Splat
+	opF32x4_Splat
+	opF64x2_Splat
+	opI8x16_ExtractlaneS
+	opI8x16_ExtractlaneU
+	opI8x16_Replacelane
+	opI16x8_ExtractlaneS
+	opI16x8_ExtractlaneU
+	opI16x8_Replacelane
+	opI32x4_Extractlane
+	opI32x4_Replacelane
+	opI64x2_Extractlane
+	opI64x2_Replacelane
+	opF32x4_Extractlane
+	opF32x4_Replacelane
+	opF64x2_Extractlane
+	opF64x2_Replacelane
+	opI8x16_Veq
+	opI8x16_Vne
+	opI8x16_VltS
+	opI8x16_VltU
+	opI8x16_VgtS
+	opI8x16_VgtU
+	opI8x16_VleS
+	opI8x16_VleU
+	opI8x16_VgeS
+	opI8x16_VgeU
+	opI16x8_Veq
+	opI16x8_Vne
+	opI16x8_VltS
+	opI16x8_VltU
+	opI16x8_VgtS
+	opI16x8_VgtU
+	opI16x8_VleS
+	opI16x8_VleU
+	opI16x8_VgeS
+	opI16x8_VgeU
+	opI32x4_Veq
+	opI32x4_Vne
+	opI32x4_VltS
+	opI32x4_VltU
+	opI32x4_VgtS
+	opI32x4_VgtU
+	opI32x4_VleS
+	opI32x4_VleU
+	opI32x4_VgeS
+	opI32x4_VgeU
+	opF32x4_Veq
+	opF32x4_Vne
+	opF32x4_Vlt
+	opF32x4_Vgt
+	opF32x4_Vle
+	opF32x4_Vge
+	opF64x2_Veq
+	opF64x2_Vne
+	opF64x2_Vlt
+	opF64x2_Vgt
+	opF64x2_Vle
+	opF64x2_Vge
+	opV128_Vnot
+	opV128_Vand
+	opV128_Vandnot
+	opV128_Vor
+	opV128_Vxor
+	opV128_Bitselect
+	opV128_Anytrue
+	opV128_Load8Lane
+	opV128_Load16Lane
+	opV128_Load32Lane
+	opV128_Load64Lane
+	opV128_Store8Lane
+	opV128_Store16Lane
+	opV128_Store32Lane
+	opV128_Store64Lane
+	opV128_Load32Zero
+	opV128_Load64Zero
+	opF32x4_VdemoteF64x2Zero
+	opF64x2_VpromoteLowF32x4
+	opI8x16_Vabs
+	opI8x16_Vneg
+	opI8x16_Vpopcnt
+	opI8x16_Alltrue
+	opI8x16_Bitmask
+	opI8x16_NarrowI16x8S
+	opI8x16_NarrowI16x8U
+	opF32x4_Vceil
+	opF32x4_Vfloor
+	opF32x4_Vtrunc
+	opF32x4_Vnearest
+	opI8x16_Vshl
+	opI8x16_VshrS
+	opI8x16_VshrU
+	opI8x16_Vadd
+	opI8x16_VaddSatS
+	opI8x16_VaddSatU
+	opI8x16_Vsub
+	opI8x16_VsubSatS
+	opI8x16_VsubSatU
+	opF64x2_Vceil
+	opF64x2_Vfloor
+	opI8x16_VminS
+	opI8x16_VminU
+	opI8x16_VmaxS
+	opI8x16_VmaxU
+	opF64x2_Vtrunc
+	opI8x16_AvgrU
+	opI16x8_ExtaddpairwiseI8x16S
+	opI16x8_ExtaddpairwiseI8x16U
+	opI32x4_ExtaddpairwiseI16x8S
+	opI32x4_ExtaddpairwiseI16x8U
+	opI16x8_Vabs
+	opI16x8_Vneg
+	opI16x8_Q15mulrsatS
+	opI16x8_Alltrue
+	opI16x8_Bitmask
+	opI16x8_NarrowI32x4S
+	opI16x8_NarrowI32x4U
+	opI16x8_VextendLowI8x16S
+	opI16x8_VextendHighI8x16S
+	opI16x8_VextendLowI8x16U
+	opI16x8_VextendHighI8x16U
+	opI16x8_Vshl
+	opI16x8_VshrS
+	opI16x8_VshrU
+	opI16x8_Vadd
+	opI16x8_VaddSatS
+	opI16x8_VaddSatU
+	opI16x8_Vsub
+	opI16x8_VsubSatS
+	opI16x8_VsubSatU
+	opF64x2_Vnearest
+	opI16x8_Vmul
+	opI16x8_VminS
+	opI16x8_VminU
+	opI16x8_VmaxS
+	opI16x8_VmaxU
+	opI16x8_AvgrU
+	opI16x8_ExtmulLowI8x16S
+	opI16x8_ExtmulHighI8x16S
+	opI16x8_ExtmulLowI8x16U
+	opI16x8_ExtmulHighI8x16U
+	opI32x4_Vabs
+	opI32x4_Vneg
+	opI32x4_Alltrue
+	opI32x4_Bitmask
+	opI32x4_VextendLowI16x8S
+	opI32x4_VextendHighI16x8S
+	opI32x4_VextendLowI16x8U
+	opI32x4_VextendHighI16x8U
+	opI32x4_Vshl
+	opI32x4_VshrS
+	opI32x4_VshrU
+	opI32x4_Vadd
+	opI32x4_Vsub
+	opI32x4_Vmul
+	opI32x4_VminS
+	opI32x4_VminU
+	opI32x4_VmaxS
+	opI32x4_VmaxU
+	opI32x4_DotI16x8S
+	opI32x4_ExtmulLowI16x8S
+	opI32x4_ExtmulHighI16x8S
+	opI32x4_ExtmulLowI16x8U
+	opI32x4_ExtmulHighI16x8U
+	opI64x2_Vabs
+	opI64x2_Vneg
+	opI64x2_Alltrue
+	opI64x2_Bitmask
+	opI64x2_VextendLowI32x4S
+	opI64x2_VextendHighI32x4S
+	opI64x2_VextendLowI32x4U
+	opI64x2_VextendHighI32x4U
+	opI64x2_Vshl
+	opI64x2_VshrS
+	opI64x2_VshrU
+	opI64x2_Vadd
+	opI64x2_Vsub
+	opI64x2_Vmul
+	opI64x2_Veq
+	opI64x2_Vne
+	opI64x2_VltS
+	opI64x2_VgtS
+	opI64x2_VleS
+	opI64x2_VgeS
+	opI64x2_ExtmulLowI32x4S
+	opI64x2_ExtmulHighI32x4S
+	opI64x2_ExtmulLowI32x4U
+	opI64x2_ExtmulHighI32x4U
+	opF32x4_Vabs
+	opF32x4_Vneg
+	opF32x4_Vsqrt
+	opF32x4_Vadd
+	opF32x4_Vsub
+	opF32x4_Vmul
+	opF32x4_Vdiv
+	opF32x4_Vmin
+	opF32x4_Vmax
+	opF32x4_Vpmin
+	opF32x4_Vpmax
+	opF64x2_Vabs
+	opF64x2_Vneg
+	opF64x2_Vsqrt
+	opF64x2_Vadd
+	opF64x2_Vsub
+	opF64x2_Vmul
+	opF64x2_Vdiv
+	opF64x2_Vmin
+	opF64x2_Vmax
+	opF64x2_Vpmin
+	opF64x2_Vpmax
+	opI32x4_TruncSatF32x4S
+	opI32x4_TruncSatF32x4U
+	opF32x4_VconvertI32x4S
+	opF32x4_VconvertI32x4U
+	opI32x4_VtruncSatF64x2SZero
+	opI32x4_VtruncSatF64x2UZero
+	opF64x2_VconvertLowI32x4S
+	opF64x2_VconvertLowI32x4U
+	numOpcodes
+)
+
+var opcodeNames = [numOpcodes]string{
+	opUnreachable:                "unreachable",
+	opNop:                        "nop",
+	opBlock:                      "block",
+	opLoop:                       "loop",
+	opIf:                         "if",
+	opElse:                       "else",
+	opEnd:                        "end",
+	opBr:                         "br",
+	opBrif:                       "brif",
+	opBrtable:                    "brtable",
+	opReturn:                     "return",
+	opCall:                       "call",
+	opCallindirect:               "callindirect",
+	opDrop:                       "drop",
+	opSelect:                     "select",
+	opSelectTyped:                "select_typed",
+	opLocalget:                   "localget",
+	opLocalset:                   "localset",
+	opLocaltee:                   "localtee",
+	opGlobalget:                  "globalget",
+	opGlobalset:                  "globalset",
+	opTableget:                   "tableget",
+	opTableset:                   "tableset",
+	opI32_Load:                   "i32.load",
+	opI64_Load:                   "i64.load",
+	opF32_Load:                   "f32.load",
+	opF64_Load:                   "f64.load",
+	opI32_Load8S:                 "i32.load8_s",
+	opI32_Load8U:                 "i32.load8_u",
+	opI32_Load16S:                "i32.load16_s",
+	opI32_Load16U:                "i32.load16_u",
+	opI64_Load8S:                 "i64.load8_s",
+	opI64_Load8U:                 "i64.load8_u",
+	opI64_Load16S:                "i64.load16_s",
+	opI64_Load16U:                "i64.load16_u",
+	opI64_Load32S:                "i64.load32_s",
+	opI64_Load32U:                "i64.load32_u",
+	opI32_Store:                  "i32.store",
+	opI64_Store:                  "i64.store",
+	opF32_Store:                  "f32.store",
+	opF64_Store:                  "f64.store",
+	opI32_Store8:                 "i32.store8",
+	opI32_Store16:                "i32.store16",
+	opI64_Store8:                 "i64.store8",
+	opI64_Store16:                "i64.store16",
+	opI64_Store32:                "i64.store32",
+	opMemorysize:                 "memorysize",
+	opMemorygrow:                 "memorygrow",
+	opI32_Const:                  "i32.const",
+	opI64_Const:                  "i64.const",
+	opF32_Const:                  "f32.const",
+	opF64_Const:                  "f64.const",
+	opI32_Eqz:                    "i32.eqz",
+	opI32_Eq:                     "i32.eq",
+	opI32_Ne:                     "i32.ne",
+	opI32_LtS:                    "i32.lt_s",
+	opI32_LtU:                    "i32.lt_u",
+	opI32_GtS:                    "i32.gt_s",
+	opI32_GtU:                    "i32.gt_u",
+	opI32_LeS:                    "i32.le_s",
+	opI32_LeU:                    "i32.le_u",
+	opI32_GeS:                    "i32.ge_s",
+	opI32_GeU:                    "i32.ge_u",
+	opI64_Eqz:                    "i64.eqz",
+	opI64_Eq:                     "i64.eq",
+	opI64_Ne:                     "i64.ne",
+	opI64_LtS:                    "i64.lt_s",
+	opI64_LtU:                    "i64.lt_u",
+	opI64_GtS:                    "i64.gt_s",
+	opI64_GtU:                    "i64.gt_u",
+	opI64_LeS:                    "i64.le_s",
+	opI64_LeU:                    "i64.le_u",
+	opI64_GeS:                    "i64.ge_s",
+	opI64_GeU:                    "i64.ge_u",
+	opF32_Eq:                     "f32.eq",
+	opF32_Ne:                     "f32.ne",
+	opF32_Lt:                     "f32.lt",
+	opF32_Gt:                     "f32.gt",
+	opF32_Le:                     "f32.le",
+	opF32_Ge:                     "f32.ge",
+	opF64_Eq:                     "f64.eq",
+	opF64_Ne:                     "f64.ne",
+	opF64_Lt:                     "f64.lt",
+	opF64_Gt:                     "f64.gt",
+	opF64_Le:                     "f64.le",
+	opF64_Ge:                     "f64.ge",
+	opI32_Clz:                    "i32.clz",
+	opI32_Ctz:                    "i32.ctz",
+	opI32_Popcnt:                 "i32.popcnt",
+	opI32_Add:                    "i32.add",
+	opI32_Sub:                    "i32.sub",
+	opI32_Mul:                    "i32.mul",
+	opI32_DivS:                   "i32.div_s",
+	opI32_DivU:                   "i32.div_u",
+	opI32_RemS:                   "i32.rem_s",
+	opI32_RemU:                   "i32.rem_u",
+	opI32_And:                    "i32.and",
+	opI32_Or:                     "i32.or",
+	opI32_Xor:                    "i32.xor",
+	opI32_Shl:                    "i32.shl",
+	opI32_ShrS:                   "i32.shr_s",
+	opI32_ShrU:                   "i32.shr_u",
+	opI32_Rotl:                   "i32.rotl",
+	opI32_Rotr:                   "i32.rotr",
+	opI64_Clz:                    "i64.clz",
+	opI64_Ctz:                    "i64.ctz",
+	opI64_Popcnt:                 "i64.popcnt",
+	opI64_Add:                    "i64.add",
+	opI64_Sub:                    "i64.sub",
+	opI64_Mul:                    "i64.mul",
+	opI64_DivS:                   "i64.div_s",
+	opI64_DivU:                   "i64.div_u",
+	opI64_RemS:                   "i64.rem_s",
+	opI64_RemU:                   "i64.rem_u",
+	opI64_And:                    "i64.and",
+	opI64_Or:                     "i64.or",
+	opI64_Xor:                    "i64.xor",
+	opI64_Shl:                    "i64.shl",
+	opI64_ShrS:                   "i64.shr_s",
+	opI64_ShrU:                   "i64.shr_u",
+	opI64_Rotl:                   "i64.rotl",
+	opI64_Rotr:                   "i64.rotr",
+	opF32_Abs:                    "f32.abs",
+	opF32_Neg:                    "f32.neg",
+	opF32_Ceil:                   "f32.ceil",
+	opF32_Floor:                  "f32.floor",
+	opF32_Trunc:                  "f32.trunc",
+	opF32_Nearest:                "f32.nearest",
+	opF32_Sqrt:                   "f32.sqrt",
+	opF32_Add:                    "f32.add",
+	opF32_Sub:                    "f32.sub",
+	opF32_Mul:                    "f32.mul",
+	opF32_Div:                    "f32.div",
+	opF32_Fmin:                   "f32.fmin",
+	opF32_Fmax:                   "f32.fmax",
+	opF32_Copysign:               "f32.copysign",
+	opF64_Abs:                    "f64.abs",
+	opF64_Neg:                    "f64.neg",
+	opF64_Ceil:                   "f64.ceil",
+	opF64_Floor:                  "f64.floor",
+	opF64_Trunc:                  "f64.trunc",
+	opF64_Nearest:                "f64.nearest",
+	opF64_Sqrt:                   "f64.sqrt",
+	opF64_Add:                    "f64.add",
+	opF64_Sub:                    "f64.sub",
+	opF64_Mul:                    "f64.mul",
+	opF64_Div:                    "f64.div",
+	opF64_Fmin:                   "f64.fmin",
+	opF64_Fmax:                   "f64.fmax",
+	opF64_Copysign:               "f64.copysign",
+	opI32_WrapI64:                "i32.wrap_i64",
+	opI32_TruncF32S:              "i32.trunc_f32_s",
+	opI32_TruncF32U:              "i32.trunc_f32_u",
+	opI32_TruncF64S:              "i32.trunc_f64_s",
+	opI32_TruncF64U:              "i32.trunc_f64_u",
+	opI64_ExtendI32S:             "i64.extend_i32_s",
+	opI64_ExtendI32U:             "i64.extend_i32_u",
+	opI64_TruncF32S:              "i64.trunc_f32_s",
+	opI64_TruncF32U:              "i64.trunc_f32_u",
+	opI64_TruncF64S:              "i64.trunc_f64_s",
+	opI64_TruncF64U:              "i64.trunc_f64_u",
+	opF32_ConvertI32S:            "f32.convert_i32_s",
+	opF32_ConvertI32U:            "f32.convert_i32_u",
+	opF32_ConvertI64S:            "f32.convert_i64_s",
+	opF32_ConvertI64U:            "f32.convert_i64_u",
+	opF32_DemoteF64:              "f32.demote_f64",
+	opF64_ConvertI32S:            "f64.convert_i32_s",
+	opF64_ConvertI32U:            "f64.convert_i32_u",
+	opF64_ConvertI64S:            "f64.convert_i64_s",
+	opF64_ConvertI64U:            "f64.convert_i64_u",
+	opF64_PromoteF32:             "f64.promote_f32",
+	opI32_ReinterpretF32:         "i32.reinterpret_f32",
+	opI64_ReinterpretF64:         "i64.reinterpret_f64",
+	opF32_ReinterpretI32:         "f32.reinterpret_i32",
+	opF64_ReinterpretI64:         "f64.reinterpret_i64",
+	opI32_Extend8S:               "i32.extend8_s",
+	opI32_Extend16S:              "i32.extend16_s",
+	opI64_Extend8S:               "i64.extend8_s",
+	opI64_Extend16S:              "i64.extend16_s",
+	opI64_Extend32S:              "i64.extend32_s",
+	opRefnull:                    "refnull",
+	opRefisnull:                  "refisnull",
+	opReffunc:                    "reffunc",
+	opI32_TruncSatF32S:           "i32.trunc_sat_f32_s",
+	opI32_TruncSatF32U:           "i32.trunc_sat_f32_u",
+	opI32_TruncSatF64S:           "i32.trunc_sat_f64_s",
+	opI32_TruncSatF64U:           "i32.trunc_sat_f64_u",
+	opI64_TruncSatF32S:           "i64.trunc_sat_f32_s",
+	opI64_TruncSatF32U:           "i64.trunc_sat_f32_u",
+	opI64_TruncSatF64S:           "i64.trunc_sat_f64_s",
+	opI64_TruncSatF64U:           "i64.trunc_sat_f64_u",
+	opMemoryinit:                 "memoryinit",
+	opDatadrop:                   "datadrop",
+	opMemorycopy:                 "memorycopy",
+	opMemoryfill:                 "memoryfill",
+	opTableinit:                  "tableinit",
+	opElemdrop:                   "elemdrop",
+	opTablecopy:                  "tablecopy",
+	opTablegrow:                  "tablegrow",
+	opTablesize:                  "tablesize",
+	opTablefill:                  "tablefill",
+	opV128_Load:                  "v128.load",
+	opV128_Load8x8S:              "v128.load8x8_s",
+	opV128_Load8x8U:              "v128.load8x8_u",
+	opV128_Load16x4S:             "v128.load16x4_s",
+	opV128_Load16x4U:             "v128.load16x4_u",
+	opV128_Load32x2S:             "v128.load32x2_s",
+	opV128_Load32x2U:             "v128.load32x2_u",
+	opV128_Load8Splat:            "v128.load8_splat",
+	opV128_Load16Splat:           "v128.load16_splat",
+	opV128_Load32Splat:           "v128.load32_splat",
+	opV128_Load64Splat:           "v128.load64_splat",
+	opV128_Store:                 "v128.store",
+	opV128_Vconst:                "v128.vconst",
+	opI8x16_Shuffle:              "i8x16.shuffle",
+	opI8x16_Swizzle:              "i8x16.swizzle",
+	opI8x16_Splat:                "i8x16.splat",
+	opI16x8_Splat:                "i16x8.splat",
+	opI32x4_Splat:                "i32x4.splat",
+	opI64x2_Splat:                "i64x2.splat",
+	opF32x4_Splat:                "f32x4.splat",
+	opF64x2_Splat:                "f64x2.splat",
+	opI8x16_ExtractlaneS:         "i8x16.extractlane_s",
+	opI8x16_ExtractlaneU:         "i8x16.extractlane_u",
+	opI8x16_Replacelane:          "i8x16.replacelane",
+	opI16x8_ExtractlaneS:         "i16x8.extractlane_s",
+	opI16x8_ExtractlaneU:         "i16x8.extractlane_u",
+	opI16x8_Replacelane:          "i16x8.replacelane",
+	opI32x4_Extractlane:          "i32x4.extractlane",
+	opI32x4_Replacelane:          "i32x4.replacelane",
+	opI64x2_Extractlane:          "i64x2.extractlane",
+	opI64x2_Replacelane:          "i64x2.replacelane",
+	opF32x4_Extractlane:          "f32x4.extractlane",
+	opF32x4_Replacelane:          "f32x4.replacelane",
+	opF64x2_Extractlane:          "f64x2.extractlane",
+	opF64x2_Replacelane:          "f64x2.replacelane",
+	opI8x16_Veq:                  "i8x16.veq",
+	opI8x16_Vne:                  "i8x16.vne",
+	opI8x16_VltS:                 "i8x16.vlt_s",
+	opI8x16_VltU:                 "i8x16.vlt_u",
+	opI8x16_VgtS:                 "i8x16.vgt_s",
+	opI8x16_VgtU:                 "i8x16.vgt_u",
+	opI8x16_VleS:                 "i8x16.vle_s",
+	opI8x16_VleU:                 "i8x16.vle_u",
+	opI8x16_VgeS:                 "i8x16.vge_s",
+	opI8x16_VgeU:                 "i8x16.vge_u",
+	opI16x8_Veq:                  "i16x8.veq",
+	opI16x8_Vne:                  "i16x8.vne",
+	opI16x8_VltS:                 "i16x8.vlt_s",
+	opI16x8_VltU:                 "i16x8.vlt_u",
+	opI16x8_VgtS:                 "i16x8.vgt_s",
+	opI16x8_VgtU:                 "i16x8.vgt_u",
+	opI16x8_VleS:                 "i16x8.vle_s",
+	opI16x8_VleU:                 "i16x8.vle_u",
+	opI16x8_VgeS:                 "i16x8.vge_s",
+	opI16x8_VgeU:                 "i16x8.vge_u",
+	opI32x4_Veq:                  "i32x4.veq",
+	opI32x4_Vne:                  "i32x4.vne",
+	opI32x4_VltS:                 "i32x4.vlt_s",
+	opI32x4_VltU:                 "i32x4.vlt_u",
+	opI32x4_VgtS:                 "i32x4.vgt_s",
+	opI32x4_VgtU:                 "i32x4.vgt_u",
+	opI32x4_VleS:                 "i32x4.vle_s",
+	opI32x4_VleU:                 "i32x4.vle_u",
+	opI32x4_VgeS:                 "i32x4.vge_s",
+	opI32x4_VgeU:                 "i32x4.vge_u",
+	opF32x4_Veq:                  "f32x4.veq",
+	opF32x4_Vne:                  "f32x4.vne",
+	opF32x4_Vlt:                  "f32x4.vlt",
+	opF32x4_Vgt:                  "f32x4.vgt",
+	opF32x4_Vle:                  "f32x4.vle",
+	opF32x4_Vge:                  "f32x4.vge",
+	opF64x2_Veq:                  "f64x2.veq",
+	opF64x2_Vne:                  "f64x2.vne",
+	opF64x2_Vlt:                  "f64x2.vlt",
+	opF64x2_Vgt:                  "f64x2.vgt",
+	opF64x2_Vle:                  "f64x2.vle",
+	opF64x2_Vge:                  "f64x2.vge",
+	opV128_Vnot:                  "v128.vnot",
+	opV128_Vand:                  "v128.vand",
+	opV128_Vandnot:               "v128.vandnot",
+	opV128_Vor:                   "v128.vor",
+	opV128_Vxor:                  "v128.vxor",
+	opV128_Bitselect:             "v128.bitselect",
+	opV128_Anytrue:               "v128.anytrue",
+	opV128_Load8Lane:             "v128.load8_lane",
+	opV128_Load16Lane:            "v128.load16_lane",
+	opV128_Load32Lane:            "v128.load32_lane",
+	opV128_Load64Lane:            "v128.load64_lane",
+	opV128_Store8Lane:            "v128.store8_lane",
+	opV128_Store16Lane:           "v128.store16_lane",
+	opV128_Store32Lane:           "v128.store32_lane",
+	opV128_Store64Lane:           "v128.store64_lane",
+	opV128_Load32Zero:            "v128.load32_zero",
+	opV128_Load64Zero:            "v128.load64_zero",
+	opF32x4_VdemoteF64x2Zero:     "f32x4.vdemote_f64x2_zero",
+	opF64x2_VpromoteLowF32x4:     "f64x2.vpromote_low_f32x4",
+	opI8x16_Vabs:                 "i8x16.vabs",
+	opI8x16_Vneg:                 "i8x16.vneg",
+	opI8x16_Vpopcnt:              "i8x16.vpopcnt",
+	opI8x16_Alltrue:              "i8x16.alltrue",
+	opI8x16_Bitmask:              "i8x16.bitmask",
+	opI8x16_NarrowI16x8S:         "i8x16.narrow_i16x8_s",
+	opI8x16_NarrowI16x8U:         "i8x16.narrow_i16x8_u",
+	opF32x4_Vceil:                "f32x4.vceil",
+	opF32x4_Vfloor:               "f32x4.vfloor",
+	opF32x4_Vtrunc:               "f32x4.vtrunc",
+	opF32x4_Vnearest:             "f32x4.vnearest",
+	opI8x16_Vshl:                 "i8x16.vshl",
+	opI8x16_VshrS:                "i8x16.vshr_s",
+	opI8x16_VshrU:                "i8x16.vshr_u",
+	opI8x16_Vadd:                 "i8x16.vadd",
+	opI8x16_VaddSatS:             "i8x16.vadd_sat_s",
+	opI8x16_VaddSatU:             "i8x16.vadd_sat_u",
+	opI8x16_Vsub:                 "i8x16.vsub",
+	opI8x16_VsubSatS:             "i8x16.vsub_sat_s",
+	opI8x16_VsubSatU:             "i8x16.vsub_sat_u",
+	opF64x2_Vceil:                "f64x2.vceil",
+	opF64x2_Vfloor:               "f64x2.vfloor",
+	opI8x16_VminS:                "i8x16.vmin_s",
+	opI8x16_VminU:                "i8x16.vmin_u",
+	opI8x16_VmaxS:                "i8x16.vmax_s",
+	opI8x16_VmaxU:                "i8x16.vmax_u",
+	opF64x2_Vtrunc:               "f64x2.vtrunc",
+	opI8x16_AvgrU:                "i8x16.avgr_u",
+	opI16x8_ExtaddpairwiseI8x16S: "i16x8.extaddpairwise_i8x16_s",
+	opI16x8_ExtaddpairwiseI8x16U: "i16x8.extaddpairwise_i8x16_u",
+	opI32x4_ExtaddpairwiseI16x8S: "i32x4.extaddpairwise_i16x8_s",
+	opI32x4_ExtaddpairwiseI16x8U: "i32x4.extaddpairwise_i16x8_u",
+	opI16x8_Vabs:                 "i16x8.vabs",
+	opI16x8_Vneg:                 "i16x8.vneg",
+	opI16x8_Q15mulrsatS:          "i16x8.q15mulrsat_s",
+	opI16x8_Alltrue:              "i16x8.alltrue",
+	opI16x8_Bitmask:              "i16x8.bitmask",
+	opI16x8_NarrowI32x4S:         "i16x8.narrow_i32x4_s",
+	opI16x8_NarrowI32x4U:         "i16x8.narrow_i32x4_u",
+	opI16x8_VextendLowI8x16S:     "i16x8.vextend_low_i8x16_s",
+	opI16x8_VextendHighI8x16S:    "i16x8.vextend_high_i8x16_s",
+	opI16x8_VextendLowI8x16U:     "i16x8.vextend_low_i8x16_u",
+	opI16x8_VextendHighI8x16U:    "i16x8.vextend_high_i8x16_u",
+	opI16x8_Vshl:                 "i16x8.vshl",
+	opI16x8_VshrS:                "i16x8.vshr_s",
+	opI16x8_VshrU:                "i16x8.vshr_u",
+	opI16x8_Vadd:                 "i16x8.vadd",
+	opI16x8_VaddSatS:             "i16x8.vadd_sat_s",
+	opI16x8_VaddSatU:             "i16x8.vadd_sat_u",
+	opI16x8_Vsub:                 "i16x8.vsub",
+	opI16x8_VsubSatS:             "i16x8.vsub_sat_s",
+	opI16x8_VsubSatU:             "i16x8.vsub_sat_u",
+	opF64x2_Vnearest:             "f64x2.vnearest",
+	opI16x8_Vmul:                 "i16x8.vmul",
+	opI16x8_VminS:                "i16x8.vmin_s",
+	opI16x8_VminU:                "i16x8.vmin_u",
+	opI16x8_VmaxS:                "i16x8.vmax_s",
+	opI16x8_VmaxU:                "i16x8.vmax_u",
+	opI16x8_AvgrU:                "i16x8.avgr_u",
+	opI16x8_ExtmulLowI8x16S:      "i16x8.extmul_low_i8x16_s",
+	opI16x8_ExtmulHighI8x16S:     "i16x8.extmul_high_i8x16_s",
+	opI16x8_ExtmulLowI8x16U:      "i16x8.extmul_low_i8x16_u",
+	opI16x8_ExtmulHighI8x16U:     "i16x8.extmul_high_i8x16_u",
+	opI32x4_Vabs:                 "i32x4.vabs",
+	opI32x4_Vneg:                 "i32x4.vneg",
+	opI32x4_Alltrue:              "i32x4.alltrue",
+	opI32x4_Bitmask:              "i32x4.bitmask",
+	opI32x4_VextendLowI16x8S:     "i32x4.vextend_low_i16x8_s",
+	opI32x4_VextendHighI16x8S:    "i32x4.vextend_high_i16x8_s",
+	opI32x4_VextendLowI16x8U:     "i32x4.vextend_low_i16x8_u",
+	opI32x4_VextendHighI16x8U:    "i32x4.vextend_high_i16x8_u",
+	opI32x4_Vshl:                 "i32x4.vshl",
+	opI32x4_VshrS:                "i32x4.vshr_s",
+	opI32x4_VshrU:                "i32x4.vshr_u",
+	opI32x4_Vadd:                 "i32x4.vadd",
+	opI32x4_Vsub:                 "i32x4.vsub",
+	opI32x4_Vmul:                 "i32x4.vmul",
+	opI32x4_VminS:                "i32x4.vmin_s",
+	opI32x4_VminU:                "i32x4.vmin_u",
+	opI32x4_VmaxS:                "i32x4.vmax_s",
+	opI32x4_VmaxU:                "i32x4.vmax_u",
+	opI32x4_DotI16x8S:            "i32x4.dot_i16x8_s",
+	opI32x4_ExtmulLowI16x8S:      "i32x4.extmul_low_i16x8_s",
+	opI32x4_ExtmulHighI16x8S:     "i32x4.extmul_high_i16x8_s",
+	opI32x4_ExtmulLowI16x8U:      "i32x4.extmul_low_i16x8_u",
+	opI32x4_ExtmulHighI16x8U:     "i32x4.extmul_high_i16x8_u",
+	opI64x2_Vabs:                 "i64x2.vabs",
+	opI64x2_Vneg:                 "i64x2.vneg",
+	opI64x2_Alltrue:              "i64x2.alltrue",
+	opI64x2_Bitmask:              "i64x2.bitmask",
+	opI64x2_VextendLowI32x4S:     "i64x2.vextend_low_i32x4_s",
+	opI64x2_VextendHighI32x4S:    "i64x2.vextend_high_i32x4_s",
+	opI64x2_VextendLowI32x4U:     "i64x2.vextend_low_i32x4_u",
+	opI64x2_VextendHighI32x4U:    "i64x2.vextend_high_i32x4_u",
+	opI64x2_Vshl:                 "i64x2.vshl",
+	opI64x2_VshrS:                "i64x2.vshr_s",
+	opI64x2_VshrU:                "i64x2.vshr_u",
+	opI64x2_Vadd:                 "i64x2.vadd",
+	opI64x2_Vsub:                 "i64x2.vsub",
+	opI64x2_Vmul:                 "i64x2.vmul",
+	opI64x2_Veq:                  "i64x2.veq",
+	opI64x2_Vne:                  "i64x2.vne",
+	opI64x2_VltS:                 "i64x2.vlt_s",
+	opI64x2_VgtS:                 "i64x2.vgt_s",
+	opI64x2_VleS:                 "i64x2.vle_s",
+	opI64x2_VgeS:                 "i64x2.vge_s",
+	opI64x2_ExtmulLowI32x4S:      "i64x2.extmul_low_i32x4_s",
+	opI64x2_ExtmulHighI32x4S:     "i64x2.extmul_high_i32x4_s",
+	opI64x2_ExtmulLowI32x4U:      "i64x2.extmul_low_i32x4_u",
+	opI64x2_ExtmulHighI32x4U:     "i64x2.extmul_high_i32x4_u",
+	opF32x4_Vabs:                 "f32x4.vabs",
+	opF32x4_Vneg:                 "f32x4.vneg",
+	opF32x4_Vsqrt:                "f32x4.vsqrt",
+	opF32x4_Vadd:                 "f32x4.vadd",
+	opF32x4_Vsub:                 "f32x4.vsub",
+	opF32x4_Vmul:                 "f32x4.vmul",
+	opF32x4_Vdiv:                 "f32x4.vdiv",
+	opF32x4_Vmin:                 "f32x4.vmin",
+	opF32x4_Vmax:                 "f32x4.vmax",
+	opF32x4_Vpmin:                "f32x4.vpmin",
+	opF32x4_Vpmax:                "f32x4.vpmax",
+	opF64x2_Vabs:                 "f64x2.vabs",
+	opF64x2_Vneg:                 "f64x2.vneg",
+	opF64x2_Vsqrt:                "f64x2.vsqrt",
+	opF64x2_Vadd:                 "f64x2.vadd",
+	opF64x2_Vsub:                 "f64x2.vsub",
+	opF64x2_Vmul:                 "f64x2.vmul",
+	opF64x2_Vdiv:                 "f64x2.vdiv",
+	opF64x2_Vmin:                 "f64x2.vmin",
+	opF64x2_Vmax:                 "f64x2.vmax",
+	opF64x2_Vpmin:                "f64x2.vpmin",
+	opF64x2_Vpmax:                "f64x2.vpmax",
+	opI32x4_TruncSatF32x4S:       "i32x4.trunc_sat_f32x4_s",
+	opI32x4_TruncSatF32x4U:       "i32x4.trunc_sat_f32x4_u",
+	opF32x4_VconvertI32x4S:       "f32x4.vconvert_i32x4_s",
+	opF32x4_VconvertI32x4U:       "f32x4.vconvert_i32x4_u",
+	opI32x4_VtruncSatF64x2SZero:  "i32x4.vtrunc_sat_f64x2_s_zero",
+	opI32x4_VtruncSatF64x2UZero:  "i32x4.vtrunc_sat_f64x2_u_zero",
+	opF64x2_VconvertLowI32x4S:    "f64x2.vconvert_low_i32x4_s",
+	opF64x2_VconvertLowI32x4U:    "f64x2.vconvert_low_i32x4_u",
+}
+
+// Opcode IDs by opcode byte, and by the LEB128 value following the FC and
+// FD prefixes.
+var (
+	opcodesByByte = [0x100]opcode{
+		0x00: opUnreachable,
+		0x01: opNop,
+		0x02: opBlock,
+		0x03: opLoop,
+		0x04: opIf,
+		0x05: opElse,
+		0x0b: opEnd,
+		0x0c: opBr,
+		0x0d: opBrif,
+		0x0e: opBrtable,
+		0x0f: opReturn,
+		0x10: opCall,
+		0x11: opCallindirect,
+		0x1a: opDrop,
+		0x1b: opSelect,
+		0x1c: opSelectTyped,
+		0x20: opLocalget,
+		0x21: opLocalset,
+		0x22: opLocaltee,
+		0x23: opGlobalget,
+		0x24: opGlobalset,
+		0x25: opTableget,
+		0x26: opTableset,
+		0x28: opI32_Load,
+		0x29: opI64_Load,
+		0x2a: opF32_Load,
+		0x2b: opF64_Load,
+		0x2c: opI32_Load8S,
+		0x2d: opI32_Load8U,
+		0x2e: opI32_Load16S,
+		0x2f: opI32_Load16U,
+		0x30: opI64_Load8S,
+		0x31: opI64_Load8U,
+		0x32: opI64_Load16S,
+		0x33: opI64_Load16U,
+		0x34: opI64_Load32S,
+		0x35: opI64_Load32U,
+		0x36: opI32_Store,
+		0x37: opI64_Store,
+		0x38: opF32_Store,
+		0x39: opF64_Store,
+		0x3a: opI32_Store8,
+		0x3b: opI32_Store16,
+		0x3c: opI64_Store8,
+		0x3d: opI64_Store16,
+		0x3e: opI64_Store32,
+		0x3f: opMemorysize,
+		0x40: opMemorygrow,
+		0x41: opI32_Const,
+		0x42: opI64_Const,
+		0x43: opF32_Const,
+		0x44: opF64_Const,
+		0x45: opI32_Eqz,
+		0x46: opI32_Eq,
+		0x47: opI32_Ne,
+		0x48: opI32_LtS,
+		0x49: opI32_LtU,
+		0x4a: opI32_GtS,
+		0x4b: opI32_GtU,
+		0x4c: opI32_LeS,
+		0x4d: opI32_LeU,
+		0x4e: opI32_GeS,
+		0x4f: opI32_GeU,
+		0x50: opI64_Eqz,
+		0x51: opI64_Eq,
+		0x52: opI64_Ne,
+		0x53: opI64_LtS,
+		0x54: opI64_LtU,
+		0x55: opI64_GtS,
+		0x56: opI64_GtU,
+		0x57: opI64_LeS,
+		0x58: opI64_LeU,
+		0x59: opI64_GeS,
+		0x5a: opI64_GeU,
+		0x5b: opF32_Eq,
+		0x5c: opF32_Ne,
+		0x5d: opF32_Lt,
+		0x5e: opF32_Gt,
+		0x5f: opF32_Le,
+		0x60: opF32_Ge,
+		0x61: opF64_Eq,
+		0x62: opF64_Ne,
+		0x63: opF64_Lt,
+		0x64: opF64_Gt,
+		0x65: opF64_Le,
+		0x66: opF64_Ge,
+		0x67: opI32_Clz,
+		0x68: opI32_Ctz,
+		0x69: opI32_Popcnt,
+		0x6a: opI32_Add,
+		0x6b: opI32_Sub,
+		0x6c: opI32_Mul,
+		0x6d: opI32_DivS,
+		0x6e: opI32_DivU,
+		0x6f: opI32_RemS,
+		0x70: opI32_RemU,
+		0x71: opI32_And,
+		0x72: opI32_Or,
+		0x73: opI32_Xor,
+		0x74: opI32_Shl,
+		0x75: opI32_ShrS,
+		0x76: opI32_ShrU,
+		0x77: opI32_Rotl,
+		0x78: opI32_Rotr,
+		0x79: opI64_Clz,
+		0x7a: opI64_Ctz,
+		0x7b: opI64_Popcnt,
+		0x7c: opI64_Add,
+		0x7d: opI64_Sub,
+		0x7e: opI64_Mul,
+		0x7f: opI64_DivS,
+		0x80: opI64_DivU,
+		0x81: opI64_RemS,
+		0x82: opI64_RemU,
+		0x83: opI64_And,
+		0x84: opI64_Or,
+		0x85: opI64_Xor,
+		0x86: opI64_Shl,
+		0x87: opI64_ShrS,
+		0x88: opI64_ShrU,
+		0x89: opI64_Rotl,
+		0x8a: opI64_Rotr,
+		0x8b: opF32_Abs,
+		0x8c: opF32_Neg,
+		0x8d: opF32_Ceil,
+		0x8e: opF32_Floor,
+		0x8f: opF32_Trunc,
+		0x90: opF32_Nearest,
+		0x91: opF32_Sqrt,
+		0x92: opF32_Add,
+		0x93: opF32_Sub,
+		0x94: opF32_Mul,
+		0x95: opF32_Div,
+		0x96: opF32_Fmin,
+		0x97: opF32_Fmax,
+		0x98: opF32_Copysign,
+		0x99: opF64_Abs,
+		0x9a: opF64_Neg,
+		0x9b: opF64_Ceil,
+		0x9c: opF64_Floor,
+		0x9d: opF64_Trunc,
+		0x9e: opF64_Nearest,
+		0x9f: opF64_Sqrt,
+		0xa0: opF64_Add,
+		0xa1: opF64_Sub,
+		0xa2: opF64_Mul,
+		0xa3: opF64_Div,
+		0xa4: opF64_Fmin,
+		0xa5: opF64_Fmax,
+		0xa6: opF64_Copysign,
+		0xa7: opI32_WrapI64,
+		0xa8: opI32_TruncF32S,
+		0xa9: opI32_TruncF32U,
+		0xaa: opI32_TruncF64S,
+		0xab: opI32_TruncF64U,
+		0xac: opI64_ExtendI32S,
+		0xad: opI64_ExtendI32U,
+		0xae: opI64_TruncF32S,
+		0xaf: opI64_TruncF32U,
+		0xb0: opI64_TruncF64S,
+		0xb1: opI64_TruncF64U,
+		0xb2: opF32_ConvertI32S,
+		0xb3: opF32_ConvertI32U,
+		0xb4: opF32_ConvertI64S,
+		0xb5: opF32_ConvertI64U,
+		0xb6: opF32_DemoteF64,
+		0xb7: opF64_ConvertI32S,
+		0xb8: opF64_ConvertI32U,
+		0xb9: opF64_ConvertI64S,
+		0xba: opF64_ConvertI64U,
+		0xbb: opF64_PromoteF32,
+		0xbc: opI32_ReinterpretF32,
+		0xbd: opI64_ReinterpretF64,
+		0xbe: opF32_ReinterpretI32,
+		0xbf: opF64_ReinterpretI64,
+		0xc0: opI32_Extend8S,
+		0xc1: opI32_Extend16S,
+		0xc2: opI64_Extend8S,
+		0xc3: opI64_Extend16S,
+		0xc4: opI64_Extend32S,
+		0xd0: opRefnull,
+		0xd1: opRefisnull,
+		0xd2: opReffunc,
+	}
+	opcodesFC = [0x12]opcode{
+		0x00: opI32_TruncSatF32S,
+		0x01: opI32_TruncSatF32U,
+		0x02: opI32_TruncSatF64S,
+		0x03: opI32_TruncSatF64U,
+		0x04: opI64_TruncSatF32S,
+		0x05: opI64_TruncSatF32U,
+		0x06: opI64_TruncSatF64S,
+		0x07: opI64_TruncSatF64U,
+		0x08: opMemoryinit,
+		0x09: opDatadrop,
+		0x0a: opMemorycopy,
+		0x0b: opMemoryfill,
+		0x0c: opTableinit,
+		0x0d: opElemdrop,
+		0x0e: opTablecopy,
+		0x0f: opTablegrow,
+		0x10: opTablesize,
+		0x11: opTablefill,
+	}
+	opcodesFD = [0x100]opcode{
+		0x00: opV128_Load,
+		0x01: opV128_Load8x8S,
+		0x02: opV128_Load8x8U,
+		0x03: opV128_Load16x4S,
+		0x04: opV128_Load16x4U,
+		0x05: opV128_Load32x2S,
+		0x06: opV128_Load32x2U,
+		0x07: opV128_Load8Splat,
+		0x08: opV128_Load16Splat,
+		0x09: opV128_Load32Splat,
+		0x0a: opV128_Load64Splat,
+		0x0b: opV128_Store,
+		0x0c: opV128_Vconst,
+		0x0d: opI8x16_Shuffle,
+		0x0e: opI8x16_Swizzle,
+		0x0f: opI8x16_Splat,
+		0x10: opI16x8_Splat,
+		0x11: opI32x4_Splat,
+		0x12: opI64x2_Splat,
+		0x13: opF32x4_Splat,
+		0x14: opF64x2_Splat,
+		0x15: opI8x16_ExtractlaneS,
+		0x16: opI8x16_ExtractlaneU,
+		0x17: opI8x16_Replacelane,
+		0x18: opI16x8_ExtractlaneS,
+		0x19: opI16x8_ExtractlaneU,
+		0x1a: opI16x8_Replacelane,
+		0x1b: opI32x4_Extractlane,
+		0x1c: opI32x4_Replacelane,
+		0x1d: opI64x2_Extractlane,
+		0x1e: opI64x2_Replacelane,
+		0x1f: opF32x4_Extractlane,
+		0x20: opF32x4_Replacelane,
+		0x21: opF64x2_Extractlane,
+		0x22: opF64x2_Replacelane,
+		0x23: opI8x16_Veq,
+		0x24: opI8x16_Vne,
+		0x25: opI8x16_VltS,
+		0x26: opI8x16_VltU,
+		0x27: opI8x16_VgtS,
+		0x28: opI8x16_VgtU,
+		0x29: opI8x16_VleS,
+		0x2a: opI8x16_VleU,
+		0x2b: opI8x16_VgeS,
+		0x2c: opI8x16_VgeU,
+		0x2d: opI16x8_Veq,
+		0x2e: opI16x8_Vne,
+		0x2f: opI16x8_VltS,
+		0x30: opI16x8_VltU,
+		0x31: opI16x8_VgtS,
+		0x32: opI16x8_VgtU,
+		0x33: opI16x8_VleS,
+		0x34: opI16x8_VleU,
+		0x35: opI16x8_VgeS,
+		0x36: opI16x8_VgeU,
+		0x37: opI32x4_Veq,
+		0x38: opI32x4_Vne,
+		0x39: opI32x4_VltS,
+		0x3a: opI32x4_VltU,
+		0x3b: opI32x4_VgtS,
+		0x3c: opI32x4_VgtU,
+		0x3d: opI32x4_VleS,
+		0x3e: opI32x4_VleU,
+		0x3f: opI32x4_VgeS,
+		0x40: opI32x4_VgeU,
+		0x41: opF32x4_Veq,
+		0x42: opF32x4_Vne,
+		0x43: opF32x4_Vlt,
+		0x44: opF32x4_Vgt,
+		0x45: opF32x4_Vle,
+		0x46: opF32x4_Vge,
+		0x47: opF64x2_Veq,
+		0x48: opF64x2_Vne,
+		0x49: opF64x2_Vlt,
+		0x4a: opF64x2_Vgt,
+		0x4b: opF64x2_Vle,
+		0x4c: opF64x2_Vge,
+		0x4d: opV128_Vnot,
+		0x4e: opV128_Vand,
+		0x4f: opV128_Vandnot,
+		0x50: opV128_Vor,
+		0x51: opV128_Vxor,
+		0x52: opV128_Bitselect,
+		0x53: opV128_Anytrue,
+		0x54: opV128_Load8Lane,
+		0x55: opV128_Load16Lane,
+		0x56: opV128_Load32Lane,
+		0x57: opV128_Load64Lane,
+		0x58: opV128_Store8Lane,
+		0x59: opV128_Store16Lane,
+		0x5a: opV128_Store32Lane,
+		0x5b: opV128_Store64Lane,
+		0x5c: opV128_Load32Zero,
+		0x5d: opV128_Load64Zero,
+		0x5e: opF32x4_VdemoteF64x2Zero,
+		0x5f: opF64x2_VpromoteLowF32x4,
+		0x60: opI8x16_Vabs,
+		0x61: opI8x16_Vneg,
+		0x62: opI8x16_Vpopcnt,
+		0x63: opI8x16_Alltrue,
+		0x64: opI8x16_Bitmask,
+		0x65: opI8x16_NarrowI16x8S,
+		0x66: opI8x16_NarrowI16x8U,
+		0x67: opF32x4_Vceil,
+		0x68: opF32x4_Vfloor,
+		0x69: opF32x4_Vtrunc,
+		0x6a: opF32x4_Vnearest,
+		0x6b: opI8x16_Vshl,
+		0x6c: opI8x16_VshrS,
+		0x6d: opI8x16_VshrU,
+		0x6e: opI8x16_Vadd,
+		0x6f: opI8x16_VaddSatS,
+		0x70: opI8x16_VaddSatU,
+		0x71: opI8x16_Vsub,
+		0x72: opI8x16_VsubSatS,
+		0x73: opI8x16_VsubSatU,
+		0x74: opF64x2_Vceil,
+		0x75: opF64x2_Vfloor,
+		0x76: opI8x16_VminS,
+		0x77: opI8x16_VminU,
+		0x78: opI8x16_VmaxS,
+		0x79: opI8x16_VmaxU,
+		0x7a: opF64x2_Vtrunc,
+		0x7b: opI8x16_AvgrU,
+		0x7c: opI16x8_ExtaddpairwiseI8x16S,
+		0x7d: opI16x8_ExtaddpairwiseI8x16U,
+		0x7e: opI32x4_ExtaddpairwiseI16x8S,
+		0x7f: opI32x4_ExtaddpairwiseI16x8U,
+		0x80: opI16x8_Vabs,
+		0x81: opI16x8_Vneg,
+		0x82: opI16x8_Q15mulrsatS,
+		0x83: opI16x8_Alltrue,
+		0x84: opI16x8_Bitmask,
+		0x85: opI16x8_NarrowI32x4S,
+		0x86: opI16x8_NarrowI32x4U,
+		0x87: opI16x8_VextendLowI8x16S,
+		0x88: opI16x8_VextendHighI8x16S,
+		0x89: opI16x8_VextendLowI8x16U,
+		0x8a: opI16x8_VextendHighI8x16U,
+		0x8b: opI16x8_Vshl,
+		0x8c: opI16x8_VshrS,
+		0x8d: opI16x8_VshrU,
+		0x8e: opI16x8_Vadd,
+		0x8f: opI16x8_VaddSatS,
+		0x90: opI16x8_VaddSatU,
+		0x91: opI16x8_Vsub,
+		0x92: opI16x8_VsubSatS,
+		0x93: opI16x8_VsubSatU,
+		0x94: opF64x2_Vnearest,
+		0x95: opI16x8_Vmul,
+		0x96: opI16x8_VminS,
+		0x97: opI16x8_VminU,
+		0x98: opI16x8_VmaxS,
+		0x99: opI16x8_VmaxU,
+		0x9b: opI16x8_AvgrU,
+		0x9c: opI16x8_ExtmulLowI8x16S,
+		0x9d: opI16x8_ExtmulHighI8x16S,
+		0x9e: opI16x8_ExtmulLowI8x16U,
+		0x9f: opI16x8_ExtmulHighI8x16U,
+		0xa0: opI32x4_Vabs,
+		0xa1: opI32x4_Vneg,
+		0xa3: opI32x4_Alltrue,
+		0xa4: opI32x4_Bitmask,
+		0xa7: opI32x4_VextendLowI16x8S,
+		0xa8: opI32x4_VextendHighI16x8S,
+		0xa9: opI32x4_VextendLowI16x8U,
+		0xaa: opI32x4_VextendHighI16x8U,
+		0xab: opI32x4_Vshl,
+		0xac: opI32x4_VshrS,
+		0xad: opI32x4_VshrU,
+		0xae: opI32x4_Vadd,
+		0xb1: opI32x4_Vsub,
+		0xb5: opI32x4_Vmul,
+		0xb6: opI32x4_VminS,
+		0xb7: opI32x4_VminU,
+		0xb8: opI32x4_VmaxS,
+		0xb9: opI32x4_VmaxU,
+		0xba: opI32x4_DotI16x8S,
+		0xbc: opI32x4_ExtmulLowI16x8S,
+		0xbd: opI32x4_ExtmulHighI16x8S,
+		0xbe: opI32x4_ExtmulLowI16x8U,
+		0xbf: opI32x4_ExtmulHighI16x8U,
+		0xc0: opI64x2_Vabs,
+		0xc1: opI64x2_Vneg,
+		0xc3: opI64x2_Alltrue,
+		0xc4: opI64x2_Bitmask,
+		0xc7: opI64x2_VextendLowI32x4S,
+		0xc8: opI64x2_VextendHighI32x4S,
+		0xc9: opI64x2_VextendLowI32x4U,
+		0xca: opI64x2_VextendHighI32x4U,
+		0xcb: opI64x2_Vshl,
+		0xcc: opI64x2_VshrS,
+		0xcd: opI64x2_VshrU,
+		0xce: opI64x2_Vadd,
+		0xd1: opI64x2_Vsub,
+		0xd5: opI64x2_Vmul,
+		0xd6: opI64x2_Veq,
+		0xd7: opI64x2_Vne,
+		0xd8: opI64x2_VltS,
+		0xd9: opI64x2_VgtS,
+		0xda: opI64x2_VleS,
+		0xdb: opI64x2_VgeS,
+		0xdc: opI64x2_ExtmulLowI32x4S,
+		0xdd: opI64x2_ExtmulHighI32x4S,
+		0xde: opI64x2_ExtmulLowI32x4U,
+		0xdf: opI64x2_ExtmulHighI32x4U,
+		0xe0: opF32x4_Vabs,
+		0xe1: opF32x4_Vneg,
+		0xe3: opF32x4_Vsqrt,
+		0xe4: opF32x4_Vadd,
+		0xe5: opF32x4_Vsub,
+		0xe6: opF32x4_Vmul,
+		0xe7: opF32x4_Vdiv,
+		0xe8: opF32x4_Vmin,
+		0xe9: opF32x4_Vmax,
+		0xea: opF32x4_Vpmin,
+		0xeb: opF32x4_Vpmax,
+		0xec: opF64x2_Vabs,
+		0xed: opF64x2_Vneg,
+		0xef: opF64x2_Vsqrt,
+		0xf0: opF64x2_Vadd,
+		0xf1: opF64x2_Vsub,
+		0xf2: opF64x2_Vmul,
+		0xf3: opF64x2_Vdiv,
+		0xf4: opF64x2_Vmin,
+		0xf5: opF64x2_Vmax,
+		0xf6: opF64x2_Vpmin,
+		0xf7: opF64x2_Vpmax,
+		0xf8: opI32x4_TruncSatF32x4S,
+		0xf9: opI32x4_TruncSatF32x4U,
+		0xfa: opF32x4_VconvertI32x4S,
+		0xfb: opF32x4_VconvertI32x4U,
+		0xfc: opI32x4_VtruncSatF64x2SZero,
+		0xfd: opI32x4_VtruncSatF64x2UZero,
+		0xfe: opF64x2_VconvertLowI32x4S,
+		0xff: opF64x2_VconvertLowI32x4U,
+	}
+)
+
+// Encoded opcodes, including any prefix byte.
+var opcodeEncodings = [numOpcodes]string{
+	opUnreachable:                "\x00",
+	opNop:                        "\x01",
+	opBlock:                      "\x02",
+	opLoop:                       "\x03",
+	opIf:                         "\x04",
+	opElse:                       "\x05",
+	opEnd:                        "\x0B",
+	opBr:                         "\x0C",
+	opBrif:                       "\x0D",
+	opBrtable:                    "\x0E",
+	opReturn:                     "\x0F",
+	opCall:                       "\x10",
+	opCallindirect:               "\x11",
+	opDrop:                       "\x1A",
+	opSelect:                     "\x1B",
+	opSelectTyped:                "\x1C",
+	opLocalget:                   "\x20",
+	opLocalset:                   "\x21",
+	opLocaltee:                   "\x22",
+	opGlobalget:                  "\x23",
+	opGlobalset:                  "\x24",
+	opTableget:                   "\x25",
+	opTableset:                   "\x26",
+	opI32_Load:                   "\x28",
+	opI64_Load:                   "\x29",
+	opF32_Load:                   "\x2A",
+	opF64_Load:                   "\x2B",
+	opI32_Load8S:                 "\x2C",
+	opI32_Load8U:                 "\x2D",
+	opI32_Load16S:                "\x2E",
+	opI32_Load16U:                "\x2F",
+	opI64_Load8S:                 "\x30",
+	opI64_Load8U:                 "\x31",
+	opI64_Load16S:                "\x32",
+	opI64_Load16U:                "\x33",
+	opI64_Load32S:                "\x34",
+	opI64_Load32U:                "\x35",
+	opI32_Store:                  "\x36",
+	opI64_Store:                  "\x37",
+	opF32_Store:                  "\x38",
+	opF64_Store:                  "\x39",
+	opI32_Store8:                 "\x3A",
+	opI32_Store16:                "\x3B",
+	opI64_Store8:                 "\x3C",
+	opI64_Store16:                "\x3D",
+	opI64_Store32:                "\x3E",
+	opMemorysize:                 "\x3F",
+	opMemorygrow:                 "\x40",
+	opI32_Const:                  "\x41",
+	opI64_Const:                  "\x42",
+	opF32_Const:                  "\x43",
+	opF64_Const:                  "\x44",
+	opI32_Eqz:                    "\x45",
+	opI32_Eq:                     "\x46",
+	opI32_Ne:                     "\x47",
+	opI32_LtS:                    "\x48",
+	opI32_LtU:                    "\x49",
+	opI32_GtS:                    "\x4A",
+	opI32_GtU:                    "\x4B",
+	opI32_LeS:                    "\x4C",
+	opI32_LeU:                    "\x4D",
+	opI32_GeS:                    "\x4E",
+	opI32_GeU:                    "\x4F",
+	opI64_Eqz:                    "\x50",
+	opI64_Eq:                     "\x51",
+	opI64_Ne:                     "\x52",
+	opI64_LtS:                    "\x53",
+	opI64_LtU:                    "\x54",
+	opI64_GtS:                    "\x55",
+	opI64_GtU:                    "\x56",
+	opI64_LeS:                    "\x57",
+	opI64_LeU:                    "\x58",
+	opI64_GeS:                    "\x59",
+	opI64_GeU:                    "\x5A",
+	opF32_Eq:                     "\x5B",
+	opF32_Ne:                     "\x5C",
+	opF32_Lt:                     "\x5D",
+	opF32_Gt:                     "\x5E",
+	opF32_Le:                     "\x5F",
+	opF32_Ge:                     "\x60",
+	opF64_Eq:                     "\x61",
+	opF64_Ne:                     "\x62",
+	opF64_Lt:                     "\x63",
+	opF64_Gt:                     "\x64",
+	opF64_Le:                     "\x65",
+	opF64_Ge:                     "\x66",
+	opI32_Clz:                    "\x67",
+	opI32_Ctz:                    "\x68",
+	opI32_Popcnt:                 "\x69",
+	opI32_Add:                    "\x6A",
+	opI32_Sub:                    "\x6B",
+	opI32_Mul:                    "\x6C",
+	opI32_DivS:                   "\x6D",
+	opI32_DivU:                   "\x6E",
+	opI32_RemS:                   "\x6F",
+	opI32_RemU:                   "\x70",
+	opI32_And:                    "\x71",
+	opI32_Or:                     "\x72",
+	opI32_Xor:                    "\x73",
+	opI32_Shl:                    "\x74",
+	opI32_ShrS:                   "\x75",
+	opI32_ShrU:                   "\x76",
+	opI32_Rotl:                   "\x77",
+	opI32_Rotr:                   "\x78",
+	opI64_Clz:                    "\x79",
+	opI64_Ctz:                    "\x7A",
+	opI64_Popcnt:                 "\x7B",
+	opI64_Add:                    "\x7C",
+	opI64_Sub:                    "\x7D",
+	opI64_Mul:                    "\x7E",
+	opI64_DivS:                   "\x7F",
+	opI64_DivU:                   "\x80",
+	opI64_RemS:                   "\x81",
+	opI64_RemU:                   "\x82",
+	opI64_And:                    "\x83",
+	opI64_Or:                     "\x84",
+	opI64_Xor:                    "\x85",
+	opI64_Shl:                    "\x86",
+	opI64_ShrS:                   "\x87",
+	opI64_ShrU:                   "\x88",
+	opI64_Rotl:                   "\x89",
+	opI64_Rotr:                   "\x8A",
+	opF32_Abs:                    "\x8B",
+	opF32_Neg:                    "\x8C",
+	opF32_Ceil:                   "\x8D",
+	opF32_Floor:                  "\x8E",
+	opF32_Trunc:                  "\x8F",
+	opF32_Nearest:                "\x90",
+	opF32_Sqrt:                   "\x91",
+	opF32_Add:                    "\x92",
+	opF32_Sub:                    "\x93",
+	opF32_Mul:                    "\x94",
+	opF32_Div:                    "\x95",
+	opF32_Fmin:                   "\x96",
+	opF32_Fmax:                   "\x97",
+	opF32_Copysign:               "\x98",
+	opF64_Abs:                    "\x99",
+	opF64_Neg:                    "\x9A",
+	opF64_Ceil:                   "\x9B",
+	opF64_Floor:                  "\x9C",
+	opF64_Trunc:                  "\x9D",
+	opF64_Nearest:                "\x9E",
+	opF64_Sqrt:                   "\x9F",
+	opF64_Add:                    "\xA0",
+	opF64_Sub:                    "\xA1",
+	opF64_Mul:                    "\xA2",
+	opF64_Div:                    "\xA3",
+	opF64_Fmin:                   "\xA4",
+	opF64_Fmax:                   "\xA5",
+	opF64_Copysign:               "\xA6",
+	opI32_WrapI64:                "\xA7",
+	opI32_TruncF32S:              "\xA8",
+	opI32_TruncF32U:              "\xA9",
+	opI32_TruncF64S:              "\xAA",
+	opI32_TruncF64U:              "\xAB",
+	opI64_ExtendI32S:             "\xAC",
+	opI64_ExtendI32U:             "\xAD",
+	opI64_TruncF32S:              "\xAE",
+	opI64_TruncF32U:              "\xAF",
+	opI64_TruncF64S:              "\xB0",
+	opI64_TruncF64U:              "\xB1",
+	opF32_ConvertI32S:            "\xB2",
+	opF32_ConvertI32U:            "\xB3",
+	opF32_ConvertI64S:            "\xB4",
+	opF32_ConvertI64U:            "\xB5",
+	opF32_DemoteF64:              "\xB6",
+	opF64_ConvertI32S:            "\xB7",
+	opF64_ConvertI32U:            "\xB8",
+	opF64_ConvertI64S:            "\xB9",
+	opF64_ConvertI64U:            "\xBA",
+	opF64_PromoteF32:             "\xBB",
+	opI32_ReinterpretF32:         "\xBC",
+	opI64_ReinterpretF64:         "\xBD",
+	opF32_ReinterpretI32:         "\xBE",
+	opF64_ReinterpretI64:         "\xBF",
+	opI32_Extend8S:               "\xC0",
+	opI32_Extend16S:              "\xC1",
+	opI64_Extend8S:               "\xC2",
+	opI64_Extend16S:              "\xC3",
+	opI64_Extend32S:              "\xC4",
+	opRefnull:                    "\xD0",
+	opRefisnull:                  "\xD1",
+	opReffunc:                    "\xD2",
+	opI32_TruncSatF32S:           "\xFC\x00",
+	opI32_TruncSatF32U:           "\xFC\x01",
+	opI32_TruncSatF64S:           "\xFC\x02",
+	opI32_TruncSatF64U:           "\xFC\x03",
+	opI64_TruncSatF32S:           "\xFC\x04",
+	opI64_TruncSatF32U:           "\xFC\x05",
+	opI64_TruncSatF64S:           "\xFC\x06",
+	opI64_TruncSatF64U:           "\xFC\x07",
+	opMemoryinit:                 "\xFC\x08",
+	opDatadrop:                   "\xFC\x09",
+	opMemorycopy:                 "\xFC\x0A",
+	opMemoryfill:                 "\xFC\x0B",
+	opTableinit:                  "\xFC\x0C",
+	opElemdrop:                   "\xFC\x0D",
+	opTablecopy:                  "\xFC\x0E",
+	opTablegrow:                  "\xFC\x0F",
+	opTablesize:                  "\xFC\x10",
+	opTablefill:                  "\xFC\x11",
+	opV128_Load:                  "\xFD\x00",
+	opV128_Load8x8S:              "\xFD\x01",
+	opV128_Load8x8U:              "\xFD\x02",
+	opV128_Load16x4S:             "\xFD\x03",
+	opV128_Load16x4U:             "\xFD\x04",
+	opV128_Load32x2S:             "\xFD\x05",
+	opV128_Load32x2U:             "\xFD\x06",
+	opV128_Load8Splat:            "\xFD\x07",
+	opV128_Load16Splat:           "\xFD\x08",
+	opV128_Load32Splat:           "\xFD\x09",
+	opV128_Load64Splat:           "\xFD\x0A",
+	opV128_Store:                 "\xFD\x0B",
+	opV128_Vconst:                "\xFD\x0C",
+	opI8x16_Shuffle:              "\xFD\x0D",
+	opI8x16_Swizzle:              "\xFD\x0E",
+	opI8x16_Splat:                "\xFD\x0F",
+	opI16x8_Splat:                "\xFD\x10",
+	opI32x4_Splat:                "\xFD\x11",
+	opI64x2_Splat:                "\xFD\x12",
+	opF32x4_Splat:                "\xFD\x13",
+	opF64x2_Splat:                "\xFD\x14",
+	opI8x16_ExtractlaneS:         "\xFD\x15",
+	opI8x16_ExtractlaneU:         "\xFD\x16",
+	opI8x16_Replacelane:          "\xFD\x17",
+	opI16x8_ExtractlaneS:         "\xFD\x18",
+	opI16x8_ExtractlaneU:         "\xFD\x19",
+	opI16x8_Replacelane:          "\xFD\x1A",
+	opI32x4_Extractlane:          "\xFD\x1B",
+	opI32x4_Replacelane:          "\xFD\x1C",
+	opI64x2_Extractlane:          "\xFD\x1D",
+	opI64x2_Replacelane:          "\xFD\x1E",
+	opF32x4_Extractlane:          "\xFD\x1F",
+	opF32x4_Replacelane:          "\xFD\x20",
+	opF64x2_Extractlane:          "\xFD\x21",
+	opF64x2_Replacelane:          "\xFD\x22",
+	opI8x16_Veq:                  "\xFD\x23",
+	opI8x16_Vne:                  "\xFD\x24",
+	opI8x16_VltS:                 "\xFD\x25",
+	opI8x16_VltU:                 "\xFD\x26",
+	opI8x16_VgtS:                 "\xFD\x27",
+	opI8x16_VgtU:                 "\xFD\x28",
+	opI8x16_VleS:                 "\xFD\x29",
+	opI8x16_VleU:                 "\xFD\x2A",
+	opI8x16_VgeS:                 "\xFD\x2B",
+	opI8x16_VgeU:                 "\xFD\x2C",
+	opI16x8_Veq:                  "\xFD\x2D",
+	opI16x8_Vne:                  "\xFD\x2E",
+	opI16x8_VltS:                 "\xFD\x2F",
+	opI16x8_VltU:                 "\xFD\x30",
+	opI16x8_VgtS:                 "\xFD\x31",
+	opI16x8_VgtU:                 "\xFD\x32",
+	opI16x8_VleS:                 "\xFD\x33",
+	opI16x8_VleU:                 "\xFD\x34",
+	opI16x8_VgeS:                 "\xFD\x35",
+	opI16x8_VgeU:                 "\xFD\x36",
+	opI32x4_Veq:                  "\xFD\x37",
+	opI32x4_Vne:                  "\xFD\x38",
+	opI32x4_VltS:                 "\xFD\x39",
+	opI32x4_VltU:                 "\xFD\x3A",
+	opI32x4_VgtS:                 "\xFD\x3B",
+	opI32x4_VgtU:                 "\xFD\x3C",
+	opI32x4_VleS:                 "\xFD\x3D",
+	opI32x4_VleU:                 "\xFD\x3E",
+	opI32x4_VgeS:                 "\xFD\x3F",
+	opI32x4_VgeU:                 "\xFD\x40",
+	opF32x4_Veq:                  "\xFD\x41",
+	opF32x4_Vne:                  "\xFD\x42",
+	opF32x4_Vlt:                  "\xFD\x43",
+	opF32x4_Vgt:                  "\xFD\x44",
+	opF32x4_Vle:                  "\xFD\x45",
+	opF32x4_Vge:                  "\xFD\x46",
+	opF64x2_Veq:                  "\xFD\x47",
+	opF64x2_Vne:                  "\xFD\x48",
+	opF64x2_Vlt:                  "\xFD\x49",
+	opF64x2_Vgt:                  "\xFD\x4A",
+	opF64x2_Vle:                  "\xFD\x4B",
+	opF64x2_Vge:                  "\xFD\x4C",
+	opV128_Vnot:                  "\xFD\x4D",
+	opV128_Vand:                  "\xFD\x4E",
+	opV128_Vandnot:               "\xFD\x4F",
+	opV128_Vor:                   "\xFD\x50",
+	opV128_Vxor:                  "\xFD\x51",
+	opV128_Bitselect:             "\xFD\x52",
+	opV128_Anytrue:               "\xFD\x53",
+	opV128_Load8Lane:             "\xFD\x54",
+	opV128_Load16Lane:            "\xFD\x55",
+	opV128_Load32Lane:            "\xFD\x56",
+	opV128_Load64Lane:            "\xFD\x57",
+	opV128_Store8Lane:            "\xFD\x58",
+	opV128_Store16Lane:           "\xFD\x59",
+	opV128_Store32Lane:           "\xFD\x5A",
+	opV128_Store64Lane:           "\xFD\x5B",
+	opV128_Load32Zero:            "\xFD\x5C",
+	opV128_Load64Zero:            "\xFD\x5D",
+	opF32x4_VdemoteF64x2Zero:     "\xFD\x5E",
+	opF64x2_VpromoteLowF32x4:     "\xFD\x5F",
+	opI8x16_Vabs:                 "\xFD\x60",
+	opI8x16_Vneg:                 "\xFD\x61",
+	opI8x16_Vpopcnt:              "\xFD\x62",
+	opI8x16_Alltrue:              "\xFD\x63",
+	opI8x16_Bitmask:              "\xFD\x64",
+	opI8x16_NarrowI16x8S:         "\xFD\x65",
+	opI8x16_NarrowI16x8U:         "\xFD\x66",
+	opF32x4_Vceil:                "\xFD\x67",
+	opF32x4_Vfloor:               "\xFD\x68",
+	opF32x4_Vtrunc:               "\xFD\x69",
+	opF32x4_Vnearest:             "\xFD\x6A",
+	opI8x16_Vshl:                 "\xFD\x6B",
+	opI8x16_VshrS:                "\xFD\x6C",
+	opI8x16_VshrU:                "\xFD\x6D",
+	opI8x16_Vadd:                 "\xFD\x6E",
+	opI8x16_VaddSatS:             "\xFD\x6F",
+	opI8x16_VaddSatU:             "\xFD\x70",
+	opI8x16_Vsub:                 "\xFD\x71",
+	opI8x16_VsubSatS:             "\xFD\x72",
+	opI8x16_VsubSatU:             "\xFD\x73",
+	opF64x2_Vceil:                "\xFD\x74",
+	opF64x2_Vfloor:               "\xFD\x75",
+	opI8x16_VminS:                "\xFD\x76",
+	opI8x16_VminU:                "\xFD\x77",
+	opI8x16_VmaxS:                "\xFD\x78",
+	opI8x16_VmaxU:                "\xFD\x79",
+	opF64x2_Vtrunc:               "\xFD\x7A",
+	opI8x16_AvgrU:                "\xFD\x7B",
+	opI16x8_ExtaddpairwiseI8x16S: "\xFD\x7C",
+	opI16x8_ExtaddpairwiseI8x16U: "\xFD\x7D",
+	opI32x4_ExtaddpairwiseI16x8S: "\xFD\x7E",
+	opI32x4_ExtaddpairwiseI16x8U: "\xFD\x7F",
+	opI16x8_Vabs:                 "\xFD\x80\x01",
+	opI16x8_Vneg:                 "\xFD\x81\x01",
+	opI16x8_Q15mulrsatS:          "\xFD\x82\x01",
+	opI16x8_Alltrue:              "\xFD\x83\x01",
+	opI16x8_Bitmask:              "\xFD\x84\x01",
+	opI16x8_NarrowI32x4S:         "\xFD\x85\x01",
+	opI16x8_NarrowI32x4U:         "\xFD\x86\x01",
+	opI16x8_VextendLowI8x16S:     "\xFD\x87\x01",
+	opI16x8_VextendHighI8x16S:    "\xFD\x88\x01",
+	opI16x8_VextendLowI8x16U:     "\xFD\x89\x01",
+	opI16x8_VextendHighI8x16U:    "\xFD\x8A\x01",
+	opI16x8_Vshl:                 "\xFD\x8B\x01",
+	opI16x8_VshrS:                "\xFD\x8C\x01",
+	opI16x8_VshrU:                "\xFD\x8D\x01",
+	opI16x8_Vadd:                 "\xFD\x8E\x01",
+	opI16x8_VaddSatS:             "\xFD\x8F\x01",
+	opI16x8_VaddSatU:             "\xFD\x90\x01",
+	opI16x8_Vsub:                 "\xFD\x91\x01",
+	opI16x8_VsubSatS:             "\xFD\x92\x01",
+	opI16x8_VsubSatU:             "\xFD\x93\x01",
+	opF64x2_Vnearest:             "\xFD\x94\x01",
+	opI16x8_Vmul:                 "\xFD\x95\x01",
+	opI16x8_VminS:                "\xFD\x96\x01",
+	opI16x8_VminU:                "\xFD\x97\x01",
+	opI16x8_VmaxS:                "\xFD\x98\x01",
+	opI16x8_VmaxU:                "\xFD\x99\x01",
+	opI16x8_AvgrU:                "\xFD\x9B\x01",
+	opI16x8_ExtmulLowI8x16S:      "\xFD\x9C\x01",
+	opI16x8_ExtmulHighI8x16S:     "\xFD\x9D\x01",
+	opI16x8_ExtmulLowI8x16U:      "\xFD\x9E\x01",
+	opI16x8_ExtmulHighI8x16U:     "\xFD\x9F\x01",
+	opI32x4_Vabs:                 "\xFD\xA0\x01",
+	opI32x4_Vneg:                 "\xFD\xA1\x01",
+	opI32x4_Alltrue:              "\xFD\xA3\x01",
+	opI32x4_Bitmask:              "\xFD\xA4\x01",
+	opI32x4_VextendLowI16x8S:     "\xFD\xA7\x01",
+	opI32x4_VextendHighI16x8S:    "\xFD\xA8\x01",
+	opI32x4_VextendLowI16x8U:     "\xFD\xA9\x01",
+	opI32x4_VextendHighI16x8U:    "\xFD\xAA\x01",
+	opI32x4_Vshl:                 "\xFD\xAB\x01",
+	opI32x4_VshrS:                "\xFD\xAC\x01",
+	opI32x4_VshrU:                "\xFD\xAD\x01",
+	opI32x4_Vadd:                 "\xFD\xAE\x01",
+	opI32x4_Vsub:                 "\xFD\xB1\x01",
+	opI32x4_Vmul:                 "\xFD\xB5\x01",
+	opI32x4_VminS:                "\xFD\xB6\x01",
+	opI32x4_VminU:                "\xFD\xB7\x01",
+	opI32x4_VmaxS:                "\xFD\xB8\x01",
+	opI32x4_VmaxU:                "\xFD\xB9\x01",
+	opI32x4_DotI16x8S:            "\xFD\xBA\x01",
+	opI32x4_ExtmulLowI16x8S:      "\xFD\xBC\x01",
+	opI32x4_ExtmulHighI16x8S:     "\xFD\xBD\x01",
+	opI32x4_ExtmulLowI16x8U:      "\xFD\xBE\x01",
+	opI32x4_ExtmulHighI16x8U:     "\xFD\xBF\x01",
+	opI64x2_Vabs:                 "\xFD\xC0\x01",
+	opI64x2_Vneg:                 "\xFD\xC1\x01",
+	opI64x2_Alltrue:              "\xFD\xC3\x01",
+	opI64x2_Bitmask:              "\xFD\xC4\x01",
+	opI64x2_VextendLowI32x4S:     "\xFD\xC7\x01",
+	opI64x2_VextendHighI32x4S:    "\xFD\xC8\x01",
+	opI64x2_VextendLowI32x4U:     "\xFD\xC9\x01",
+	opI64x2_VextendHighI32x4U:    "\xFD\xCA\x01",
+	opI64x2_Vshl:                 "\xFD\xCB\x01",
+	opI64x2_VshrS:                "\xFD\xCC\x01",
+	opI64x2_VshrU:                "\xFD\xCD\x01",
+	opI64x2_Vadd:                 "\xFD\xCE\x01",
+	opI64x2_Vsub:                 "\xFD\xD1\x01",
+	opI64x2_Vmul:                 "\xFD\xD5\x01",
+	opI64x2_Veq:                  "\xFD\xD6\x01",
+	opI64x2_Vne:                  "\xFD\xD7\x01",
+	opI64x2_VltS:                 "\xFD\xD8\x01",
+	opI64x2_VgtS:                 "\xFD\xD9\x01",
+	opI64x2_VleS:                 "\xFD\xDA\x01",
+	opI64x2_VgeS:                 "\xFD\xDB\x01",
+	opI64x2_ExtmulLowI32x4S:      "\xFD\xDC\x01",
+	opI64x2_ExtmulHighI32x4S:     "\xFD\xDD\x01",
+	opI64x2_ExtmulLowI32x4U:      "\xFD\xDE\x01",
+	opI64x2_ExtmulHighI32x4U:     "\xFD\xDF\x01",
+	opF32x4_Vabs:                 "\xFD\xE0\x01",
+	opF32x4_Vneg:                 "\xFD\xE1\x01",
+	opF32x4_Vsqrt:                "\xFD\xE3\x01",
+	opF32x4_Vadd:                 "\xFD\xE4\x01",
+	opF32x4_Vsub:                 "\xFD\xE5\x01",
+	opF32x4_Vmul:                 "\xFD\xE6\x01",
+	opF32x4_Vdiv:                 "\xFD\xE7\x01",
+	opF32x4_Vmin:                 "\xFD\xE8\x01",
+	opF32x4_Vmax:                 "\xFD\xE9\x01",
+	opF32x4_Vpmin:                "\xFD\xEA\x01",
+	opF32x4_Vpmax:                "\xFD\xEB\x01",
+	opF64x2_Vabs:                 "\xFD\xEC\x01",
+	opF64x2_Vneg:                 "\xFD\xED\x01",
+	opF64x2_Vsqrt:                "\xFD\xEF\x01",
+	opF64x2_Vadd:                 "\xFD\xF0\x01",
+	opF64x2_Vsub:                 "\xFD\xF1\x01",
+	opF64x2_Vmul:                 "\xFD\xF2\x01",
+	opF64x2_Vdiv:                 "\xFD\xF3\x01",
+	opF64x2_Vmin:                 "\xFD\xF4\x01",
+	opF64x2_Vmax:                 "\xFD\xF5\x01",
+	opF64x2_Vpmin:                "\xFD\xF6\x01",
+	opF64x2_Vpmax:                "\xFD\xF7\x01",
+	opI32x4_TruncSatF32x4S:       "\xFD\xF8\x01",
+	opI32x4_TruncSatF32x4U:       "\xFD\xF9\x01",
+	opF32x4_VconvertI32x4S:       "\xFD\xFA\x01",
+	opF32x4_VconvertI32x4U:       "\xFD\xFB\x01",
+	opI32x4_VtruncSatF64x2SZero:  "\xFD\xFC\x01",
+	opI32x4_VtruncSatF64x2UZero:  "\xFD\xFD\x01",
+	opF64x2_VconvertLowI32x4S:    "\xFD\xFE\x01",
+	opF64x2_VconvertLowI32x4U:    "\xFD\xFF\x01",
+}
+
+var opcodeInfos = [numOpcodes]opcodeInfo{
+	opUnreachable:                {polymorphic: true},
+	opNop:                        {},
+	opBlock:                      {imm: [maxImmediates]immKind{immBlockType}, polymorphic: true},
+	opLoop:                       {imm: [maxImmediates]immKind{immBlockType}, polymorphic: true},
+	opIf:                         {imm: [maxImmediates]immKind{immBlockType}, in: []ValType{TypeI32}, polymorphic: true},
+	opElse:                       {},
+	opEnd:                        {},
+	opBr:                         {imm: [maxImmediates]immKind{immLabel}, polymorphic: true},
+	opBrif:                       {imm: [maxImmediates]immKind{immLabel}, in: []ValType{TypeI32}, polymorphic: true},
+	opBrtable:                    {imm: [maxImmediates]immKind{immLabels, immLabel}, in: []ValType{TypeI32}, polymorphic: true},
+	opReturn:                     {polymorphic: true},
+	opCall:                       {imm: [maxImmediates]immKind{immFunc}, polymorphic: true},
+	opCallindirect:               {imm: [maxImmediates]immKind{immIndex, immIndex}, in: []ValType{TypeI32}, polymorphic: true},
+	opDrop:                       {in: []ValType{typeAny}},
+	opSelect:                     {in: []ValType{typeAny, typeAny, TypeI32}, out: []ValType{typeAny}},
+	opSelectTyped:                {imm: [maxImmediates]immKind{immTypes}, in: []ValType{typeAny, typeAny, TypeI32}, out: []ValType{typeAny}},
+	opLocalget:                   {imm: [maxImmediates]immKind{immLocal}, out: []ValType{typeAny}},
+	opLocalset:                   {imm: [maxImmediates]immKind{immLocal}, in: []ValType{typeAny}},
+	opLocaltee:                   {imm: [maxImmediates]immKind{immLocal}, in: []ValType{typeAny}, out: []ValType{typeAny}},
+	opGlobalget:                  {imm: [maxImmediates]immKind{immGlobal}, out: []ValType{typeAny}},
+	opGlobalset:                  {imm: [maxImmediates]immKind{immGlobal}, in: []ValType{typeAny}},
+	opTableget:                   {imm: [maxImmediates]immKind{immIndex}, in: []ValType{TypeI32}, out: []ValType{typeAny}},
+	opTableset:                   {imm: [maxImmediates]immKind{immIndex}, in: []ValType{TypeI32, typeAny}},
+	opI32_Load:                   {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI64_Load:                   {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opF32_Load:                   {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeF32}},
+	opF64_Load:                   {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeF64}},
+	opI32_Load8S:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Load8U:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Load16S:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Load16U:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI64_Load8S:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_Load8U:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_Load16S:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_Load16U:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_Load32S:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_Load32U:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI32_Store:                  {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI32}},
+	opI64_Store:                  {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI64}},
+	opF32_Store:                  {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeF32}},
+	opF64_Store:                  {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeF64}},
+	opI32_Store8:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI32}},
+	opI32_Store16:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI32}},
+	opI64_Store8:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI64}},
+	opI64_Store16:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI64}},
+	opI64_Store32:                {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeI64}},
+	opMemorysize:                 {imm: [maxImmediates]immKind{immZero}, out: []ValType{TypeI32}},
+	opMemorygrow:                 {imm: [maxImmediates]immKind{immZero}, in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Const:                  {imm: [maxImmediates]immKind{immI32}, out: []ValType{TypeI32}},
+	opI64_Const:                  {imm: [maxImmediates]immKind{immI64}, out: []ValType{TypeI64}},
+	opF32_Const:                  {imm: [maxImmediates]immKind{immF32}, out: []ValType{TypeF32}},
+	opF64_Const:                  {imm: [maxImmediates]immKind{immF64}, out: []ValType{TypeF64}},
+	opI32_Eqz:                    {in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Eq:                     {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Ne:                     {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_LtS:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_LtU:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_GtS:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_GtU:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_LeS:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_LeU:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_GeS:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_GeU:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI64_Eqz:                    {in: []ValType{TypeI64}, out: []ValType{TypeI32}},
+	opI64_Eq:                     {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_Ne:                     {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_LtS:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_LtU:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_GtS:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_GtU:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_LeS:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_LeU:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_GeS:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opI64_GeU:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI32}},
+	opF32_Eq:                     {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeI32}},
+	opF32_Ne:                     {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeI32}},
+	opF32_Lt:                     {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeI32}},
+	opF32_Gt:                     {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeI32}},
+	opF32_Le:                     {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeI32}},
+	opF32_Ge:                     {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeI32}},
+	opF64_Eq:                     {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeI32}},
+	opF64_Ne:                     {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeI32}},
+	opF64_Lt:                     {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeI32}},
+	opF64_Gt:                     {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeI32}},
+	opF64_Le:                     {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeI32}},
+	opF64_Ge:                     {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeI32}},
+	opI32_Clz:                    {in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Ctz:                    {in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Popcnt:                 {in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Add:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Sub:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Mul:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_DivS:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_DivU:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_RemS:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_RemU:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_And:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Or:                     {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Xor:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Shl:                    {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_ShrS:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_ShrU:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Rotl:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI32_Rotr:                   {in: []ValType{TypeI32, TypeI32}, out: []ValType{TypeI32}},
+	opI64_Clz:                    {in: []ValType{TypeI64}, out: []ValType{TypeI64}},
+	opI64_Ctz:                    {in: []ValType{TypeI64}, out: []ValType{TypeI64}},
+	opI64_Popcnt:                 {in: []ValType{TypeI64}, out: []ValType{TypeI64}},
+	opI64_Add:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Sub:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Mul:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_DivS:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_DivU:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_RemS:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_RemU:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_And:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Or:                     {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Xor:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Shl:                    {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_ShrS:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_ShrU:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Rotl:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opI64_Rotr:                   {in: []ValType{TypeI64, TypeI64}, out: []ValType{TypeI64}},
+	opF32_Abs:                    {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Neg:                    {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Ceil:                   {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Floor:                  {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Trunc:                  {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Nearest:                {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Sqrt:                   {in: []ValType{TypeF32}, out: []ValType{TypeF32}},
+	opF32_Add:                    {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF32_Sub:                    {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF32_Mul:                    {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF32_Div:                    {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF32_Fmin:                   {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF32_Fmax:                   {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF32_Copysign:               {in: []ValType{TypeF32, TypeF32}, out: []ValType{TypeF32}},
+	opF64_Abs:                    {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Neg:                    {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Ceil:                   {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Floor:                  {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Trunc:                  {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Nearest:                {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Sqrt:                   {in: []ValType{TypeF64}, out: []ValType{TypeF64}},
+	opF64_Add:                    {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opF64_Sub:                    {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opF64_Mul:                    {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opF64_Div:                    {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opF64_Fmin:                   {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opF64_Fmax:                   {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opF64_Copysign:               {in: []ValType{TypeF64, TypeF64}, out: []ValType{TypeF64}},
+	opI32_WrapI64:                {in: []ValType{TypeI64}, out: []ValType{TypeI32}},
+	opI32_TruncF32S:              {in: []ValType{TypeF32}, out: []ValType{TypeI32}},
+	opI32_TruncF32U:              {in: []ValType{TypeF32}, out: []ValType{TypeI32}},
+	opI32_TruncF64S:              {in: []ValType{TypeF64}, out: []ValType{TypeI32}},
+	opI32_TruncF64U:              {in: []ValType{TypeF64}, out: []ValType{TypeI32}},
+	opI64_ExtendI32S:             {in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_ExtendI32U:             {in: []ValType{TypeI32}, out: []ValType{TypeI64}},
+	opI64_TruncF32S:              {in: []ValType{TypeF32}, out: []ValType{TypeI64}},
+	opI64_TruncF32U:              {in: []ValType{TypeF32}, out: []ValType{TypeI64}},
+	opI64_TruncF64S:              {in: []ValType{TypeF64}, out: []ValType{TypeI64}},
+	opI64_TruncF64U:              {in: []ValType{TypeF64}, out: []ValType{TypeI64}},
+	opF32_ConvertI32S:            {in: []ValType{TypeI32}, out: []ValType{TypeF32}},
+	opF32_ConvertI32U:            {in: []ValType{TypeI32}, out: []ValType{TypeF32}},
+	opF32_ConvertI64S:            {in: []ValType{TypeI64}, out: []ValType{TypeF32}},
+	opF32_ConvertI64U:            {in: []ValType{TypeI64}, out: []ValType{TypeF32}},
+	opF32_DemoteF64:              {in: []ValType{TypeF64}, out: []ValType{TypeF32}},
+	opF64_ConvertI32S:            {in: []ValType{TypeI32}, out: []ValType{TypeF64}},
+	opF64_ConvertI32U:            {in: []ValType{TypeI32}, out: []ValType{TypeF64}},
+	opF64_ConvertI64S:            {in: []ValType{TypeI64}, out: []ValType{TypeF64}},
+	opF64_ConvertI64U:            {in: []ValType{TypeI64}, out: []ValType{TypeF64}},
+	opF64_PromoteF32:             {in: []ValType{TypeF32}, out: []ValType{TypeF64}},
+	opI32_ReinterpretF32:         {in: []ValType{TypeF32}, out: []ValType{TypeI32}},
+	opI64_ReinterpretF64:         {in: []ValType{TypeF64}, out: []ValType{TypeI64}},
+	opF32_ReinterpretI32:         {in: []ValType{TypeI32}, out: []ValType{TypeF32}},
+	opF64_ReinterpretI64:         {in: []ValType{TypeI64}, out: []ValType{TypeF64}},
+	opI32_Extend8S:               {in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI32_Extend16S:              {in: []ValType{TypeI32}, out: []ValType{TypeI32}},
+	opI64_Extend8S:               {in: []ValType{TypeI64}, out: []ValType{TypeI64}},
+	opI64_Extend16S:              {in: []ValType{TypeI64}, out: []ValType{TypeI64}},
+	opI64_Extend32S:              {in: []ValType{TypeI64}, out: []ValType{TypeI64}},
+	opRefnull:                    {imm: [maxImmediates]immKind{immType}, out: []ValType{typeAny}},
+	opRefisnull:                  {in: []ValType{typeAny}, out: []ValType{TypeI32}},
+	opReffunc:                    {imm: [maxImmediates]immKind{immIndex}, out: []ValType{TypeFuncRef}},
+	opI32_TruncSatF32S:           {in: []ValType{TypeF32}, out: []ValType{TypeI32}},
+	opI32_TruncSatF32U:           {in: []ValType{TypeF32}, out: []ValType{TypeI32}},
+	opI32_TruncSatF64S:           {in: []ValType{TypeF64}, out: []ValType{TypeI32}},
+	opI32_TruncSatF64U:           {in: []ValType{TypeF64}, out: []ValType{TypeI32}},
+	opI64_TruncSatF32S:           {in: []ValType{TypeF32}, out: []ValType{TypeI64}},
+	opI64_TruncSatF32U:           {in: []ValType{TypeF32}, out: []ValType{TypeI64}},
+	opI64_TruncSatF64S:           {in: []ValType{TypeF64}, out: []ValType{TypeI64}},
+	opI64_TruncSatF64U:           {in: []ValType{TypeF64}, out: []ValType{TypeI64}},
+	opMemoryinit:                 {imm: [maxImmediates]immKind{immIndex, immZero}, in: []ValType{TypeI32, TypeI32, TypeI32}},
+	opDatadrop:                   {imm: [maxImmediates]immKind{immIndex}},
+	opMemorycopy:                 {imm: [maxImmediates]immKind{immZero, immZero}, in: []ValType{TypeI32, TypeI32, TypeI32}},
+	opMemoryfill:                 {imm: [maxImmediates]immKind{immZero}, in: []ValType{TypeI32, TypeI32, TypeI32}},
+	opTableinit:                  {imm: [maxImmediates]immKind{immIndex, immIndex}, in: []ValType{TypeI32, TypeI32, TypeI32}},
+	opElemdrop:                   {imm: [maxImmediates]immKind{immIndex}},
+	opTablecopy:                  {imm: [maxImmediates]immKind{immIndex, immIndex}, in: []ValType{TypeI32, TypeI32, TypeI32}},
+	opTablegrow:                  {imm: [maxImmediates]immKind{immIndex}, in: []ValType{typeAny, TypeI32}, out: []ValType{TypeI32}},
+	opTablesize:                  {imm: [maxImmediates]immKind{immIndex}, out: []ValType{TypeI32}},
+	opTablefill:                  {imm: [maxImmediates]immKind{immIndex}, in: []ValType{TypeI32, typeAny, TypeI32}},
+	opV128_Load:                  {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load8x8S:              {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load8x8U:              {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load16x4S:             {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load16x4U:             {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load32x2S:             {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load32x2U:             {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load8Splat:            {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load16Splat:           {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load32Splat:           {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load64Splat:           {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Store:                 {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32, TypeV128}},
+	opV128_Vconst:                {imm: [maxImmediates]immKind{immV128}, out: []ValType{TypeV128}},
+	opI8x16_Shuffle:              {imm: [maxImmediates]immKind{immShuffle}, in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Swizzle:              {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Splat:                {in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opI16x8_Splat:                {in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opI32x4_Splat:                {in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opI64x2_Splat:                {in: []ValType{TypeI64}, out: []ValType{TypeV128}},
+	opF32x4_Splat:                {in: []ValType{TypeF32}, out: []ValType{TypeV128}},
+	opF64x2_Splat:                {in: []ValType{TypeF64}, out: []ValType{TypeV128}},
+	opI8x16_ExtractlaneS:         {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI8x16_ExtractlaneU:         {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI8x16_Replacelane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI16x8_ExtractlaneS:         {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI16x8_ExtractlaneU:         {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI16x8_Replacelane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI32x4_Extractlane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI32x4_Replacelane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI64x2_Extractlane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeI64}},
+	opI64x2_Replacelane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128, TypeI64}, out: []ValType{TypeV128}},
+	opF32x4_Extractlane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeF32}},
+	opF32x4_Replacelane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128, TypeF32}, out: []ValType{TypeV128}},
+	opF64x2_Extractlane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128}, out: []ValType{TypeF64}},
+	opF64x2_Replacelane:          {imm: [maxImmediates]immKind{immLane}, in: []ValType{TypeV128, TypeF64}, out: []ValType{TypeV128}},
+	opI8x16_Veq:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Vne:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VltS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VltU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VgtS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VgtU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VleS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VleU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VgeS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VgeU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Veq:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Vne:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VltS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VltU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VgtS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VgtU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VleS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VleU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VgeS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VgeU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Veq:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Vne:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VltS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VltU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VgtS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VgtU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VleS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VleU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VgeS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VgeU:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Veq:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vne:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vlt:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vgt:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vle:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vge:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Veq:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vne:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vlt:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vgt:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vle:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vge:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Vnot:                  {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opV128_Vand:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Vandnot:               {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Vor:                   {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Vxor:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Bitselect:             {in: []ValType{TypeV128, TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Anytrue:               {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opV128_Load8Lane:             {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Load16Lane:            {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Load32Lane:            {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Load64Lane:            {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}, out: []ValType{TypeV128}},
+	opV128_Store8Lane:            {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}},
+	opV128_Store16Lane:           {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}},
+	opV128_Store32Lane:           {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}},
+	opV128_Store64Lane:           {imm: [maxImmediates]immKind{immMemArg, immLane}, in: []ValType{TypeI32, TypeV128}},
+	opV128_Load32Zero:            {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opV128_Load64Zero:            {imm: [maxImmediates]immKind{immMemArg}, in: []ValType{TypeI32}, out: []ValType{TypeV128}},
+	opF32x4_VdemoteF64x2Zero:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_VpromoteLowF32x4:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Vabs:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Vneg:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Vpopcnt:              {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Alltrue:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI8x16_Bitmask:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI8x16_NarrowI16x8S:         {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_NarrowI16x8U:         {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vceil:                {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vfloor:               {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vtrunc:               {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vnearest:             {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Vshl:                 {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI8x16_VshrS:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI8x16_VshrU:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI8x16_Vadd:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VaddSatS:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VaddSatU:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_Vsub:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VsubSatS:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VsubSatU:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vceil:                {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vfloor:               {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VminS:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VminU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VmaxS:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_VmaxU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vtrunc:               {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI8x16_AvgrU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_ExtaddpairwiseI8x16S: {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_ExtaddpairwiseI8x16U: {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_ExtaddpairwiseI16x8S: {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_ExtaddpairwiseI16x8U: {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Vabs:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Vneg:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Q15mulrsatS:          {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Alltrue:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI16x8_Bitmask:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI16x8_NarrowI32x4S:         {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_NarrowI32x4U:         {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VextendLowI8x16S:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VextendHighI8x16S:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VextendLowI8x16U:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VextendHighI8x16U:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Vshl:                 {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI16x8_VshrS:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI16x8_VshrU:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI16x8_Vadd:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VaddSatS:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VaddSatU:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Vsub:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VsubSatS:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VsubSatU:             {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vnearest:             {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_Vmul:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VminS:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VminU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VmaxS:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_VmaxU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_AvgrU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_ExtmulLowI8x16S:      {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_ExtmulHighI8x16S:     {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_ExtmulLowI8x16U:      {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI16x8_ExtmulHighI8x16U:     {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Vabs:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Vneg:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Alltrue:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI32x4_Bitmask:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI32x4_VextendLowI16x8S:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VextendHighI16x8S:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VextendLowI16x8U:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VextendHighI16x8U:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Vshl:                 {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI32x4_VshrS:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI32x4_VshrU:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI32x4_Vadd:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Vsub:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_Vmul:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VminS:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VminU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VmaxS:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VmaxU:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_DotI16x8S:            {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_ExtmulLowI16x8S:      {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_ExtmulHighI16x8S:     {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_ExtmulLowI16x8U:      {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_ExtmulHighI16x8U:     {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Vabs:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Vneg:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Alltrue:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI64x2_Bitmask:              {in: []ValType{TypeV128}, out: []ValType{TypeI32}},
+	opI64x2_VextendLowI32x4S:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VextendHighI32x4S:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VextendLowI32x4U:     {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VextendHighI32x4U:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Vshl:                 {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI64x2_VshrS:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI64x2_VshrU:                {in: []ValType{TypeV128, TypeI32}, out: []ValType{TypeV128}},
+	opI64x2_Vadd:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Vsub:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Vmul:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Veq:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_Vne:                  {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VltS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VgtS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VleS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_VgeS:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_ExtmulLowI32x4S:      {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_ExtmulHighI32x4S:     {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_ExtmulLowI32x4U:      {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI64x2_ExtmulHighI32x4U:     {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vabs:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vneg:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vsqrt:                {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vadd:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vsub:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vmul:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vdiv:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vmin:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vmax:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vpmin:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_Vpmax:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vabs:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vneg:                 {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vsqrt:                {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vadd:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vsub:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vmul:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vdiv:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vmin:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vmax:                 {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vpmin:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_Vpmax:                {in: []ValType{TypeV128, TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_TruncSatF32x4S:       {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_TruncSatF32x4U:       {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_VconvertI32x4S:       {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF32x4_VconvertI32x4U:       {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VtruncSatF64x2SZero:  {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opI32x4_VtruncSatF64x2UZero:  {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_VconvertLowI32x4S:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+	opF64x2_VconvertLowI32x4U:    {in: []ValType{TypeV128}, out: []ValType{TypeV128}},
+}
+
 // Writer methods for WebAssembly instructions
 
 // unreachable ( t1[] -- t2[] )
 func (c *Expr) Unreachable() {
-	c.buf.WriteRawByte(0x00)
+	c.count(opUnreachable)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opUnreachable)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x00)
 }
 
 // nop ( -- )
 func (c *Expr) Nop() {
-	c.buf.WriteRawByte(0x01)
+	c.count(opNop)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opNop)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x01)
 }
 
 // block bt ( t1[] -- t2[] )
 func (c *Expr) Block(blockType TypeIdx) {
-	c.buf.WriteRawByte(0x02)
+	c.count(opBlock)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opBlock)
+		c.ir.WriteTypeIdx(blockType)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x02)
 	c.buf.WriteTypeIdx(blockType)
 }
 
 // loop bt ( t1[] -- t2[] )
 func (c *Expr) Loop(blockType TypeIdx) {
-	c.buf.WriteRawByte(0x03)
+	c.count(opLoop)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opLoop)
+		c.ir.WriteTypeIdx(blockType)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x03)
 	c.buf.WriteTypeIdx(blockType)
 }
 
 // if bt ( t1[] i32 -- t2[] )
 func (c *Expr) If(blockType TypeIdx) {
-	c.buf.WriteRawByte(0x04)
+	c.count(opIf)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opIf)
+		c.ir.WriteTypeIdx(blockType)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x04)
 	c.buf.WriteTypeIdx(blockType)
 }
 
 // else ( -- )
 func (c *Expr) Else() {
-	c.buf.WriteRawByte(0x05)
+	c.count(opElse)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opElse)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x05)
 }
 
 // end ( -- )
 func (c *Expr) End() {
-	c.buf.WriteRawByte(0x0B)
+	c.count(opEnd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opEnd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x0B)
 }
 
 // br l ( t1[] t[] -- t2[] )
 func (c *Expr) Br(label0 LabelIdx) {
-	c.buf.WriteRawByte(0x0C)
+	c.count(opBr)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opBr)
+		c.ir.WriteLabelIdx(label0)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x0C)
 	c.buf.WriteLabelIdx(label0)
 }
 
 // brif l ( t[] i32 -- t[] )
 func (c *Expr) Brif(label0 LabelIdx) {
-	c.buf.WriteRawByte(0x0D)
+	c.count(opBrif)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opBrif)
+		c.ir.WriteLabelIdx(label0)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x0D)
 	c.buf.WriteLabelIdx(label0)
 }
 
-// brtable l l ( t1[] t[] i32 -- t2[] )
-func (c *Expr) Brtable(label0 LabelIdx, label1 LabelIdx) {
-	c.buf.WriteRawByte(0x0E)
-	c.buf.WriteLabelIdx(label0)
+// brtable l* l ( t1[] t[] i32 -- t2[] )
+func (c *Expr) Brtable(labels LabelVec, label1 LabelIdx) {
+	c.count(opBrtable)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opBrtable)
+		c.ir.WriteLabelVec(labels)
+		c.ir.WriteLabelIdx(label1)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x0E)
+	c.buf.WriteLabelVec(labels)
 	c.buf.WriteLabelIdx(label1)
 }
 
 // return ( t1[] t[] -- t2[] )
 func (c *Expr) Return() {
-	c.buf.WriteRawByte(0x0F)
+	c.count(opReturn)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opReturn)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x0F)
 }
 
 // call func ( t1[] -- t2[] )
 func (c *Expr) Call(x FuncIdx) {
-	c.buf.WriteRawByte(0x10)
+	c.count(opCall)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opCall)
+		c.ir.WriteFuncIdx(x)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x10)
 	c.buf.WriteFuncIdx(x)
 }
 
 // callindirect x y ( t1[] i32 -- t2[] )
 func (c *Expr) Callindirect(idx U32, idx2 U32) {
-	c.buf.WriteRawByte(0x11)
+	c.count(opCallindirect)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opCallindirect)
+		c.ir.WriteU32(idx)
+		c.ir.WriteU32(idx2)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x11)
 	c.buf.WriteU32(idx)
 	c.buf.WriteU32(idx2)
 }
 
 // drop ( t -- )
 func (c *Expr) Drop() {
-	c.buf.WriteRawByte(0x1A)
+	c.count(opDrop)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opDrop)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x1A)
 }
 
 // select ( t t i32 -- t )
 func (c *Expr) Select() {
-	c.buf.WriteRawByte(0x1B)
-}
-
-// select_typed t ( t t i32 -- t )
-func (c *Expr) SelectTyped(typ TypeIdx) {
-	c.buf.WriteRawByte(0x1C)
-	c.buf.WriteTypeIdx(typ)
+	c.count(opSelect)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opSelect)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x1B)
+}
+
+// select_typed t* ( t t i32 -- t )
+func (c *Expr) SelectTyped(types ResultType) {
+	c.count(opSelectTyped)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opSelectTyped)
+		c.ir.WriteResultType(types)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x1C)
+	c.buf.WriteResultType(types)
 }
 
 // localget local ( -- t )
 func (c *Expr) Localget(x LocalIdx) {
-	c.buf.WriteRawByte(0x20)
+	c.count(opLocalget)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opLocalget)
+		c.ir.WriteLocalIdx(x)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x20)
 	c.buf.WriteLocalIdx(x)
 }
 
 // localset local ( t -- )
 func (c *Expr) Localset(x LocalIdx) {
-	c.buf.WriteRawByte(0x21)
+	c.count(opLocalset)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opLocalset)
+		c.ir.WriteLocalIdx(x)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x21)
 	c.buf.WriteLocalIdx(x)
 }
 
 // localtee local ( t -- t )
 func (c *Expr) Localtee(x LocalIdx) {
-	c.buf.WriteRawByte(0x22)
+	c.count(opLocaltee)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opLocaltee)
+		c.ir.WriteLocalIdx(x)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x22)
 	c.buf.WriteLocalIdx(x)
 }
 
 // globalget global ( -- t )
 func (c *Expr) Globalget(x GlobalIdx) {
-	c.buf.WriteRawByte(0x23)
+	c.count(opGlobalget)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opGlobalget)
+		c.ir.WriteGlobalIdx(x)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x23)
 	c.buf.WriteGlobalIdx(x)
 }
 
 // globalset global ( t -- )
 func (c *Expr) Globalset(x GlobalIdx) {
-	c.buf.WriteRawByte(0x24)
+	c.count(opGlobalset)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opGlobalset)
+		c.ir.WriteGlobalIdx(x)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x24)
 	c.buf.WriteGlobalIdx(x)
 }
 
 // tableget x ( i32 -- t )
 func (c *Expr) Tableget(idx U32) {
-	c.buf.WriteRawByte(0x25)
+	c.count(opTableget)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTableget)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x25)
 	c.buf.WriteU32(idx)
 }
 
 // tableset x ( i32 t -- )
 func (c *Expr) Tableset(idx U32) {
-	c.buf.WriteRawByte(0x26)
+	c.count(opTableset)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTableset)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x26)
 	c.buf.WriteU32(idx)
 }
 
 // i32.load memarg ( i32 -- i32 )
 func (c *Expr) I32_Load(mem MemArg) {
-	c.buf.WriteRawByte(0x28)
+	c.count(opI32_Load)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Load)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x28)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load memarg ( i32 -- i64 )
 func (c *Expr) I64_Load(mem MemArg) {
-	c.buf.WriteRawByte(0x29)
+	c.count(opI64_Load)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x29)
 	c.buf.WriteMemArg(mem)
 }
 
 // f32.load memarg ( i32 -- f32 )
 func (c *Expr) F32_Load(mem MemArg) {
-	c.buf.WriteRawByte(0x2A)
+	c.count(opF32_Load)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Load)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x2A)
 	c.buf.WriteMemArg(mem)
 }
 
 // f64.load memarg ( i32 -- f64 )
 func (c *Expr) F64_Load(mem MemArg) {
-	c.buf.WriteRawByte(0x2B)
+	c.count(opF64_Load)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Load)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x2B)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.load8_s memarg ( i32 -- i32 )
 func (c *Expr) I32_Load8S(mem MemArg) {
-	c.buf.WriteRawByte(0x2C)
+	c.count(opI32_Load8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Load8S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x2C)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.load8_u memarg ( i32 -- i32 )
 func (c *Expr) I32_Load8U(mem MemArg) {
-	c.buf.WriteRawByte(0x2D)
+	c.count(opI32_Load8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Load8U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x2D)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.load16_s memarg ( i32 -- i32 )
 func (c *Expr) I32_Load16S(mem MemArg) {
-	c.buf.WriteRawByte(0x2E)
+	c.count(opI32_Load16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Load16S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x2E)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.load16_u memarg ( i32 -- i32 )
 func (c *Expr) I32_Load16U(mem MemArg) {
-	c.buf.WriteRawByte(0x2F)
+	c.count(opI32_Load16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Load16U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x2F)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load8_s memarg ( i32 -- i64 )
 func (c *Expr) I64_Load8S(mem MemArg) {
-	c.buf.WriteRawByte(0x30)
+	c.count(opI64_Load8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load8S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x30)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load8_u memarg ( i32 -- i64 )
 func (c *Expr) I64_Load8U(mem MemArg) {
-	c.buf.WriteRawByte(0x31)
+	c.count(opI64_Load8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load8U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x31)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load16_s memarg ( i32 -- i64 )
 func (c *Expr) I64_Load16S(mem MemArg) {
-	c.buf.WriteRawByte(0x32)
+	c.count(opI64_Load16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load16S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x32)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load16_u memarg ( i32 -- i64 )
 func (c *Expr) I64_Load16U(mem MemArg) {
-	c.buf.WriteRawByte(0x33)
+	c.count(opI64_Load16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load16U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x33)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load32_s memarg ( i32 -- i64 )
 func (c *Expr) I64_Load32S(mem MemArg) {
-	c.buf.WriteRawByte(0x34)
+	c.count(opI64_Load32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load32S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x34)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.load32_u memarg ( i32 -- i64 )
 func (c *Expr) I64_Load32U(mem MemArg) {
-	c.buf.WriteRawByte(0x35)
+	c.count(opI64_Load32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Load32U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x35)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.store memarg ( i32 i32 -- )
 func (c *Expr) I32_Store(mem MemArg) {
-	c.buf.WriteRawByte(0x36)
+	c.count(opI32_Store)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Store)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x36)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.store memarg ( i32 i64 -- )
 func (c *Expr) I64_Store(mem MemArg) {
-	c.buf.WriteRawByte(0x37)
+	c.count(opI64_Store)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Store)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x37)
 	c.buf.WriteMemArg(mem)
 }
 
 // f32.store memarg ( i32 f32 -- )
 func (c *Expr) F32_Store(mem MemArg) {
-	c.buf.WriteRawByte(0x38)
+	c.count(opF32_Store)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Store)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x38)
 	c.buf.WriteMemArg(mem)
 }
 
 // f64.store memarg ( i32 f64 -- )
 func (c *Expr) F64_Store(mem MemArg) {
-	c.buf.WriteRawByte(0x39)
+	c.count(opF64_Store)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Store)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x39)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.store8 memarg ( i32 i32 -- )
 func (c *Expr) I32_Store8(mem MemArg) {
-	c.buf.WriteRawByte(0x3A)
+	c.count(opI32_Store8)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Store8)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x3A)
 	c.buf.WriteMemArg(mem)
 }
 
 // i32.store16 memarg ( i32 i32 -- )
 func (c *Expr) I32_Store16(mem MemArg) {
-	c.buf.WriteRawByte(0x3B)
+	c.count(opI32_Store16)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Store16)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x3B)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.store8 memarg ( i32 i64 -- )
 func (c *Expr) I64_Store8(mem MemArg) {
-	c.buf.WriteRawByte(0x3C)
+	c.count(opI64_Store8)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Store8)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x3C)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.store16 memarg ( i32 i64 -- )
 func (c *Expr) I64_Store16(mem MemArg) {
-	c.buf.WriteRawByte(0x3D)
+	c.count(opI64_Store16)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Store16)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x3D)
 	c.buf.WriteMemArg(mem)
 }
 
 // i64.store32 memarg ( i32 i64 -- )
 func (c *Expr) I64_Store32(mem MemArg) {
-	c.buf.WriteRawByte(0x3E)
+	c.count(opI64_Store32)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Store32)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(11)
+	c.buf.buf = append(c.buf.buf, 0x3E)
 	c.buf.WriteMemArg(mem)
 }
 
-// memorysize ( -- i32 )
+// memorysize 0x00 ( -- i32 )
 func (c *Expr) Memorysize() {
-	c.buf.WriteRawByte(0x3F)
+	c.count(opMemorysize)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opMemorysize)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x3F, 0x00)
 }
 
-// memorygrow ( i32 -- i32 )
+// memorygrow 0x00 ( i32 -- i32 )
 func (c *Expr) Memorygrow() {
-	c.buf.WriteRawByte(0x40)
+	c.count(opMemorygrow)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opMemorygrow)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x40, 0x00)
 }
 
 // i32.const i32 ( -- i32 )
 func (c *Expr) I32_Const(val I32) {
-	c.buf.WriteRawByte(0x41)
+	c.count(opI32_Const)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Const)
+		c.ir.WriteI32(val)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x41)
 	c.buf.WriteI32(val)
 }
 
 // i64.const i64 ( -- i64 )
 func (c *Expr) I64_Const(val I64) {
-	c.buf.WriteRawByte(0x42)
+	c.count(opI64_Const)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Const)
+		c.ir.WriteI64(val)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x42)
 	c.buf.WriteI64(val)
 }
 
 // f32.const f32 ( -- f32 )
 func (c *Expr) F32_Const(val F32) {
-	c.buf.WriteRawByte(0x43)
+	c.count(opF32_Const)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Const)
+		c.ir.WriteF32(val)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x43)
 	c.buf.WriteF32(val)
 }
 
 // f64.const f64 ( -- f64 )
 func (c *Expr) F64_Const(val F64) {
-	c.buf.WriteRawByte(0x44)
+	c.count(opF64_Const)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Const)
+		c.ir.WriteF64(val)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x44)
 	c.buf.WriteF64(val)
 }
 
 // i32.eqz ( i32 -- i32 )
 func (c *Expr) I32_Eqz() {
-	c.buf.WriteRawByte(0x45)
+	c.count(opI32_Eqz)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Eqz)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x45)
 }
 
 // i32.eq ( i32 i32 -- i32 )
 func (c *Expr) I32_Eq() {
-	c.buf.WriteRawByte(0x46)
+	c.count(opI32_Eq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Eq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x46)
 }
 
 // i32.ne ( i32 i32 -- i32 )
 func (c *Expr) I32_Ne() {
-	c.buf.WriteRawByte(0x47)
+	c.count(opI32_Ne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Ne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x47)
 }
 
 // i32.lt_s ( i32 i32 -- i32 )
 func (c *Expr) I32_LtS() {
-	c.buf.WriteRawByte(0x48)
+	c.count(opI32_LtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_LtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x48)
 }
 
 // i32.lt_u ( i32 i32 -- i32 )
 func (c *Expr) I32_LtU() {
-	c.buf.WriteRawByte(0x49)
+	c.count(opI32_LtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_LtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x49)
 }
 
 // i32.gt_s ( i32 i32 -- i32 )
 func (c *Expr) I32_GtS() {
-	c.buf.WriteRawByte(0x4A)
+	c.count(opI32_GtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_GtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x4A)
 }
 
 // i32.gt_u ( i32 i32 -- i32 )
 func (c *Expr) I32_GtU() {
-	c.buf.WriteRawByte(0x4B)
+	c.count(opI32_GtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_GtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x4B)
 }
 
 // i32.le_s ( i32 i32 -- i32 )
 func (c *Expr) I32_LeS() {
-	c.buf.WriteRawByte(0x4C)
+	c.count(opI32_LeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_LeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x4C)
 }
 
 // i32.le_u ( i32 i32 -- i32 )
 func (c *Expr) I32_LeU() {
-	c.buf.WriteRawByte(0x4D)
+	c.count(opI32_LeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_LeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x4D)
 }
 
 // i32.ge_s ( i32 i32 -- i32 )
 func (c *Expr) I32_GeS() {
-	c.buf.WriteRawByte(0x4E)
+	c.count(opI32_GeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_GeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x4E)
 }
 
 // i32.ge_u ( i32 i32 -- i32 )
 func (c *Expr) I32_GeU() {
-	c.buf.WriteRawByte(0x4F)
+	c.count(opI32_GeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_GeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x4F)
 }
 
 // i64.eqz ( i64 -- i32 )
 func (c *Expr) I64_Eqz() {
-	c.buf.WriteRawByte(0x50)
+	c.count(opI64_Eqz)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Eqz)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x50)
 }
 
 // i64.eq ( i64 i64 -- i32 )
 func (c *Expr) I64_Eq() {
-	c.buf.WriteRawByte(0x51)
+	c.count(opI64_Eq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Eq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x51)
 }
 
 // i64.ne ( i64 i64 -- i32 )
 func (c *Expr) I64_Ne() {
-	c.buf.WriteRawByte(0x52)
+	c.count(opI64_Ne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Ne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x52)
 }
 
 // i64.lt_s ( i64 i64 -- i32 )
 func (c *Expr) I64_LtS() {
-	c.buf.WriteRawByte(0x53)
+	c.count(opI64_LtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_LtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x53)
 }
 
 // i64.lt_u ( i64 i64 -- i32 )
 func (c *Expr) I64_LtU() {
-	c.buf.WriteRawByte(0x54)
+	c.count(opI64_LtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_LtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x54)
 }
 
 // i64.gt_s ( i64 i64 -- i32 )
 func (c *Expr) I64_GtS() {
-	c.buf.WriteRawByte(0x55)
+	c.count(opI64_GtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_GtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x55)
 }
 
 // i64.gt_u ( i64 i64 -- i32 )
 func (c *Expr) I64_GtU() {
-	c.buf.WriteRawByte(0x56)
+	c.count(opI64_GtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_GtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x56)
 }
 
 // i64.le_s ( i64 i64 -- i32 )
 func (c *Expr) I64_LeS() {
-	c.buf.WriteRawByte(0x57)
+	c.count(opI64_LeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_LeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x57)
 }
 
 // i64.le_u ( i64 i64 -- i32 )
 func (c *Expr) I64_LeU() {
-	c.buf.WriteRawByte(0x58)
+	c.count(opI64_LeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_LeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x58)
 }
 
 // i64.ge_s ( i64 i64 -- i32 )
 func (c *Expr) I64_GeS() {
-	c.buf.WriteRawByte(0x59)
+	c.count(opI64_GeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_GeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x59)
 }
 
 // i64.ge_u ( i64 i64 -- i32 )
 func (c *Expr) I64_GeU() {
-	c.buf.WriteRawByte(0x5A)
+	c.count(opI64_GeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_GeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x5A)
 }
 
 // f32.eq ( f32 f32 -- i32 )
 func (c *Expr) F32_Eq() {
-	c.buf.WriteRawByte(0x5B)
+	c.count(opF32_Eq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Eq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x5B)
 }
 
 // f32.ne ( f32 f32 -- i32 )
 func (c *Expr) F32_Ne() {
-	c.buf.WriteRawByte(0x5C)
+	c.count(opF32_Ne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Ne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x5C)
 }
 
 // f32.lt ( f32 f32 -- i32 )
 func (c *Expr) F32_Lt() {
-	c.buf.WriteRawByte(0x5D)
+	c.count(opF32_Lt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Lt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x5D)
 }
 
 // f32.gt ( f32 f32 -- i32 )
 func (c *Expr) F32_Gt() {
-	c.buf.WriteRawByte(0x5E)
+	c.count(opF32_Gt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Gt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x5E)
 }
 
 // f32.le ( f32 f32 -- i32 )
 func (c *Expr) F32_Le() {
-	c.buf.WriteRawByte(0x5F)
+	c.count(opF32_Le)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Le)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x5F)
 }
 
 // f32.ge ( f32 f32 -- i32 )
 func (c *Expr) F32_Ge() {
-	c.buf.WriteRawByte(0x60)
+	c.count(opF32_Ge)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Ge)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x60)
 }
 
 // f64.eq ( f64 f64 -- i32 )
 func (c *Expr) F64_Eq() {
-	c.buf.WriteRawByte(0x61)
+	c.count(opF64_Eq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Eq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x61)
 }
 
 // f64.ne ( f64 f64 -- i32 )
 func (c *Expr) F64_Ne() {
-	c.buf.WriteRawByte(0x62)
+	c.count(opF64_Ne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Ne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x62)
 }
 
 // f64.lt ( f64 f64 -- i32 )
 func (c *Expr) F64_Lt() {
-	c.buf.WriteRawByte(0x63)
+	c.count(opF64_Lt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Lt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x63)
 }
 
 // f64.gt ( f64 f64 -- i32 )
 func (c *Expr) F64_Gt() {
-	c.buf.WriteRawByte(0x64)
+	c.count(opF64_Gt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Gt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x64)
 }
 
 // f64.le ( f64 f64 -- i32 )
 func (c *Expr) F64_Le() {
-	c.buf.WriteRawByte(0x65)
+	c.count(opF64_Le)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Le)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x65)
 }
 
 // f64.ge ( f64 f64 -- i32 )
 func (c *Expr) F64_Ge() {
-	c.buf.WriteRawByte(0x66)
+	c.count(opF64_Ge)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Ge)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x66)
 }
 
 // i32.clz ( i32 -- i32 )
 func (c *Expr) I32_Clz() {
-	c.buf.WriteRawByte(0x67)
+	c.count(opI32_Clz)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Clz)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x67)
 }
 
 // i32.ctz ( i32 -- i32 )
 func (c *Expr) I32_Ctz() {
-	c.buf.WriteRawByte(0x68)
+	c.count(opI32_Ctz)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Ctz)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x68)
 }
 
 // i32.popcnt ( i32 -- i32 )
 func (c *Expr) I32_Popcnt() {
-	c.buf.WriteRawByte(0x69)
+	c.count(opI32_Popcnt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Popcnt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x69)
 }
 
 // i32.add ( i32 i32 -- i32 )
 func (c *Expr) I32_Add() {
-	c.buf.WriteRawByte(0x6A)
+	c.count(opI32_Add)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Add)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x6A)
 }
 
 // i32.sub ( i32 i32 -- i32 )
 func (c *Expr) I32_Sub() {
-	c.buf.WriteRawByte(0x6B)
+	c.count(opI32_Sub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Sub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x6B)
 }
 
 // i32.mul ( i32 i32 -- i32 )
 func (c *Expr) I32_Mul() {
-	c.buf.WriteRawByte(0x6C)
+	c.count(opI32_Mul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Mul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x6C)
 }
 
 // i32.div_s ( i32 i32 -- i32 )
 func (c *Expr) I32_DivS() {
-	c.buf.WriteRawByte(0x6D)
+	c.count(opI32_DivS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_DivS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x6D)
 }
 
 // i32.div_u ( i32 i32 -- i32 )
 func (c *Expr) I32_DivU() {
-	c.buf.WriteRawByte(0x6E)
+	c.count(opI32_DivU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_DivU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x6E)
 }
 
 // i32.rem_s ( i32 i32 -- i32 )
 func (c *Expr) I32_RemS() {
-	c.buf.WriteRawByte(0x6F)
+	c.count(opI32_RemS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_RemS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x6F)
 }
 
 // i32.rem_u ( i32 i32 -- i32 )
 func (c *Expr) I32_RemU() {
-	c.buf.WriteRawByte(0x70)
+	c.count(opI32_RemU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_RemU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x70)
 }
 
 // i32.and ( i32 i32 -- i32 )
 func (c *Expr) I32_And() {
-	c.buf.WriteRawByte(0x71)
+	c.count(opI32_And)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_And)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x71)
 }
 
 // i32.or ( i32 i32 -- i32 )
 func (c *Expr) I32_Or() {
-	c.buf.WriteRawByte(0x72)
+	c.count(opI32_Or)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Or)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x72)
 }
 
 // i32.xor ( i32 i32 -- i32 )
 func (c *Expr) I32_Xor() {
-	c.buf.WriteRawByte(0x73)
+	c.count(opI32_Xor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Xor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x73)
 }
 
 // i32.shl ( i32 i32 -- i32 )
 func (c *Expr) I32_Shl() {
-	c.buf.WriteRawByte(0x74)
+	c.count(opI32_Shl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Shl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x74)
 }
 
 // i32.shr_s ( i32 i32 -- i32 )
 func (c *Expr) I32_ShrS() {
-	c.buf.WriteRawByte(0x75)
+	c.count(opI32_ShrS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_ShrS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x75)
 }
 
 // i32.shr_u ( i32 i32 -- i32 )
 func (c *Expr) I32_ShrU() {
-	c.buf.WriteRawByte(0x76)
+	c.count(opI32_ShrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_ShrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x76)
 }
 
 // i32.rotl ( i32 i32 -- i32 )
 func (c *Expr) I32_Rotl() {
-	c.buf.WriteRawByte(0x77)
+	c.count(opI32_Rotl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Rotl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x77)
 }
 
 // i32.rotr ( i32 i32 -- i32 )
 func (c *Expr) I32_Rotr() {
-	c.buf.WriteRawByte(0x78)
+	c.count(opI32_Rotr)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Rotr)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x78)
 }
 
 // i64.clz ( i64 -- i64 )
 func (c *Expr) I64_Clz() {
-	c.buf.WriteRawByte(0x79)
+	c.count(opI64_Clz)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Clz)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x79)
 }
 
 // i64.ctz ( i64 -- i64 )
 func (c *Expr) I64_Ctz() {
-	c.buf.WriteRawByte(0x7A)
+	c.count(opI64_Ctz)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Ctz)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x7A)
 }
 
 // i64.popcnt ( i64 -- i64 )
 func (c *Expr) I64_Popcnt() {
-	c.buf.WriteRawByte(0x7B)
+	c.count(opI64_Popcnt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Popcnt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x7B)
 }
 
 // i64.add ( i64 i64 -- i64 )
 func (c *Expr) I64_Add() {
-	c.buf.WriteRawByte(0x7C)
+	c.count(opI64_Add)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Add)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x7C)
 }
 
 // i64.sub ( i64 i64 -- i64 )
 func (c *Expr) I64_Sub() {
-	c.buf.WriteRawByte(0x7D)
+	c.count(opI64_Sub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Sub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x7D)
 }
 
 // i64.mul ( i64 i64 -- i64 )
 func (c *Expr) I64_Mul() {
-	c.buf.WriteRawByte(0x7E)
+	c.count(opI64_Mul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Mul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x7E)
 }
 
 // i64.div_s ( i64 i64 -- i64 )
 func (c *Expr) I64_DivS() {
-	c.buf.WriteRawByte(0x7F)
+	c.count(opI64_DivS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_DivS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x7F)
 }
 
 // i64.div_u ( i64 i64 -- i64 )
 func (c *Expr) I64_DivU() {
-	c.buf.WriteRawByte(0x80)
+	c.count(opI64_DivU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_DivU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x80)
 }
 
 // i64.rem_s ( i64 i64 -- i64 )
 func (c *Expr) I64_RemS() {
-	c.buf.WriteRawByte(0x81)
+	c.count(opI64_RemS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_RemS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x81)
 }
 
 // i64.rem_u ( i64 i64 -- i64 )
 func (c *Expr) I64_RemU() {
-	c.buf.WriteRawByte(0x82)
+	c.count(opI64_RemU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_RemU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x82)
 }
 
 // i64.and ( i64 i64 -- i64 )
 func (c *Expr) I64_And() {
-	c.buf.WriteRawByte(0x83)
+	c.count(opI64_And)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_And)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x83)
 }
 
 // i64.or ( i64 i64 -- i64 )
 func (c *Expr) I64_Or() {
-	c.buf.WriteRawByte(0x84)
+	c.count(opI64_Or)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Or)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x84)
 }
 
 // i64.xor ( i64 i64 -- i64 )
 func (c *Expr) I64_Xor() {
-	c.buf.WriteRawByte(0x85)
+	c.count(opI64_Xor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Xor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x85)
 }
 
 // i64.shl ( i64 i64 -- i64 )
 func (c *Expr) I64_Shl() {
-	c.buf.WriteRawByte(0x86)
+	c.count(opI64_Shl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Shl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x86)
 }
 
 // i64.shr_s ( i64 i64 -- i64 )
 func (c *Expr) I64_ShrS() {
-	c.buf.WriteRawByte(0x87)
+	c.count(opI64_ShrS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_ShrS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x87)
 }
 
 // i64.shr_u ( i64 i64 -- i64 )
 func (c *Expr) I64_ShrU() {
-	c.buf.WriteRawByte(0x88)
+	c.count(opI64_ShrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_ShrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x88)
 }
 
 // i64.rotl ( i64 i64 -- i64 )
 func (c *Expr) I64_Rotl() {
-	c.buf.WriteRawByte(0x89)
+	c.count(opI64_Rotl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Rotl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x89)
 }
 
 // i64.rotr ( i64 i64 -- i64 )
 func (c *Expr) I64_Rotr() {
-	c.buf.WriteRawByte(0x8A)
+	c.count(opI64_Rotr)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Rotr)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x8A)
 }
 
 // f32.abs ( f32 -- f32 )
 func (c *Expr) F32_Abs() {
-	c.buf.WriteRawByte(0x8B)
+	c.count(opF32_Abs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Abs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x8B)
 }
 
 // f32.neg ( f32 -- f32 )
 func (c *Expr) F32_Neg() {
-	c.buf.WriteRawByte(0x8C)
+	c.count(opF32_Neg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Neg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x8C)
 }
 
 // f32.ceil ( f32 -- f32 )
 func (c *Expr) F32_Ceil() {
-	c.buf.WriteRawByte(0x8D)
+	c.count(opF32_Ceil)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Ceil)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x8D)
 }
 
 // f32.floor ( f32 -- f32 )
 func (c *Expr) F32_Floor() {
-	c.buf.WriteRawByte(0x8E)
+	c.count(opF32_Floor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Floor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x8E)
 }
 
 // f32.trunc ( f32 -- f32 )
 func (c *Expr) F32_Trunc() {
-	c.buf.WriteRawByte(0x8F)
+	c.count(opF32_Trunc)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Trunc)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x8F)
 }
 
 // f32.nearest ( f32 -- f32 )
 func (c *Expr) F32_Nearest() {
-	c.buf.WriteRawByte(0x90)
+	c.count(opF32_Nearest)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Nearest)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x90)
 }
 
 // f32.sqrt ( f32 -- f32 )
 func (c *Expr) F32_Sqrt() {
-	c.buf.WriteRawByte(0x91)
+	c.count(opF32_Sqrt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Sqrt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x91)
 }
 
 // f32.add ( f32 f32 -- f32 )
 func (c *Expr) F32_Add() {
-	c.buf.WriteRawByte(0x92)
+	c.count(opF32_Add)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Add)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x92)
 }
 
 // f32.sub ( f32 f32 -- f32 )
 func (c *Expr) F32_Sub() {
-	c.buf.WriteRawByte(0x93)
+	c.count(opF32_Sub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Sub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x93)
 }
 
 // f32.mul ( f32 f32 -- f32 )
 func (c *Expr) F32_Mul() {
-	c.buf.WriteRawByte(0x94)
+	c.count(opF32_Mul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Mul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x94)
 }
 
 // f32.div ( f32 f32 -- f32 )
 func (c *Expr) F32_Div() {
-	c.buf.WriteRawByte(0x95)
+	c.count(opF32_Div)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Div)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x95)
 }
 
 // f32.fmin ( f32 f32 -- f32 )
 func (c *Expr) F32_Fmin() {
-	c.buf.WriteRawByte(0x96)
+	c.count(opF32_Fmin)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Fmin)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x96)
 }
 
 // f32.fmax ( f32 f32 -- f32 )
 func (c *Expr) F32_Fmax() {
-	c.buf.WriteRawByte(0x97)
+	c.count(opF32_Fmax)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Fmax)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x97)
 }
 
 // f32.copysign ( f32 f32 -- f32 )
 func (c *Expr) F32_Copysign() {
-	c.buf.WriteRawByte(0x98)
+	c.count(opF32_Copysign)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_Copysign)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x98)
 }
 
 // f64.abs ( f64 -- f64 )
 func (c *Expr) F64_Abs() {
-	c.buf.WriteRawByte(0x99)
+	c.count(opF64_Abs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Abs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x99)
 }
 
 // f64.neg ( f64 -- f64 )
 func (c *Expr) F64_Neg() {
-	c.buf.WriteRawByte(0x9A)
+	c.count(opF64_Neg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Neg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x9A)
 }
 
 // f64.ceil ( f64 -- f64 )
 func (c *Expr) F64_Ceil() {
-	c.buf.WriteRawByte(0x9B)
+	c.count(opF64_Ceil)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Ceil)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x9B)
 }
 
 // f64.floor ( f64 -- f64 )
 func (c *Expr) F64_Floor() {
-	c.buf.WriteRawByte(0x9C)
+	c.count(opF64_Floor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Floor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x9C)
 }
 
 // f64.trunc ( f64 -- f64 )
 func (c *Expr) F64_Trunc() {
-	c.buf.WriteRawByte(0x9D)
+	c.count(opF64_Trunc)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Trunc)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x9D)
 }
 
 // f64.nearest ( f64 -- f64 )
 func (c *Expr) F64_Nearest() {
-	c.buf.WriteRawByte(0x9E)
+	c.count(opF64_Nearest)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Nearest)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x9E)
 }
 
 // f64.sqrt ( f64 -- f64 )
 func (c *Expr) F64_Sqrt() {
-	c.buf.WriteRawByte(0x9F)
+	c.count(opF64_Sqrt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Sqrt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0x9F)
 }
 
 // f64.add ( f64 f64 -- f64 )
 func (c *Expr) F64_Add() {
-	c.buf.WriteRawByte(0xA0)
+	c.count(opF64_Add)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Add)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA0)
 }
 
 // f64.sub ( f64 f64 -- f64 )
 func (c *Expr) F64_Sub() {
-	c.buf.WriteRawByte(0xA1)
+	c.count(opF64_Sub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Sub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA1)
 }
 
 // f64.mul ( f64 f64 -- f64 )
 func (c *Expr) F64_Mul() {
-	c.buf.WriteRawByte(0xA2)
+	c.count(opF64_Mul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Mul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA2)
 }
 
 // f64.div ( f64 f64 -- f64 )
 func (c *Expr) F64_Div() {
-	c.buf.WriteRawByte(0xA3)
+	c.count(opF64_Div)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Div)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA3)
 }
 
 // f64.fmin ( f64 f64 -- f64 )
 func (c *Expr) F64_Fmin() {
-	c.buf.WriteRawByte(0xA4)
+	c.count(opF64_Fmin)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Fmin)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA4)
 }
 
 // f64.fmax ( f64 f64 -- f64 )
 func (c *Expr) F64_Fmax() {
-	c.buf.WriteRawByte(0xA5)
+	c.count(opF64_Fmax)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Fmax)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA5)
 }
 
 // f64.copysign ( f64 f64 -- f64 )
 func (c *Expr) F64_Copysign() {
-	c.buf.WriteRawByte(0xA6)
+	c.count(opF64_Copysign)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_Copysign)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA6)
 }
 
 // i32.wrap_i64 ( i64 -- i32 )
 func (c *Expr) I32_WrapI64() {
-	c.buf.WriteRawByte(0xA7)
+	c.count(opI32_WrapI64)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_WrapI64)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA7)
 }
 
 // i32.trunc_f32_s ( f32 -- i32 )
 func (c *Expr) I32_TruncF32S() {
-	c.buf.WriteRawByte(0xA8)
+	c.count(opI32_TruncF32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncF32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA8)
 }
 
 // i32.trunc_f32_u ( f32 -- i32 )
 func (c *Expr) I32_TruncF32U() {
-	c.buf.WriteRawByte(0xA9)
+	c.count(opI32_TruncF32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncF32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xA9)
 }
 
 // i32.trunc_f64_s ( f64 -- i32 )
 func (c *Expr) I32_TruncF64S() {
-	c.buf.WriteRawByte(0xAA)
+	c.count(opI32_TruncF64S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncF64S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xAA)
 }
 
 // i32.trunc_f64_u ( f64 -- i32 )
 func (c *Expr) I32_TruncF64U() {
-	c.buf.WriteRawByte(0xAB)
+	c.count(opI32_TruncF64U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncF64U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xAB)
 }
 
 // i64.extend_i32_s ( i32 -- i64 )
 func (c *Expr) I64_ExtendI32S() {
-	c.buf.WriteRawByte(0xAC)
+	c.count(opI64_ExtendI32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_ExtendI32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xAC)
 }
 
 // i64.extend_i32_u ( i32 -- i64 )
 func (c *Expr) I64_ExtendI32U() {
-	c.buf.WriteRawByte(0xAD)
+	c.count(opI64_ExtendI32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_ExtendI32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xAD)
 }
 
 // i64.trunc_f32_s ( f32 -- i64 )
 func (c *Expr) I64_TruncF32S() {
-	c.buf.WriteRawByte(0xAE)
+	c.count(opI64_TruncF32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncF32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xAE)
 }
 
 // i64.trunc_f32_u ( f32 -- i64 )
 func (c *Expr) I64_TruncF32U() {
-	c.buf.WriteRawByte(0xAF)
+	c.count(opI64_TruncF32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncF32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xAF)
 }
 
 // i64.trunc_f64_s ( f64 -- i64 )
 func (c *Expr) I64_TruncF64S() {
-	c.buf.WriteRawByte(0xB0)
+	c.count(opI64_TruncF64S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncF64S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB0)
 }
 
 // i64.trunc_f64_u ( f64 -- i64 )
 func (c *Expr) I64_TruncF64U() {
-	c.buf.WriteRawByte(0xB1)
+	c.count(opI64_TruncF64U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncF64U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB1)
 }
 
 // f32.convert_i32_s ( i32 -- f32 )
 func (c *Expr) F32_ConvertI32S() {
-	c.buf.WriteRawByte(0xB2)
+	c.count(opF32_ConvertI32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_ConvertI32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB2)
 }
 
 // f32.convert_i32_u ( i32 -- f32 )
 func (c *Expr) F32_ConvertI32U() {
-	c.buf.WriteRawByte(0xB3)
+	c.count(opF32_ConvertI32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_ConvertI32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB3)
 }
 
 // f32.convert_i64_s ( i64 -- f32 )
 func (c *Expr) F32_ConvertI64S() {
-	c.buf.WriteRawByte(0xB4)
+	c.count(opF32_ConvertI64S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_ConvertI64S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB4)
 }
 
 // f32.convert_i64_u ( i64 -- f32 )
 func (c *Expr) F32_ConvertI64U() {
-	c.buf.WriteRawByte(0xB5)
+	c.count(opF32_ConvertI64U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_ConvertI64U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB5)
 }
 
 // f32.demote_f64 ( f64 -- f32 )
 func (c *Expr) F32_DemoteF64() {
-	c.buf.WriteRawByte(0xB6)
+	c.count(opF32_DemoteF64)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_DemoteF64)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB6)
 }
 
 // f64.convert_i32_s ( i32 -- f64 )
 func (c *Expr) F64_ConvertI32S() {
-	c.buf.WriteRawByte(0xB7)
+	c.count(opF64_ConvertI32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_ConvertI32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB7)
 }
 
 // f64.convert_i32_u ( i32 -- f64 )
 func (c *Expr) F64_ConvertI32U() {
-	c.buf.WriteRawByte(0xB8)
+	c.count(opF64_ConvertI32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_ConvertI32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB8)
 }
 
 // f64.convert_i64_s ( i64 -- f64 )
 func (c *Expr) F64_ConvertI64S() {
-	c.buf.WriteRawByte(0xB9)
+	c.count(opF64_ConvertI64S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_ConvertI64S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xB9)
 }
 
 // f64.convert_i64_u ( i64 -- f64 )
 func (c *Expr) F64_ConvertI64U() {
-	c.buf.WriteRawByte(0xBA)
+	c.count(opF64_ConvertI64U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_ConvertI64U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xBA)
 }
 
 // f64.promote_f32 ( f32 -- f64 )
 func (c *Expr) F64_PromoteF32() {
-	c.buf.WriteRawByte(0xBB)
+	c.count(opF64_PromoteF32)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_PromoteF32)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xBB)
 }
 
 // i32.reinterpret_f32 ( f32 -- i32 )
 func (c *Expr) I32_ReinterpretF32() {
-	c.buf.WriteRawByte(0xBC)
+	c.count(opI32_ReinterpretF32)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_ReinterpretF32)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xBC)
 }
 
 // i64.reinterpret_f64 ( f64 -- i64 )
 func (c *Expr) I64_ReinterpretF64() {
-	c.buf.WriteRawByte(0xBD)
+	c.count(opI64_ReinterpretF64)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_ReinterpretF64)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xBD)
 }
 
 // f32.reinterpret_i32 ( i32 -- f32 )
 func (c *Expr) F32_ReinterpretI32() {
-	c.buf.WriteRawByte(0xBE)
+	c.count(opF32_ReinterpretI32)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32_ReinterpretI32)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xBE)
 }
 
 // f64.reinterpret_i64 ( i64 -- f64 )
 func (c *Expr) F64_ReinterpretI64() {
-	c.buf.WriteRawByte(0xBF)
+	c.count(opF64_ReinterpretI64)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64_ReinterpretI64)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xBF)
 }
 
 // i32.extend8_s ( i32 -- i32 )
 func (c *Expr) I32_Extend8S() {
-	c.buf.WriteRawByte(0xC0)
+	c.count(opI32_Extend8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Extend8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xC0)
 }
 
 // i32.extend16_s ( i32 -- i32 )
 func (c *Expr) I32_Extend16S() {
-	c.buf.WriteRawByte(0xC1)
+	c.count(opI32_Extend16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_Extend16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xC1)
 }
 
 // i64.extend8_s ( i64 -- i64 )
 func (c *Expr) I64_Extend8S() {
-	c.buf.WriteRawByte(0xC2)
+	c.count(opI64_Extend8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Extend8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xC2)
 }
 
 // i64.extend16_s ( i64 -- i64 )
 func (c *Expr) I64_Extend16S() {
-	c.buf.WriteRawByte(0xC3)
+	c.count(opI64_Extend16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Extend16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xC3)
 }
 
 // i64.extend32_s ( i64 -- i64 )
 func (c *Expr) I64_Extend32S() {
-	c.buf.WriteRawByte(0xC4)
+	c.count(opI64_Extend32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_Extend32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xC4)
 }
 
 // refnull t ( -- t )
 func (c *Expr) Refnull(typ TypeIdx) {
-	c.buf.WriteRawByte(0xD0)
+	c.count(opRefnull)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opRefnull)
+		c.ir.WriteTypeIdx(typ)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xD0)
 	c.buf.WriteTypeIdx(typ)
 }
 
 // refisnull ( t -- i32 )
 func (c *Expr) Refisnull() {
-	c.buf.WriteRawByte(0xD1)
+	c.count(opRefisnull)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opRefisnull)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xD1)
 }
 
 // reffunc x ( -- funcref )
 func (c *Expr) Reffunc(idx U32) {
-	c.buf.WriteRawByte(0xD2)
+	c.count(opReffunc)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opReffunc)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xD2)
 	c.buf.WriteU32(idx)
 }
 
 // i32.trunc_sat_f32_s ( f32 -- i32 )
 func (c *Expr) I32_TruncSatF32S() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x00)
+	c.count(opI32_TruncSatF32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncSatF32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x00)
 }
 
 // i32.trunc_sat_f32_u ( f32 -- i32 )
 func (c *Expr) I32_TruncSatF32U() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32_TruncSatF32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncSatF32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x01)
 }
 
 // i32.trunc_sat_f64_s ( f64 -- i32 )
 func (c *Expr) I32_TruncSatF64S() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x02)
+	c.count(opI32_TruncSatF64S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncSatF64S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x02)
 }
 
 // i32.trunc_sat_f64_u ( f64 -- i32 )
 func (c *Expr) I32_TruncSatF64U() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x03)
+	c.count(opI32_TruncSatF64U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32_TruncSatF64U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x03)
 }
 
 // i64.trunc_sat_f32_s ( f32 -- i64 )
 func (c *Expr) I64_TruncSatF32S() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x04)
+	c.count(opI64_TruncSatF32S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncSatF32S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x04)
 }
 
 // i64.trunc_sat_f32_u ( f32 -- i64 )
 func (c *Expr) I64_TruncSatF32U() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x05)
+	c.count(opI64_TruncSatF32U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncSatF32U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x05)
 }
 
 // i64.trunc_sat_f64_s ( f64 -- i64 )
 func (c *Expr) I64_TruncSatF64S() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x06)
+	c.count(opI64_TruncSatF64S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncSatF64S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x06)
 }
 
 // i64.trunc_sat_f64_u ( f64 -- i64 )
 func (c *Expr) I64_TruncSatF64U() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x07)
+	c.count(opI64_TruncSatF64U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64_TruncSatF64U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x07)
 }
 
-// memoryinit x ( i32 i32 i32 -- )
+// memoryinit x 0x00 ( i32 i32 i32 -- )
 func (c *Expr) Memoryinit(idx U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x08)
+	c.count(opMemoryinit)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opMemoryinit)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.reserve(8)
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x08)
 	c.buf.WriteU32(idx)
+	c.buf.buf = append(c.buf.buf, 0x00)
 }
 
 // datadrop x ( -- )
 func (c *Expr) Datadrop(idx U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x09)
+	c.count(opDatadrop)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opDatadrop)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x09)
 	c.buf.WriteU32(idx)
 }
 
-// memorycopy ( i32 i32 i32 -- )
+// memorycopy 0x00 0x00 ( i32 i32 i32 -- )
 func (c *Expr) Memorycopy() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x0A)
+	c.count(opMemorycopy)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opMemorycopy)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x0A, 0x00, 0x00)
 }
 
-// memoryfill ( i32 i32 i32 -- )
+// memoryfill 0x00 ( i32 i32 i32 -- )
 func (c *Expr) Memoryfill() {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x0B)
+	c.count(opMemoryfill)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opMemoryfill)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x0B, 0x00)
 }
 
 // tableinit x y ( i32 i32 i32 -- )
 func (c *Expr) Tableinit(idx U32, idx2 U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x0C)
+	c.count(opTableinit)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTableinit)
+		c.ir.WriteU32(idx)
+		c.ir.WriteU32(idx2)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x0C)
 	c.buf.WriteU32(idx)
 	c.buf.WriteU32(idx2)
 }
 
 // elemdrop x ( -- )
 func (c *Expr) Elemdrop(idx U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x0D)
+	c.count(opElemdrop)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opElemdrop)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x0D)
 	c.buf.WriteU32(idx)
 }
 
 // tablecopy x y ( i32 i32 i32 -- )
 func (c *Expr) Tablecopy(idx U32, idx2 U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x0E)
+	c.count(opTablecopy)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTablecopy)
+		c.ir.WriteU32(idx)
+		c.ir.WriteU32(idx2)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x0E)
 	c.buf.WriteU32(idx)
 	c.buf.WriteU32(idx2)
 }
 
 // tablegrow x ( t i32 -- i32 )
 func (c *Expr) Tablegrow(idx U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x0F)
+	c.count(opTablegrow)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTablegrow)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x0F)
 	c.buf.WriteU32(idx)
 }
 
 // tablesize x ( -- i32 )
 func (c *Expr) Tablesize(idx U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x10)
+	c.count(opTablesize)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTablesize)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x10)
 	c.buf.WriteU32(idx)
 }
 
 // tablefill x ( i32 t i32 -- )
 func (c *Expr) Tablefill(idx U32) {
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x11)
+	c.count(opTablefill)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opTablefill)
+		c.ir.WriteU32(idx)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFC, 0x11)
 	c.buf.WriteU32(idx)
 }
 
 // v128.load memarg ( i32 -- v128 )
 func (c *Expr) V128_Load(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x00)
+	c.count(opV128_Load)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x00)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load8x8_s memarg ( i32 -- v128 )
 func (c *Expr) V128_Load8x8S(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x01)
+	c.count(opV128_Load8x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load8x8S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x01)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load8x8_u memarg ( i32 -- v128 )
 func (c *Expr) V128_Load8x8U(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x02)
+	c.count(opV128_Load8x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load8x8U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x02)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load16x4_s memarg ( i32 -- v128 )
 func (c *Expr) V128_Load16x4S(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x03)
+	c.count(opV128_Load16x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load16x4S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x03)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load16x4_u memarg ( i32 -- v128 )
 func (c *Expr) V128_Load16x4U(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x04)
+	c.count(opV128_Load16x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load16x4U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x04)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load32x2_s memarg ( i32 -- v128 )
 func (c *Expr) V128_Load32x2S(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x05)
+	c.count(opV128_Load32x2S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load32x2S)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x05)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load32x2_u memarg ( i32 -- v128 )
 func (c *Expr) V128_Load32x2U(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x06)
+	c.count(opV128_Load32x2U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load32x2U)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x06)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load8_splat memarg ( i32 -- v128 )
 func (c *Expr) V128_Load8Splat(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x07)
+	c.count(opV128_Load8Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load8Splat)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x07)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load16_splat memarg ( i32 -- v128 )
 func (c *Expr) V128_Load16Splat(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x08)
+	c.count(opV128_Load16Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load16Splat)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x08)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load32_splat memarg ( i32 -- v128 )
 func (c *Expr) V128_Load32Splat(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x09)
+	c.count(opV128_Load32Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load32Splat)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x09)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load64_splat memarg ( i32 -- v128 )
 func (c *Expr) V128_Load64Splat(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x0A)
+	c.count(opV128_Load64Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load64Splat)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x0A)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.store memarg ( i32 v128 -- )
 func (c *Expr) V128_Store(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x0B)
+	c.count(opV128_Store)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Store)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x0B)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.vconst i128 ( -- v128 )
 func (c *Expr) V128_Vconst(val I128) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x0C)
+	c.count(opV128_Vconst)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Vconst)
+		c.ir.WriteI128(val)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x0C)
 	c.buf.WriteI128(val)
 }
 
 // i8x16.shuffle laneidx{16} ( v128 v128 -- v128 )
 func (c *Expr) I8x16_Shuffle(lanes LaneShuffle) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x0D)
+	c.count(opI8x16_Shuffle)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Shuffle)
+		c.ir.WriteLaneShuffle(lanes)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x0D)
 	c.buf.WriteLaneShuffle(lanes)
 }
 
 // i8x16.swizzle ( v128 v128 -- v128 )
 func (c *Expr) I8x16_Swizzle() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x0E)
+	c.count(opI8x16_Swizzle)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Swizzle)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x0E)
 }
 
 // i8x16.splat ( i32 -- v128 )
 func (c *Expr) I8x16_Splat() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x0F)
+	c.count(opI8x16_Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Splat)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x0F)
 }
 
 // i16x8.splat ( i32 -- v128 )
 func (c *Expr) I16x8_Splat() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x10)
+	c.count(opI16x8_Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Splat)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x10)
 }
 
 // i32x4.splat ( i32 -- v128 )
 func (c *Expr) I32x4_Splat() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x11)
+	c.count(opI32x4_Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Splat)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x11)
 }
 
 // i64x2.splat ( i64 -- v128 )
 func (c *Expr) I64x2_Splat() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x12)
+	c.count(opI64x2_Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Splat)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x12)
 }
 
 // f32x4.splat ( f32 -- v128 )
 func (c *Expr) F32x4_Splat() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x13)
+	c.count(opF32x4_Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Splat)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x13)
 }
 
 // f64x2.splat ( f64 -- v128 )
 func (c *Expr) F64x2_Splat() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x14)
+	c.count(opF64x2_Splat)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Splat)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x14)
 }
 
 // i8x16.extractlane_s laneidx ( v128 -- i32 )
 func (c *Expr) I8x16_ExtractlaneS(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x15)
+	c.count(opI8x16_ExtractlaneS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_ExtractlaneS)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x15)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i8x16.extractlane_u laneidx ( v128 -- i32 )
 func (c *Expr) I8x16_ExtractlaneU(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x16)
+	c.count(opI8x16_ExtractlaneU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_ExtractlaneU)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x16)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i8x16.replacelane laneidx ( v128 i32 -- v128 )
 func (c *Expr) I8x16_Replacelane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x17)
+	c.count(opI8x16_Replacelane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Replacelane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x17)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i16x8.extractlane_s laneidx ( v128 -- i32 )
 func (c *Expr) I16x8_ExtractlaneS(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x18)
+	c.count(opI16x8_ExtractlaneS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtractlaneS)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x18)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i16x8.extractlane_u laneidx ( v128 -- i32 )
 func (c *Expr) I16x8_ExtractlaneU(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x19)
+	c.count(opI16x8_ExtractlaneU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtractlaneU)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x19)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i16x8.replacelane laneidx ( v128 i32 -- v128 )
 func (c *Expr) I16x8_Replacelane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x1A)
+	c.count(opI16x8_Replacelane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Replacelane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x1A)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i32x4.extractlane laneidx ( v128 -- i32 )
 func (c *Expr) I32x4_Extractlane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x1B)
+	c.count(opI32x4_Extractlane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Extractlane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x1B)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i32x4.replacelane laneidx ( v128 i32 -- v128 )
 func (c *Expr) I32x4_Replacelane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x1C)
+	c.count(opI32x4_Replacelane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Replacelane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x1C)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i64x2.extractlane laneidx ( v128 -- i64 )
 func (c *Expr) I64x2_Extractlane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x1D)
+	c.count(opI64x2_Extractlane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Extractlane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x1D)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i64x2.replacelane laneidx ( v128 i64 -- v128 )
 func (c *Expr) I64x2_Replacelane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x1E)
+	c.count(opI64x2_Replacelane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Replacelane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x1E)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // f32x4.extractlane laneidx ( v128 -- f32 )
 func (c *Expr) F32x4_Extractlane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x1F)
+	c.count(opF32x4_Extractlane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Extractlane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x1F)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // f32x4.replacelane laneidx ( v128 f32 -- v128 )
 func (c *Expr) F32x4_Replacelane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x20)
+	c.count(opF32x4_Replacelane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Replacelane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x20)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // f64x2.extractlane laneidx ( v128 -- f64 )
 func (c *Expr) F64x2_Extractlane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x21)
+	c.count(opF64x2_Extractlane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Extractlane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x21)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // f64x2.replacelane laneidx ( v128 f64 -- v128 )
 func (c *Expr) F64x2_Replacelane(lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x22)
+	c.count(opF64x2_Replacelane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Replacelane)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x22)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // i8x16.veq ( v128 v128 -- v128 )
 func (c *Expr) I8x16_Veq() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x23)
+	c.count(opI8x16_Veq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Veq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x23)
 }
 
 // i8x16.vne ( v128 v128 -- v128 )
 func (c *Expr) I8x16_Vne() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x24)
+	c.count(opI8x16_Vne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x24)
 }
 
 // i8x16.vlt_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VltS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x25)
+	c.count(opI8x16_VltS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VltS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x25)
 }
 
 // i8x16.vlt_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VltU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x26)
+	c.count(opI8x16_VltU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VltU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x26)
 }
 
 // i8x16.vgt_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VgtS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x27)
+	c.count(opI8x16_VgtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VgtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x27)
 }
 
 // i8x16.vgt_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VgtU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x28)
+	c.count(opI8x16_VgtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VgtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x28)
 }
 
 // i8x16.vle_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VleS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x29)
+	c.count(opI8x16_VleS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VleS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x29)
 }
 
 // i8x16.vle_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VleU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x2A)
+	c.count(opI8x16_VleU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VleU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x2A)
 }
 
 // i8x16.vge_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VgeS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x2B)
+	c.count(opI8x16_VgeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VgeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x2B)
 }
 
 // i8x16.vge_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VgeU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x2C)
+	c.count(opI8x16_VgeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VgeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x2C)
 }
 
 // i16x8.veq ( v128 v128 -- v128 )
 func (c *Expr) I16x8_Veq() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x2D)
+	c.count(opI16x8_Veq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Veq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x2D)
 }
 
 // i16x8.vne ( v128 v128 -- v128 )
 func (c *Expr) I16x8_Vne() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x2E)
+	c.count(opI16x8_Vne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x2E)
 }
 
 // i16x8.vlt_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VltS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x2F)
+	c.count(opI16x8_VltS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VltS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x2F)
 }
 
 // i16x8.vlt_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VltU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x30)
+	c.count(opI16x8_VltU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VltU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x30)
 }
 
 // i16x8.vgt_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VgtS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x31)
+	c.count(opI16x8_VgtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VgtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x31)
 }
 
 // i16x8.vgt_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VgtU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x32)
+	c.count(opI16x8_VgtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VgtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x32)
 }
 
 // i16x8.vle_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VleS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x33)
+	c.count(opI16x8_VleS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VleS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x33)
 }
 
 // i16x8.vle_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VleU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x34)
+	c.count(opI16x8_VleU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VleU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x34)
 }
 
 // i16x8.vge_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VgeS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x35)
+	c.count(opI16x8_VgeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VgeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x35)
 }
 
 // i16x8.vge_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VgeU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x36)
+	c.count(opI16x8_VgeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VgeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x36)
 }
 
 // i32x4.veq ( v128 v128 -- v128 )
 func (c *Expr) I32x4_Veq() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x37)
+	c.count(opI32x4_Veq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Veq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x37)
 }
 
 // i32x4.vne ( v128 v128 -- v128 )
 func (c *Expr) I32x4_Vne() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x38)
+	c.count(opI32x4_Vne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x38)
 }
 
 // i32x4.vlt_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VltS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x39)
+	c.count(opI32x4_VltS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VltS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x39)
 }
 
 // i32x4.vlt_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VltU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x3A)
+	c.count(opI32x4_VltU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VltU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x3A)
 }
 
 // i32x4.vgt_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VgtS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x3B)
+	c.count(opI32x4_VgtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VgtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x3B)
 }
 
 // i32x4.vgt_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VgtU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x3C)
+	c.count(opI32x4_VgtU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VgtU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x3C)
 }
 
 // i32x4.vle_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VleS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x3D)
+	c.count(opI32x4_VleS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VleS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x3D)
 }
 
 // i32x4.vle_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VleU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x3E)
+	c.count(opI32x4_VleU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VleU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x3E)
 }
 
 // i32x4.vge_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VgeS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x3F)
+	c.count(opI32x4_VgeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VgeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x3F)
 }
 
 // i32x4.vge_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VgeU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x40)
+	c.count(opI32x4_VgeU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VgeU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x40)
 }
 
 // f32x4.veq ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Veq() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x41)
+	c.count(opF32x4_Veq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Veq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x41)
 }
 
 // f32x4.vne ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vne() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x42)
+	c.count(opF32x4_Vne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x42)
 }
 
 // f32x4.vlt ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vlt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x43)
+	c.count(opF32x4_Vlt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vlt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x43)
 }
 
 // f32x4.vgt ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vgt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x44)
+	c.count(opF32x4_Vgt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vgt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x44)
 }
 
 // f32x4.vle ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vle() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x45)
+	c.count(opF32x4_Vle)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vle)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x45)
 }
 
 // f32x4.vge ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vge() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x46)
+	c.count(opF32x4_Vge)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vge)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x46)
 }
 
 // f64x2.veq ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Veq() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x47)
+	c.count(opF64x2_Veq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Veq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x47)
 }
 
 // f64x2.vne ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vne() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x48)
+	c.count(opF64x2_Vne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x48)
 }
 
 // f64x2.vlt ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vlt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x49)
+	c.count(opF64x2_Vlt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vlt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x49)
 }
 
 // f64x2.vgt ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vgt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x4A)
+	c.count(opF64x2_Vgt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vgt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x4A)
 }
 
 // f64x2.vle ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vle() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x4B)
+	c.count(opF64x2_Vle)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vle)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x4B)
 }
 
 // f64x2.vge ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vge() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x4C)
+	c.count(opF64x2_Vge)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vge)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x4C)
 }
 
 // v128.vnot ( v128 -- v128 )
 func (c *Expr) V128_Vnot() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x4D)
+	c.count(opV128_Vnot)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Vnot)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x4D)
 }
 
 // v128.vand ( v128 v128 -- v128 )
 func (c *Expr) V128_Vand() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x4E)
+	c.count(opV128_Vand)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Vand)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x4E)
 }
 
 // v128.vandnot ( v128 v128 -- v128 )
 func (c *Expr) V128_Vandnot() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x4F)
+	c.count(opV128_Vandnot)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Vandnot)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x4F)
 }
 
 // v128.vor ( v128 v128 -- v128 )
 func (c *Expr) V128_Vor() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x50)
+	c.count(opV128_Vor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Vor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x50)
 }
 
 // v128.vxor ( v128 v128 -- v128 )
 func (c *Expr) V128_Vxor() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x51)
+	c.count(opV128_Vxor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Vxor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x51)
 }
 
 // v128.bitselect ( v128 v128 v128 -- v128 )
 func (c *Expr) V128_Bitselect() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x52)
+	c.count(opV128_Bitselect)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Bitselect)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x52)
 }
 
 // v128.anytrue ( v128 -- i32 )
 func (c *Expr) V128_Anytrue() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x53)
+	c.count(opV128_Anytrue)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Anytrue)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x53)
 }
 
 // v128.load8_lane memarg laneidx ( i32 v128 -- v128 )
 func (c *Expr) V128_Load8Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x54)
+	c.count(opV128_Load8Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load8Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x54)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.load16_lane memarg laneidx ( i32 v128 -- v128 )
 func (c *Expr) V128_Load16Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x55)
+	c.count(opV128_Load16Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load16Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x55)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.load32_lane memarg laneidx ( i32 v128 -- v128 )
 func (c *Expr) V128_Load32Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x56)
+	c.count(opV128_Load32Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load32Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x56)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.load64_lane memarg laneidx ( i32 v128 -- v128 )
 func (c *Expr) V128_Load64Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x57)
+	c.count(opV128_Load64Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load64Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x57)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.store8_lane memarg laneidx ( i32 v128 -- )
 func (c *Expr) V128_Store8Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x58)
+	c.count(opV128_Store8Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Store8Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x58)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.store16_lane memarg laneidx ( i32 v128 -- )
 func (c *Expr) V128_Store16Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x59)
+	c.count(opV128_Store16Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Store16Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x59)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.store32_lane memarg laneidx ( i32 v128 -- )
 func (c *Expr) V128_Store32Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x5A)
+	c.count(opV128_Store32Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Store32Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x5A)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.store64_lane memarg laneidx ( i32 v128 -- )
 func (c *Expr) V128_Store64Lane(mem MemArg, lane LaneIdx) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x5B)
+	c.count(opV128_Store64Lane)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Store64Lane)
+		c.ir.WriteMemArg(mem)
+		c.ir.WriteLaneIdx(lane)
+		return
+	}
+	c.buf.reserve(13)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x5B)
 	c.buf.WriteMemArg(mem)
 	c.buf.WriteLaneIdx(lane)
 }
 
 // v128.load32_zero memarg ( i32 -- v128 )
 func (c *Expr) V128_Load32Zero(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x5C)
+	c.count(opV128_Load32Zero)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load32Zero)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x5C)
 	c.buf.WriteMemArg(mem)
 }
 
 // v128.load64_zero memarg ( i32 -- v128 )
 func (c *Expr) V128_Load64Zero(mem MemArg) {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x5D)
+	c.count(opV128_Load64Zero)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opV128_Load64Zero)
+		c.ir.WriteMemArg(mem)
+		return
+	}
+	c.buf.reserve(12)
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x5D)
 	c.buf.WriteMemArg(mem)
 }
 
 // f32x4.vdemote_f64x2_zero ( v128 -- v128 )
 func (c *Expr) F32x4_VdemoteF64x2Zero() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x5E)
+	c.count(opF32x4_VdemoteF64x2Zero)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_VdemoteF64x2Zero)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x5E)
 }
 
 // f64x2.vpromote_low_f32x4 ( v128 -- v128 )
 func (c *Expr) F64x2_VpromoteLowF32x4() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x5F)
+	c.count(opF64x2_VpromoteLowF32x4)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_VpromoteLowF32x4)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x5F)
 }
 
 // i8x16.vabs ( v128 -- v128 )
 func (c *Expr) I8x16_Vabs() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x60)
+	c.count(opI8x16_Vabs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vabs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x60)
 }
 
 // i8x16.vneg ( v128 -- v128 )
 func (c *Expr) I8x16_Vneg() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x61)
+	c.count(opI8x16_Vneg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vneg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x61)
 }
 
 // i8x16.vpopcnt ( v128 -- v128 )
 func (c *Expr) I8x16_Vpopcnt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x62)
+	c.count(opI8x16_Vpopcnt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vpopcnt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x62)
 }
 
 // i8x16.alltrue ( v128 -- i32 )
 func (c *Expr) I8x16_Alltrue() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x63)
+	c.count(opI8x16_Alltrue)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Alltrue)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x63)
 }
 
 // i8x16.bitmask ( v128 -- i32 )
 func (c *Expr) I8x16_Bitmask() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x64)
+	c.count(opI8x16_Bitmask)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Bitmask)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x64)
 }
 
 // i8x16.narrow_i16x8_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_NarrowI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x65)
+	c.count(opI8x16_NarrowI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_NarrowI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x65)
 }
 
 // i8x16.narrow_i16x8_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_NarrowI16x8U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x66)
+	c.count(opI8x16_NarrowI16x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_NarrowI16x8U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x66)
 }
 
 // f32x4.vceil ( v128 -- v128 )
 func (c *Expr) F32x4_Vceil() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x67)
+	c.count(opF32x4_Vceil)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vceil)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x67)
 }
 
 // f32x4.vfloor ( v128 -- v128 )
 func (c *Expr) F32x4_Vfloor() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x68)
+	c.count(opF32x4_Vfloor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vfloor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x68)
 }
 
 // f32x4.vtrunc ( v128 -- v128 )
 func (c *Expr) F32x4_Vtrunc() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x69)
+	c.count(opF32x4_Vtrunc)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vtrunc)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x69)
 }
 
 // f32x4.vnearest ( v128 -- v128 )
 func (c *Expr) F32x4_Vnearest() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x6A)
+	c.count(opF32x4_Vnearest)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vnearest)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x6A)
 }
 
 // i8x16.vshl ( v128 i32 -- v128 )
 func (c *Expr) I8x16_Vshl() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x6B)
+	c.count(opI8x16_Vshl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vshl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x6B)
 }
 
 // i8x16.vshr_s ( v128 i32 -- v128 )
 func (c *Expr) I8x16_VshrS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x6C)
+	c.count(opI8x16_VshrS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VshrS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x6C)
 }
 
 // i8x16.vshr_u ( v128 i32 -- v128 )
 func (c *Expr) I8x16_VshrU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x6D)
+	c.count(opI8x16_VshrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VshrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x6D)
 }
 
 // i8x16.vadd ( v128 v128 -- v128 )
 func (c *Expr) I8x16_Vadd() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x6E)
+	c.count(opI8x16_Vadd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vadd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x6E)
 }
 
 // i8x16.vadd_sat_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VaddSatS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x6F)
+	c.count(opI8x16_VaddSatS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VaddSatS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x6F)
 }
 
 // i8x16.vadd_sat_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VaddSatU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x70)
+	c.count(opI8x16_VaddSatU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VaddSatU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x70)
 }
 
 // i8x16.vsub ( v128 v128 -- v128 )
 func (c *Expr) I8x16_Vsub() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x71)
+	c.count(opI8x16_Vsub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_Vsub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x71)
 }
 
 // i8x16.vsub_sat_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VsubSatS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x72)
+	c.count(opI8x16_VsubSatS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VsubSatS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x72)
 }
 
 // i8x16.vsub_sat_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VsubSatU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x73)
+	c.count(opI8x16_VsubSatU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VsubSatU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x73)
 }
 
 // f64x2.vceil ( v128 -- v128 )
 func (c *Expr) F64x2_Vceil() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x74)
+	c.count(opF64x2_Vceil)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vceil)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x74)
 }
 
 // f64x2.vfloor ( v128 -- v128 )
 func (c *Expr) F64x2_Vfloor() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x75)
+	c.count(opF64x2_Vfloor)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vfloor)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x75)
 }
 
 // i8x16.vmin_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VminS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x76)
+	c.count(opI8x16_VminS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VminS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x76)
 }
 
 // i8x16.vmin_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VminU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x77)
+	c.count(opI8x16_VminU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VminU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x77)
 }
 
 // i8x16.vmax_s ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VmaxS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x78)
+	c.count(opI8x16_VmaxS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VmaxS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x78)
 }
 
 // i8x16.vmax_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_VmaxU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x79)
+	c.count(opI8x16_VmaxU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_VmaxU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x79)
 }
 
 // f64x2.vtrunc ( v128 -- v128 )
 func (c *Expr) F64x2_Vtrunc() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x7A)
+	c.count(opF64x2_Vtrunc)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vtrunc)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x7A)
 }
 
 // i8x16.avgr_u ( v128 v128 -- v128 )
 func (c *Expr) I8x16_AvgrU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x7B)
+	c.count(opI8x16_AvgrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI8x16_AvgrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x7B)
 }
 
 // i16x8.extaddpairwise_i8x16_s ( v128 -- v128 )
 func (c *Expr) I16x8_ExtaddpairwiseI8x16S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x7C)
+	c.count(opI16x8_ExtaddpairwiseI8x16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtaddpairwiseI8x16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x7C)
 }
 
 // i16x8.extaddpairwise_i8x16_u ( v128 -- v128 )
 func (c *Expr) I16x8_ExtaddpairwiseI8x16U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x7D)
+	c.count(opI16x8_ExtaddpairwiseI8x16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtaddpairwiseI8x16U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x7D)
 }
 
 // i32x4.extaddpairwise_i16x8_s ( v128 -- v128 )
 func (c *Expr) I32x4_ExtaddpairwiseI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x7E)
+	c.count(opI32x4_ExtaddpairwiseI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_ExtaddpairwiseI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x7E)
 }
 
 // i32x4.extaddpairwise_i16x8_u ( v128 -- v128 )
 func (c *Expr) I32x4_ExtaddpairwiseI16x8U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x7F)
+	c.count(opI32x4_ExtaddpairwiseI16x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_ExtaddpairwiseI16x8U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x7F)
 }
 
 // i16x8.vabs ( v128 -- v128 )
 func (c *Expr) I16x8_Vabs() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x80)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Vabs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vabs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x80, 0x01)
 }
 
 // i16x8.vneg ( v128 -- v128 )
 func (c *Expr) I16x8_Vneg() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x81)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Vneg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vneg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x81, 0x01)
 }
 
 // i16x8.q15mulrsat_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_Q15mulrsatS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x82)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Q15mulrsatS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Q15mulrsatS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x82, 0x01)
 }
 
 // i16x8.alltrue ( v128 -- i32 )
 func (c *Expr) I16x8_Alltrue() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x83)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Alltrue)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Alltrue)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x83, 0x01)
 }
 
 // i16x8.bitmask ( v128 -- i32 )
 func (c *Expr) I16x8_Bitmask() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x84)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Bitmask)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Bitmask)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x84, 0x01)
 }
 
 // i16x8.narrow_i32x4_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_NarrowI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x85)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_NarrowI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_NarrowI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x85, 0x01)
 }
 
 // i16x8.narrow_i32x4_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_NarrowI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x86)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_NarrowI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_NarrowI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x86, 0x01)
 }
 
 // i16x8.vextend_low_i8x16_s ( v128 -- v128 )
 func (c *Expr) I16x8_VextendLowI8x16S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x87)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VextendLowI8x16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VextendLowI8x16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x87, 0x01)
 }
 
 // i16x8.vextend_high_i8x16_s ( v128 -- v128 )
 func (c *Expr) I16x8_VextendHighI8x16S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x88)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VextendHighI8x16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VextendHighI8x16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x88, 0x01)
 }
 
 // i16x8.vextend_low_i8x16_u ( v128 -- v128 )
 func (c *Expr) I16x8_VextendLowI8x16U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x89)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VextendLowI8x16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VextendLowI8x16U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x89, 0x01)
 }
 
 // i16x8.vextend_high_i8x16_u ( v128 -- v128 )
 func (c *Expr) I16x8_VextendHighI8x16U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x8A)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VextendHighI8x16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VextendHighI8x16U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x8A, 0x01)
 }
 
 // i16x8.vshl ( v128 i32 -- v128 )
 func (c *Expr) I16x8_Vshl() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x8B)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Vshl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vshl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x8B, 0x01)
 }
 
 // i16x8.vshr_s ( v128 i32 -- v128 )
 func (c *Expr) I16x8_VshrS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x8C)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VshrS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VshrS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x8C, 0x01)
 }
 
 // i16x8.vshr_u ( v128 i32 -- v128 )
 func (c *Expr) I16x8_VshrU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x8D)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VshrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VshrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x8D, 0x01)
 }
 
 // i16x8.vadd ( v128 v128 -- v128 )
 func (c *Expr) I16x8_Vadd() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x8E)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Vadd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vadd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x8E, 0x01)
 }
 
 // i16x8.vadd_sat_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VaddSatS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x8F)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VaddSatS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VaddSatS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x8F, 0x01)
 }
 
 // i16x8.vadd_sat_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VaddSatU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x90)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VaddSatU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VaddSatU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x90, 0x01)
 }
 
 // i16x8.vsub ( v128 v128 -- v128 )
 func (c *Expr) I16x8_Vsub() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x91)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Vsub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vsub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x91, 0x01)
 }
 
 // i16x8.vsub_sat_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VsubSatS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x92)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VsubSatS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VsubSatS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x92, 0x01)
 }
 
 // i16x8.vsub_sat_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VsubSatU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x93)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VsubSatU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VsubSatU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x93, 0x01)
 }
 
 // f64x2.vnearest ( v128 -- v128 )
 func (c *Expr) F64x2_Vnearest() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x94)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vnearest)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vnearest)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x94, 0x01)
 }
 
 // i16x8.vmul ( v128 v128 -- v128 )
 func (c *Expr) I16x8_Vmul() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x95)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_Vmul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_Vmul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x95, 0x01)
 }
 
 // i16x8.vmin_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VminS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x96)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VminS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VminS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x96, 0x01)
 }
 
 // i16x8.vmin_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VminU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x97)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VminU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VminU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x97, 0x01)
 }
 
 // i16x8.vmax_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VmaxS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x98)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VmaxS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VmaxS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x98, 0x01)
 }
 
 // i16x8.vmax_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_VmaxU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x99)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_VmaxU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_VmaxU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x99, 0x01)
 }
 
 // i16x8.avgr_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_AvgrU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x9B)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_AvgrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_AvgrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x9B, 0x01)
 }
 
 // i16x8.extmul_low_i8x16_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_ExtmulLowI8x16S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x9C)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_ExtmulLowI8x16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtmulLowI8x16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x9C, 0x01)
 }
 
 // i16x8.extmul_high_i8x16_s ( v128 v128 -- v128 )
 func (c *Expr) I16x8_ExtmulHighI8x16S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x9D)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_ExtmulHighI8x16S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtmulHighI8x16S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x9D, 0x01)
 }
 
 // i16x8.extmul_low_i8x16_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_ExtmulLowI8x16U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x9E)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_ExtmulLowI8x16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtmulLowI8x16U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x9E, 0x01)
 }
 
 // i16x8.extmul_high_i8x16_u ( v128 v128 -- v128 )
 func (c *Expr) I16x8_ExtmulHighI8x16U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x9F)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI16x8_ExtmulHighI8x16U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI16x8_ExtmulHighI8x16U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0x9F, 0x01)
 }
 
 // i32x4.vabs ( v128 -- v128 )
 func (c *Expr) I32x4_Vabs() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA0)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Vabs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vabs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA0, 0x01)
 }
 
 // i32x4.vneg ( v128 -- v128 )
 func (c *Expr) I32x4_Vneg() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA1)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Vneg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vneg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA1, 0x01)
 }
 
 // i32x4.alltrue ( v128 -- i32 )
 func (c *Expr) I32x4_Alltrue() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA3)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Alltrue)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Alltrue)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA3, 0x01)
 }
 
 // i32x4.bitmask ( v128 -- i32 )
 func (c *Expr) I32x4_Bitmask() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA4)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Bitmask)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Bitmask)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA4, 0x01)
 }
 
 // i32x4.vextend_low_i16x8_s ( v128 -- v128 )
 func (c *Expr) I32x4_VextendLowI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA7)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VextendLowI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VextendLowI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA7, 0x01)
 }
 
 // i32x4.vextend_high_i16x8_s ( v128 -- v128 )
 func (c *Expr) I32x4_VextendHighI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA8)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VextendHighI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VextendHighI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA8, 0x01)
 }
 
 // i32x4.vextend_low_i16x8_u ( v128 -- v128 )
 func (c *Expr) I32x4_VextendLowI16x8U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xA9)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VextendLowI16x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VextendLowI16x8U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xA9, 0x01)
 }
 
 // i32x4.vextend_high_i16x8_u ( v128 -- v128 )
 func (c *Expr) I32x4_VextendHighI16x8U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xAA)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VextendHighI16x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VextendHighI16x8U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xAA, 0x01)
 }
 
 // i32x4.vshl ( v128 i32 -- v128 )
 func (c *Expr) I32x4_Vshl() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xAB)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Vshl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vshl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xAB, 0x01)
 }
 
 // i32x4.vshr_s ( v128 i32 -- v128 )
 func (c *Expr) I32x4_VshrS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xAC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VshrS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VshrS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xAC, 0x01)
 }
 
 // i32x4.vshr_u ( v128 i32 -- v128 )
 func (c *Expr) I32x4_VshrU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xAD)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VshrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VshrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xAD, 0x01)
 }
 
 // i32x4.vadd ( v128 v128 -- v128 )
 func (c *Expr) I32x4_Vadd() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xAE)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Vadd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vadd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xAE, 0x01)
 }
 
 // i32x4.vsub ( v128 v128 -- v128 )
 func (c *Expr) I32x4_Vsub() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xB1)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Vsub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vsub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xB1, 0x01)
 }
 
 // i32x4.vmul ( v128 v128 -- v128 )
 func (c *Expr) I32x4_Vmul() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xB5)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_Vmul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_Vmul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xB5, 0x01)
 }
 
 // i32x4.vmin_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VminS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xB6)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VminS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VminS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xB6, 0x01)
 }
 
 // i32x4.vmin_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VminU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xB7)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VminU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VminU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xB7, 0x01)
 }
 
 // i32x4.vmax_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VmaxS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xB8)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VmaxS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VmaxS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xB8, 0x01)
 }
 
 // i32x4.vmax_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_VmaxU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xB9)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VmaxU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VmaxU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xB9, 0x01)
 }
 
 // i32x4.dot_i16x8_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_DotI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xBA)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_DotI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_DotI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xBA, 0x01)
 }
 
 // i32x4.extmul_low_i16x8_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_ExtmulLowI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xBC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_ExtmulLowI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_ExtmulLowI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xBC, 0x01)
 }
 
 // i32x4.extmul_high_i16x8_s ( v128 v128 -- v128 )
 func (c *Expr) I32x4_ExtmulHighI16x8S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xBD)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_ExtmulHighI16x8S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_ExtmulHighI16x8S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xBD, 0x01)
 }
 
 // i32x4.extmul_low_i16x8_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_ExtmulLowI16x8U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xBE)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_ExtmulLowI16x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_ExtmulLowI16x8U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xBE, 0x01)
 }
 
 // i32x4.extmul_high_i16x8_u ( v128 v128 -- v128 )
 func (c *Expr) I32x4_ExtmulHighI16x8U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xBF)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_ExtmulHighI16x8U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_ExtmulHighI16x8U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xBF, 0x01)
 }
 
 // i64x2.vabs ( v128 -- v128 )
 func (c *Expr) I64x2_Vabs() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC0)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vabs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vabs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC0, 0x01)
 }
 
 // i64x2.vneg ( v128 -- v128 )
 func (c *Expr) I64x2_Vneg() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC1)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vneg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vneg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC1, 0x01)
 }
 
 // i64x2.alltrue ( v128 -- i32 )
 func (c *Expr) I64x2_Alltrue() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC3)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Alltrue)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Alltrue)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC3, 0x01)
 }
 
 // i64x2.bitmask ( v128 -- i32 )
 func (c *Expr) I64x2_Bitmask() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC4)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Bitmask)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Bitmask)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC4, 0x01)
 }
 
 // i64x2.vextend_low_i32x4_s ( v128 -- v128 )
 func (c *Expr) I64x2_VextendLowI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC7)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VextendLowI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VextendLowI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC7, 0x01)
 }
 
 // i64x2.vextend_high_i32x4_s ( v128 -- v128 )
 func (c *Expr) I64x2_VextendHighI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC8)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VextendHighI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VextendHighI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC8, 0x01)
 }
 
 // i64x2.vextend_low_i32x4_u ( v128 -- v128 )
 func (c *Expr) I64x2_VextendLowI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xC9)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VextendLowI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VextendLowI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xC9, 0x01)
 }
 
 // i64x2.vextend_high_i32x4_u ( v128 -- v128 )
 func (c *Expr) I64x2_VextendHighI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xCA)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VextendHighI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VextendHighI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xCA, 0x01)
 }
 
 // i64x2.vshl ( v128 i32 -- v128 )
 func (c *Expr) I64x2_Vshl() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xCB)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vshl)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vshl)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xCB, 0x01)
 }
 
 // i64x2.vshr_s ( v128 i32 -- v128 )
 func (c *Expr) I64x2_VshrS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xCC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VshrS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VshrS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xCC, 0x01)
 }
 
 // i64x2.vshr_u ( v128 i32 -- v128 )
 func (c *Expr) I64x2_VshrU() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xCD)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VshrU)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VshrU)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xCD, 0x01)
 }
 
 // i64x2.vadd ( v128 v128 -- v128 )
 func (c *Expr) I64x2_Vadd() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xCE)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vadd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vadd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xCE, 0x01)
 }
 
 // i64x2.vsub ( v128 v128 -- v128 )
 func (c *Expr) I64x2_Vsub() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xD1)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vsub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vsub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xD1, 0x01)
 }
 
 // i64x2.vmul ( v128 v128 -- v128 )
 func (c *Expr) I64x2_Vmul() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xD5)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vmul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vmul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xD5, 0x01)
 }
 
 // i64x2.veq ( v128 v128 -- v128 )
 func (c *Expr) I64x2_Veq() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xD6)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Veq)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Veq)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xD6, 0x01)
 }
 
 // i64x2.vne ( v128 v128 -- v128 )
 func (c *Expr) I64x2_Vne() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xD7)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_Vne)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_Vne)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xD7, 0x01)
 }
 
 // i64x2.vlt_s ( v128 v128 -- v128 )
 func (c *Expr) I64x2_VltS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xD8)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VltS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VltS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xD8, 0x01)
 }
 
 // i64x2.vgt_s ( v128 v128 -- v128 )
 func (c *Expr) I64x2_VgtS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xD9)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VgtS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VgtS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xD9, 0x01)
 }
 
 // i64x2.vle_s ( v128 v128 -- v128 )
 func (c *Expr) I64x2_VleS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xDA)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VleS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VleS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xDA, 0x01)
 }
 
 // i64x2.vge_s ( v128 v128 -- v128 )
 func (c *Expr) I64x2_VgeS() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xDB)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_VgeS)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_VgeS)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xDB, 0x01)
 }
 
 // i64x2.extmul_low_i32x4_s ( v128 v128 -- v128 )
 func (c *Expr) I64x2_ExtmulLowI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xDC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_ExtmulLowI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_ExtmulLowI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xDC, 0x01)
 }
 
 // i64x2.extmul_high_i32x4_s ( v128 v128 -- v128 )
 func (c *Expr) I64x2_ExtmulHighI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xDD)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_ExtmulHighI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_ExtmulHighI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xDD, 0x01)
 }
 
 // i64x2.extmul_low_i32x4_u ( v128 v128 -- v128 )
 func (c *Expr) I64x2_ExtmulLowI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xDE)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_ExtmulLowI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_ExtmulLowI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xDE, 0x01)
 }
 
 // i64x2.extmul_high_i32x4_u ( v128 v128 -- v128 )
 func (c *Expr) I64x2_ExtmulHighI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xDF)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI64x2_ExtmulHighI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI64x2_ExtmulHighI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xDF, 0x01)
 }
 
 // f32x4.vabs ( v128 -- v128 )
 func (c *Expr) F32x4_Vabs() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE0)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vabs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vabs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE0, 0x01)
 }
 
 // f32x4.vneg ( v128 -- v128 )
 func (c *Expr) F32x4_Vneg() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE1)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vneg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vneg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE1, 0x01)
 }
 
 // f32x4.vsqrt ( v128 -- v128 )
 func (c *Expr) F32x4_Vsqrt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE3)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vsqrt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vsqrt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE3, 0x01)
 }
 
 // f32x4.vadd ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vadd() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE4)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vadd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vadd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE4, 0x01)
 }
 
 // f32x4.vsub ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vsub() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE5)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vsub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vsub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE5, 0x01)
 }
 
 // f32x4.vmul ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vmul() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE6)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vmul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vmul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE6, 0x01)
 }
 
 // f32x4.vdiv ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vdiv() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE7)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vdiv)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vdiv)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE7, 0x01)
 }
 
 // f32x4.vmin ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vmin() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE8)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vmin)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vmin)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE8, 0x01)
 }
 
 // f32x4.vmax ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vmax() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xE9)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vmax)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vmax)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xE9, 0x01)
 }
 
 // f32x4.vpmin ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vpmin() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xEA)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vpmin)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vpmin)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xEA, 0x01)
 }
 
 // f32x4.vpmax ( v128 v128 -- v128 )
 func (c *Expr) F32x4_Vpmax() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xEB)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_Vpmax)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_Vpmax)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xEB, 0x01)
 }
 
 // f64x2.vabs ( v128 -- v128 )
 func (c *Expr) F64x2_Vabs() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xEC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vabs)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vabs)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xEC, 0x01)
 }
 
 // f64x2.vneg ( v128 -- v128 )
 func (c *Expr) F64x2_Vneg() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xED)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vneg)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vneg)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xED, 0x01)
 }
 
 // f64x2.vsqrt ( v128 -- v128 )
 func (c *Expr) F64x2_Vsqrt() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xEF)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vsqrt)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vsqrt)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xEF, 0x01)
 }
 
 // f64x2.vadd ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vadd() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF0)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vadd)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vadd)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF0, 0x01)
 }
 
 // f64x2.vsub ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vsub() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF1)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vsub)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vsub)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF1, 0x01)
 }
 
 // f64x2.vmul ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vmul() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF2)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vmul)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vmul)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF2, 0x01)
 }
 
 // f64x2.vdiv ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vdiv() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF3)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vdiv)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vdiv)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF3, 0x01)
 }
 
 // f64x2.vmin ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vmin() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF4)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vmin)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vmin)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF4, 0x01)
 }
 
 // f64x2.vmax ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vmax() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF5)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vmax)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vmax)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF5, 0x01)
 }
 
 // f64x2.vpmin ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vpmin() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF6)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vpmin)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vpmin)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF6, 0x01)
 }
 
 // f64x2.vpmax ( v128 v128 -- v128 )
 func (c *Expr) F64x2_Vpmax() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF7)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_Vpmax)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_Vpmax)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF7, 0x01)
 }
 
 // i32x4.trunc_sat_f32x4_s ( v128 -- v128 )
 func (c *Expr) I32x4_TruncSatF32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF8)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_TruncSatF32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_TruncSatF32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF8, 0x01)
 }
 
 // i32x4.trunc_sat_f32x4_u ( v128 -- v128 )
 func (c *Expr) I32x4_TruncSatF32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xF9)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_TruncSatF32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_TruncSatF32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xF9, 0x01)
 }
 
 // f32x4.vconvert_i32x4_s ( v128 -- v128 )
 func (c *Expr) F32x4_VconvertI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xFA)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_VconvertI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_VconvertI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xFA, 0x01)
 }
 
 // f32x4.vconvert_i32x4_u ( v128 -- v128 )
 func (c *Expr) F32x4_VconvertI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xFB)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF32x4_VconvertI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF32x4_VconvertI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xFB, 0x01)
 }
 
 // i32x4.vtrunc_sat_f64x2_s_zero ( v128 -- v128 )
 func (c *Expr) I32x4_VtruncSatF64x2SZero() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xFC)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VtruncSatF64x2SZero)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VtruncSatF64x2SZero)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xFC, 0x01)
 }
 
 // i32x4.vtrunc_sat_f64x2_u_zero ( v128 -- v128 )
 func (c *Expr) I32x4_VtruncSatF64x2UZero() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0x01)
+	c.count(opI32x4_VtruncSatF64x2UZero)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opI32x4_VtruncSatF64x2UZero)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xFD, 0x01)
 }
 
 // f64x2.vconvert_low_i32x4_s ( v128 -- v128 )
 func (c *Expr) F64x2_VconvertLowI32x4S() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xFE)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_VconvertLowI32x4S)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_VconvertLowI32x4S)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xFE, 0x01)
 }
 
 // f64x2.vconvert_low_i32x4_u ( v128 -- v128 )
 func (c *Expr) F64x2_VconvertLowI32x4U() {
-	c.buf.WriteRawByte(0xFD)
-	c.buf.WriteRawByte(0xFF)
-	c.buf.WriteRawByte(0x01)
+	c.count(opF64x2_VconvertLowI32x4U)
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, opF64x2_VconvertLowI32x4U)
+		return
+	}
+	c.buf.buf = append(c.buf.buf, 0xFD, 0xFF, 0x01)
 }
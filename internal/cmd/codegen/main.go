@@ -1,21 +1,40 @@
 package main
 
 import (
+	"bytes"
 	"encoding/csv"
 	"fmt"
+	"go/format"
 	"log"
 	"os"
+	"strconv"
 	"strings"
 	"text/template"
 )
 
 // Instruction represents a WebAssembly instruction from the CSV file
 type Instruction struct {
-	Opcode    []string
+	Name   string
+	Opcode []string
+	// Reserved zero bytes, appended with the opcode when there are no
+	// parameters and after them otherwise.
+	Zeros     int
 	Signature string
 	Method    string
 	Params    []Param
 	ParamList string
+	// Worst-case encoded length of the opcode and its immediates, if
+	// capacity should be reserved before writing them; otherwise 0.
+	Reserve int
+
+	// Decoder table entries.
+	Prefix     string // "", "FC" or "FD".
+	SubOpcode  int    // The opcode byte, or the value following the prefix.
+	Immediates []string
+	Input      []string
+	Output     []string
+	// Whether the stack effect also depends on immediates or context.
+	Polymorphic bool
 }
 
 type Param struct {
@@ -23,18 +42,153 @@ type Param struct {
 	Type string
 }
 
+// Worst-case encoded length of each immediate type, as written by the
+// corresponding Buffer method. Vectors have no bound, so are absent.
+var maxParamSize = map[string]int{
+	"MemArg":      10,
+	"I32":         5,
+	"I64":         10,
+	"F32":         4,
+	"F64":         8,
+	"I128":        16,
+	"LaneIdx":     1,
+	"LaneShuffle": 16,
+	"LabelIdx":    5,
+	"TypeIdx":     5,
+	"U32":         5,
+	"LocalIdx":    5,
+	"GlobalIdx":   5,
+	"FuncIdx":     5,
+}
+
+// Number of separate appends made by the Buffer method for each immediate
+// type, where more than one.
+var paramWrites = map[string]int{
+	"MemArg": 2,
+}
+
+// Decoder immediate kinds, by index.csv token.
+var immediateKinds = map[string]string{
+	"memarg":      "immMemArg",
+	"i32":         "immI32",
+	"i64":         "immI64",
+	"f32":         "immF32",
+	"f64":         "immF64",
+	"i128":        "immV128",
+	"laneidx":     "immLane",
+	"laneidx{16}": "immShuffle",
+	"l":           "immLabel",
+	"l*":          "immLabels",
+	"bt":          "immBlockType",
+	"x":           "immIndex",
+	"y":           "immIndex",
+	"t":           "immType",
+	"t*":          "immTypes",
+	"local":       "immLocal",
+	"global":      "immGlobal",
+	"func":        "immFunc",
+	"0x00":        "immZero",
+}
+
+// Operand types, by index.csv token. Stack tokens not listed here stand for
+// any number of operands, so make an instruction's stack effect polymorphic.
+var stackTypes = map[string]string{
+	"i32":     "TypeI32",
+	"i64":     "TypeI64",
+	"f32":     "TypeF32",
+	"f64":     "TypeF64",
+	"v128":    "TypeV128",
+	"funcref": "TypeFuncRef",
+	"t":       "typeAny",
+}
+
+// The opcode is appended in one step. When immediates take several appends,
+// capacity for all of them is reserved first, so they never reallocate.
 const instructionTemplate = `
 // {{ .Signature }}
 func (c *Expr) {{ .Method }}({{ .ParamList }}) {
-	{{- range .Opcode }}
-	c.buf.WriteRawByte(0x{{ . }})
+	c.count(op{{ .Method }})
+	if c.ir != nil {
+		c.ir.ops = append(c.ir.ops, op{{ .Method }})
+		{{- range .Params }}
+		c.ir.Write{{ .Type }}({{ .Name }})
+		{{- end }}
+		return
+	}
+	{{- if .Reserve }}
+	c.buf.reserve({{ .Reserve }})
 	{{- end }}
+	c.buf.buf = append(c.buf.buf, {{ range $i, $b := .Opcode }}{{ if $i }}, {{ end }}0x{{ $b }}{{ end }}
+	{{- if not .Params }}{{ range zeros .Zeros }}, 0x00{{ end }}{{ end }})
 	{{- range .Params }}
 	c.buf.Write{{ .Type }}({{ .Name }})
 	{{- end }}
+	{{- if and .Params .Zeros }}
+	c.buf.buf = append(c.buf.buf{{ range zeros .Zeros }}, 0x00{{ end }})
+	{{- end }}
+}
+`
+
+// Opcode IDs identify instructions densely, in index.csv order, for use in
+// tables indexed by instruction.
+const opcodeTemplate = `
+// Opcode IDs, numbered in index.csv order.
+// Zero marks unassigned entries in the decoder tables.
+const (
+	opInvalid opcode = iota
+	{{- range . }}
+	op{{ .Method }}
+	{{- end }}
+	numOpcodes
+)
+
+var opcodeNames = [numOpcodes]string{
+	{{- range . }}
+	op{{ .Method }}: "{{ .Name }}",
+	{{- end }}
+}
+`
+
+// The decoder tables map encoded opcodes to IDs, and IDs to the layout of
+// their immediates and their operand types.
+const decoderTemplate = `
+// Opcode IDs by opcode byte, and by the LEB128 value following the FC and
+// FD prefixes.
+var (
+	{{- range .Tables }}
+	{{ .Name }} = [{{ printf "%#x" .Size }}]opcode{
+		{{- range .Instrs }}
+		{{ printf "%#02x" .SubOpcode }}: op{{ .Method }},
+		{{- end }}
+	}
+	{{- end }}
+)
+
+// Encoded opcodes, including any prefix byte.
+var opcodeEncodings = [numOpcodes]string{
+	{{- range .Instrs }}
+	op{{ .Method }}: "{{ range .Opcode }}\x{{ . }}{{ end }}",
+	{{- end }}
+}
+
+var opcodeInfos = [numOpcodes]opcodeInfo{
+	{{- range .Instrs }}
+	op{{ .Method }}: {
+		{{- if .Immediates }}imm: [maxImmediates]immKind{ {{- join .Immediates ", " -}} }, {{ end }}
+		{{- if .Input }}in: []ValType{ {{- join .Input ", " -}} }, {{ end }}
+		{{- if .Output }}out: []ValType{ {{- join .Output ", " -}} }, {{ end }}
+		{{- if .Polymorphic }}polymorphic: true{{ end -}}
+	},
+	{{- end }}
 }
 `
 
+type decoderTable struct {
+	Name   string
+	Size   int
+	Instrs []Instruction
+}
+
 func main() {
 	// Parse the CSV from stdin
 	reader := csv.NewReader(os.Stdin)
@@ -43,20 +197,31 @@ func main() {
 		log.Fatalf("Failed to read CSV: %v", err)
 	}
 
-	// Write header to stdout
-	fmt.Println(`// Code generated by internal/cmd/codegen/main.go; DO NOT EDIT.
-
-package webassembler
-
-// Writer methods for WebAssembly instructions`)
-
-	// Create template
-	tmpl, err := template.New("instruction").Parse(instructionTemplate)
+	// Create templates
+	funcs := template.FuncMap{
+		"join":  strings.Join,
+		"zeros": func(n int) []struct{} { return make([]struct{}, n) },
+	}
+	opcodeTmpl, err := template.New("opcode").Parse(opcodeTemplate)
+	if err != nil {
+		log.Fatalf("Failed to parse template: %v", err)
+	}
+	decoderTmpl, err := template.New("decoder").Funcs(funcs).Parse(decoderTemplate)
+	if err != nil {
+		log.Fatalf("Failed to parse template: %v", err)
+	}
+	tmpl, err := template.New("instruction").Funcs(funcs).Parse(instructionTemplate)
 	if err != nil {
 		log.Fatalf("Failed to parse template: %v", err)
 	}
 
-	// Process records and generate code
+	// Process records
+	var instrs []Instruction
+	tables := []*decoderTable{
+		{Name: "opcodesByByte", Size: 0x100},
+		{Name: "opcodesFC"},
+		{Name: "opcodesFD"},
+	}
 	for i, record := range records {
 		// Skip header row
 		if i == 0 {
@@ -76,25 +241,106 @@ package webassembler
 		}
 
 		// Parse.
-		params := parseParams(immediates)
+		params, zeros := parseParams(immediates)
 		effect := formatStackEffect(input, output)
 
 		// Create instruction object
 		instr := Instruction{
-			Opcode:    strings.Split(opcode, " "),
-			Method:    formatMethodName(name),
-			Signature: formatSignature(name, immediates, effect),
-			Params:    params,
-			ParamList: formatParamList(params),
+			Name:       name,
+			Opcode:     strings.Split(opcode, " "),
+			Zeros:      zeros,
+			Method:     formatMethodName(name),
+			Signature:  formatSignature(name, immediates, effect),
+			Params:     params,
+			ParamList:  formatParamList(params),
+			Immediates: parseImmediates(immediates),
+		}
+		instr.Input, instr.Polymorphic = parseStack(input)
+		var polymorphic bool
+		instr.Output, polymorphic = parseStack(output)
+		instr.Polymorphic = instr.Polymorphic || polymorphic
+
+		size, writes := len(instr.Opcode)+zeros, 0
+		if zeros > 0 && len(params) > 0 {
+			writes++
 		}
+		for _, param := range params {
+			paramSize, ok := maxParamSize[param.Type]
+			if !ok {
+				writes = 0
+				break
+			}
+			size += paramSize
+			writes += max(paramWrites[param.Type], 1)
+		}
+		if writes > 1 {
+			instr.Reserve = size
+		}
+
+		table := tables[0]
+		instr.SubOpcode = parseHex(instr.Opcode[0])
+		if len(instr.Opcode) > 1 {
+			instr.Prefix = instr.Opcode[0]
+			switch instr.Prefix {
+			case "FC":
+				table = tables[1]
+			case "FD":
+				table = tables[2]
+			default:
+				log.Fatalf("Unknown opcode prefix for %s: %s", name, instr.Prefix)
+			}
+			// The sub-opcode is a LEB128 value.
+			instr.SubOpcode = 0
+			for j, b := range instr.Opcode[1:] {
+				instr.SubOpcode |= (parseHex(b) & 0x7f) << (7 * j)
+			}
+			table.Size = max(table.Size, instr.SubOpcode+1)
+		}
+		table.Instrs = append(table.Instrs, instr)
+		instrs = append(instrs, instr)
+	}
+
+	// Generate code, formatting it before writing to stdout
+	var out bytes.Buffer
+	out.WriteString(`// Code generated by internal/cmd/codegen/main.go; DO NOT EDIT.
+
+package webassembler
+`)
+
+	err = opcodeTmpl.Execute(&out, instrs)
+	if err != nil {
+		log.Fatalf("Failed to execute opcode template: %v", err)
+	}
+
+	err = decoderTmpl.Execute(&out, map[string]any{"Tables": tables, "Instrs": instrs})
+	if err != nil {
+		log.Fatalf("Failed to execute decoder template: %v", err)
+	}
+
+	out.WriteString(`
+// Writer methods for WebAssembly instructions
+`)
 
-		// Execute template to stdout
-		err = tmpl.Execute(os.Stdout, instr)
+	for _, instr := range instrs {
+		err = tmpl.Execute(&out, instr)
 		if err != nil {
-			log.Fatalf("Failed to execute template for %s: %v", name, err)
+			log.Fatalf("Failed to execute template for %s: %v", instr.Name, err)
 		}
 	}
 
+	src, err := format.Source(out.Bytes())
+	if err != nil {
+		log.Fatalf("Failed to format generated code: %v", err)
+	}
+	os.Stdout.Write(src)
+}
+
+func parseHex(s string) int {
+	n, err := strconv.ParseUint(s, 16, 8)
+	if err != nil {
+		log.Fatalf("Invalid opcode byte %q: %v", s, err)
+	}
+	return int(n)
 }
 
 func formatMethodName(instruction string) string {
@@ -132,16 +378,57 @@ func formatSignature(name string, immediates string, effect string) string {
 	return signature
 }
 
-func parseParams(immediates string) []Param {
+// parseParams returns the method parameters for immediates, and the number
+// of reserved zero bytes, which are not parameters.
+func parseParams(immediates string) ([]Param, int) {
+	if immediates == "" {
+		return nil, 0
+	}
+	var params []Param
+	zeros := 0
+	for i, imm := range strings.Split(immediates, " ") {
+		if imm == "0x00" {
+			zeros++
+			continue
+		}
+		params = append(params, parseParam(i, imm))
+	}
+	return params, zeros
+}
+
+func parseImmediates(immediates string) []string {
 	if immediates == "" {
 		return nil
 	}
-	imms := strings.Split(immediates, " ")
-	params := make([]Param, len(imms))
-	for i, imm := range imms {
-		params[i] = parseParam(i, imm)
+	var kinds []string
+	for _, imm := range strings.Split(immediates, " ") {
+		kind, ok := immediateKinds[imm]
+		if !ok {
+			log.Fatalf("Unknown immediate %q", imm)
+		}
+		kinds = append(kinds, kind)
+	}
+	return kinds
+}
+
+// parseStack returns the operand types in a stack notation, and whether it
+// also includes a variable number of operands.
+func parseStack(stack string) ([]string, bool) {
+	if stack == "" {
+		return nil, false
+	}
+	var types []string
+	polymorphic := false
+	for _, tok := range strings.Split(stack, " ") {
+		if typ, ok := stackTypes[tok]; ok {
+			types = append(types, typ)
+		} else if strings.HasSuffix(tok, "[]") {
+			polymorphic = true
+		} else {
+			log.Fatalf("Unknown operand type %q", tok)
+		}
 	}
-	return params
+	return types, polymorphic
 }
 
 func parseParam(i int, imm string) Param {
@@ -164,6 +451,8 @@ func parseParam(i int, imm string) Param {
 		return Param{"lanes", "LaneShuffle"}
 	case "l":
 		return Param{fmt.Sprintf("label%d", i), "LabelIdx"}
+	case "l*":
+		return Param{"labels", "LabelVec"}
 	case "bt":
 		return Param{"blockType", "TypeIdx"}
 	case "x":
@@ -172,6 +461,8 @@ func parseParam(i int, imm string) Param {
 		return Param{"idx2", "U32"} // XXX what type of index?
 	case "t":
 		return Param{"typ", "TypeIdx"}
+	case "t*":
+		return Param{"types", "ResultType"}
 	case "local":
 		return Param{"x", "LocalIdx"}
 	case "global":
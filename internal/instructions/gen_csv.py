@@ -94,6 +94,21 @@ def generate_csv():
                 immediates = "global"
             elif "call" in name and immediates == "x":
                 immediates = "func"
+
+            # Binary layout fixups, where the encoding differs from the
+            # abstract syntax: br_table takes a vector of labels and typed
+            # select a vector of types, and the memory instructions carry
+            # reserved zero bytes.
+            if name == "brtable":
+                immediates = "l* l"
+            elif name == "select_typed":
+                immediates = "t*"
+            elif name in ("memorysize", "memorygrow", "memoryfill"):
+                immediates = "0x00"
+            elif name == "memoryinit":
+                immediates = "x 0x00"
+            elif name == "memorycopy":
+                immediates = "0x00 0x00"
             
             writer.writerow([name, immediates, clean_code, input_stack, output_stack])
 
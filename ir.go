@@ -0,0 +1,149 @@
+package webassembler
+
+import (
+	"encoding/binary"
+	"math"
+)
+
+// EnableRecording switches the expression to recording mode, in which
+// instructions are stored in compact arrays rather than encoded as they are
+// written: an opcode ID per instruction, and its immediates packed into
+// 64-bit slots. Encoding is deferred until the bytes are needed, which for
+// function bodies is when the module is sized or encoded, and instructions
+// written afterwards are recorded in turn. Bytes already written, such as
+// a body's local declarations, are kept as a prefix.
+func (c *Expr) EnableRecording() {
+	if c.ir == nil {
+		c.ir = &exprIR{}
+	}
+}
+
+// flush encodes the instructions recorded since the last flush.
+func (c *Expr) flush() {
+	if c.ir != nil && c.ir.encodedOps < len(c.ir.ops) {
+		c.ir.encode(&c.buf)
+	}
+}
+
+// An exprIR holds recorded instructions. Its writer methods mirror those of
+// Buffer, so the generated instruction methods use either alike. Each
+// immediate takes one slot, except v128 and shuffle immediates, which take
+// two, and vectors, which take one for their length and one per element.
+// Reserved zero bytes take none.
+type exprIR struct {
+	ops  []opcode
+	imms []uint64
+	// Recorded instructions and slots already encoded.
+	encodedOps, encodedImms int
+}
+
+func (ir *exprIR) WriteU32(i U32) {
+	ir.imms = append(ir.imms, uint64(i))
+}
+
+func (ir *exprIR) WriteI32(i I32) {
+	ir.imms = append(ir.imms, uint64(i))
+}
+
+func (ir *exprIR) WriteI64(i I64) {
+	ir.imms = append(ir.imms, uint64(i))
+}
+
+func (ir *exprIR) WriteF32(f F32) {
+	ir.imms = append(ir.imms, uint64(math.Float32bits(f)))
+}
+
+func (ir *exprIR) WriteF64(f F64) {
+	ir.imms = append(ir.imms, math.Float64bits(f))
+}
+
+func (ir *exprIR) WriteI128(i I128) {
+	ir.imms = append(ir.imms, binary.LittleEndian.Uint64(i[:8]), binary.LittleEndian.Uint64(i[8:]))
+}
+
+func (ir *exprIR) WriteLaneShuffle(lanes LaneShuffle) {
+	var bs I128
+	for i, lane := range lanes {
+		bs[i] = byte(lane)
+	}
+	ir.WriteI128(bs)
+}
+
+func (ir *exprIR) WriteMemArg(mem MemArg) {
+	ir.imms = append(ir.imms, uint64(mem.Align)<<32|uint64(mem.Offset))
+}
+
+func (ir *exprIR) WriteTypeIdx(i TypeIdx)     { ir.WriteU32(U32(i)) }
+func (ir *exprIR) WriteLaneIdx(i LaneIdx)     { ir.WriteU32(U32(i)) }
+func (ir *exprIR) WriteLabelIdx(i LabelIdx)   { ir.WriteU32(U32(i)) }
+func (ir *exprIR) WriteLocalIdx(i LocalIdx)   { ir.WriteU32(U32(i)) }
+func (ir *exprIR) WriteGlobalIdx(i GlobalIdx) { ir.WriteU32(U32(i)) }
+func (ir *exprIR) WriteFuncIdx(i FuncIdx)     { ir.WriteU32(U32(i)) }
+
+func (ir *exprIR) WriteLabelVec(labels LabelVec) {
+	ir.WriteU32(U32(len(labels)))
+	for _, label := range labels {
+		ir.WriteU32(U32(label))
+	}
+}
+
+func (ir *exprIR) WriteResultType(rt ResultType) {
+	ir.WriteU32(U32(len(rt)))
+	for _, typ := range rt {
+		ir.WriteU32(U32(typ))
+	}
+}
+
+// encode appends the encoding of the instructions not yet encoded to buf,
+// exactly as the instruction methods would have written them.
+func (ir *exprIR) encode(buf *Buffer) {
+	imms := ir.imms[ir.encodedImms:]
+	next := func() uint64 {
+		v := imms[0]
+		imms = imms[1:]
+		return v
+	}
+	for _, op := range ir.ops[ir.encodedOps:] {
+		buf.buf = append(buf.buf, opcodeEncodings[op]...)
+		for _, kind := range opcodeInfos[op].imm {
+			switch kind {
+			case immNone:
+			case immMemArg:
+				v := next()
+				buf.WriteU32(U32(v >> 32))
+				buf.WriteU32(U32(v))
+			case immI32:
+				buf.WriteI32(I32(next()))
+			case immI64:
+				buf.WriteI64(I64(next()))
+			case immF32:
+				buf.buf = binary.LittleEndian.AppendUint32(buf.buf, U32(next()))
+			case immF64:
+				buf.buf = binary.LittleEndian.AppendUint64(buf.buf, next())
+			case immV128, immShuffle:
+				buf.buf = binary.LittleEndian.AppendUint64(buf.buf, next())
+				buf.buf = binary.LittleEndian.AppendUint64(buf.buf, next())
+			case immLane:
+				buf.WriteRawByte(byte(next()))
+			case immLabels:
+				n := next()
+				buf.WriteU32(U32(n))
+				for ; n > 0; n-- {
+					buf.WriteU32(U32(next()))
+				}
+			case immTypes:
+				n := next()
+				buf.WriteU32(U32(n))
+				for ; n > 0; n-- {
+					buf.WriteRawByte(byte(next()))
+				}
+			case immZero:
+				buf.WriteRawByte(0x00)
+			default:
+				buf.WriteU32(U32(next()))
+			}
+		}
+	}
+	ir.encodedOps = len(ir.ops)
+	ir.encodedImms = len(ir.imms)
+}
@@ -0,0 +1,81 @@
+package webassembler
+
+import (
+	"reflect"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// recordArg returns an immediate argument of type typ that exercises its
+// full encoding.
+func recordArg(typ reflect.Type) reflect.Value {
+	switch typ {
+	case reflect.TypeOf(MemArg{}):
+		return reflect.ValueOf(MemArg{3, 1 << 30})
+	case reflect.TypeOf(I32(0)):
+		return reflect.ValueOf(I32(-5000))
+	case reflect.TypeOf(I64(0)):
+		return reflect.ValueOf(I64(-1 << 40))
+	case reflect.TypeOf(F32(0)):
+		return reflect.ValueOf(F32(1.25))
+	case reflect.TypeOf(F64(0)):
+		return reflect.ValueOf(F64(-0.5))
+	case reflect.TypeOf(LaneIdx(0)), reflect.TypeOf(LaneShuffle{}), reflect.TypeOf(I128{}):
+		return simdArg("i8x16", typ)
+	case reflect.TypeOf(LabelVec{}):
+		return reflect.ValueOf(LabelVec{1, 2, 300})
+	case reflect.TypeOf(ResultType{}):
+		return reflect.ValueOf(ResultType{TypeI32, TypeF64})
+	}
+	return reflect.ValueOf(uint32(200)).Convert(typ)
+}
+
+func TestRecording(t *testing.T) {
+	var encoded, recorded Expr
+	recorded.EnableRecording()
+	typ := reflect.TypeOf(&encoded)
+	for i := 0; i < typ.NumMethod(); i++ {
+		method := typ.Method(i)
+		if method.Type.NumOut() != 0 || method.Type.NumIn() == 0 || method.Name == "SetStats" || method.Name == "EnableRecording" {
+			continue
+		}
+		args := make([]reflect.Value, method.Type.NumIn())
+		for j := 1; j < len(args); j++ {
+			args[j] = recordArg(method.Type.In(j))
+		}
+		args[0] = reflect.ValueOf(&encoded)
+		method.Func.Call(args)
+		args[0] = reflect.ValueOf(&recorded)
+		method.Func.Call(args)
+	}
+	assert.Equal(t, 0, recorded.buf.Len())
+	assert.Equal(t, int(numOpcodes)-1, len(recorded.ir.ops))
+	recorded.flush()
+	assert.Equal(t, encoded.buf.Bytes(), recorded.buf.Bytes())
+
+	// Instructions recorded after a flush are appended.
+	encoded.I32_Const(1)
+	recorded.I32_Const(1)
+	it := recorded.Instrs()
+	assert.Equal(t, encoded.buf.Bytes(), it.bs)
+}
+
+func TestRecordedCode(t *testing.T) {
+	code := NewCode(LocalType{1, TypeIdx(TypeI32)})
+	code.EnableRecording()
+	code.I32_Const(20)
+	code.Localset(0)
+	code.Localget(0)
+	code.Localget(0)
+	code.I32_Add()
+	code.End()
+
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+	// Only the locals are encoded until the module is.
+	assert.Equal(t, 3, code.buf.Len())
+	assert.Equal(t, 40, runInt(t, mod))
+	assert.Equal(t, 13, code.buf.Len())
+}
@@ -1,6 +1,6 @@
 package webassembler
 
-import "bytes"
+import "math/bits"
 
 type signed interface {
 	I32 | I64
@@ -10,47 +10,82 @@ type unsigned interface {
 	U32 | U64
 }
 
-func writeSignedLEB128[T signed](buf *bytes.Buffer, i T) {
-	more := true
-	for more {
-		b := byte(i & 0x7f)
-		i >>= 7
+// The append functions special-case one and two byte encodings, which cover
+// nearly all indices and small constants, and are kept small enough to be
+// inlined into callers. Longer values fall through to a loop.
 
-		if (i == 0 && (b&0x40) == 0) || (i == -1 && (b&0x40) != 0) {
-			more = false
-		} else {
-			b |= 0x80
-		}
+func appendSignedLEB128[T signed](dst []byte, i T) []byte {
+	if -0x40 <= i && i < 0x40 {
+		return append(dst, byte(i)&0x7f)
+	}
+	if -0x2000 <= i && i < 0x2000 {
+		return append(dst, byte(i)|0x80, byte(i>>7)&0x7f)
+	}
+	return appendSignedLEB128Slow(dst, i)
+}
 
-		buf.WriteByte(b)
+func appendSignedLEB128Slow[T signed](dst []byte, i T) []byte {
+	// Stop once the remaining bits are all copies of the sign bit.
+	for i < -0x40 || 0x40 <= i {
+		dst = append(dst, byte(i)|0x80)
+		i >>= 7
 	}
+	return append(dst, byte(i)&0x7f)
 }
 
 func unsignedLEB128Size[T unsigned](i T) int {
-	size := 0
-	for {
-		b := byte(i & 0x7f)
-		i >>= 7
-		if i != 0 {
-			b |= 0x80
-		}
-		size++
-		if i == 0 {
-			return size
-		}
+	return (bits.Len64(uint64(i)|1) + 6) / 7
+}
+
+func appendUnsignedLEB128[T unsigned](dst []byte, i T) []byte {
+	if i < 0x80 {
+		return append(dst, byte(i))
+	}
+	if i < 0x4000 {
+		return append(dst, byte(i)|0x80, byte(i>>7))
 	}
+	return appendUnsignedLEB128Slow(dst, i)
 }
 
-func writeUnsignedLEB128[T unsigned](buf *bytes.Buffer, i T) {
-	for {
-		b := byte(i & 0x7f)
+func appendUnsignedLEB128Slow[T unsigned](dst []byte, i T) []byte {
+	for i >= 0x80 {
+		dst = append(dst, byte(i)|0x80)
 		i >>= 7
-		if i != 0 {
-			b |= 0x80
+	}
+	return append(dst, byte(i))
+}
+
+// appendPaddedU32 appends i as a 5-byte LEB128, padded with continuation
+// bits, so that the encoding of any other U32 can later overwrite it.
+func appendPaddedU32(dst []byte, i U32) []byte {
+	return append(dst, byte(i)|0x80, byte(i>>7)|0x80, byte(i>>14)|0x80, byte(i>>21)|0x80, byte(i>>28))
+}
+
+// readUnsignedLEB128 decodes a value from the front of bs, returning it and
+// the number of bytes read.
+func readUnsignedLEB128(bs []byte) (U32, int) {
+	var i U32
+	for n, b := range bs {
+		i |= U32(b&0x7f) << (7 * n)
+		if b < 0x80 {
+			return i, n + 1
 		}
-		buf.WriteByte(b)
-		if i == 0 {
-			break
+	}
+	panic("truncated LEB128")
+}
+
+// readSignedLEB128 is like readUnsignedLEB128, for signed values of up to 64
+// bits.
+func readSignedLEB128(bs []byte) (I64, int) {
+	var i I64
+	for n, b := range bs {
+		i |= I64(b&0x7f) << (7 * n)
+		if b < 0x80 {
+			if shift := 7 * (n + 1); shift < 64 && b&0x40 != 0 {
+				i |= -1 << shift
+			}
+			return i, n + 1
 		}
 	}
+	panic("truncated LEB128")
 }
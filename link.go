@@ -0,0 +1,432 @@
+package webassembler
+
+import (
+	"bytes"
+	"fmt"
+)
+
+// A Linker combines modules built separately, such as one per compilation
+// unit, into a single module.
+//
+// Each module is added under a name, and its imports from that name are
+// resolved to the exports of the module added under it, as when the
+// modules are instantiated together. Imports that no added module exports
+// remain imports of the linked module, merged when identical. Function
+// types are merged too, and every function, global, type and data index
+// in the modules' sections and function bodies is renumbered to match.
+//
+// The linked module holds the functions, globals, exports and data
+// segments of each module in the order they were added. All imported and
+// defined memories must be one and the same, as must tables, since memory
+// and table indices are not renumbered; data segments keep their offsets.
+// Sections other than the module's own, such as custom sections, are not
+// carried over, and tree shaking applies only if enabled on the result.
+type Linker struct {
+	units []linkUnit
+}
+
+// Add adds a module to be linked under the given name. The module must not
+// be modified until Link returns.
+func (l *Linker) Add(name string, mod *Module) {
+	l.units = append(l.units, linkUnit{name: name, mod: mod})
+}
+
+// Import kinds, which also index the per-kind arrays of a linkUnit.
+const (
+	externFunc   = 0x00
+	externTable  = 0x01
+	externMemory = 0x02
+	externGlobal = 0x03
+	numExterns   = 4
+)
+
+var externNames = [numExterns]string{"function", "table", "memory", "global"}
+
+// A linkUnit is a module being linked.
+type linkUnit struct {
+	name string
+	mod  *Module
+
+	imports []importEntry
+	// Positions in imports of the imports of each kind, by index.
+	importsByKind [numExterns][]int
+	numDefs       [numExterns]U32
+	// Linked module indices of the first definition of each kind.
+	base [numExterns]U32
+	// Where each import of each kind resolves to.
+	targets [numExterns][]linkTarget
+
+	// Type indices of defined functions, and initializer spans of defined
+	// globals, as in the module's sections.
+	funcTypes   []U32
+	globalInits [][2]int
+
+	// Maps from the module's index spaces to the linked module's.
+	rel relocation
+	// Maps imports, tables and memories likewise; rel shares the function
+	// and global maps.
+	index [numExterns][]U32
+}
+
+// An importEntry is a decoded import.
+type importEntry struct {
+	module, name string
+	kind         byte
+	// Encoded import description, following the kind.
+	desc []byte
+}
+
+// A linkTarget is where an import resolves to: a definition in a unit, or
+// an import of a unit that no unit exports.
+type linkTarget struct {
+	unit int
+	// Index among the unit's definitions or imports of the kind.
+	idx      U32
+	imported bool
+}
+
+// A linkSymbol is an export of a unit.
+type linkSymbol struct {
+	unit int
+	kind byte
+	idx  U32
+}
+
+// Link returns the linked module, or an error if imports and the exports
+// they resolve to have different types, two modules export the same name,
+// imports resolve in a cycle, or there is more than one memory or table.
+func (l *Linker) Link() (*Module, error) {
+	out := NewModule()
+	out.Types.Intern()
+	symbols := make(map[string]linkSymbol)
+	numImports := 0
+	for i := range l.units {
+		u := &l.units[i]
+		u.parse(&out.Types)
+		numImports += len(u.imports)
+		exports := u.mod.Exports.buf.Bytes()
+		for j, n := 0, u.mod.Exports.n; n > 0; n-- {
+			var name string
+			name, j = readName(exports, j)
+			sym := linkSymbol{unit: i, kind: exports[j]}
+			sym.idx, j = decodeU32(exports, j+1)
+			symbols[u.name+"\x00"+name] = sym
+		}
+	}
+
+	// Resolve imports, merging those left over.
+	var imports []importEntry
+	var importIdxs []U32
+	merged := make(map[string]int)
+	var numOut [numExterns]U32
+	for i := range l.units {
+		u := &l.units[i]
+		var j [numExterns]U32
+		for k := range u.imports {
+			imp := &u.imports[k]
+			t, err := l.resolve(symbols, i, imp.kind, j[imp.kind], numImports)
+			if err != nil {
+				return nil, err
+			}
+			if !l.matches(u, imp, t) {
+				return nil, fmt.Errorf("%s import %s.%s of module %s does not match its %s",
+					externNames[imp.kind], imp.module, imp.name, u.name, l.describe(t))
+			}
+			u.targets[imp.kind][j[imp.kind]] = t
+			j[imp.kind]++
+			if !t.imported {
+				continue
+			}
+			entry := *l.units[t.unit].importAt(imp.kind, t.idx)
+			if entry.kind == externFunc {
+				typ, _ := readUnsignedLEB128(entry.desc)
+				entry.desc = appendUnsignedLEB128(nil, l.units[t.unit].rel.types[typ])
+			}
+			key := entry.key()
+			if pos, ok := merged[key]; ok {
+				if !bytes.Equal(imports[pos].desc, entry.desc) {
+					return nil, fmt.Errorf("conflicting %s imports %s.%s", externNames[entry.kind], entry.module, entry.name)
+				}
+				continue
+			}
+			merged[key] = len(imports)
+			imports = append(imports, entry)
+			importIdxs = append(importIdxs, numOut[entry.kind])
+			numOut[entry.kind]++
+		}
+	}
+
+	// Number definitions after the imports, then map each unit's index
+	// spaces.
+	next := numOut
+	for i := range l.units {
+		u := &l.units[i]
+		u.base = next
+		for kind := range next {
+			next[kind] += u.numDefs[kind]
+		}
+	}
+	for kind, name := range externNames {
+		if kind != externFunc && kind != externGlobal && next[kind] > 1 {
+			return nil, fmt.Errorf("linked modules have %d %ss; at most one is supported", next[kind], name)
+		}
+	}
+	numData := U32(0)
+	for i := range l.units {
+		u := &l.units[i]
+		for kind := range u.index {
+			index := make([]U32, 0, len(u.targets[kind])+int(u.numDefs[kind]))
+			for _, t := range u.targets[kind] {
+				if t.imported {
+					index = append(index, importIdxs[merged[l.units[t.unit].importAt(byte(kind), t.idx).key()]])
+				} else {
+					index = append(index, l.units[t.unit].base[kind]+t.idx)
+				}
+			}
+			for j := U32(0); j < u.numDefs[kind]; j++ {
+				index = append(index, u.base[kind]+j)
+			}
+			u.index[kind] = index
+		}
+		u.rel.funcs = u.index[externFunc]
+		u.rel.globals = u.index[externGlobal]
+		u.rel.data = make([]U32, len(u.mod.Data.segments))
+		for j := range u.rel.data {
+			u.rel.data[j] = numData + U32(j)
+		}
+		numData += U32(len(u.rel.data))
+	}
+
+	// Write the linked sections.
+	nums := [numExterns]*U32{
+		&out.Imports.numFuncs,
+		&out.Imports.numTables,
+		&out.Imports.numMemories,
+		&out.Imports.numGlobals,
+	}
+	for _, entry := range imports {
+		out.Imports.addImport(entry.module, entry.name, entry.kind, nums[entry.kind])
+		out.Imports.buf.WriteRaw(entry.desc)
+	}
+	exported := make(map[string]bool)
+	for i := range l.units {
+		u := &l.units[i]
+		out.Memory.n += u.mod.Memory.n
+		out.Memory.buf.WriteRaw(u.mod.Memory.buf.Bytes())
+		for j, code := range u.mod.Code.funcs {
+			if remapped := u.rel.apply(code.Instrs()); remapped != nil {
+				code = &Code{Expr: Expr{buf: Buffer{buf: remapped}}}
+			}
+			out.AddFunc(TypeIdx(u.rel.types[u.funcTypes[j]]), code)
+		}
+		globals := u.mod.Globals.buf.Bytes()
+		for _, span := range u.globalInits {
+			typ := GlobalType{ValType(globals[span[0]-2]), globals[span[0]-1] == 1}
+			init := globals[span[0]:span[1]]
+			if remapped := u.rel.apply(NewInstrIter(init)); remapped != nil {
+				init = remapped
+			}
+			out.AddGlobal(typ, &Expr{buf: Buffer{buf: init}})
+		}
+		exports := u.mod.Exports.buf.Bytes()
+		for j, n := 0, u.mod.Exports.n; n > 0; n-- {
+			var name string
+			name, j = readName(exports, j)
+			kind := exports[j]
+			var idx U32
+			idx, j = decodeU32(exports, j+1)
+			if exported[name] {
+				return nil, fmt.Errorf("export %s of module %s is already exported", name, u.name)
+			}
+			exported[name] = true
+			out.Exports.add(name, kind, u.index[kind][idx])
+		}
+		for _, seg := range u.mod.Data.segments {
+			out.Data.add(seg)
+		}
+	}
+	return out, nil
+}
+
+// parse decodes the unit's imports and definitions, and adds its function
+// types to types, replacing what an earlier Link decoded.
+func (u *linkUnit) parse(types *TypeSection) {
+	mod := u.mod
+	u.imports = nil
+	u.importsByKind = [numExterns][]int{}
+	u.funcTypes = nil
+	mod.Code.settle()
+	bs := mod.Types.buf.Bytes()
+	u.rel.types = make([]U32, mod.Types.n)
+	for i, start := 0, 0; i < len(u.rel.types); i++ {
+		end := funcTypeEnd(bs, start)
+		u.rel.types[i] = U32(types.addEncoded(bs[start:end]))
+		start = end
+	}
+
+	bs = mod.Imports.buf.Bytes()
+	for i, n := 0, mod.Imports.n; n > 0; n-- {
+		var imp importEntry
+		imp.module, i = readName(bs, i)
+		imp.name, i = readName(bs, i)
+		imp.kind = bs[i]
+		i++
+		start := i
+		switch imp.kind {
+		case externFunc:
+			i = skipLEB128(bs, i)
+		case externTable:
+			i = skipLimits(bs, i+1)
+		case externMemory:
+			i = skipLimits(bs, i)
+		case externGlobal:
+			i += 2
+		}
+		imp.desc = bs[start:i]
+		u.importsByKind[imp.kind] = append(u.importsByKind[imp.kind], len(u.imports))
+		u.imports = append(u.imports, imp)
+	}
+	for kind := range u.targets {
+		u.targets[kind] = make([]linkTarget, len(u.importsByKind[kind]))
+	}
+
+	bs = mod.Funcs.buf.Bytes()
+	for i := 0; i < len(bs); {
+		var typ U32
+		typ, i = decodeU32(bs, i)
+		u.funcTypes = append(u.funcTypes, typ)
+	}
+	u.globalInits = globalInits(mod.Globals.buf.Bytes(), mod.Globals.n)
+	u.numDefs = [numExterns]U32{
+		externFunc:   mod.Funcs.n,
+		externMemory: mod.Memory.n,
+		externGlobal: mod.Globals.n,
+	}
+}
+
+// resolve follows the import of the given kind and index of a unit through
+// the exports of other units, for at most depth steps.
+func (l *Linker) resolve(symbols map[string]linkSymbol, unit int, kind byte, idx U32, depth int) (linkTarget, error) {
+	for ; depth >= 0; depth-- {
+		u := &l.units[unit]
+		imports := u.importsByKind[kind]
+		if int(idx) >= len(imports) {
+			return linkTarget{unit: unit, idx: idx - U32(len(imports))}, nil
+		}
+		imp := &u.imports[imports[idx]]
+		sym, ok := symbols[imp.module+"\x00"+imp.name]
+		if !ok || sym.kind != kind {
+			return linkTarget{unit: unit, idx: idx, imported: true}, nil
+		}
+		unit, idx = sym.unit, sym.idx
+	}
+	return linkTarget{}, fmt.Errorf("import cycle through module %s", l.units[unit].name)
+}
+
+// matches reports whether an import of u has the type of what it resolves
+// to. Memory and table limits are not compared.
+func (l *Linker) matches(u *linkUnit, imp *importEntry, t linkTarget) bool {
+	v := &l.units[t.unit]
+	switch imp.kind {
+	case externFunc:
+		typ, _ := readUnsignedLEB128(imp.desc)
+		var want U32
+		if t.imported {
+			want, _ = readUnsignedLEB128(v.importAt(externFunc, t.idx).desc)
+		} else {
+			want = v.funcTypes[t.idx]
+		}
+		return u.rel.types[typ] == v.rel.types[want]
+	case externGlobal:
+		if t.imported {
+			return bytes.Equal(imp.desc, v.importAt(externGlobal, t.idx).desc)
+		}
+		span := v.globalInits[t.idx]
+		return bytes.Equal(imp.desc, v.mod.Globals.buf.Bytes()[span[0]-2:span[0]])
+	}
+	return true
+}
+
+// describe names what an import resolves to, for errors.
+func (l *Linker) describe(t linkTarget) string {
+	v := &l.units[t.unit]
+	if t.imported {
+		return fmt.Sprintf("import in module %s", v.name)
+	}
+	return fmt.Sprintf("definition in module %s", v.name)
+}
+
+// importAt returns the unit's import of the given kind and index.
+func (u *linkUnit) importAt(kind byte, idx U32) *importEntry {
+	return &u.imports[u.importsByKind[kind][idx]]
+}
+
+// key identifies the imported entity.
+func (imp *importEntry) key() string {
+	return imp.module + "\x00" + imp.name + "\x00" + string(imp.kind)
+}
+
+// readName decodes a name at bs[i], returning the offset following it.
+func readName(bs []byte, i int) (string, int) {
+	n, i := decodeU32(bs, i)
+	return string(bs[i : i+int(n)]), i + int(n)
+}
+
+// A relocation maps the function, type, global and data indices of
+// instructions to another module's. Indices beyond the end of a map are
+// left as they are.
+type relocation struct {
+	funcs, types, globals, data []U32
+}
+
+// apply returns a copy of the instructions with indices renumbered, or nil
+// if none change.
+func (r *relocation) apply(it InstrIter) []byte {
+	var out []byte
+	copied := it.end
+	for it.Next() {
+		imm := it.Immediates()
+		var index []U32
+		switch it.op {
+		case opCall, opReffunc:
+			index = r.funcs
+		case opCallindirect, opBlock, opLoop, opIf:
+			index = r.types
+		case opGlobalget, opGlobalset:
+			index = r.globals
+		case opMemoryinit, opDatadrop:
+			index = r.data
+		default:
+			continue
+		}
+		var idx U32
+		var n int
+		signed := it.op == opBlock || it.op == opLoop || it.op == opIf
+		if signed {
+			var ok bool
+			if idx, n, ok = blockTypeIdx(imm); !ok {
+				continue
+			}
+		} else {
+			idx, n = readUnsignedLEB128(imm)
+		}
+		if int(idx) >= len(index) || index[idx] == idx {
+			continue
+		}
+		if out == nil {
+			out = make([]byte, 0, len(it.bs))
+			out = append(out, it.bs[:copied]...)
+		}
+		out = append(out, it.bs[copied:it.imm]...)
+		if signed {
+			out = appendSignedLEB128(out, I64(index[idx]))
+		} else {
+			out = appendUnsignedLEB128(out, index[idx])
+		}
+		copied = it.imm + n
+	}
+	if out == nil {
+		return nil
+	}
+	return append(out, it.bs[copied:]...)
+}
@@ -0,0 +1,115 @@
+package webassembler
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestLink(t *testing.T) {
+	lib := NewModule()
+	i2i := lib.Types.AddFunc(ResultType{TypeI32}, ResultType{TypeI32})
+	v2i := lib.Types.AddFunc(nil, ResultType{TypeI32})
+	lib.Exports.AddMem("memory", lib.AddMemory(MemType{MakeUnlimited(1)}))
+	init := &Expr{}
+	init.I32_Const(2)
+	init.End()
+	factor := lib.AddGlobal(GlobalType{Value: TypeI32}, init)
+	lib.AddFunc(v2i, constCode(0))
+	scale := NewCode()
+	scale.Localget(0)
+	scale.Globalget(factor)
+	scale.I32_Mul()
+	scale.End()
+	lib.ExportFunc("scale", lib.AddFunc(i2i, scale))
+	lib.Data.AddActive(0, 0, []byte{3})
+
+	// The main module numbers its types, functions, globals and data
+	// differently from how they end up linked.
+	main := NewModule()
+	v2i = main.Types.AddFunc(nil, ResultType{TypeI32})
+	i2i = main.Types.AddFunc(ResultType{TypeI32}, ResultType{TypeI32})
+	scaleIdx := main.ImportFunc("lib", "scale", i2i)
+	main.Imports.AddMemory("lib", "memory", MemType{MakeUnlimited(1)})
+	init = &Expr{}
+	init.I32_Const(4)
+	init.End()
+	offset := main.AddGlobal(GlobalType{Value: TypeI32}, init)
+	seg := main.Data.AddPassive([]byte{7})
+	start := NewCode()
+	start.I32_Const(8)
+	start.I32_Const(0)
+	start.I32_Const(1)
+	start.Memoryinit(U32(seg))
+	start.Datadrop(U32(seg))
+	start.I32_Const(8)
+	start.I32_Load(MemArg{})
+	start.Call(scaleIdx)
+	start.Call(scaleIdx + 2)
+	start.I32_Add()
+	start.I32_Const(0)
+	start.I32_Load(MemArg{})
+	start.I32_Add()
+	start.End()
+	main.ExportFunc("_start", main.AddFunc(v2i, start))
+	get := NewCode()
+	get.Globalget(offset)
+	get.End()
+	main.AddFunc(v2i, get)
+
+	var l Linker
+	l.Add("lib", lib)
+	l.Add("main", main)
+	linked, err := l.Link()
+	assert.NoError(t, err)
+	assert.Equal(t, U32(0), linked.Imports.n)
+	assert.Equal(t, U32(2), linked.Types.n)
+	assert.Equal(t, 7*2+4+3, runInt(t, linked))
+
+	// Linking again gives the same module.
+	relinked, err := l.Link()
+	assert.NoError(t, err)
+	assert.Equal(t, linked.Bytes(), relinked.Bytes())
+	assert.Equal(t, 7*2+4+3, runInt(t, relinked))
+}
+
+func TestLinkImports(t *testing.T) {
+	unit := func(typ ResultType, export string) *Module {
+		mod := NewModule()
+		log := mod.ImportFunc("env", "log", mod.Types.AddFunc(typ, nil))
+		code := NewCode()
+		code.Call(log)
+		code.End()
+		mod.ExportFunc(export, mod.AddFunc(mod.Types.AddFunc(nil, nil), code))
+		return mod
+	}
+	var l Linker
+	l.Add("a", unit(nil, "a"))
+	l.Add("b", unit(nil, "b"))
+	linked, err := l.Link()
+	assert.NoError(t, err)
+	assert.Equal(t, U32(1), linked.Imports.numFuncs)
+	assert.Equal(t, U32(2), linked.Funcs.n)
+	relinked, err := l.Link()
+	assert.NoError(t, err)
+	assert.Equal(t, linked.Bytes(), relinked.Bytes())
+
+	l.Add("c", unit(nil, "a"))
+	_, err = l.Link()
+	assert.Error(t, err)
+
+	l = Linker{}
+	l.Add("a", unit(nil, "a"))
+	l.Add("b", unit(ResultType{TypeI32}, "b"))
+	_, err = l.Link()
+	assert.Error(t, err)
+
+	// An import that resolves to a function of another type.
+	mod := NewModule()
+	mod.ImportFunc("a", "a", mod.Types.AddFunc(nil, ResultType{TypeI32}))
+	l = Linker{}
+	l.Add("a", unit(nil, "a"))
+	l.Add("b", mod)
+	_, err = l.Link()
+	assert.Error(t, err)
+}
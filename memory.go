@@ -7,6 +7,9 @@ type MemType struct {
 type MemorySection struct {
 	n   U32
 	buf Buffer
+
+	// Digest of a prefix of buf, extended by Module.Digest.
+	hashed digest
 }
 
 func (sec *MemorySection) SectionID() SectionID {
@@ -17,9 +20,9 @@ func (sec *MemorySection) Size() int {
 	return unsignedLEB128Size(sec.n) + sec.buf.Len()
 }
 
-func (sec *MemorySection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *MemorySection) emitContents(w sectionWriter) {
+	w.WriteU32(sec.n)
+	w.WriteRaw(sec.buf.Bytes())
 }
 
 func (sec *MemorySection) Add(typ MemType, numMemoryImports U32) MemIdx {
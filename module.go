@@ -1,5 +1,12 @@
 package webassembler
 
+import (
+	"io"
+	"slices"
+	"sync"
+	"time"
+)
+
 type Module struct {
 	Sections []Section
 
@@ -12,8 +19,15 @@ type Module struct {
 	Exports ExportSection
 	//Starts   StartSection
 	//Elements ElementSection
-	Code CodeSection
-	//Data     DataSection
+	DataCount DataCountSection
+	Code      CodeSection
+	Data      DataSection
+
+	// Receives encoding metrics when non-nil.
+	stats *Stats
+
+	// Whether unreachable functions are omitted when encoding.
+	treeShaking bool
 }
 
 func NewModule() *Module {
@@ -25,37 +39,153 @@ func NewModule() *Module {
 		&mod.Memory,
 		&mod.Globals,
 		&mod.Exports,
+		&mod.DataCount,
 		&mod.Code,
+		&mod.Data,
 	}
+	mod.DataCount.data = &mod.Data
 	return mod
 }
 
 func (mod *Module) Bytes() []byte {
-	var buf Buffer
-	mod.emit(&buf)
-	return buf.Bytes()
+	return mod.AppendTo(nil)
+}
+
+// Size returns the exact length of the encoded module in bytes. Like the
+// methods that encode the module, it settles the code section: every
+// function declared with ReserveFunc must have been defined, or Size
+// panics, and recorded bodies are encoded.
+func (mod *Module) Size() int {
+	return moduleSize(mod.sections())
+}
+
+func moduleSize(sections []Section) int {
+	size := len(moduleHeader)
+	for _, s := range sections {
+		size += sectionSize(s)
+	}
+	return size
 }
 
-func (mod *Module) emit(buf *Buffer) {
-	mod.emitHeaders(buf)
-	mod.emitSections(buf)
+// AppendTo appends the encoded module to dst and returns the extended slice.
+// dst is grown at most once, so no allocation occurs when it already has
+// Size() bytes of spare capacity.
+func (mod *Module) AppendTo(dst []byte) []byte {
+	// Emitting through the sectionWriter interface moves the Buffer to the
+	// heap, so Buffers are pooled to keep AppendTo allocation-free.
+	sections := mod.sections()
+	buf := appendBuffers.Get().(*Buffer)
+	*buf = bufferFrom(slices.Grow(dst, moduleSize(sections)))
+	mod.emit(buf, sections)
+	dst = buf.Bytes()
+	*buf = Buffer{}
+	appendBuffers.Put(buf)
+	return dst
 }
 
-func (mod *Module) emitHeaders(buf *Buffer) {
-	buf.WriteRaw([]byte{
-		// Magic.
-		0x00, 0x61, 0x73, 0x6D,
-		// Version.
-		0x01, 0x00, 0x00, 0x00,
-	})
+var appendBuffers = sync.Pool{
+	New: func() any { return new(Buffer) },
 }
 
-func (mod *Module) emitSections(buf *Buffer) {
+// WriteTo streams the encoded module to w. Unlike Bytes, the module is never
+// assembled in memory: section and function body buffers are written in
+// place, using vectored I/O when w supports it.
+func (mod *Module) WriteTo(w io.Writer) (int64, error) {
+	vw := vectorWriter{w: w}
+	mod.emit(&vw, mod.sections())
+	vw.flush()
+	return vw.n, vw.err
+}
+
+// Splice returns the encoding of the module given prev, its encoding from
+// before any calls to CodeSection.ReplaceBody, without re-encoding it. The
+// code section must be in incremental mode, and nothing else in the module
+// may have changed since prev was encoded. prev must be the last encoding
+// made, or returned by Splice, before the first replacement; the module may
+// be encoded again in the meantime. If there was none, because the module
+// was not encoded or has had functions added since, prev must be the first
+// encoding made after it, or if none has been made either, Splice encodes
+// the module in full over prev. Splice does not support tree shaking.
+//
+// When every replaced body keeps its encoded size, prev is patched in place
+// and returned, at a cost proportional to the replaced bodies. Otherwise
+// the unchanged runs of prev are copied around them into a new slice.
+func (mod *Module) Splice(prev []byte) []byte {
+	if mod.treeShaking {
+		panic("splicing a tree-shaken module")
+	}
+	if !mod.Code.incremental {
+		panic("splicing a module whose code section is not incremental")
+	}
+	if !mod.Code.laidOut() {
+		// No encoding of every body has been recorded, so there is nothing
+		// to splice into; encode the module in full over prev instead.
+		return mod.AppendTo(prev[:0])
+	}
+	start := len(moduleHeader)
 	for _, s := range mod.Sections {
-		writeSection(buf, s)
+		if s == Section(&mod.Code) {
+			break
+		}
+		start += sectionSize(s)
+	}
+	return mod.Code.splice(prev, start)
+}
+
+// CompactData rewrites active data segments to shrink the module and
+// returns the number of bytes saved. Runs of at least minZeroRun zeros are
+// cut out of segments, relying on memories defined by the module starting
+// zeroed, and neighboring segments are merged wherever the zeros between
+// them cost fewer bytes than a segment header.
+//
+// Only slice-backed segments after the last passive segment are rewritten,
+// so passive segment indices are preserved. Segments in imported memories,
+// or in memories with overlapping segments, are left alone.
+func (mod *Module) CompactData(minZeroRun int) int {
+	before := sectionSize(&mod.Data)
+	mod.Data.compact(mod.Imports.numMemories, minZeroRun)
+	return before - sectionSize(&mod.Data)
+}
+
+func (mod *Module) emit(w sectionWriter, sections []Section) {
+	mod.emitHeaders(w)
+	mod.emitSections(w, sections)
+}
+
+var moduleHeader = []byte{
+	// Magic.
+	0x00, 0x61, 0x73, 0x6D,
+	// Version.
+	0x01, 0x00, 0x00, 0x00,
+}
+
+func (mod *Module) emitHeaders(w sectionWriter) {
+	w.WriteRaw(moduleHeader)
+}
+
+func (mod *Module) emitSections(w sectionWriter, sections []Section) {
+	for _, s := range sections {
+		if mod.stats == nil {
+			writeSection(w, s)
+			continue
+		}
+		start := time.Now()
+		writeSection(w, s)
+		// Empty sections are skipped by writeSection, so are not counted.
+		if size := sectionSize(s); size != 0 {
+			mod.stats.recordSection(s.SectionID(), size, time.Since(start))
+		}
 	}
 }
 
+// SetStats directs per-section encoding metrics, and counts of function
+// bodies added to the code section, to s. A nil s, the default, disables
+// collection.
+func (mod *Module) SetStats(s *Stats) {
+	mod.stats = s
+	mod.Code.stats = s
+}
+
 func (mod *Module) ImportFunc(modName, name string, typ TypeIdx) FuncIdx {
 	return mod.Imports.AddFunc(modName, name, typ)
 }
@@ -65,10 +195,29 @@ func (mod *Module) ExportFunc(name string, idx FuncIdx) ExportIdx {
 }
 
 func (mod *Module) AddFunc(typeIdx TypeIdx, code *Code) FuncIdx {
+	return mod.declareFunc(typeIdx, mod.Code.Add(code))
+}
+
+// ReserveFunc declares a function whose body will be supplied later with
+// DefineFunc. This allows bodies to be encoded on separate goroutines;
+// they are emitted in index order regardless of when they are defined.
+// The function must be defined before the module is sized, digested or
+// encoded.
+func (mod *Module) ReserveFunc(typeIdx TypeIdx) FuncIdx {
+	return mod.declareFunc(typeIdx, mod.Code.Reserve())
+}
+
+// DefineFunc supplies the body of a function declared with ReserveFunc.
+// It is safe to call concurrently for distinct functions, but not
+// concurrently with other methods of the module.
+func (mod *Module) DefineFunc(idx FuncIdx, code *Code) {
+	mod.Code.Define(CodeIdx(idx-FuncIdx(mod.Imports.numFuncs)), code)
+}
+
+func (mod *Module) declareFunc(typeIdx TypeIdx, codeIdx CodeIdx) FuncIdx {
 	mod.Imports.Freeze()
 	numImports := mod.Imports.numFuncs
 	funcIdx := mod.Funcs.Add(typeIdx, numImports)
-	codeIdx := mod.Code.Add(code)
 	if CodeIdx(int(funcIdx)-int(numImports)) != codeIdx {
 		panic("misaligned function signatures and code sections")
 	}
@@ -0,0 +1,214 @@
+package webassembler
+
+import (
+	"cmp"
+	"io"
+	"slices"
+)
+
+// NameSection holds function and local names for the "name" custom
+// section, which runtimes use in stack traces. Names are copied into a
+// single arena as they are added, and only encoded if the section is
+// attached to a module that is then encoded:
+//
+//	var names NameSection
+//	...
+//	if debug {
+//		mod.AddCustom("name", &names)
+//	}
+//
+// Names may be added in any order. A later name for the same function or
+// local replaces an earlier one.
+type NameSection struct {
+	arena  []byte
+	funcs  []nameEntry
+	locals []nameEntry
+
+	// Whether the entries are sorted and deduplicated, and if so, the
+	// encoded sizes of the function and local names subsections' contents.
+	sorted                bool
+	funcsSize, localsSize int
+}
+
+// A nameEntry locates a name in the arena. fn is the function index of a
+// local name.
+type nameEntry struct {
+	fn, idx    U32
+	start, end U32
+}
+
+// AddFunc names a function.
+func (ns *NameSection) AddFunc(idx FuncIdx, name string) {
+	ns.funcs = append(ns.funcs, ns.entry(0, U32(idx), name))
+}
+
+// AddLocal names a local of a function, including its parameters.
+func (ns *NameSection) AddLocal(fn FuncIdx, idx LocalIdx, name string) {
+	ns.locals = append(ns.locals, ns.entry(U32(fn), U32(idx), name))
+}
+
+func (ns *NameSection) entry(fn, idx U32, name string) nameEntry {
+	start := U32(len(ns.arena))
+	ns.arena = append(ns.arena, name...)
+	ns.sorted = false
+	return nameEntry{fn: fn, idx: idx, start: start, end: U32(len(ns.arena))}
+}
+
+func (ns *NameSection) name(e nameEntry) []byte {
+	return ns.arena[e.start:e.end]
+}
+
+// Len returns the encoded size of the section's contents.
+func (ns *NameSection) Len() int {
+	ns.sort()
+	return subsectionSize(ns.funcsSize) + subsectionSize(ns.localsSize)
+}
+
+func subsectionSize(size int) int {
+	if size == 0 {
+		return 0
+	}
+	return 1 + unsignedLEB128Size(U32(size)) + size
+}
+
+// sort orders the entries by index, keeping the last of duplicates, and
+// sizes the subsections.
+func (ns *NameSection) sort() {
+	if ns.sorted {
+		return
+	}
+	ns.sorted = true
+	ns.funcs = sortNames(ns.funcs)
+	ns.locals = sortNames(ns.locals)
+
+	ns.funcsSize = 0
+	if len(ns.funcs) > 0 {
+		ns.funcsSize = ns.nameMapSize(ns.funcs)
+	}
+	ns.localsSize = 0
+	numFuncs := 0
+	for i := 0; i < len(ns.locals); {
+		j := i + 1
+		for j < len(ns.locals) && ns.locals[j].fn == ns.locals[i].fn {
+			j++
+		}
+		ns.localsSize += unsignedLEB128Size(ns.locals[i].fn) + ns.nameMapSize(ns.locals[i:j])
+		numFuncs++
+		i = j
+	}
+	if numFuncs > 0 {
+		ns.localsSize += unsignedLEB128Size(U32(numFuncs))
+	}
+}
+
+func sortNames(entries []nameEntry) []nameEntry {
+	slices.SortStableFunc(entries, func(a, b nameEntry) int {
+		if c := cmp.Compare(a.fn, b.fn); c != 0 {
+			return c
+		}
+		return cmp.Compare(a.idx, b.idx)
+	})
+	out := entries[:0]
+	for i, e := range entries {
+		if i+1 < len(entries) && entries[i+1].fn == e.fn && entries[i+1].idx == e.idx {
+			continue
+		}
+		out = append(out, e)
+	}
+	return out
+}
+
+// nameMapSize returns the encoded size of a name map.
+func (ns *NameSection) nameMapSize(entries []nameEntry) int {
+	size := unsignedLEB128Size(U32(len(entries)))
+	for _, e := range entries {
+		n := e.end - e.start
+		size += unsignedLEB128Size(e.idx) + unsignedLEB128Size(n) + int(n)
+	}
+	return size
+}
+
+// WriteTo encodes the section's contents to w, a chunk at a time.
+func (ns *NameSection) WriteTo(w io.Writer) (int64, error) {
+	ns.sort()
+	nw := nameWriter{w: w}
+	if ns.funcsSize > 0 {
+		nw.buf.WriteRawByte(0x01)
+		nw.buf.WriteU32(U32(ns.funcsSize))
+		ns.writeNameMap(&nw, ns.funcs)
+	}
+	if ns.localsSize > 0 {
+		nw.buf.WriteRawByte(0x02)
+		nw.buf.WriteU32(U32(ns.localsSize))
+		numFuncs := 0
+		for i, e := range ns.locals {
+			if i == 0 || e.fn != ns.locals[i-1].fn {
+				numFuncs++
+			}
+		}
+		nw.buf.WriteU32(U32(numFuncs))
+		for i := 0; i < len(ns.locals); {
+			j := i + 1
+			for j < len(ns.locals) && ns.locals[j].fn == ns.locals[i].fn {
+				j++
+			}
+			nw.buf.WriteU32(ns.locals[i].fn)
+			ns.writeNameMap(&nw, ns.locals[i:j])
+			i = j
+		}
+	}
+	nw.flush()
+	return nw.n, nw.err
+}
+
+func (ns *NameSection) writeNameMap(nw *nameWriter, entries []nameEntry) {
+	nw.buf.WriteU32(U32(len(entries)))
+	for _, e := range entries {
+		name := ns.name(e)
+		nw.buf.WriteU32(e.idx)
+		nw.buf.WriteU32(U32(len(name)))
+		nw.buf.WriteRaw(name)
+		if nw.buf.Len() >= nameChunkSize {
+			nw.flush()
+		}
+	}
+}
+
+// remap returns the names of the functions that funcs, an index map built
+// by tree shaking, keeps, with their new indices.
+func (ns *NameSection) remap(funcs []U32) *NameSection {
+	ns.sort()
+	out := &NameSection{arena: ns.arena}
+	for _, e := range ns.funcs {
+		if int(e.idx) < len(funcs) && funcs[e.idx] != dead {
+			e.idx = funcs[e.idx]
+			out.funcs = append(out.funcs, e)
+		}
+	}
+	for _, e := range ns.locals {
+		if int(e.fn) < len(funcs) && funcs[e.fn] != dead {
+			e.fn = funcs[e.fn]
+			out.locals = append(out.locals, e)
+		}
+	}
+	return out
+}
+
+const nameChunkSize = 32 << 10
+
+// A nameWriter encodes into a buffer, which is written out as it fills.
+type nameWriter struct {
+	w   io.Writer
+	buf Buffer
+	n   int64
+	err error
+}
+
+func (nw *nameWriter) flush() {
+	if nw.err == nil {
+		var m int
+		m, nw.err = nw.w.Write(nw.buf.Bytes())
+		nw.n += int64(m)
+	}
+	nw.buf.buf = nw.buf.buf[:0]
+}
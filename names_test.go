@@ -0,0 +1,59 @@
+package webassembler
+
+import (
+	"bytes"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestNameSection(t *testing.T) {
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	start := mod.AddFunc(typeIdx, constCode(7))
+	unused := mod.AddFunc(typeIdx, constCode(8))
+	mod.ExportFunc("_start", start)
+
+	var names NameSection
+	names.AddFunc(unused, "unused")
+	names.AddFunc(start, "first")
+	names.AddFunc(start, "start")
+	names.AddLocal(unused, 1, "b")
+	names.AddLocal(unused, 0, "a")
+	names.AddLocal(start, 0, "x")
+	want := []byte{
+		0x01, 16, 2, 0, 5, 's', 't', 'a', 'r', 't', 1, 6, 'u', 'n', 'u', 's', 'e', 'd',
+		0x02, 14, 2, 0, 1, 0, 1, 'x', 1, 2, 0, 1, 'a', 1, 1, 'b',
+	}
+	var buf bytes.Buffer
+	n, err := names.WriteTo(&buf)
+	assert.NoError(t, err)
+	assert.Equal(t, want, buf.Bytes())
+	assert.Equal(t, int64(len(want)), n)
+	assert.Equal(t, len(want), names.Len())
+
+	bin := mod.Bytes()
+	mod.AddCustom("name", &names)
+	named := mod.Bytes()
+	assert.Equal(t, bin, named[:len(bin)])
+	assert.Equal(t, []byte("\x00\x27\x04name"), named[len(bin):len(bin)+7])
+	assert.Equal(t, want, named[len(bin)+7:])
+	assert.Equal(t, DigestBytes(named), mod.Digest())
+	buf.Reset()
+	_, err = mod.WriteTo(&buf)
+	assert.NoError(t, err)
+	assert.Equal(t, named, buf.Bytes())
+	assert.Equal(t, 7, runBytes(t, named))
+
+	// Freezing sorts the names, so that modules created from the template
+	// can be encoded concurrently.
+	names.AddFunc(start, "start")
+	mod.Freeze()
+	assert.True(t, names.sorted)
+
+	// Tree shaking drops the names of omitted functions.
+	mod.EnableTreeShaking()
+	named = mod.Bytes()
+	want = []byte{0x01, 8, 1, 0, 5, 's', 't', 'a', 'r', 't', 0x02, 6, 1, 0, 1, 0, 1, 'x'}
+	assert.Equal(t, want, named[len(named)-len(want):])
+}
@@ -0,0 +1,232 @@
+package webassembler
+
+import "math/bits"
+
+// Peephole returns a copy of the body with naive instruction sequences
+// simplified, or c itself if there are none:
+//
+//   - nop is removed.
+//   - local.set x; local.get x becomes local.tee x.
+//   - An integer operation whose second operand is a constant identity, as
+//     in i32.const 0; i32.add, is removed along with the constant.
+//   - An integer operation on two constants is folded into one constant.
+//     Division and remainder, which may trap, are not folded.
+//
+// Rewrites only apply to adjacent instructions, which are always within the
+// same block, and operand types are checked against the stack effects in
+// index.csv. The pass takes linear time. c is not modified.
+func (c *Code) Peephole() *Code {
+	it := c.Instrs()
+	p := peephole{in: c.buf.Bytes()}
+	for it.Next() {
+		p.step(&it)
+	}
+	if it.Err() != nil || p.out == nil {
+		return c
+	}
+	return &Code{Expr: Expr{buf: Buffer{buf: p.out}}}
+}
+
+// A peephole pass copies instructions to out, rewriting them as it goes.
+// out is only allocated on the first rewrite; until then, it is implicitly
+// the input up to the current instruction.
+type peephole struct {
+	in  []byte
+	out []byte
+	// The last n instructions in out, most recent last.
+	instrs [maxPeepholeInstrs]peepholeInstr
+	n      int
+}
+
+type peepholeInstr struct {
+	op opcode
+	// Offset in out.
+	offset int
+	// Value of a constant, or index of a local.
+	val I64
+}
+
+// Deepest run of instructions that rewrites can look back over.
+const maxPeepholeInstrs = 64
+
+func (p *peephole) step(it *InstrIter) {
+	op := it.op
+	n := p.n
+	switch op {
+	case opNop:
+		p.rewrite(it, 0)
+		return
+	case opLocalget:
+		idx, _ := readUnsignedLEB128(it.Immediates())
+		if n > 0 && p.instrs[n-1].op == opLocalset && p.instrs[n-1].val == I64(idx) {
+			p.rewrite(it, 1)
+			p.push(opLocaltee, len(p.out), I64(idx))
+			p.out = append(p.out, 0x22)
+			p.out = appendUnsignedLEB128(p.out, idx)
+			return
+		}
+	}
+
+	bin := &binaryOps[op]
+	if n > 0 && (bin.eval != nil || bin.hasIdentity) {
+		info := &opcodeInfos[op]
+		a, b := &p.instrs[max(n-2, 0)], &p.instrs[n-1]
+		if isConst(b.op, info.in[1]) {
+			if n > 1 && bin.eval != nil && isConst(a.op, info.in[0]) {
+				val := bin.eval(a.val, b.val)
+				p.rewrite(it, 2)
+				p.appendConst(info.out[0], val)
+				return
+			}
+			if bin.hasIdentity && b.val == bin.identity {
+				p.rewrite(it, 1)
+				return
+			}
+		}
+	}
+
+	var val I64
+	switch op {
+	case opI32_Const, opI64_Const:
+		val, _ = readSignedLEB128(it.Immediates())
+	case opLocalset:
+		idx, _ := readUnsignedLEB128(it.Immediates())
+		val = I64(idx)
+	}
+	if p.out == nil {
+		p.push(op, it.start, val)
+	} else {
+		p.push(op, len(p.out), val)
+		p.out = append(p.out, it.Bytes()...)
+	}
+}
+
+// rewrite drops the current instruction and the last n instructions
+// written, so that the caller may write their replacement.
+func (p *peephole) rewrite(it *InstrIter, n int) {
+	if p.out == nil {
+		p.out = make([]byte, it.start, len(p.in))
+		copy(p.out, p.in)
+	}
+	if n > 0 {
+		p.n -= n
+		p.out = p.out[:p.instrs[p.n].offset]
+	}
+}
+
+// push records an instruction written to out at offset. Only the most
+// recent instructions are kept.
+func (p *peephole) push(op opcode, offset int, val I64) {
+	if p.n == maxPeepholeInstrs {
+		p.n = copy(p.instrs[:], p.instrs[maxPeepholeInstrs/2:])
+	}
+	p.instrs[p.n] = peepholeInstr{op: op, offset: offset, val: val}
+	p.n++
+}
+
+func (p *peephole) appendConst(typ ValType, val I64) {
+	if typ == TypeI32 {
+		p.push(opI32_Const, len(p.out), val)
+		p.out = append(p.out, 0x41)
+		p.out = appendSignedLEB128(p.out, I32(val))
+	} else {
+		p.push(opI64_Const, len(p.out), val)
+		p.out = append(p.out, 0x42)
+		p.out = appendSignedLEB128(p.out, val)
+	}
+}
+
+func isConst(op opcode, typ ValType) bool {
+	return op == opI32_Const && typ == TypeI32 || op == opI64_Const && typ == TypeI64
+}
+
+// A binaryOp describes how an integer operation on two operands of the same
+// type is simplified. Constant values are held sign-extended to 64 bits.
+type binaryOp struct {
+	// Computes the result for constant operands, if it may be folded.
+	eval func(a, b I64) I64
+	// The second operand for which the operation returns its first.
+	identity    I64
+	hasIdentity bool
+}
+
+var binaryOps = [numOpcodes]binaryOp{
+	opI32_Add:  {eval: i32Op(func(a, b I32) I32 { return a + b }), hasIdentity: true},
+	opI32_Sub:  {eval: i32Op(func(a, b I32) I32 { return a - b }), hasIdentity: true},
+	opI32_Mul:  {eval: i32Op(func(a, b I32) I32 { return a * b }), identity: 1, hasIdentity: true},
+	opI32_DivS: {identity: 1, hasIdentity: true},
+	opI32_DivU: {identity: 1, hasIdentity: true},
+	opI32_And:  {eval: i32Op(func(a, b I32) I32 { return a & b }), identity: -1, hasIdentity: true},
+	opI32_Or:   {eval: i32Op(func(a, b I32) I32 { return a | b }), hasIdentity: true},
+	opI32_Xor:  {eval: i32Op(func(a, b I32) I32 { return a ^ b }), hasIdentity: true},
+	opI32_Shl:  {eval: i32Op(func(a, b I32) I32 { return a << (b & 31) }), hasIdentity: true},
+	opI32_ShrS: {eval: i32Op(func(a, b I32) I32 { return a >> (b & 31) }), hasIdentity: true},
+	opI32_ShrU: {eval: u32Op(func(a, b U32) U32 { return a >> (b & 31) }), hasIdentity: true},
+	opI32_Rotl: {eval: u32Op(func(a, b U32) U32 { return bits.RotateLeft32(a, int(b&31)) }), hasIdentity: true},
+	opI32_Rotr: {eval: u32Op(func(a, b U32) U32 { return bits.RotateLeft32(a, -int(b&31)) }), hasIdentity: true},
+	opI32_Eq:   {eval: i32Cmp(func(a, b I32) bool { return a == b })},
+	opI32_Ne:   {eval: i32Cmp(func(a, b I32) bool { return a != b })},
+	opI32_LtS:  {eval: i32Cmp(func(a, b I32) bool { return a < b })},
+	opI32_LtU:  {eval: u32Cmp(func(a, b U32) bool { return a < b })},
+	opI32_GtS:  {eval: i32Cmp(func(a, b I32) bool { return a > b })},
+	opI32_GtU:  {eval: u32Cmp(func(a, b U32) bool { return a > b })},
+	opI32_LeS:  {eval: i32Cmp(func(a, b I32) bool { return a <= b })},
+	opI32_LeU:  {eval: u32Cmp(func(a, b U32) bool { return a <= b })},
+	opI32_GeS:  {eval: i32Cmp(func(a, b I32) bool { return a >= b })},
+	opI32_GeU:  {eval: u32Cmp(func(a, b U32) bool { return a >= b })},
+
+	opI64_Add:  {eval: func(a, b I64) I64 { return a + b }, hasIdentity: true},
+	opI64_Sub:  {eval: func(a, b I64) I64 { return a - b }, hasIdentity: true},
+	opI64_Mul:  {eval: func(a, b I64) I64 { return a * b }, identity: 1, hasIdentity: true},
+	opI64_DivS: {identity: 1, hasIdentity: true},
+	opI64_DivU: {identity: 1, hasIdentity: true},
+	opI64_And:  {eval: func(a, b I64) I64 { return a & b }, identity: -1, hasIdentity: true},
+	opI64_Or:   {eval: func(a, b I64) I64 { return a | b }, hasIdentity: true},
+	opI64_Xor:  {eval: func(a, b I64) I64 { return a ^ b }, hasIdentity: true},
+	opI64_Shl:  {eval: func(a, b I64) I64 { return a << (b & 63) }, hasIdentity: true},
+	opI64_ShrS: {eval: func(a, b I64) I64 { return a >> (b & 63) }, hasIdentity: true},
+	opI64_ShrU: {eval: func(a, b I64) I64 { return I64(U64(a) >> (b & 63)) }, hasIdentity: true},
+	opI64_Rotl: {eval: func(a, b I64) I64 { return I64(bits.RotateLeft64(U64(a), int(b&63))) }, hasIdentity: true},
+	opI64_Rotr: {eval: func(a, b I64) I64 { return I64(bits.RotateLeft64(U64(a), -int(b&63))) }, hasIdentity: true},
+	opI64_Eq:   {eval: i64Cmp(func(a, b I64) bool { return a == b })},
+	opI64_Ne:   {eval: i64Cmp(func(a, b I64) bool { return a != b })},
+	opI64_LtS:  {eval: i64Cmp(func(a, b I64) bool { return a < b })},
+	opI64_LtU:  {eval: u64Cmp(func(a, b U64) bool { return a < b })},
+	opI64_GtS:  {eval: i64Cmp(func(a, b I64) bool { return a > b })},
+	opI64_GtU:  {eval: u64Cmp(func(a, b U64) bool { return a > b })},
+	opI64_LeS:  {eval: i64Cmp(func(a, b I64) bool { return a <= b })},
+	opI64_LeU:  {eval: u64Cmp(func(a, b U64) bool { return a <= b })},
+	opI64_GeS:  {eval: i64Cmp(func(a, b I64) bool { return a >= b })},
+	opI64_GeU:  {eval: u64Cmp(func(a, b U64) bool { return a >= b })},
+}
+
+func i32Op(f func(a, b I32) I32) func(a, b I64) I64 {
+	return func(a, b I64) I64 { return I64(f(I32(a), I32(b))) }
+}
+
+func u32Op(f func(a, b U32) U32) func(a, b I64) I64 {
+	return func(a, b I64) I64 { return I64(I32(f(U32(a), U32(b)))) }
+}
+
+func i32Cmp(f func(a, b I32) bool) func(a, b I64) I64 {
+	return func(a, b I64) I64 { return boolConst(f(I32(a), I32(b))) }
+}
+
+func u32Cmp(f func(a, b U32) bool) func(a, b I64) I64 {
+	return func(a, b I64) I64 { return boolConst(f(U32(a), U32(b))) }
+}
+
+func i64Cmp(f func(a, b I64) bool) func(a, b I64) I64 {
+	return func(a, b I64) I64 { return boolConst(f(a, b)) }
+}
+
+func u64Cmp(f func(a, b U64) bool) func(a, b I64) I64 {
+	return func(a, b I64) I64 { return boolConst(f(U64(a), U64(b))) }
+}
+
+func boolConst(b bool) I64 {
+	if b {
+		return 1
+	}
+	return 0
+}
@@ -0,0 +1,46 @@
+package webassembler
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestPeephole(t *testing.T) {
+	code := NewCode(LocalType{1, TypeIdx(TypeI32)})
+	code.Nop()
+	code.I32_Const(6)
+	code.I32_Const(7)
+	code.I32_Mul()
+	code.Localset(0)
+	code.Localget(0)
+	code.I32_Const(0)
+	code.I32_Add()
+	code.I32_Const(2)
+	code.I32_Const(3)
+	code.I32_Shl()
+	code.I32_Add()
+	code.I64_Const(-5)
+	code.I64_Const(5)
+	code.I64_LtS()
+	code.I32_Add()
+	code.Nop()
+	code.End()
+
+	opt := code.Peephole()
+	var names []string
+	for it := opt.Instrs(); it.Next(); {
+		names = append(names, it.Name())
+	}
+	assert.Equal(t, []string{
+		"i32.const", "localtee", "i32.const", "i32.add", "i32.const", "i32.add", "end",
+	}, names)
+	assert.Same(t, opt, opt.Peephole())
+
+	mod := NewModule()
+	mod.Code.EnablePeephole()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+	assert.Equal(t, 59, runInt(t, mod))
+	assert.Equal(t, opt.buf.Bytes(), mod.Code.funcs[0].buf.Bytes())
+}
@@ -1,5 +1,7 @@
 package webassembler
 
+import "io"
+
 type SectionID byte
 
 const (
@@ -21,15 +23,34 @@ const (
 type Section interface {
 	SectionID() SectionID
 	Size() int
-	emitContents(buf *Buffer)
+	emitContents(w sectionWriter)
+}
+
+// Sections are emitted either into a Buffer, which copies their contents,
+// or into a vectorWriter, which references their buffers in place.
+type sectionWriter interface {
+	WriteRawByte(c byte)
+	WriteU32(i U32)
+	WriteRaw(bs []byte)
+	writeReaderAt(r io.ReaderAt, n int64)
+	writeWriterTo(wt io.WriterTo, n int)
 }
 
-func writeSection(buf *Buffer, s Section) {
+func writeSection(w sectionWriter, s Section) {
 	size := s.Size()
 	if size == 0 {
 		return
 	}
-	buf.WriteI32(I32(s.SectionID()))
-	buf.WriteU32(U32(size))
-	s.emitContents(buf)
+	w.WriteRawByte(byte(s.SectionID()))
+	w.WriteU32(U32(size))
+	s.emitContents(w)
+}
+
+// sectionSize returns the encoded size of s, including its header.
+func sectionSize(s Section) int {
+	size := s.Size()
+	if size == 0 {
+		return 0
+	}
+	return 1 + unsignedLEB128Size(U32(size)) + size
 }
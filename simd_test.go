@@ -0,0 +1,150 @@
+package webassembler
+
+import (
+	"reflect"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// maxLane returns the highest lane index valid for a SIMD instruction,
+// judging by the lane shape in its name.
+func maxLane(name string) LaneIdx {
+	switch {
+	case strings.Contains(name, "8x16"), strings.Contains(name, "8_lane"):
+		return 15
+	case strings.Contains(name, "16x8"), strings.Contains(name, "16_lane"):
+		return 7
+	case strings.Contains(name, "32x4"), strings.Contains(name, "32_lane"):
+		return 3
+	default:
+		return 1
+	}
+}
+
+// simdArg returns an immediate argument of type typ for the named
+// instruction.
+func simdArg(name string, typ reflect.Type) reflect.Value {
+	switch typ {
+	case reflect.TypeOf(LaneIdx(0)):
+		return reflect.ValueOf(maxLane(name))
+	case reflect.TypeOf(LaneShuffle{}):
+		var lanes LaneShuffle
+		for i := range lanes {
+			lanes[i] = LaneIdx(31 - 2*i)
+		}
+		return reflect.ValueOf(lanes)
+	case reflect.TypeOf(I128{}):
+		var v I128
+		for i := range v {
+			v[i] = byte(0x80 + i)
+		}
+		return reflect.ValueOf(v)
+	}
+	return reflect.Zero(typ)
+}
+
+func pushOperand(code *Code, typ ValType) {
+	switch typ {
+	case TypeI32:
+		code.I32_Const(0)
+	case TypeI64:
+		code.I64_Const(-1)
+	case TypeF32:
+		code.F32_Const(1.5)
+	case TypeF64:
+		code.F64_Const(-2.25)
+	case TypeV128:
+		code.V128_Vconst(I128{0: 1, 15: 0xff})
+	}
+}
+
+// TestSIMD calls the method for every FD-prefixed instruction, with
+// immediates at the top of their ranges, and runs the result.
+func TestSIMD(t *testing.T) {
+	code := NewCode()
+	var names []string
+	vconsts := 0
+	seen := make(map[opcode]bool)
+	typ := reflect.TypeOf(&code.Expr)
+	for i := 0; i < typ.NumMethod(); i++ {
+		method := typ.Method(i)
+		if method.Type.NumOut() != 0 || method.Name == "SetStats" {
+			continue
+		}
+		args := make([]reflect.Value, method.Type.NumIn())
+		args[0] = reflect.ValueOf(&Expr{})
+		for j := 1; j < len(args); j++ {
+			args[j] = reflect.Zero(method.Type.In(j))
+		}
+		method.Func.Call(args)
+		it := args[0].Interface().(*Expr).Instrs()
+		if !it.Next() || it.Opcode()[0] != 0xFD {
+			continue
+		}
+		name := it.Name()
+		seen[it.op] = true
+		in, out, ok := it.StackEffect()
+		assert.True(t, ok, name)
+
+		for _, typ := range in {
+			pushOperand(code, typ)
+			if typ == TypeV128 {
+				vconsts++
+			}
+		}
+		args[0] = reflect.ValueOf(&code.Expr)
+		for j := 1; j < len(args); j++ {
+			args[j] = simdArg(name, method.Type.In(j))
+		}
+		method.Func.Call(args)
+		for range out {
+			code.Drop()
+		}
+		names = append(names, name)
+	}
+	code.I32_Const(7)
+	code.End()
+
+	numFD := 0
+	for _, op := range opcodesFD {
+		if op != opInvalid {
+			numFD++
+		}
+	}
+	assert.Equal(t, numFD, len(seen))
+
+	// The encoding decodes back to the same instructions, besides operands.
+	var decoded []string
+	it := code.Instrs()
+	for it.Next() {
+		if it.Opcode()[0] == 0xFD {
+			decoded = append(decoded, it.Name())
+		}
+	}
+	assert.NoError(t, it.Err())
+	assert.Equal(t, len(names)+vconsts, len(decoded))
+
+	mod := NewModule()
+	mod.AddMemory(MemType{MakeUnlimited(1)})
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+	assert.Equal(t, 7, runInt(t, mod))
+}
+
+func TestFloatConst(t *testing.T) {
+	code := NewCode()
+	code.F64_Const(0.5)
+	code.F32_Const(2)
+	code.F64_PromoteF32()
+	code.F64_Mul()
+	code.I32_TruncF64S()
+	code.End()
+
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+	assert.Equal(t, 1, runInt(t, mod))
+	assert.Equal(t, []byte{0x44, 0, 0, 0, 0, 0, 0, 0xe0, 0x3f}, code.buf.Bytes()[1:10])
+}
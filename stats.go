@@ -0,0 +1,98 @@
+package webassembler
+
+import "time"
+
+const numSectionIDs = DataCountSectionID + 1
+
+// Stats accumulates encoding metrics: the size and encode time of each
+// section from Module.SetStats, the number of function bodies added from
+// the module's code section, and instruction counts from Expr.SetStats.
+// Nothing is collected unless a Stats is attached.
+//
+// A Stats is not safe for concurrent use. Give each goroutine its own and
+// combine them with Merge.
+type Stats struct {
+	sections  [numSectionIDs]SectionStats
+	bodies    uint64
+	bodyBytes int64
+	opcodes   [numOpcodes]uint64
+}
+
+type SectionStats struct {
+	ID SectionID
+	// Number of times the section was emitted.
+	Emits uint64
+	// Total bytes emitted, including section headers.
+	Bytes int64
+	// Total time spent encoding. For Module.WriteTo, this excludes writes
+	// to the destination that are deferred until a batch is flushed.
+	Duration time.Duration
+}
+
+type OpcodeCount struct {
+	Name  string
+	Count uint64
+}
+
+// A StatsSnapshot is a copy of collected metrics in a form suitable for
+// exporting.
+type StatsSnapshot struct {
+	// Sections that were emitted at least once, ordered by ID.
+	Sections []SectionStats
+	// Function bodies added to code sections, and their encoded bytes.
+	Bodies    uint64
+	BodyBytes int64
+	// Instructions emitted at least once, in index.csv order.
+	Opcodes []OpcodeCount
+}
+
+// Snapshot returns a copy of the metrics collected so far.
+func (s *Stats) Snapshot() StatsSnapshot {
+	snap := StatsSnapshot{
+		Bodies:    s.bodies,
+		BodyBytes: s.bodyBytes,
+	}
+	for id, sec := range s.sections {
+		if sec.Emits > 0 {
+			sec.ID = SectionID(id)
+			snap.Sections = append(snap.Sections, sec)
+		}
+	}
+	for op, n := range s.opcodes {
+		if n > 0 {
+			snap.Opcodes = append(snap.Opcodes, OpcodeCount{opcodeNames[op], n})
+		}
+	}
+	return snap
+}
+
+// Merge adds the metrics collected in other to s.
+func (s *Stats) Merge(other *Stats) {
+	for id := range s.sections {
+		s.sections[id].Emits += other.sections[id].Emits
+		s.sections[id].Bytes += other.sections[id].Bytes
+		s.sections[id].Duration += other.sections[id].Duration
+	}
+	s.bodies += other.bodies
+	s.bodyBytes += other.bodyBytes
+	for op := range s.opcodes {
+		s.opcodes[op] += other.opcodes[op]
+	}
+}
+
+// Reset discards the metrics collected so far.
+func (s *Stats) Reset() {
+	*s = Stats{}
+}
+
+func (s *Stats) recordSection(id SectionID, size int, d time.Duration) {
+	sec := &s.sections[id]
+	sec.Emits++
+	sec.Bytes += int64(size)
+	sec.Duration += d
+}
+
+func (s *Stats) recordBody(code *Code) {
+	s.bodies++
+	s.bodyBytes += int64(encodedBodySize(code))
+}
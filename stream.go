@@ -0,0 +1,140 @@
+package webassembler
+
+import (
+	"fmt"
+	"io"
+	"math"
+	"slices"
+	"time"
+)
+
+// A CodeStream writes a module to an io.WriteSeeker while its function
+// bodies are still being built, so that only one body need be held in
+// memory at a time. Everything preceding the code section is written when
+// the stream begins. Each body is then written as it is supplied, and the
+// code section's size, which is left as a fixed-width placeholder, is
+// patched in when the stream is closed, followed by the data section and
+// any others after the code section.
+type CodeStream struct {
+	mod *Module
+	w   io.WriteSeeker
+	vw  vectorWriter
+
+	// Offset of the module in w, and of the code section's size placeholder
+	// in the module.
+	base, sizeAt int64
+	// Index of the next body to write.
+	next  int
+	start time.Time
+	// Number of data segments written to the data count section, or -1 if
+	// it was not written.
+	dataCount int
+}
+
+// StreamTo begins writing the module to w, at its current offset. The
+// functions whose bodies are to be streamed must have been declared with
+// ReserveFunc and not yet defined; bodies already added or defined are
+// written in index order along with those supplied to the stream.
+//
+// The sections preceding the code section, such as the function section
+// and the data count section, are written immediately, so must not change
+// afterwards. In particular, if the module already has data segments, their
+// count has been written, and no more may be added; Close fails if they
+// are. Otherwise segments may be added until Close. The module is consumed by streaming: it cannot be encoded again, and stream
+// bodies are not retained by its code section. Tree shaking is not
+// supported.
+func (mod *Module) StreamTo(w io.WriteSeeker) (*CodeStream, error) {
+	if mod.treeShaking {
+		panic("streaming a tree-shaken module")
+	}
+	i := slices.Index(mod.Sections, Section(&mod.Code))
+	if i < 0 {
+		panic("module has no code section")
+	}
+	base, err := w.Seek(0, io.SeekCurrent)
+	if err != nil {
+		return nil, err
+	}
+	s := &CodeStream{mod: mod, w: w, vw: vectorWriter{w: w}, base: base, start: time.Now(), dataCount: -1}
+	if slices.Contains(mod.Sections[:i], Section(&mod.DataCount)) && mod.DataCount.Size() != 0 {
+		s.dataCount = len(mod.Data.segments)
+	}
+	mod.emit(&s.vw, mod.Sections[:i])
+	s.vw.WriteRawByte(byte(CodeSectionID))
+	s.sizeAt = s.vw.offset()
+	var placeholder [5]byte
+	s.vw.copyRaw(appendPaddedU32(placeholder[:0], 0))
+	s.vw.WriteU32(U32(len(mod.Code.funcs)))
+	s.writeDefined()
+	return s, s.vw.err
+}
+
+// Add writes the body of the next function reserved with ReserveFunc. The
+// body is copied, so it may be modified or released once Add returns.
+func (s *CodeStream) Add(code *Code) error {
+	funcs := s.mod.Code.funcs
+	if s.next >= len(funcs) {
+		panic("streamed more bodies than reserved functions")
+	}
+	s.write(s.mod.Code.optimize(code))
+	s.next++
+	s.writeDefined()
+	return s.vw.err
+}
+
+// writeDefined writes the bodies already in the code section from the next
+// index onwards, up to the first reserved slot.
+func (s *CodeStream) writeDefined() {
+	funcs := s.mod.Code.funcs
+	for ; s.next < len(funcs) && funcs[s.next] != nil; s.next++ {
+		s.write(funcs[s.next])
+	}
+}
+
+func (s *CodeStream) write(code *Code) {
+	code.flush()
+	body := code.buf.Bytes()
+	s.vw.WriteU32(U32(len(body)))
+	s.vw.copyRaw(body)
+	if stats := s.mod.Code.stats; stats != nil {
+		stats.recordBody(code)
+	}
+}
+
+// Close patches the code section's size and writes the sections following
+// it. It fails if any reserved function was not supplied a body, or if
+// data segments were added after their count was written.
+func (s *CodeStream) Close() error {
+	if missing := len(s.mod.Code.funcs) - s.next; missing > 0 {
+		return fmt.Errorf("%d function bodies were never streamed", missing)
+	}
+	if n := len(s.mod.Data.segments); s.dataCount >= 0 && n != s.dataCount {
+		return fmt.Errorf("data count section counts %d segments, but there are %d", s.dataCount, n)
+	}
+	s.vw.flush()
+	if s.vw.err != nil {
+		return s.vw.err
+	}
+	end := s.vw.offset()
+	size := end - s.sizeAt - 5
+	if size > math.MaxUint32 {
+		return fmt.Errorf("code section is too large: %d bytes", size)
+	}
+	if s.mod.stats != nil {
+		s.mod.stats.recordSection(CodeSectionID, int(size), time.Since(s.start))
+	}
+	var placeholder [5]byte
+	if _, err := s.w.Seek(s.base+s.sizeAt, io.SeekStart); err != nil {
+		return err
+	}
+	if _, err := s.w.Write(appendPaddedU32(placeholder[:0], U32(size))); err != nil {
+		return err
+	}
+	if _, err := s.w.Seek(s.base+end, io.SeekStart); err != nil {
+		return err
+	}
+	i := slices.Index(s.mod.Sections, Section(&s.mod.Code))
+	s.mod.emitSections(&s.vw, s.mod.Sections[i+1:])
+	s.vw.flush()
+	return s.vw.err
+}
@@ -0,0 +1,80 @@
+package webassembler
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestStreamTo(t *testing.T) {
+	mod := NewModule()
+	mod.AddMemory(MemType{MakeUnlimited(1)})
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	const n = 1000
+	funcs := make([]FuncIdx, n)
+	for i := range funcs {
+		if i%10 == 0 {
+			funcs[i] = mod.AddFunc(typeIdx, constCode(I32(i)))
+		} else {
+			funcs[i] = mod.ReserveFunc(typeIdx)
+		}
+	}
+	mod.ExportFunc("_start", funcs[n-1])
+	seg := mod.Data.AddPassive([]byte{7})
+
+	path := filepath.Join(t.TempDir(), "module.wasm")
+	f, err := os.Create(path)
+	assert.NoError(t, err)
+	defer f.Close()
+	_, err = f.Write([]byte("prefix"))
+	assert.NoError(t, err)
+	s, err := mod.StreamTo(f)
+	assert.NoError(t, err)
+
+	// Each streamed body returns the result of the previous function, and
+	// is released as soon as it is written.
+	for i := 1; i < n; i++ {
+		if i%10 == 0 {
+			continue
+		}
+		if i == n-1 {
+			assert.Error(t, s.Close())
+		}
+		code := AcquireCode()
+		code.Call(funcs[i-1])
+		if i == n-1 {
+			code.I32_Const(0)
+			code.I32_Const(0)
+			code.I32_Const(1)
+			code.Memoryinit(U32(seg))
+			code.I32_Const(0)
+			code.I32_Load8U(MemArg{})
+			code.I32_Add()
+		}
+		code.End()
+		assert.NoError(t, s.Add(code))
+		code.Release()
+	}
+	assert.NoError(t, s.Close())
+
+	bin, err := os.ReadFile(path)
+	assert.NoError(t, err)
+	assert.Equal(t, "prefix", string(bin[:6]))
+	assert.Equal(t, 990+7, runBytes(t, bin[6:]))
+}
+
+func TestStreamToDataCount(t *testing.T) {
+	mod := NewModule()
+	mod.AddMemory(MemType{MakeUnlimited(1)})
+	mod.ExportFunc("_start", mod.AddFunc(mod.Types.AddFunc(nil, ResultType{TypeI32}), constCode(1)))
+	mod.Data.AddPassive([]byte{1})
+	f, err := os.Create(filepath.Join(t.TempDir(), "module.wasm"))
+	assert.NoError(t, err)
+	defer f.Close()
+	s, err := mod.StreamTo(f)
+	assert.NoError(t, err)
+	mod.Data.AddPassive([]byte{2})
+	assert.Error(t, s.Close())
+}
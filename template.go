@@ -0,0 +1,113 @@
+package webassembler
+
+import (
+	"maps"
+	"slices"
+)
+
+// A Template is a frozen, partially built module, such as a prefix of
+// runtime types, imports, memories and globals shared by many modules.
+// Modules created from a template share its buffers until they first
+// append to them, so creating one costs little more than NewModule.
+//
+// A Template is safe for concurrent use.
+type Template struct {
+	mod *Module
+}
+
+// Freeze returns a template of the module as built so far. The module
+// itself may go on being built, without affecting the template. Any
+// functions reserved with ReserveFunc must have been defined.
+//
+// Custom sections are shared by the template and its modules, not copied,
+// so names added to a NameSection after Freeze appear in every module
+// created from the template, and must not be added while any of them is
+// being encoded.
+//
+// Encoding metrics are not collected for modules created from the
+// template unless they are given their own Stats.
+func (mod *Module) Freeze() *Template {
+	mod.Code.settle()
+	for _, s := range mod.Sections {
+		// Names are sorted lazily; do so now rather than concurrently.
+		if sec, ok := s.(*CustomSection); ok {
+			if names, ok := sec.contents.(*NameSection); ok {
+				names.sort()
+			}
+		}
+	}
+	t := &Template{mod: mod.clone()}
+	// The template keeps its own references to the bodies, which the
+	// module's owner may go on to Reset.
+	funcs := make([]*Code, len(mod.Code.funcs))
+	for i, code := range mod.Code.funcs {
+		code.shared = true
+		funcs[i] = &Code{Expr: Expr{buf: code.buf.share()}, shared: true}
+	}
+	t.mod.Code.funcs = funcs
+	t.mod.Code.sharedFuncs = true
+	return t
+}
+
+// NewModule returns a module with the contents of the template, including
+// its index spaces and whether its imports are frozen.
+func (t *Template) NewModule() *Module {
+	return t.mod.clone()
+}
+
+// clone returns a module that shares mod's section contents. Shared
+// buffers and slices have their capacity capped at their length, so that
+// appending to them in either module copies them first. mod must have
+// been frozen, and is not modified.
+func (mod *Module) clone() *Module {
+	c := &Module{
+		Types:       mod.Types,
+		Imports:     mod.Imports,
+		Funcs:       mod.Funcs,
+		Memory:      mod.Memory,
+		Globals:     mod.Globals,
+		Exports:     mod.Exports,
+		Code:        mod.Code,
+		Data:        mod.Data,
+		treeShaking: mod.treeShaking,
+	}
+	c.Types.buf = c.Types.buf.share()
+	if c.Types.interned != nil {
+		c.Types.interned = maps.Clone(c.Types.interned)
+	}
+	c.Imports.buf = c.Imports.buf.share()
+	c.Funcs.buf = c.Funcs.buf.share()
+	c.Memory.buf = c.Memory.buf.share()
+	c.Globals.buf = c.Globals.buf.share()
+	c.Exports.buf = c.Exports.buf.share()
+	c.Code.funcs = slices.Clip(c.Code.funcs)
+	c.Code.pending = nil
+	c.Code.layout = nil
+	if c.Code.edits != nil {
+		c.Code.edits = make(map[CodeIdx]int)
+	}
+	c.Code.stats = nil
+	c.Data.segments = slices.Clip(c.Data.segments)
+	c.DataCount.data = &c.Data
+
+	// Sections other than the module's own are shared as they are.
+	c.Sections = make([]Section, len(mod.Sections))
+	own := map[Section]Section{
+		&mod.Types:     &c.Types,
+		&mod.Imports:   &c.Imports,
+		&mod.Funcs:     &c.Funcs,
+		&mod.Memory:    &c.Memory,
+		&mod.Globals:   &c.Globals,
+		&mod.Exports:   &c.Exports,
+		&mod.DataCount: &c.DataCount,
+		&mod.Code:      &c.Code,
+		&mod.Data:      &c.Data,
+	}
+	for i, s := range mod.Sections {
+		if cs, ok := own[s]; ok {
+			s = cs
+		}
+		c.Sections[i] = s
+	}
+	return c
+}
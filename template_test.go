@@ -0,0 +1,54 @@
+package webassembler
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestTemplate(t *testing.T) {
+	base := NewModule()
+	base.Types.Intern()
+	v2i := base.Types.AddFunc(nil, ResultType{TypeI32})
+	base.AddMemory(MemType{MakeUnlimited(1)})
+	init := &Expr{}
+	init.I32_Const(40)
+	init.End()
+	global := base.AddGlobal(GlobalType{Value: TypeI32}, init)
+	helper := NewCode()
+	helper.Globalget(global)
+	helper.End()
+	helperIdx := base.AddFunc(v2i, helper)
+	tmpl := base.Freeze()
+	want := base.Bytes()
+
+	// Each module extends the shared prefix with its own function.
+	add := func(mod *Module, i I32) {
+		code := NewCode()
+		code.Call(helperIdx)
+		code.I32_Const(i)
+		code.I32_Add()
+		code.End()
+		mod.ExportFunc("_start", mod.AddFunc(mod.Types.AddFunc(nil, ResultType{TypeI32}), code))
+	}
+	a, b := tmpl.NewModule(), tmpl.NewModule()
+	add(a, 1)
+	add(b, 2)
+	assert.Equal(t, 41, runInt(t, a))
+	assert.Equal(t, 42, runInt(t, b))
+	assert.Equal(t, FuncIdx(2), b.AddFunc(v2i, constCode(3)))
+	assert.Equal(t, TypeIdx(1), a.Types.AddFunc(ResultType{TypeI64}, nil))
+	assert.Equal(t, TypeIdx(1), b.Types.AddFunc(ResultType{TypeF32}, nil))
+	assert.Panics(t, func() { a.Imports.AddMemory("env", "mem", MemType{}) })
+
+	// Neither the template nor the module it was frozen from changes.
+	assert.Equal(t, want, tmpl.NewModule().Bytes())
+	base.Code.ReplaceBody(0, constCode(7))
+	helper.Reset()
+	helper.Unreachable()
+	helper.End()
+	add(base, 0)
+	assert.Equal(t, 7, runInt(t, base))
+	assert.Equal(t, want, tmpl.NewModule().Bytes())
+	assert.Equal(t, 41, runInt(t, a))
+}
@@ -0,0 +1,307 @@
+package webassembler
+
+// EnableTreeShaking makes the module omit functions that are unreachable
+// from its exports whenever it is encoded, along with the function types
+// that are then unused. Reachability follows call and ref.func
+// instructions, in function bodies and global initializers. Imported
+// functions are always kept.
+//
+// The surviving functions and types are renumbered in every section that
+// refers to them, so indices returned while building the module need not
+// match the encoding; export names do. The analysis is repeated each time
+// the module is encoded, and leaves the module's own sections unchanged.
+// Function names in a NameSection are renumbered too, and those of omitted
+// functions dropped.
+func (mod *Module) EnableTreeShaking() {
+	mod.treeShaking = true
+}
+
+// sections returns the sections to encode.
+func (mod *Module) sections() []Section {
+	if !mod.treeShaking {
+		return mod.Sections
+	}
+	return mod.shake()
+}
+
+// shake returns the module's sections with unreachable functions and
+// unused types removed.
+func (mod *Module) shake() []Section {
+	mod.Code.settle()
+	numImports := int(mod.Imports.numFuncs)
+	numFuncs := numImports + len(mod.Code.funcs)
+	ts := treeShaker{relocation: relocation{
+		funcs: make([]U32, numFuncs),
+		types: make([]U32, mod.Types.n),
+	}}
+
+	// Mark roots.
+	imports := mod.Imports.buf.Bytes()
+	importTypes := funcImportTypes(imports, mod.Imports.n)
+	for _, imp := range importTypes {
+		ts.markType(imp.idx)
+	}
+	for i := 0; i < numImports; i++ {
+		ts.funcs[i] = live
+	}
+	funcTypes := make([]U32, 0, mod.Funcs.n)
+	for i, bs := 0, mod.Funcs.buf.Bytes(); i < len(bs); {
+		var typ U32
+		typ, i = decodeU32(bs, i)
+		funcTypes = append(funcTypes, typ)
+	}
+	exports := mod.Exports.buf.Bytes()
+	for _, exp := range funcExports(exports, mod.Exports.n) {
+		ts.markFunc(exp.idx)
+	}
+	globals := mod.Globals.buf.Bytes()
+	for _, span := range globalInits(globals, mod.Globals.n) {
+		ts.scan(NewInstrIter(globals[span[0]:span[1]]))
+	}
+
+	// Trace calls from live bodies.
+	for len(ts.work) > 0 {
+		idx := ts.work[len(ts.work)-1]
+		ts.work = ts.work[:len(ts.work)-1]
+		ts.markType(funcTypes[idx-U32(numImports)])
+		ts.scan(mod.Code.funcs[idx-U32(numImports)].Instrs())
+	}
+
+	// Number the survivors.
+	funcs := 0
+	for i := range ts.funcs {
+		if ts.funcs[i] == live {
+			ts.funcs[i] = U32(funcs)
+			funcs++
+		} else {
+			ts.funcs[i] = dead
+		}
+	}
+	types := 0
+	for i := range ts.types {
+		if ts.types[i] == live {
+			ts.types[i] = U32(types)
+			types++
+		} else {
+			ts.types[i] = dead
+		}
+	}
+	if funcs == numFuncs && types == len(ts.types) {
+		return mod.Sections
+	}
+
+	sections := make([]Section, len(mod.Sections))
+	for i, s := range mod.Sections {
+		switch s {
+		case Section(&mod.Types):
+			sec := &TypeSection{n: U32(types)}
+			bs := mod.Types.buf.Bytes()
+			for j, start := 0, 0; j < len(ts.types); j++ {
+				end := funcTypeEnd(bs, start)
+				if ts.types[j] != dead {
+					sec.buf.WriteRaw(bs[start:end])
+				}
+				start = end
+			}
+			s = sec
+		case Section(&mod.Imports):
+			sec := mod.Imports
+			sec.buf, sec.hashed = Buffer{}, digest{}
+			start := 0
+			for _, imp := range importTypes {
+				sec.buf.WriteRaw(imports[start:imp.offset])
+				sec.buf.WriteTypeIdx(TypeIdx(ts.types[imp.idx]))
+				start = imp.end
+			}
+			sec.buf.WriteRaw(imports[start:])
+			s = &sec
+		case Section(&mod.Funcs):
+			sec := &FuncSection{}
+			for j, typ := range funcTypes {
+				if ts.funcs[numImports+j] != dead {
+					sec.Add(TypeIdx(ts.types[typ]), 0)
+				}
+			}
+			s = sec
+		case Section(&mod.Globals):
+			sec := &GlobalSection{n: mod.Globals.n}
+			start := 0
+			for _, span := range globalInits(globals, mod.Globals.n) {
+				sec.buf.WriteRaw(globals[start:span[0]])
+				init := globals[span[0]:span[1]]
+				if remapped := ts.apply(NewInstrIter(init)); remapped != nil {
+					init = remapped
+				}
+				sec.buf.WriteRaw(init)
+				start = span[1]
+			}
+			s = sec
+		case Section(&mod.Exports):
+			sec := &ExportSection{n: mod.Exports.n}
+			start := 0
+			for _, exp := range funcExports(exports, mod.Exports.n) {
+				sec.buf.WriteRaw(exports[start:exp.offset])
+				sec.buf.WriteFuncIdx(FuncIdx(ts.funcs[exp.idx]))
+				start = exp.end
+			}
+			sec.buf.WriteRaw(exports[start:])
+			s = sec
+		case Section(&mod.Code):
+			sec := &CodeSection{}
+			for j, code := range mod.Code.funcs {
+				if ts.funcs[numImports+j] == dead {
+					continue
+				}
+				if remapped := ts.apply(code.Instrs()); remapped != nil {
+					code = &Code{Expr: Expr{buf: Buffer{buf: remapped}}}
+				}
+				sec.Add(code)
+			}
+			s = sec
+		}
+		if sec, ok := s.(*CustomSection); ok {
+			if names, ok := sec.contents.(*NameSection); ok {
+				s = &CustomSection{name: sec.name, contents: names.remap(ts.funcs)}
+			}
+		}
+		sections[i] = s
+	}
+	return sections
+}
+
+// Entries of treeShaker index maps are zero or live until the survivors are
+// numbered, and dead afterwards for the rest.
+const (
+	live = 1
+	dead = ^U32(0)
+)
+
+// A treeShaker maps old function and type indices to new ones.
+type treeShaker struct {
+	relocation
+	// Live functions whose bodies are yet to be scanned.
+	work []U32
+}
+
+func (ts *treeShaker) markFunc(idx U32) {
+	if int(idx) < len(ts.funcs) && ts.funcs[idx] != live {
+		ts.funcs[idx] = live
+		ts.work = append(ts.work, idx)
+	}
+}
+
+func (ts *treeShaker) markType(idx U32) {
+	if int(idx) < len(ts.types) {
+		ts.types[idx] = live
+	}
+}
+
+// scan marks the functions and types referred to by instructions.
+func (ts *treeShaker) scan(it InstrIter) {
+	for it.Next() {
+		switch it.op {
+		case opCall, opReffunc:
+			idx, _ := readUnsignedLEB128(it.Immediates())
+			ts.markFunc(idx)
+		case opCallindirect:
+			idx, _ := readUnsignedLEB128(it.Immediates())
+			ts.markType(idx)
+		case opBlock, opLoop, opIf:
+			if idx, _, ok := blockTypeIdx(it.Immediates()); ok {
+				ts.markType(idx)
+			}
+		}
+	}
+}
+
+// blockTypeIdx returns the type index of a block type immediate, and its
+// encoded size. ok is false for the empty and value block types.
+func blockTypeIdx(imm []byte) (idx U32, n int, ok bool) {
+	if 0x40 <= imm[0] && imm[0] < 0x80 {
+		return 0, 1, false
+	}
+	i, n := readSignedLEB128(imm)
+	return U32(i), n, true
+}
+
+// An indexRef locates an encoded index within a section's contents.
+type indexRef struct {
+	idx         U32
+	offset, end int
+}
+
+// funcImportTypes returns the type indices of the function imports encoded
+// in bs.
+func funcImportTypes(bs []byte, n U32) []indexRef {
+	var refs []indexRef
+	i := 0
+	for ; n > 0; n-- {
+		i = skipName(bs, i)
+		i = skipName(bs, i)
+		kind := bs[i]
+		i++
+		switch kind {
+		case 0x00:
+			ref := indexRef{offset: i}
+			ref.idx, i = decodeU32(bs, i)
+			ref.end = i
+			refs = append(refs, ref)
+		case 0x01:
+			i = skipLimits(bs, i+1)
+		case 0x02:
+			i = skipLimits(bs, i)
+		case 0x03:
+			i += 2
+		}
+	}
+	return refs
+}
+
+// funcExports returns the function indices of the function exports encoded
+// in bs.
+func funcExports(bs []byte, n U32) []indexRef {
+	var refs []indexRef
+	i := 0
+	for ; n > 0; n-- {
+		i = skipName(bs, i)
+		kind := bs[i]
+		ref := indexRef{offset: i + 1}
+		ref.idx, i = decodeU32(bs, i+1)
+		ref.end = i
+		if kind == 0x00 {
+			refs = append(refs, ref)
+		}
+	}
+	return refs
+}
+
+// globalInits returns the [start, end) spans of the initializer
+// expressions of the globals encoded in bs.
+func globalInits(bs []byte, n U32) [][2]int {
+	var spans [][2]int
+	i := 0
+	for ; n > 0; n-- {
+		i += 2 // Global type.
+		it := NewInstrIter(bs)
+		it.end = i
+		for it.Next() && it.op != opEnd {
+		}
+		spans = append(spans, [2]int{i, it.end})
+		i = it.end
+	}
+	return spans
+}
+
+func skipName(bs []byte, i int) int {
+	n, i := decodeU32(bs, i)
+	return i + int(n)
+}
+
+func skipLimits(bs []byte, i int) int {
+	hasMax := bs[i] == 0x01
+	i = skipLEB128(bs, i+1)
+	if hasMax {
+		i = skipLEB128(bs, i)
+	}
+	return i
+}
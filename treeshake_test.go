@@ -0,0 +1,59 @@
+package webassembler
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestTreeShaking(t *testing.T) {
+	mod := NewModule()
+	unaryType := mod.Types.AddFunc(ResultType{TypeI32}, ResultType{TypeI32})
+	constType := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	voidType := mod.Types.AddFunc(nil, nil)
+	pairType := mod.Types.AddFunc(nil, ResultType{TypeI32, TypeI32})
+
+	// Only reachable through dead.
+	deadCallee := mod.ReserveFunc(voidType)
+	dead := NewCode()
+	dead.Call(FuncIdx(deadCallee))
+	dead.Localget(0)
+	dead.End()
+	mod.AddFunc(unaryType, dead)
+	helper := mod.AddFunc(constType, constCode(40))
+	empty := NewCode()
+	empty.End()
+	mod.DefineFunc(deadCallee, empty)
+
+	start := NewCode()
+	start.Call(helper)
+	start.Block(TypeIdx(pairType))
+	start.I32_Const(1)
+	start.I32_Const(2)
+	start.End()
+	start.I32_Add()
+	start.I32_Add()
+	start.End()
+	mod.ExportFunc("_start", mod.AddFunc(constType, start))
+
+	// Referenced from a global.
+	referenced := mod.AddFunc(voidType, empty)
+	init := &Expr{}
+	init.Reffunc(U32(referenced))
+	init.End()
+	mod.AddGlobal(GlobalType{TypeFuncRef, false}, init)
+
+	full := mod.Size()
+	assert.Equal(t, 43, runInt(t, mod))
+	mod.EnableTreeShaking()
+	assert.Less(t, mod.Size(), full)
+	assert.Equal(t, 43, runInt(t, mod))
+	assert.Equal(t, mod.Size(), len(mod.Bytes()))
+
+	sections := mod.sections()
+	assert.Equal(t, U32(3), sections[0].(*TypeSection).n)
+	assert.Len(t, sections[7].(*CodeSection).funcs, 3)
+	// The module itself is unchanged.
+	assert.Equal(t, U32(4), mod.Types.n)
+	assert.Len(t, mod.Code.funcs, 5)
+}
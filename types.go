@@ -8,6 +8,7 @@ type I128 = [16]byte
 type F32 = float32
 type F64 = float64
 type LaneShuffle = [16]LaneIdx
+type LabelVec = []LabelIdx
 
 type LaneIdx U32
 type TypeIdx U32
@@ -18,11 +19,12 @@ type MemIdx U32
 type LabelIdx U32
 type LocalIdx U32
 type GlobalIdx U32
+type DataIdx U32
 
 // Not part of the Webassembly spec.
 type CodeIdx U32
 
-func (idx LaneIdx) emit(buf *Buffer)   { buf.WriteU32(U32(idx)) }
+func (idx LaneIdx) emit(buf *Buffer)   { buf.WriteLaneIdx(idx) }
 func (idx TypeIdx) emit(buf *Buffer)   { buf.WriteU32(U32(idx)) }
 func (idx FuncIdx) emit(buf *Buffer)   { buf.WriteU32(U32(idx)) }
 func (idx LabelIdx) emit(buf *Buffer)  { buf.WriteU32(U32(idx)) }
@@ -55,9 +57,22 @@ func (rt ResultType) emit(buf *Buffer) {
 	writeVec(buf, rt)
 }
 
+// FuncType is a function signature, as accepted by TypeSection.AddFuncs.
+type FuncType struct {
+	Parameters ResultType
+	Results    ResultType
+}
+
 type TypeSection struct {
 	n   U32
 	buf Buffer
+
+	// Maps encoded function types to their indices when interning is
+	// enabled; nil otherwise.
+	interned map[string]TypeIdx
+
+	// Digest of a prefix of buf, extended by Module.Digest.
+	hashed digest
 }
 
 func (sec *TypeSection) SectionID() SectionID {
@@ -68,16 +83,80 @@ func (sec *TypeSection) Size() int {
 	return unsignedLEB128Size(sec.n) + sec.buf.Len()
 }
 
-func (sec *TypeSection) emitContents(buf *Buffer) {
-	buf.WriteU32(sec.n)
-	buf.WriteRaw(sec.buf.Bytes())
+func (sec *TypeSection) emitContents(w sectionWriter) {
+	w.WriteU32(sec.n)
+	w.WriteRaw(sec.buf.Bytes())
+}
+
+// Intern enables deduplication of function types. Afterwards, AddFunc
+// returns the index of an identical type if one is already in the section,
+// including types added before interning was enabled.
+func (sec *TypeSection) Intern() {
+	if sec.interned != nil {
+		return
+	}
+	sec.interned = make(map[string]TypeIdx)
+	bs := sec.buf.Bytes()
+	for i, start := U32(0), 0; i < sec.n; i++ {
+		end := funcTypeEnd(bs, start)
+		key := string(bs[start:end])
+		if _, ok := sec.interned[key]; !ok {
+			sec.interned[key] = TypeIdx(i)
+		}
+		start = end
+	}
+}
+
+// funcTypeEnd returns the offset following the encoded function type at
+// bs[start].
+func funcTypeEnd(bs []byte, start int) int {
+	end := start + 1 // 0x60
+	for j := 0; j < 2; j++ {
+		n, size := readUnsignedLEB128(bs[end:])
+		end += size + int(n)
+	}
+	return end
 }
 
 func (sec *TypeSection) AddFunc(parameters, results ResultType) TypeIdx {
-	idx := sec.n
-	sec.n++
+	start := sec.buf.Len()
 	sec.buf.WriteRawByte(0x60)
 	parameters.emit(&sec.buf)
 	results.emit(&sec.buf)
+	return sec.added(start)
+}
+
+// addEncoded adds a function type from its encoding.
+func (sec *TypeSection) addEncoded(bs []byte) TypeIdx {
+	start := sec.buf.Len()
+	sec.buf.WriteRaw(bs)
+	return sec.added(start)
+}
+
+// added indexes the function type just encoded at start, or removes it if
+// interning finds an identical type.
+func (sec *TypeSection) added(start int) TypeIdx {
+	if sec.interned != nil {
+		// Looking up by the freshly encoded bytes doesn't allocate; only
+		// new types pay for a key.
+		key := sec.buf.Bytes()[start:]
+		if idx, ok := sec.interned[string(key)]; ok {
+			sec.buf.buf = sec.buf.buf[:start]
+			return idx
+		}
+		sec.interned[string(key)] = TypeIdx(sec.n)
+	}
+	idx := sec.n
+	sec.n++
 	return TypeIdx(idx)
 }
+
+// AddFuncs adds a table of function types, returning their indices in
+// order. With interning enabled, duplicates share an index.
+func (sec *TypeSection) AddFuncs(types []FuncType) []TypeIdx {
+	idxs := make([]TypeIdx, len(types))
+	for i, typ := range types {
+		idxs[i] = sec.AddFunc(typ.Parameters, typ.Results)
+	}
+	return idxs
+}
@@ -0,0 +1,153 @@
+package webassembler
+
+import (
+	"fmt"
+	"io"
+	"net"
+)
+
+const (
+	// Chunks shorter than this are copied into scratch space rather than
+	// referenced, so that LEB128 prefixes and small bodies don't each cost
+	// an iovec.
+	vectorCopyThreshold = 512
+
+	// Pending output is flushed once it reaches either limit.
+	vectorFlushBytes  = 64 << 10
+	vectorFlushChunks = 1024
+)
+
+// A vectorWriter streams encoded output to an io.Writer by gathering
+// references to existing buffers and writing them with net.Buffers, which
+// uses writev where the destination supports it. Memory use is bounded by
+// the flush limits rather than by the size of the output.
+//
+// Referenced buffers must not be modified until they have been flushed.
+type vectorWriter struct {
+	w   io.Writer
+	vec [][]byte
+
+	// Small chunks are coalesced into scratch. While inScratch is set, the
+	// last entry of vec is scratch[mark:].
+	scratch   []byte
+	mark      int
+	inScratch bool
+
+	pending int
+	n       int64
+	err     error
+}
+
+func (vw *vectorWriter) WriteRaw(bs []byte) {
+	if vw.err != nil || len(bs) == 0 {
+		return
+	}
+	if len(bs) < vectorCopyThreshold {
+		vw.copyRaw(bs)
+		return
+	}
+	vw.vec = append(vw.vec, bs)
+	vw.inScratch = false
+	vw.pending += len(bs)
+	vw.maybeFlush()
+}
+
+func (vw *vectorWriter) WriteRawByte(c byte) {
+	var tmp [1]byte
+	tmp[0] = c
+	vw.copyRaw(tmp[:])
+}
+
+func (vw *vectorWriter) WriteU32(i U32) {
+	var tmp [5]byte
+	vw.copyRaw(appendUnsignedLEB128(tmp[:0], i))
+}
+
+// writeReaderAt streams n bytes from r directly to the destination, after
+// flushing any pending output.
+func (vw *vectorWriter) writeReaderAt(r io.ReaderAt, n int64) {
+	vw.flush()
+	if vw.err != nil {
+		return
+	}
+	m, err := io.Copy(vw.w, io.NewSectionReader(r, 0, n))
+	vw.n += m
+	if err == nil && m < n {
+		err = io.ErrUnexpectedEOF
+	}
+	vw.err = err
+}
+
+// writeWriterTo copies the n bytes that wt writes into scratch space, so
+// wt may reuse its buffers, flushing as the limits are reached.
+func (vw *vectorWriter) writeWriterTo(wt io.WriterTo, n int) {
+	if vw.err != nil {
+		return
+	}
+	start := vw.offset()
+	_, err := wt.WriteTo(copyWriter{vw})
+	if vw.err != nil {
+		return
+	}
+	if m := vw.offset() - start; err == nil && m != int64(n) {
+		err = fmt.Errorf("wrote %d bytes rather than %d", m, n)
+	}
+	if err != nil {
+		vw.err = fmt.Errorf("writing custom section: %w", err)
+	}
+}
+
+type copyWriter struct {
+	vw *vectorWriter
+}
+
+func (w copyWriter) Write(p []byte) (int, error) {
+	w.vw.copyRaw(p)
+	if w.vw.err != nil {
+		return 0, w.vw.err
+	}
+	return len(p), nil
+}
+
+func (vw *vectorWriter) copyRaw(bs []byte) {
+	if vw.err != nil {
+		return
+	}
+	if !vw.inScratch {
+		vw.mark = len(vw.scratch)
+		vw.vec = append(vw.vec, nil)
+		vw.inScratch = true
+	}
+	// If scratch is reallocated, earlier entries of vec keep referencing
+	// the old array, which still holds their bytes.
+	vw.scratch = append(vw.scratch, bs...)
+	vw.vec[len(vw.vec)-1] = vw.scratch[vw.mark:]
+	vw.pending += len(bs)
+	vw.maybeFlush()
+}
+
+// offset returns the number of bytes written so far, including those
+// pending.
+func (vw *vectorWriter) offset() int64 {
+	return vw.n + int64(vw.pending)
+}
+
+func (vw *vectorWriter) maybeFlush() {
+	if vw.pending >= vectorFlushBytes || len(vw.vec) >= vectorFlushChunks {
+		vw.flush()
+	}
+}
+
+func (vw *vectorWriter) flush() {
+	if vw.err == nil && len(vw.vec) > 0 {
+		bufs := net.Buffers(vw.vec)
+		var n int64
+		n, vw.err = bufs.WriteTo(vw.w)
+		vw.n += n
+	}
+	clear(vw.vec)
+	vw.vec = vw.vec[:0]
+	vw.scratch = vw.scratch[:0]
+	vw.inScratch = false
+	vw.pending = 0
+}
@@ -1,6 +1,11 @@
 package webassembler
 
 import (
+	"bytes"
+	"encoding/binary"
+	"math"
+	"strings"
+	"sync"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -8,11 +13,16 @@ import (
 )
 
 func runInt(t *testing.T, mod *Module) int {
+	return runBytes(t, mod.Bytes())
+}
+
+// runBytes is like runInt, for an encoded module.
+func runBytes(t *testing.T, bin []byte) int {
 	ctx := t.Context()
 	rt := wazero.NewRuntime(ctx)
 	defer rt.Close(ctx)
 
-	inst, err := rt.Instantiate(ctx, mod.Bytes())
+	inst, err := rt.Instantiate(ctx, bin)
 	if err != nil {
 		t.Fatalf("instantiating module: %v", err)
 	}
@@ -48,3 +58,360 @@ func TestWebassembler(t *testing.T) {
 	res := runInt(t, mod)
 	assert.Equal(t, 15, res)
 }
+
+func TestWriteTo(t *testing.T) {
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+
+	// Mix bodies below and above the copy threshold, enough to force
+	// several intermediate flushes.
+	for i := 0; i < 2000; i++ {
+		code := NewCode()
+		for j := 0; j < i%300; j++ {
+			code.I32_Const(I32(j))
+			code.Drop()
+		}
+		code.I32_Const(I32(i))
+		code.End()
+		funcIdx := mod.AddFunc(typeIdx, code)
+		if i == 0 {
+			mod.ExportFunc("_start", funcIdx)
+		}
+	}
+
+	var out bytes.Buffer
+	n, err := mod.WriteTo(&out)
+	assert.NoError(t, err)
+	assert.Equal(t, int64(out.Len()), n)
+	assert.Equal(t, mod.Bytes(), out.Bytes())
+	assert.Equal(t, 0, runInt(t, mod))
+}
+
+func TestAppendTo(t *testing.T) {
+	mod := NewModule()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mem := mod.AddMemory(MemType{MakeUnlimited(1)})
+	mod.Exports.AddMem("memory", mem)
+	for i := 0; i < 100; i++ {
+		code := NewCode()
+		code.I32_Const(I32(i))
+		code.End()
+		mod.AddFunc(typeIdx, code)
+	}
+
+	bin := mod.Bytes()
+	assert.Equal(t, len(bin), mod.Size())
+
+	prefix := []byte("prefix")
+	assert.Equal(t, append(prefix, bin...), mod.AppendTo(prefix))
+
+	dst := make([]byte, 0, mod.Size())
+	allocs := testing.AllocsPerRun(10, func() {
+		dst = mod.AppendTo(dst[:0])
+	})
+	assert.Equal(t, bin, dst)
+	assert.Equal(t, 0.0, allocs)
+}
+
+func TestReserveFunc(t *testing.T) {
+	build := func(i int) *Code {
+		code := NewCode(LocalType{1, TypeIdx(TypeI32)})
+		for j := 0; j < i%50; j++ {
+			code.Localget(0)
+			code.I32_Const(I32(i * j))
+			code.I32_Add()
+			code.Localset(0)
+		}
+		code.Localget(0)
+		code.End()
+		return code
+	}
+
+	newModule := func() (*Module, TypeIdx) {
+		mod := NewModule()
+		mod.ImportFunc("env", "f", mod.Types.AddFunc(nil, nil))
+		return mod, mod.Types.AddFunc(nil, ResultType{TypeI32})
+	}
+
+	serial, typeIdx := newModule()
+	for i := 0; i < 1000; i++ {
+		serial.AddFunc(typeIdx, build(i))
+	}
+
+	concurrent, typeIdx := newModule()
+	funcs := make([]FuncIdx, 1000)
+	for i := range funcs {
+		funcs[i] = concurrent.ReserveFunc(typeIdx)
+	}
+	var wg sync.WaitGroup
+	for w := 0; w < 8; w++ {
+		wg.Add(1)
+		go func(w int) {
+			defer wg.Done()
+			for i := len(funcs) - 1 - w; i >= 0; i -= 8 {
+				concurrent.DefineFunc(funcs[i], build(i))
+			}
+		}(w)
+	}
+	wg.Wait()
+
+	assert.Equal(t, serial.Bytes(), concurrent.Bytes())
+}
+
+func TestLEB128(t *testing.T) {
+	// Reference encoding for signed values, one byte at a time.
+	signedLEB128 := func(i int64) []byte {
+		var out []byte
+		for {
+			b := byte(i & 0x7f)
+			i >>= 7
+			if (i == 0 && b&0x40 == 0) || (i == -1 && b&0x40 != 0) {
+				return append(out, b)
+			}
+			out = append(out, b|0x80)
+		}
+	}
+
+	var values []int64
+	for shift := 0; shift < 64; shift++ {
+		for _, delta := range []int64{-1, 0, 1} {
+			values = append(values, int64(1)<<shift+delta, -(int64(1)<<shift)+delta)
+		}
+	}
+	values = append(values, math.MinInt64, math.MaxInt64, math.MinInt32, math.MaxInt32)
+
+	for _, v := range values {
+		assert.Equal(t, signedLEB128(v), appendSignedLEB128(nil, v), "i64 %d", v)
+		if v == int64(int32(v)) {
+			assert.Equal(t, signedLEB128(v), appendSignedLEB128(nil, int32(v)), "i32 %d", v)
+		}
+		u := uint64(v)
+		assert.Equal(t, binary.AppendUvarint(nil, u), appendUnsignedLEB128(nil, u), "u64 %d", u)
+		assert.Equal(t, len(binary.AppendUvarint(nil, u)), unsignedLEB128Size(u), "size %d", u)
+		if u == uint64(uint32(u)) {
+			assert.Equal(t, binary.AppendUvarint(nil, u), appendUnsignedLEB128(nil, uint32(u)), "u32 %d", u)
+		}
+	}
+}
+
+func TestTypeInterning(t *testing.T) {
+	mod := NewModule()
+	v2i := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	dup := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	assert.NotEqual(t, v2i, dup)
+
+	mod.Types.Intern()
+	assert.Equal(t, v2i, mod.Types.AddFunc(nil, ResultType{TypeI32}))
+
+	idxs := mod.Types.AddFuncs([]FuncType{
+		{ResultType{TypeI32, TypeI64}, nil},
+		{nil, ResultType{TypeI32}},
+		{ResultType{TypeI32, TypeI64}, nil},
+	})
+	assert.Equal(t, []TypeIdx{2, v2i, 2}, idxs)
+	assert.Equal(t, TypeIdx(2), mod.Types.AddFunc(ResultType{TypeI32, TypeI64}, nil))
+
+	code := NewCode()
+	code.I32_Const(7)
+	code.End()
+	mod.ExportFunc("_start", mod.AddFunc(v2i, code))
+	assert.Equal(t, 7, runInt(t, mod))
+}
+
+func TestSplice(t *testing.T) {
+	mod := NewModule()
+	mod.Code.EnableIncremental()
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+	var funcs []FuncIdx
+	for i := 0; i < 100; i++ {
+		funcs = append(funcs, mod.AddFunc(typeIdx, constCode(I32(i))))
+	}
+	mod.ExportFunc("_start", funcs[50])
+	mod.ExportFunc("last", funcs[99])
+	bin := mod.Bytes()
+
+	// Same encoded size: patched in place.
+	mod.Code.ReplaceBody(50, constCode(7))
+	spliced := mod.Splice(bin)
+	assert.Equal(t, &bin[0], &spliced[0])
+	assert.Equal(t, 7, runInt(t, mod))
+
+	// Different sizes, replacing some bodies more than once.
+	mod.Code.ReplaceBody(10, constCode(1<<20))
+	mod.Code.ReplaceBody(50, constCode(0))
+	mod.Code.ReplaceBody(50, constCode(1<<30))
+	code := NewCode()
+	code.End()
+	mod.Code.ReplaceBody(70, code)
+	mod.Code.ReplaceBody(70, constCode(70))
+	spliced = mod.Splice(spliced)
+
+	// Splicing again builds on the layout updated by the last splice, even
+	// after the module is encoded in between.
+	mod.Code.ReplaceBody(99, constCode(1<<25))
+	want := mod.Bytes()
+	spliced = mod.Splice(spliced)
+	assert.Equal(t, want, spliced)
+	assert.Equal(t, 1<<30, runInt(t, mod))
+
+	// Replacing bodies before the module is first encoded, or adding
+	// functions with replacements pending.
+	mod = NewModule()
+	mod.Code.EnableIncremental()
+	typeIdx = mod.Types.AddFunc(nil, ResultType{TypeI32})
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, constCode(1)))
+	mod.Code.ReplaceBody(0, constCode(2))
+	bin = mod.Bytes()
+	mod.Code.ReplaceBody(0, constCode(1<<20))
+	spliced = mod.Splice(bin)
+	assert.Equal(t, mod.Bytes(), spliced)
+	mod.Code.ReplaceBody(0, constCode(3))
+	mod.AddFunc(typeIdx, constCode(4))
+	spliced = mod.Splice(spliced)
+	assert.Equal(t, mod.Bytes(), spliced)
+	assert.Equal(t, 3, runInt(t, mod))
+}
+
+func TestStats(t *testing.T) {
+	var stats Stats
+	mod := NewModule()
+	mod.SetStats(&stats)
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+
+	code := NewCode()
+	code.SetStats(&stats)
+	code.I32_Const(1)
+	code.I32_Const(2)
+	code.I32_Add()
+	code.End()
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+	bin := mod.Bytes()
+
+	snap := stats.Snapshot()
+	assert.Equal(t, []OpcodeCount{
+		{"end", 1},
+		{"i32.const", 2},
+		{"i32.add", 1},
+	}, snap.Opcodes)
+	assert.Equal(t, uint64(1), snap.Bodies)
+	assert.Equal(t, int64(encodedBodySize(code)), snap.BodyBytes)
+
+	var ids []SectionID
+	var total int64
+	for _, sec := range snap.Sections {
+		ids = append(ids, sec.ID)
+		assert.Equal(t, uint64(1), sec.Emits)
+		total += sec.Bytes
+	}
+	assert.Equal(t, []SectionID{TypeSectionID, ImportSectionID, FunctionSectionID, MemorySectionID, GlobalSectionID, ExportSectionID, CodeSectionID}, ids)
+	assert.Equal(t, int64(len(bin)-len(moduleHeader)), total)
+
+	var merged Stats
+	merged.Merge(&stats)
+	merged.Merge(&stats)
+	assert.Equal(t, uint64(4), merged.Snapshot().Opcodes[1].Count)
+}
+
+func TestDataSection(t *testing.T) {
+	mod := NewModule()
+	mem := mod.AddMemory(MemType{MakeUnlimited(1)})
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+
+	mod.Data.AddActive(mem, 8, []byte{40, 0, 0, 0})
+	mod.Data.AddPassive([]byte("passive"))
+	image := strings.NewReader(strings.Repeat("\x02", 1000))
+	mod.Data.AddActiveReader(mem, 1000, image, image.Size())
+
+	code := NewCode()
+	code.I32_Const(8)
+	code.I32_Load(MemArg{2, 0})
+	code.I32_Const(0)
+	code.I32_Load8U(MemArg{0, 1999})
+	code.I32_Add()
+	code.End()
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+
+	bin := mod.Bytes()
+	assert.Equal(t, len(bin), mod.Size())
+	var out bytes.Buffer
+	_, err := mod.WriteTo(&out)
+	assert.NoError(t, err)
+	assert.Equal(t, bin, out.Bytes())
+	assert.Equal(t, 42, runInt(t, mod))
+}
+
+func TestCompactData(t *testing.T) {
+	mod := NewModule()
+	mem := mod.AddMemory(MemType{MakeUnlimited(2)})
+	typeIdx := mod.Types.AddFunc(nil, ResultType{TypeI32})
+
+	passive := make([]byte, 100)
+	mod.Data.AddPassive(passive)
+
+	image := make([]byte, 1<<16)
+	image[100] = 1
+	image[30_000] = 2
+	image[30_010] = 3 // Too close to split from the previous byte.
+	image[1<<16-1] = 4
+	mod.Data.AddActive(mem, 0, image)
+	// Close to the previous segment, so merged with its last piece.
+	mod.Data.AddActive(mem, 1<<16+2, []byte{5, 0, 0, 0})
+
+	code := NewCode()
+	code.I32_Const(0)
+	for _, addr := range []U32{100, 30_000, 30_010, 1<<16 - 1, 1<<16 + 2} {
+		code.I32_Const(I32(addr))
+		code.I32_Load8U(MemArg{0, 0})
+		code.I32_Add()
+	}
+	code.End()
+	mod.ExportFunc("_start", mod.AddFunc(typeIdx, code))
+
+	before := mod.Size()
+	saved := mod.CompactData(64)
+	assert.Equal(t, before-mod.Size(), saved)
+	assert.Less(t, mod.Size(), 300)
+
+	assert.Len(t, mod.Data.segments, 4)
+	assert.Equal(t, []byte{2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3}, mod.Data.segments[2].data)
+	assert.Equal(t, []byte{4, 0, 0, 5}, mod.Data.segments[3].data)
+	assert.Equal(t, 15, runInt(t, mod))
+}
+
+func TestCodeReset(t *testing.T) {
+	code := NewCode(LocalType{1, TypeIdx(TypeI32)})
+	code.I32_Const(1 << 20)
+	code.End()
+	code.Reset()
+	code.I32_Const(7)
+	code.End()
+	assert.Equal(t, constCode(7).buf.Bytes(), code.buf.Bytes())
+
+	code.EnableRecording()
+	code.Reset()
+	code.I32_Const(9)
+	code.End()
+	assert.Equal(t, constCode(9).Instrs().bs, code.Instrs().bs)
+
+	code.Release()
+	code = AcquireCode(LocalType{2, TypeIdx(TypeI64)})
+	code.I64_Const(5)
+	code.I32_WrapI64()
+	code.End()
+	assert.Nil(t, code.ir)
+	mod := NewModule()
+	mod.ExportFunc("_start", mod.AddFunc(mod.Types.AddFunc(nil, ResultType{TypeI32}), code))
+	assert.Equal(t, 5, runInt(t, mod))
+
+	// Bodies shared with a cache are not written into.
+	cache := NewCodeCache(1 << 10)
+	key := KeyOfCode(constCode(1))
+	cache.Put(key, constCode(1))
+	code, _ = cache.Get(key)
+	code.Reset()
+	code.Unreachable()
+	code.End()
+	code.Release()
+	code, _ = cache.Get(key)
+	assert.Equal(t, constCode(1).buf.Bytes(), code.buf.Bytes())
+}